@@ -0,0 +1,204 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the actuator models that store a joint history.
+
+Actuator models are computed at every physics step, i.e. decimation times per policy step. The script measures
+the compute time per physics step of the :class:`~isaaclab.actuators.ActuatorNetMLP` and the
+:class:`~isaaclab.actuators.DelayedPDActuator` against reference implementations that roll their history tensors
+and concatenate the network inputs over the history indices, and that delay each command with a
+:class:`~isaaclab.utils.DelayBuffer`. It also measures the batched inference of several MLP actuators that share a
+network with an :class:`~isaaclab.actuators.ActuatorNetGroup` against the inference of each actuator. Batching
+saves kernel launches on the GPU, whereas on the CPU the larger batch is usually slower.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_actuators.py --num_envs 4096 --device cuda:0
+
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import torch
+
+from isaaclab.actuators import (
+    ActuatorNetGroup,
+    ActuatorNetMLP,
+    ActuatorNetMLPCfg,
+    DelayedPDActuatorCfg,
+    IdealPDActuator,
+)
+from isaaclab.utils import DelayBuffer
+from isaaclab.utils.types import ArticulationActions
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the actuator models that store a joint history.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--num_joints", type=int, default=12, help="Number of joints per environment.")
+parser.add_argument("--num_steps", type=int, default=200, help="Number of physics steps to run.")
+parser.add_argument("--num_groups", type=int, default=4, help="Number of MLP actuators that share a network.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run the actuators on.")
+args_cli = parser.parse_args()
+
+
+class ReferenceActuatorNetMLP(ActuatorNetMLP):
+    """Reference MLP actuator that rolls its history tensors and concatenates the network inputs at every step."""
+
+    def __init__(self, cfg: ActuatorNetMLPCfg, *args, **kwargs):
+        super().__init__(cfg, *args, **kwargs)
+        history_length = max(cfg.input_idx) + 1
+        self._joint_pos_error_history = torch.zeros(
+            self._num_envs, history_length, self.num_joints, device=self._device
+        )
+        self._joint_vel_history = torch.zeros(self._num_envs, history_length, self.num_joints, device=self._device)
+
+    def reset(self, env_ids):
+        self._joint_pos_error_history[env_ids] = 0.0
+        self._joint_vel_history[env_ids] = 0.0
+
+    def compute(self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor):
+        self._joint_pos_error_history = self._joint_pos_error_history.roll(1, 1)
+        self._joint_pos_error_history[:, 0] = control_action.joint_positions - joint_pos
+        self._joint_vel_history = self._joint_vel_history.roll(1, 1)
+        self._joint_vel_history[:, 0] = joint_vel
+        self._joint_vel[:] = joint_vel
+        pos_input = torch.cat([self._joint_pos_error_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
+        pos_input = pos_input.view(self._num_envs * self.num_joints, -1)
+        vel_input = torch.cat([self._joint_vel_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
+        vel_input = vel_input.view(self._num_envs * self.num_joints, -1)
+        network_input = torch.cat([pos_input * self.cfg.pos_scale, vel_input * self.cfg.vel_scale], dim=1)
+        with torch.inference_mode():
+            torques = self.network(network_input).view(self._num_envs, self.num_joints)
+        self.computed_effort = torques * self.cfg.torque_scale
+        self.applied_effort = self._clip_effort(self.computed_effort)
+        control_action.joint_efforts = self.applied_effort
+        control_action.joint_positions = None
+        control_action.joint_velocities = None
+        return control_action
+
+
+class ReferenceDelayedPDActuator(IdealPDActuator):
+    """Reference delayed PD actuator that delays each command with a delay buffer."""
+
+    def __init__(self, cfg: DelayedPDActuatorCfg, *args, **kwargs):
+        super().__init__(cfg, *args, **kwargs)
+        self.delay_buffers = [DelayBuffer(cfg.max_delay, self._num_envs, device=self._device) for _ in range(3)]
+
+    def reset(self, env_ids):
+        super().reset(env_ids)
+        num_envs = self._num_envs if env_ids is None or env_ids == slice(None) else len(env_ids)
+        time_lags = torch.randint(self.cfg.min_delay, self.cfg.max_delay + 1, (num_envs,), device=self._device)
+        for delay_buffer in self.delay_buffers:
+            delay_buffer.set_time_lag(time_lags.int(), env_ids)
+            delay_buffer.reset(env_ids)
+
+    def compute(self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor):
+        control_action.joint_positions = self.delay_buffers[0].compute(control_action.joint_positions)
+        control_action.joint_velocities = self.delay_buffers[1].compute(control_action.joint_velocities)
+        control_action.joint_efforts = self.delay_buffers[2].compute(control_action.joint_efforts)
+        return super().compute(control_action, joint_pos, joint_vel)
+
+
+def run(actuator, reset_period: int = 50) -> float:
+    """Compute the actuator at every physics step and return the time per step in milliseconds.
+
+    Some environments are reset periodically, as terminated episodes would be.
+    """
+    num_envs, num_joints, device = args_cli.num_envs, args_cli.num_joints, args_cli.device
+    joint_pos = torch.rand(num_envs, num_joints, device=device)
+    joint_vel = torch.rand(num_envs, num_joints, device=device)
+    targets = torch.rand(num_envs, num_joints, device=device)
+    reset_ids = torch.arange(0, num_envs, 64, device=device)
+    actuator.reset(slice(None))
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start_time = time.perf_counter()
+    for step in range(args_cli.num_steps):
+        if step % reset_period == 0:
+            actuator.reset(reset_ids)
+        control_action = ArticulationActions(targets, torch.zeros_like(targets), torch.zeros_like(targets))
+        actuator.compute(control_action, joint_pos, joint_vel)
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return 1000.0 * (time.perf_counter() - start_time) / args_cli.num_steps
+
+
+def run_group(actuators: list[ActuatorNetMLP], batched: bool) -> float:
+    """Compute the actuators at every physics step and return the time per step in milliseconds.
+
+    If batched, the actuators are computed with a single inference of their shared network.
+    """
+    num_envs, num_joints, device = args_cli.num_envs, args_cli.num_joints, args_cli.device
+    joint_pos = torch.rand(num_envs, num_joints, device=device)
+    joint_vel = torch.rand(num_envs, num_joints, device=device)
+    targets = torch.rand(num_envs, num_joints, device=device)
+    group = ActuatorNetGroup(actuators)
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        control_actions = [ArticulationActions(targets, torch.zeros_like(targets)) for _ in actuators]
+        if batched:
+            group.compute(control_actions, [joint_pos] * len(actuators), [joint_vel] * len(actuators))
+        else:
+            for actuator, control_action in zip(actuators, control_actions):
+                actuator.compute(control_action, joint_pos, joint_vel)
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return 1000.0 * (time.perf_counter() - start_time) / args_cli.num_steps
+
+
+def main():
+    """Run the benchmark for the MLP and the delayed PD actuators."""
+    num_envs, num_joints, device = args_cli.num_envs, args_cli.num_joints, args_cli.device
+    joint_names = [f"joint_{i}" for i in range(num_joints)]
+    print(f"[INFO]: Computing the actuators of {num_envs} x {num_joints} joints on device: {device}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # create a network with the architecture of the ANYdrive actuator network
+        network = torch.nn.Sequential(
+            torch.nn.Linear(6, 32), torch.nn.Softsign(), torch.nn.Linear(32, 32), torch.nn.Softsign()
+        )
+        network.append(torch.nn.Linear(32, 1))
+        network_file = os.path.join(tmp_dir, "actuator_net.pt")
+        torch.jit.script(network).save(network_file)
+        mlp_cfg = ActuatorNetMLPCfg(
+            joint_names_expr=[".*"],
+            network_file=network_file,
+            pos_scale=-1.0,
+            vel_scale=1.0,
+            torque_scale=1.0,
+            input_order="pos_vel",
+            input_idx=[0, 2, 4],
+            saturation_effort=120.0,
+            effort_limit=80.0,
+            velocity_limit=7.5,
+        )
+        reference_time = run(ReferenceActuatorNetMLP(mlp_cfg, joint_names, slice(None), num_envs, device))
+        mlp_time = run(mlp_cfg.class_type(mlp_cfg, joint_names, slice(None), num_envs, device))
+        print(f"ActuatorNetMLP: {mlp_time:.3f} ms (reference: {reference_time:.3f} ms)")
+        # actuators that share the network, such as the legs of a quadruped
+        actuators = [
+            mlp_cfg.class_type(mlp_cfg, joint_names, slice(None), num_envs, device) for _ in range(args_cli.num_groups)
+        ]
+        separate_time = run_group(actuators, batched=False)
+        batched_time = run_group(actuators, batched=True)
+        print(
+            f"ActuatorNetGroup of {args_cli.num_groups} actuators: {batched_time:.3f} ms"
+            f" (separate inference: {separate_time:.3f} ms)"
+        )
+
+    delayed_cfg = DelayedPDActuatorCfg(
+        joint_names_expr=[".*"], stiffness=80.0, damping=2.0, effort_limit=80.0, min_delay=0, max_delay=4
+    )
+    reference_time = run(ReferenceDelayedPDActuator(delayed_cfg, joint_names, slice(None), num_envs, device))
+    delayed_time = run(delayed_cfg.class_type(delayed_cfg, joint_names, slice(None), num_envs, device))
+    print(f"DelayedPDActuator: {delayed_time:.3f} ms (reference: {reference_time:.3f} ms)")
+
+
+if __name__ == "__main__":
+    main()
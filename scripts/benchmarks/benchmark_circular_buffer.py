@@ -0,0 +1,102 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the update rate of the circular buffer.
+
+The script compares :class:`~isaaclab.utils.buffers.CircularBuffer` against a reference implementation that
+looks up the reset batch entries on the host in every append and rolls a copy of the storage in every read.
+Each step appends data, reads the history and resets a fraction of the batch entries.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_circular_buffer.py --batch_size 4096 --device cuda:0
+
+"""
+
+import argparse
+import time
+import torch
+
+from isaaclab.utils.buffers import CircularBuffer
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the update rate of the circular buffer.")
+parser.add_argument("--batch_size", type=int, default=4096, help="Batch dimension of the buffer.")
+parser.add_argument("--max_len", type=int, nargs="+", default=[3, 10, 50], help="History lengths of the buffer.")
+parser.add_argument("--data_dim", type=int, default=48, help="Dimension of the appended data.")
+parser.add_argument("--num_steps", type=int, default=1000, help="Number of steps to run.")
+parser.add_argument("--reset_ratio", type=float, default=0.01, help="Fraction of batch entries reset every step.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to store the buffer on.")
+args_cli = parser.parse_args()
+
+
+class ReferenceCircularBuffer:
+    """Reference circular buffer that synchronizes with the host on every append and rolls the storage on reads."""
+
+    def __init__(self, max_len: int, batch_size: int, device: str):
+        self._max_len = max_len
+        self._device = device
+        self._num_pushes = torch.zeros(batch_size, dtype=torch.long, device=device)
+        self._pointer = -1
+        self._buffer = None
+
+    @property
+    def buffer(self) -> torch.Tensor:
+        buf = self._buffer.clone()
+        buf = torch.roll(buf, shifts=self._max_len - self._pointer - 1, dims=0)
+        return torch.transpose(buf, dim0=0, dim1=1)
+
+    def reset(self, batch_ids: torch.Tensor):
+        self._num_pushes[batch_ids] = 0
+        if self._buffer is not None:
+            self._buffer[:, batch_ids] = 0.0
+
+    def append(self, data: torch.Tensor):
+        if self._buffer is None:
+            self._buffer = torch.empty((self._max_len, *data.shape), dtype=data.dtype, device=self._device)
+        self._pointer = (self._pointer + 1) % self._max_len
+        self._buffer[self._pointer] = data
+        num_pushes = self._num_pushes.tolist()
+        if 0 in num_pushes:
+            fill_ids = [i for i, x in enumerate(num_pushes) if x == 0]
+            self._buffer[:, fill_ids] = data[fill_ids]
+        self._num_pushes += 1
+
+
+def run(circular_buffer, buffer_attr: str) -> float:
+    """Run the append, read and reset cycle on the buffer and return the update rate in steps/s."""
+    data = torch.rand(args_cli.batch_size, args_cli.data_dim, device=args_cli.device)
+    num_resets = max(1, int(args_cli.reset_ratio * args_cli.batch_size))
+    # pre-generate the reset indices so that the random number generation is not measured
+    reset_ids = torch.randint(0, args_cli.batch_size, (args_cli.num_steps, num_resets), device=args_cli.device)
+    start_time = time.perf_counter()
+    for step in range(args_cli.num_steps):
+        circular_buffer.append(data)
+        getattr(circular_buffer, buffer_attr)
+        circular_buffer.reset(reset_ids[step])
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return args_cli.num_steps / (time.perf_counter() - start_time)
+
+
+def main():
+    """Run the benchmark for all the history lengths."""
+    print(f"[INFO]: Running on device: {args_cli.device} with batch size: {args_cli.batch_size}")
+    print(
+        f"{'max_len':>8} | {'reference (steps/s)':>20} | {'buffer (steps/s)':>17} | {'buffer_view (steps/s)':>22} |"
+        f" {'speedup':>8}"
+    )
+    for max_len in args_cli.max_len:
+        reference_rate = run(ReferenceCircularBuffer(max_len, args_cli.batch_size, args_cli.device), "buffer")
+        buffer_rate = run(CircularBuffer(max_len, args_cli.batch_size, args_cli.device), "buffer")
+        view_rate = run(CircularBuffer(max_len, args_cli.batch_size, args_cli.device), "buffer_view")
+        print(
+            f"{max_len:>8} | {reference_rate:>20.1f} | {buffer_rate:>17.1f} | {view_rate:>22.1f} |"
+            f" {view_rate / reference_rate:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the recording rate of episode data.
+
+The script compares the preallocated storage of :class:`~isaaclab.utils.datasets.EpisodeData` against
+re-concatenating the recorded history with :func:`torch.cat` on every step.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_episode_data.py --num_steps 1000 10000 --device cuda:0
+
+"""
+
+import argparse
+import time
+import torch
+
+from isaaclab.utils.datasets import EpisodeData
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the recording rate of episode data.")
+parser.add_argument("--num_steps", type=int, nargs="+", default=[1000, 10000], help="Episode lengths to record.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to store the recorded data on.")
+parser.add_argument("--obs_dim", type=int, default=48, help="Dimension of the recorded observations.")
+parser.add_argument("--action_dim", type=int, default=12, help="Dimension of the recorded actions.")
+args_cli = parser.parse_args()
+
+
+class ConcatEpisodeData:
+    """Reference recording that re-concatenates the history of a key on every step."""
+
+    def __init__(self):
+        self.data = dict()
+
+    def add(self, key: str, value: torch.Tensor):
+        if key not in self.data:
+            self.data[key] = value.unsqueeze(0).clone()
+        else:
+            self.data[key] = torch.cat((self.data[key], value.unsqueeze(0)))
+
+
+def record(episode, num_steps: int) -> float:
+    """Record an episode with dummy observations and actions and return the recording rate in steps/s."""
+    obs = torch.rand(args_cli.obs_dim, device=args_cli.device)
+    actions = torch.rand(args_cli.action_dim, device=args_cli.device)
+    start_time = time.perf_counter()
+    for _ in range(num_steps):
+        episode.add("obs/policy", obs)
+        episode.add("actions", actions)
+    if hasattr(episode, "finalize"):
+        episode.finalize()
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return num_steps / (time.perf_counter() - start_time)
+
+
+def main():
+    """Run the benchmark for all the episode lengths."""
+    print(f"[INFO]: Recording on device: {args_cli.device}")
+    print(f"{'num_steps':>10} | {'torch.cat (steps/s)':>20} | {'EpisodeData (steps/s)':>22} | {'speedup':>8}")
+    for num_steps in args_cli.num_steps:
+        concat_rate = record(ConcatEpisodeData(), num_steps)
+        episode_rate = record(EpisodeData(), num_steps)
+        print(f"{num_steps:>10} | {concat_rate:>20.1f} | {episode_rate:>22.1f} | {episode_rate / concat_rate:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the storage layouts of recorded HDF5 datasets.
+
+The script writes synthetic episodes with camera-like and proprioceptive observations using different
+chunking and compression settings, and reports the file size as well as the write and read throughput.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_hdf5_dataset_layout.py --num_episodes 4 --num_steps 200
+
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import torch
+
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler, HDF5DatasetKeyLayoutCfg, HDF5DatasetLayoutCfg
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the storage layouts of recorded HDF5 datasets.")
+parser.add_argument("--num_episodes", type=int, default=4, help="Number of episodes to write.")
+parser.add_argument("--num_steps", type=int, default=200, help="Number of steps per episode.")
+parser.add_argument("--image_size", type=int, nargs=2, default=[120, 160], help="Height and width of the images.")
+parser.add_argument("--obs_dim", type=int, default=64, help="Dimension of the proprioceptive observations.")
+args_cli = parser.parse_args()
+
+
+def camera_layout(**kwargs) -> HDF5DatasetLayoutCfg:
+    """Layout compressing the images frame by frame and the remaining data with the given settings."""
+    height, width = args_cli.image_size
+    image_kwargs = {k: v for k, v in kwargs.items() if k != "float16"}
+    return HDF5DatasetLayoutCfg(
+        default=HDF5DatasetKeyLayoutCfg(**kwargs),
+        keys={"obs/rgb": HDF5DatasetKeyLayoutCfg(chunk_shape=(1, height, width, 3), **image_kwargs)},
+    )
+
+
+LAYOUTS = {
+    "contiguous": HDF5DatasetLayoutCfg(),
+    "lzf": camera_layout(compression="lzf"),
+    "lzf+shuffle": camera_layout(compression="lzf", shuffle=True),
+    "gzip-1+shuffle": camera_layout(compression="gzip", compression_level=1, shuffle=True),
+    "gzip-4+shuffle": camera_layout(compression="gzip", compression_level=4, shuffle=True),
+    "gzip-4+shuffle+fp16": camera_layout(compression="gzip", compression_level=4, shuffle=True, float16=True),
+}
+"""The benchmarked storage layouts."""
+
+
+def create_episode() -> EpisodeData:
+    """Create an episode with smooth synthetic observations, which compress similarly to recorded data."""
+    height, width = args_cli.image_size
+    episode = EpisodeData()
+    # images with a moving gradient pattern
+    ys = torch.linspace(0, 1, height).view(height, 1, 1)
+    xs = torch.linspace(0, 1, width).view(1, width, 1)
+    phases = torch.linspace(0, 1, 3).view(1, 1, 3)
+    for step in range(args_cli.num_steps):
+        t = step / args_cli.num_steps
+        image = ((torch.sin(6.0 * (xs + ys + phases + t)) + 1.0) * 127.5).to(torch.uint8)
+        episode.add("obs/rgb", image)
+        episode.add("obs/joint_pos", torch.sin(torch.linspace(0, 3, args_cli.obs_dim) + t))
+        episode.add("actions", torch.cos(torch.linspace(0, 3, 12) + t))
+    episode.finalize()
+    return episode
+
+
+def episode_nbytes(data: dict) -> int:
+    """Number of bytes of the episode data in memory."""
+    return sum(episode_nbytes(v) if isinstance(v, dict) else v.numel() * v.element_size() for v in data.values())
+
+
+def main():
+    """Run the benchmark for all the storage layouts."""
+    episode = create_episode()
+    total_bytes = episode_nbytes(episode.data) * args_cli.num_episodes
+    print(f"[INFO]: Writing {args_cli.num_episodes} episodes of {total_bytes / 1e6:.1f} MB in total.")
+    print(f"{'layout':>20} | {'file size (MB)':>14} | {'ratio':>6} | {'write (MB/s)':>12} | {'read (MB/s)':>11}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, layout_cfg in LAYOUTS.items():
+            file_path = os.path.join(temp_dir, f"{name}.hdf5")
+            # write the episodes
+            handler = HDF5DatasetFileHandler(layout_cfg)
+            handler.create(file_path)
+            start_time = time.perf_counter()
+            for _ in range(args_cli.num_episodes):
+                handler.write_episode(episode)
+            handler.flush()
+            handler.close()
+            write_time = time.perf_counter() - start_time
+            file_size = os.path.getsize(file_path)
+            # read the episodes
+            handler = HDF5DatasetFileHandler()
+            handler.open(file_path)
+            start_time = time.perf_counter()
+            for episode_name in handler.get_episode_names():
+                handler.load_episode(episode_name, device="cpu")
+            read_time = time.perf_counter() - start_time
+            handler.close()
+            print(
+                f"{name:>20} | {file_size / 1e6:>14.1f} | {total_bytes / file_size:>6.2f} |"
+                f" {total_bytes / 1e6 / write_time:>12.1f} | {total_bytes / 1e6 / read_time:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
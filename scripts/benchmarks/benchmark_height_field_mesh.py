@@ -0,0 +1,96 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the decimation of the height field meshes on the rough terrain.
+
+The script generates the rough terrain with and without merging the coplanar cells of the height field
+sub-terrains. It reports the number of vertices and faces of the terrain mesh, the generation time and
+the time to build the warp mesh (including its BVH) used by the ray-caster sensors.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_height_field_mesh.py --num_rows 10 --num_cols 20 --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the decimation of the height field meshes.")
+parser.add_argument("--num_rows", type=int, default=10, help="Number of rows of sub-terrains.")
+parser.add_argument("--num_cols", type=int, default=20, help="Number of columns of sub-terrains.")
+parser.add_argument("--num_trials", type=int, default=5, help="Number of trials to build the warp mesh.")
+parser.add_argument("--seed", type=int, default=0, help="Seed of the terrain generator.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import time
+
+import warp as wp
+
+from isaaclab.terrains import HfTerrainBaseCfg, TerrainGenerator
+from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG
+from isaaclab.utils.warp import convert_to_warp_mesh
+
+
+def main():
+    """Generate the terrain with and without decimation."""
+    device = args_cli.device
+    print(f"[INFO]: Generating {args_cli.num_rows} x {args_cli.num_cols} sub-terrains. BVH device: {device}")
+    print(f"{'decimate':>8} | {'vertices':>10} | {'faces':>10} | {'generation (s)':>14} | {'BVH build (ms)':>14}")
+    reference = None
+    for decimate in [False, True]:
+        cfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.num_rows = args_cli.num_rows
+        cfg.num_cols = args_cli.num_cols
+        cfg.seed = args_cli.seed
+        cfg.use_cache = False
+        for sub_terrain_cfg in cfg.sub_terrains.values():
+            if isinstance(sub_terrain_cfg, HfTerrainBaseCfg):
+                sub_terrain_cfg.decimate = decimate
+        # generate the terrain
+        start_time = time.perf_counter()
+        mesh = TerrainGenerator(cfg).terrain_mesh
+        generation_time = time.perf_counter() - start_time
+        # build the warp mesh
+        # note: the first build is excluded since it includes the initialization of warp
+        build_times = []
+        for _ in range(args_cli.num_trials + 1):
+            wp.synchronize_device(device)
+            start_time = time.perf_counter()
+            convert_to_warp_mesh(mesh.vertices, mesh.faces, device=device)
+            wp.synchronize_device(device)
+            build_times.append(time.perf_counter() - start_time)
+        build_time = 1000.0 * sum(build_times[1:]) / args_cli.num_trials
+        print(
+            f"{str(decimate):>8} | {len(mesh.vertices):>10} | {len(mesh.faces):>10} | {generation_time:>14.2f} |"
+            f" {build_time:>14.2f}"
+        )
+        if reference is None:
+            reference = (len(mesh.vertices), len(mesh.faces), build_time)
+        else:
+            print(
+                f"[INFO]: Reduction: vertices {reference[0] / len(mesh.vertices):.2f}x,"
+                f" faces {reference[1] / len(mesh.faces):.2f}x, BVH build {reference[2] / build_time:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,99 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the linear interpolation of lookup tables.
+
+The script interpolates the joint positions of all the environments, as done by the
+:class:`~isaaclab.actuators.RemotizedPDActuator` at every physics step. It compares the
+:class:`~isaaclab.utils.LinearInterpolation` against a reference implementation that finds the closest samples
+by comparing each query point with all the samples, for a single lookup table with non-uniform and uniform
+samples, and for a lookup table per joint and per environment.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_linear_interpolation.py --num_envs 4096 --device cuda:0
+
+"""
+
+import argparse
+import time
+import torch
+
+from isaaclab.utils import LinearInterpolation
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the linear interpolation of lookup tables.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--num_joints", type=int, default=12, help="Number of joints per environment.")
+parser.add_argument("--num_samples", type=int, nargs="+", default=[10, 100, 1000], help="Samples per lookup table.")
+parser.add_argument("--num_steps", type=int, default=200, help="Number of steps to run.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run the interpolation on.")
+args_cli = parser.parse_args()
+
+
+class ReferenceLinearInterpolation:
+    """Reference interpolation that compares each query point with all the samples of a single lookup table."""
+
+    def __init__(self, x: torch.Tensor, y: torch.Tensor):
+        self._x = x
+        self._y = y
+
+    def compute(self, q: torch.Tensor) -> torch.Tensor:
+        q_1d = q.view(-1)
+        num_smaller_elements = torch.sum(self._x.unsqueeze(1) < q_1d.unsqueeze(0), dim=0, dtype=torch.int)
+        lower_bound = torch.clamp(num_smaller_elements - 1, min=0)
+        upper_bound = torch.clamp(num_smaller_elements, max=self._x.numel() - 1)
+        weight = (q_1d - self._x[lower_bound]) / (self._x[upper_bound] - self._x[lower_bound])
+        weight[upper_bound == lower_bound] = 0.0
+        fq = self._y[lower_bound] + weight * (self._y[upper_bound] - self._y[lower_bound])
+        return fq.view(q.shape)
+
+
+def run(interpolation) -> float:
+    """Interpolate random joint positions and return the time per step in milliseconds."""
+    queries = 4.0 * torch.rand(args_cli.num_steps, args_cli.num_envs, args_cli.num_joints, device=args_cli.device)
+    queries -= 2.0
+    interpolation.compute(queries[0])
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start_time = time.perf_counter()
+    for step in range(args_cli.num_steps):
+        interpolation.compute(queries[step])
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return 1000.0 * (time.perf_counter() - start_time) / args_cli.num_steps
+
+
+def main():
+    """Run the benchmark for all the numbers of samples."""
+    device = args_cli.device
+    num_envs, num_joints = args_cli.num_envs, args_cli.num_joints
+    print(f"[INFO]: Interpolating {num_envs} x {num_joints} joint positions on device: {device}")
+    print(
+        f"{'num_samples':>11} | {'reference (ms)':>14} | {'single (ms)':>11} | {'uniform (ms)':>12} |"
+        f" {'per-joint (ms)':>14} | {'per-env (ms)':>12}"
+    )
+    for num_samples in args_cli.num_samples:
+        # create non-uniform samples of a torque-speed like curve
+        x = torch.sort(4.0 * torch.rand(num_samples, device=device) - 2.0).values
+        y = 1.0 - x.abs() / 2.0
+        x_uniform = torch.linspace(-2.0, 2.0, num_samples, device=device)
+        # create randomized curves per joint and per environment
+        x_joints = x.repeat(num_joints, 1) * (1.0 + 0.1 * torch.rand(num_joints, 1, device=device))
+        x_envs = x.repeat(num_envs, num_joints, 1) * (1.0 + 0.1 * torch.rand(num_envs, num_joints, 1, device=device))
+
+        reference_time = run(ReferenceLinearInterpolation(x, y))
+        single_time = run(LinearInterpolation(x, y, device=device, uniform=False))
+        uniform_time = run(LinearInterpolation(x_uniform, y, device=device, uniform=True))
+        joints_time = run(LinearInterpolation(x_joints, y.expand_as(x_joints), device=device, uniform=False))
+        envs_time = run(LinearInterpolation(x_envs, y.expand_as(x_envs), device=device, uniform=False))
+        print(
+            f"{num_samples:>11} | {reference_time:>14.3f} | {single_time:>11.3f} | {uniform_time:>12.3f} |"
+            f" {joints_time:>14.3f} | {envs_time:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the noise of the observation terms pre-sampled in blocks.
+
+The script corrupts the observation terms of a locomotion policy, as done by the
+:class:`~isaaclab.managers.ObservationManager` at every step. It compares the noise functions of each term against
+the :class:`~isaaclab.utils.noise.BlockNoiseSampler` with the torch and the counter-based random number generators.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_noise_sampler.py --num_envs 4096 --device cuda:0
+
+"""
+
+import argparse
+import time
+import torch
+
+from isaaclab.utils.noise import BlockNoiseSampler, GaussianNoiseCfg, UniformNoiseCfg
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the noise of the observation terms pre-sampled in blocks.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--block_length", type=int, default=32, help="Number of steps of noise sampled at once.")
+parser.add_argument("--num_steps", type=int, default=200, help="Number of steps to run.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to sample the noise on.")
+args_cli = parser.parse_args()
+
+# noise and dimension of the terms of a locomotion policy
+TERMS = [
+    (UniformNoiseCfg(n_min=-0.1, n_max=0.1), 3),  # base linear velocity
+    (UniformNoiseCfg(n_min=-0.2, n_max=0.2), 3),  # base angular velocity
+    (UniformNoiseCfg(n_min=-0.05, n_max=0.05), 3),  # projected gravity
+    (UniformNoiseCfg(n_min=-0.01, n_max=0.01), 12),  # joint positions
+    (UniformNoiseCfg(n_min=-1.5, n_max=1.5), 12),  # joint velocities
+    (GaussianNoiseCfg(std=0.01), 187),  # height scan
+]
+
+
+def run(apply_noise, step=None) -> float:
+    """Corrupt the terms at every step and return the time per step in milliseconds."""
+    data = [torch.rand(args_cli.num_envs, dim, device=args_cli.device) for _, dim in TERMS]
+
+    def corrupt():
+        if step is not None:
+            step()
+        return [apply_noise(term_id, term_data) for term_id, term_data in enumerate(data)]
+
+    corrupt()
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        corrupt()
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return 1000.0 * (time.perf_counter() - start_time) / args_cli.num_steps
+
+
+def main():
+    """Run the benchmark for the noise functions and the block noise sampler."""
+    num_dims = sum(dim for _, dim in TERMS)
+    print(f"[INFO]: Corrupting {args_cli.num_envs} x {num_dims} observations on device: {args_cli.device}")
+    functions_time = run(lambda term_id, data: TERMS[term_id][0].func(data, TERMS[term_id][0]))
+    print(f"noise functions: {functions_time:.3f} ms")
+    for seed in (None, 0):
+        sampler = BlockNoiseSampler(args_cli.num_envs, args_cli.device, args_cli.block_length, seed=seed)
+        for noise_cfg, dim in TERMS:
+            sampler.register(noise_cfg, shape=(dim,))
+        sampler_time = run(sampler.apply, sampler.step)
+        rng_name = "torch" if seed is None else "counter-based"
+        print(f"block noise sampler ({rng_name}): {sampler_time:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the ray-casting against multiple meshes.
+
+The script ray-casts a height scan of each environment against a terrain and a varying number of obstacle
+meshes. Each obstacle mesh combines one obstacle per environment, as for a regex mesh prim path in the
+:class:`~isaaclab.sensors.RayCaster`. It reports the ray-casting rate of the function
+:func:`~isaaclab.utils.warp.raycast_meshes` and of the :class:`~isaaclab.utils.warp.RaycastEngine` used by the
+sensor, and the time to refit the BVH of the obstacle meshes after moving the obstacles compared to rebuilding
+the meshes.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_ray_caster_meshes.py --num_envs 256 --num_meshes 1 2 4 8
+
+"""
+
+import argparse
+import numpy as np
+import time
+import torch
+import trimesh
+
+import warp as wp
+
+from isaaclab.utils.warp import RaycastEngine, convert_to_warp_mesh, raycast_meshes, refit_mesh
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the ray-casting against multiple meshes.")
+parser.add_argument("--num_envs", type=int, default=256, help="Number of environments.")
+parser.add_argument("--num_meshes", type=int, nargs="+", default=[1, 2, 4, 8], help="Numbers of meshes to test.")
+parser.add_argument("--num_rays", type=int, default=187, help="Number of rays per environment.")
+parser.add_argument("--num_steps", type=int, default=20, help="Number of steps to run.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to ray-cast on.")
+args_cli = parser.parse_args()
+
+
+def create_terrain(size: float, resolution: float) -> trimesh.Trimesh:
+    """Create a rough terrain mesh of the given size."""
+    num_points = int(size / resolution) + 1
+    heights = np.random.uniform(0.0, 0.1, (num_points, num_points))
+    xx, yy = np.meshgrid(np.linspace(0.0, size, num_points), np.linspace(0.0, size, num_points), indexing="ij")
+    vertices = np.stack([xx, yy, heights], axis=-1).reshape(-1, 3)
+    ids = np.arange(num_points * num_points).reshape(num_points, num_points)
+    quads = np.stack([ids[:-1, :-1], ids[1:, :-1], ids[1:, 1:], ids[:-1, 1:]], axis=-1).reshape(-1, 4)
+    faces = np.concatenate([quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]])
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+
+def main():
+    """Ray-cast against the terrain and the obstacle meshes."""
+    device = args_cli.device
+    # place the environments on a grid
+    num_rows = int(np.ceil(np.sqrt(args_cli.num_envs)))
+    env_origins = np.stack(np.unravel_index(np.arange(args_cli.num_envs), (num_rows, num_rows)), axis=-1) * 4.0 + 2.0
+    terrain = create_terrain(size=num_rows * 4.0, resolution=0.1)
+    # create the rays of a height scan in each environment
+    num_rays_side = int(np.sqrt(args_cli.num_rays))
+    scan = np.stack(np.meshgrid(*[np.linspace(-0.8, 0.8, num_rays_side)] * 2, indexing="ij"), axis=-1).reshape(-1, 2)
+    ray_starts = torch.zeros(args_cli.num_envs, len(scan), 3, device=device)
+    ray_starts[..., :2] = torch.tensor(env_origins[:, None] + scan[None], dtype=torch.float, device=device)
+    ray_starts[..., 2] = 20.0
+    ray_directions = torch.zeros_like(ray_starts)
+    ray_directions[..., 2] = -1.0
+    num_rays = ray_starts.shape[0] * ray_starts.shape[1]
+
+    print(f"[INFO]: Ray-casting {num_rays} rays against the terrain ({len(terrain.faces)} faces) on {device}")
+    print(f"{'num_meshes':>10} | {'rays/s (M)':>10} | {'engine (M)':>10} | {'refit (ms)':>10} | {'rebuild (ms)':>12}")
+    for num_meshes in args_cli.num_meshes:
+        # create the obstacle meshes with one obstacle per environment
+        meshes = [convert_to_warp_mesh(terrain.vertices, terrain.faces, device=device)]
+        obstacle = trimesh.creation.icosphere(subdivisions=2, radius=0.2)
+        obstacles = []
+        for _ in range(num_meshes - 1):
+            positions = np.zeros((args_cli.num_envs, 3))
+            positions[:, :2] = env_origins + np.random.uniform(-1.0, 1.0, (args_cli.num_envs, 2))
+            positions[:, 2] = 0.5
+            mesh = trimesh.util.concatenate([obstacle.copy().apply_translation(position) for position in positions])
+            local_points = wp.array(np.tile(obstacle.vertices, (args_cli.num_envs, 1)), dtype=wp.vec3, device=device)
+            instance_ids = np.repeat(np.arange(args_cli.num_envs, dtype=np.int32), len(obstacle.vertices))
+            instance_ids = wp.array(instance_ids, dtype=wp.int32, device=device)
+            meshes.append(convert_to_warp_mesh(mesh.vertices, mesh.faces, device=device))
+            obstacles.append((mesh, local_points, instance_ids, torch.tensor(positions, dtype=torch.float)))
+
+        # ray-cast against all the meshes
+        raycast_meshes(ray_starts, ray_directions, meshes)
+        start_time = time.perf_counter()
+        for _ in range(args_cli.num_steps):
+            raycast_meshes(ray_starts, ray_directions, meshes)
+        wp.synchronize_device(device)
+        raycast_time = (time.perf_counter() - start_time) / args_cli.num_steps
+
+        # ray-cast against all the meshes with the persistent buffers of the engine
+        engine = RaycastEngine(meshes, num_envs=args_cli.num_envs, num_rays=ray_starts.shape[1])
+        engine.ray_starts[:] = ray_starts
+        engine.ray_directions[:] = ray_directions
+        engine.raycast()
+        wp.synchronize_device(device)
+        start_time = time.perf_counter()
+        for _ in range(args_cli.num_steps):
+            engine.raycast()
+        wp.synchronize_device(device)
+        engine_time = (time.perf_counter() - start_time) / args_cli.num_steps
+
+        # move the obstacles and refit or rebuild their meshes
+        refit_time, rebuild_time = 0.0, 0.0
+        orientations = torch.zeros(args_cli.num_envs, 4)
+        orientations[:, 0] = 1.0
+        for _ in range(args_cli.num_steps):
+            for wp_mesh, (mesh, local_points, instance_ids, positions) in zip(meshes[1:], obstacles):
+                positions[:, :2] += torch.empty(args_cli.num_envs, 2).uniform_(-0.01, 0.01)
+                wp.synchronize_device(device)
+                start_time = time.perf_counter()
+                refit_mesh(wp_mesh, local_points, instance_ids, positions, orientations)
+                wp.synchronize_device(device)
+                refit_time += time.perf_counter() - start_time
+                start_time = time.perf_counter()
+                convert_to_warp_mesh(wp_mesh.points.numpy(), mesh.faces, device=device)
+                wp.synchronize_device(device)
+                rebuild_time += time.perf_counter() - start_time
+        refit_time *= 1000.0 / args_cli.num_steps
+        rebuild_time *= 1000.0 / args_cli.num_steps
+
+        print(
+            f"{num_meshes:>10} | {num_rays / raycast_time / 1e6:>10.2f} | {num_rays / engine_time / 1e6:>10.2f} |"
+            f" {refit_time:>10.2f} | {rebuild_time:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,75 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the generation time of the rough terrain for different numbers of workers.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_terrain_generator.py --num_rows 20 --num_cols 20 \\
+        --num_workers 1 2 4 8 --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the terrain generation for different numbers of workers.")
+parser.add_argument("--num_rows", type=int, default=20, help="Number of rows of sub-terrains.")
+parser.add_argument("--num_cols", type=int, default=20, help="Number of columns of sub-terrains.")
+parser.add_argument("--num_workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Numbers of workers to test.")
+parser.add_argument("--curriculum", action="store_true", default=False, help="Generate the terrain with curriculum.")
+parser.add_argument("--seed", type=int, default=0, help="Seed of the terrain generator.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import hashlib
+import time
+
+from isaaclab.terrains import TerrainGenerator
+from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG
+
+
+def main():
+    """Generate the terrain for all the numbers of workers."""
+    print(f"[INFO]: Generating {args_cli.num_rows} x {args_cli.num_cols} sub-terrains")
+    print(f"{'num_workers':>11} | {'time (s)':>9} | {'speedup':>8} | {'mesh hash':>16}")
+    reference_time = None
+    for num_workers in args_cli.num_workers:
+        cfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.num_rows = args_cli.num_rows
+        cfg.num_cols = args_cli.num_cols
+        cfg.curriculum = args_cli.curriculum
+        cfg.seed = args_cli.seed
+        cfg.use_cache = False
+        cfg.num_workers = num_workers
+        # generate the terrain
+        start_time = time.perf_counter()
+        terrain_generator = TerrainGenerator(cfg)
+        elapsed_time = time.perf_counter() - start_time
+        if reference_time is None:
+            reference_time = elapsed_time
+        # hash the mesh to check that it does not depend on the number of workers
+        mesh = terrain_generator.terrain_mesh
+        mesh_hash = hashlib.md5(mesh.vertices.tobytes() + mesh.faces.tobytes()).hexdigest()[:16]
+        print(f"{num_workers:>11} | {elapsed_time:>9.2f} | {reference_time / elapsed_time:>7.2f}x | {mesh_hash:>16}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
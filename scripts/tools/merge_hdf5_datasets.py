@@ -3,9 +3,17 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+"""Script to merge a set of HDF5 datasets.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/tools/merge_hdf5_datasets.py --input_files a.hdf5 b.hdf5 --output_file merged.hdf5
+
+"""
+
 import argparse
-import h5py
-import os
+
+from isaaclab.utils.datasets import merge_hdf5_datasets
 
 parser = argparse.ArgumentParser(description="Merge a set of HDF5 datasets.")
 parser.add_argument(
@@ -16,30 +24,23 @@ parser.add_argument(
     help="A list of paths to HDF5 files to merge.",
 )
 parser.add_argument("--output_file", type=str, default="merged_dataset.hdf5", help="File path to merged output.")
+parser.add_argument(
+    "--mode",
+    type=str,
+    choices=["copy", "external_link", "virtual"],
+    default="copy",
+    help=(
+        "How to merge the episodes: copy the data, or link to the input files with external links or virtual"
+        " datasets without copying the data."
+    ),
+)
 
 args_cli = parser.parse_args()
 
 
 def merge_datasets():
-    for filepath in args_cli.input_files:
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"The dataset file {filepath} does not exist.")
-
-    with h5py.File(args_cli.output_file, "w") as output:
-        episode_idx = 0
-        copy_attributes = True
-
-        for filepath in args_cli.input_files:
-
-            with h5py.File(filepath, "r") as input:
-                for episode, data in input["data"].items():
-                    input.copy(f"data/{episode}", output, f"data/demo_{episode_idx}")
-                    episode_idx += 1
-
-                if copy_attributes:
-                    output["data"].attrs["env_args"] = input["data"].attrs["env_args"]
-                    copy_attributes = False
-
+    summary = merge_hdf5_datasets(args_cli.input_files, args_cli.output_file, args_cli.mode)
+    print(summary)
     print(f"Merged dataset saved to {args_cli.output_file}")
 
 
@@ -109,7 +109,9 @@ def main():
     dataset_file_handler = HDF5DatasetFileHandler()
     dataset_file_handler.open(args_cli.dataset_file)
     env_name = dataset_file_handler.get_env_name()
-    episode_count = dataset_file_handler.get_num_episodes()
+    # look up the names and lengths of the episodes in the index instead of opening their groups
+    episode_index = dataset_file_handler.get_episode_index()
+    episode_count = len(episode_index)
 
     if episode_count == 0:
         print("No episodes found in the dataset.")
@@ -147,12 +149,16 @@ def main():
     elif args_cli.validate_states and num_envs > 1:
         print("Warning: State validation is only supported with a single environment. Skipping state validation.")
 
+    # only load the parts of the episodes needed for the replay
+    episode_keys = ["initial_state", "actions"]
+    if state_validation_enabled:
+        episode_keys.append("states")
+
     # reset before starting
     env.reset()
     teleop_interface.reset()
 
     # simulate environment -- run everything in inference mode
-    episode_names = list(dataset_file_handler.get_episode_names())
     replayed_episode_count = 0
     with contextlib.suppress(KeyboardInterrupt) and torch.inference_mode():
         while simulation_app.is_running() and not simulation_app.is_exiting():
@@ -175,9 +181,12 @@ def main():
 
                         if next_episode_index is not None:
                             replayed_episode_count += 1
-                            print(f"{replayed_episode_count :4}: Loading #{next_episode_index} episode to env_{env_id}")
+                            print(
+                                f"{replayed_episode_count :4}: Loading #{next_episode_index} episode"
+                                f" ({episode_index.num_samples[next_episode_index]} steps) to env_{env_id}"
+                            )
                             episode_data = dataset_file_handler.load_episode(
-                                episode_names[next_episode_index], env.device
+                                episode_index.names[next_episode_index], env.device, keys=episode_keys
                             )
                             env_episode_data_map[env_id] = episode_data
                             # Set initial state for the new episode
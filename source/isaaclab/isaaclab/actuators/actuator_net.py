@@ -10,22 +10,51 @@ Currently, the following models are supported:
 * Multi-Layer Perceptron (MLP)
 * Long Short-Term Memory (LSTM)
 
+The networks are loaded once per file content and device, and shared by all the actuator models that use them.
+The inference of several actuator models that share the same network can be batched with an
+:class:`ActuatorNetGroup`.
 """
 
 from __future__ import annotations
 
+import hashlib
 import torch
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING
 
 from isaaclab.utils.assets import read_file
+from isaaclab.utils.buffers import JointHistoryBuffer
 from isaaclab.utils.types import ArticulationActions
 
 from .actuator_pd import DCMotor
 
 if TYPE_CHECKING:
+    from .actuator_base import ActuatorBase
     from .actuator_cfg import ActuatorNetLSTMCfg, ActuatorNetMLPCfg
 
+_NETWORK_CACHE: dict[tuple[str, str], torch.jit.ScriptModule] = dict()
+"""The loaded networks, indexed by the hash of their file content and their device."""
+
+
+def _load_network(network_file: str, device: str) -> torch.jit.ScriptModule:
+    """Loads the TorchScript network of an actuator model.
+
+    The networks are cached by the hash of their file content and their device, so that the actuator models of
+    all the articulations of a process that use the same network file share a single network.
+
+    Args:
+        network_file: The path to the file containing the network.
+        device: The device to load the network on.
+
+    Returns:
+        The network in evaluation mode.
+    """
+    file_bytes = read_file(network_file)
+    key = (hashlib.sha256(file_bytes.getbuffer()).hexdigest(), str(device))
+    if key not in _NETWORK_CACHE:
+        _NETWORK_CACHE[key] = torch.jit.load(file_bytes, map_location=device).eval()
+    return _NETWORK_CACHE[key]
+
 
 class ActuatorNetLSTM(DCMotor):
     """Actuator model based on recurrent neural network (LSTM).
@@ -37,6 +66,9 @@ class ActuatorNetLSTM(DCMotor):
 
     Note:
         Only the desired joint positions are used as inputs to the network.
+
+    Note:
+        The network is shared by all the actuator models that load the same network file on the same device.
     """
 
     cfg: ActuatorNetLSTMCfg
@@ -46,22 +78,17 @@ class ActuatorNetLSTM(DCMotor):
         super().__init__(cfg, *args, **kwargs)
 
         # load the model from JIT file
-        file_bytes = read_file(self.cfg.network_file)
-        self.network = torch.jit.load(file_bytes, map_location=self._device).eval()
+        self.network = _load_network(self.cfg.network_file, self._device)
 
         # extract number of lstm layers and hidden dim from the shape of weights
         num_layers = len(self.network.lstm.state_dict()) // 4
         hidden_dim = self.network.lstm.state_dict()["weight_hh_l0"].shape[1]
         # create buffers for storing LSTM inputs
-        self.sea_input = torch.zeros(self._num_envs * self.num_joints, 1, 2, device=self._device)
-        self.sea_hidden_state = torch.zeros(
-            num_layers, self._num_envs * self.num_joints, hidden_dim, device=self._device
+        self._set_network_buffers(
+            torch.zeros(self._num_envs * self.num_joints, 1, 2, device=self._device),
+            torch.zeros(num_layers, self._num_envs * self.num_joints, hidden_dim, device=self._device),
+            torch.zeros(num_layers, self._num_envs * self.num_joints, hidden_dim, device=self._device),
         )
-        self.sea_cell_state = torch.zeros(num_layers, self._num_envs * self.num_joints, hidden_dim, device=self._device)
-        # reshape via views (doesn't change the actual memory layout)
-        layer_shape_per_env = (num_layers, self._num_envs, self.num_joints, hidden_dim)
-        self.sea_hidden_state_per_env = self.sea_hidden_state.view(layer_shape_per_env)
-        self.sea_cell_state_per_env = self.sea_cell_state.view(layer_shape_per_env)
 
     """
     Operations.
@@ -77,16 +104,51 @@ class ActuatorNetLSTM(DCMotor):
         self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
     ) -> ArticulationActions:
         # compute network inputs
-        self.sea_input[:, 0, 0] = (control_action.joint_positions - joint_pos).flatten()
-        self.sea_input[:, 0, 1] = joint_vel.flatten()
-        # save current joint vel for dc-motor clipping
-        self._joint_vel[:] = joint_vel
+        self._update_network_input(control_action, joint_pos, joint_vel)
 
         # run network inference
         with torch.inference_mode():
             torques, (self.sea_hidden_state[:], self.sea_cell_state[:]) = self.network(
                 self.sea_input, (self.sea_hidden_state, self.sea_cell_state)
             )
+        return self._process_network_output(torques, control_action)
+
+    """
+    Internal helpers.
+    """
+
+    def _set_network_buffers(self, sea_input: torch.Tensor, hidden_state: torch.Tensor, cell_state: torch.Tensor):
+        """Sets the buffers of the network inputs and of the LSTM states.
+
+        The buffers can be slices of the buffers of an :class:`ActuatorNetGroup`, which runs the network of
+        several actuator models at once.
+
+        Args:
+            sea_input: The buffer of the network inputs. Shape is (num_envs * num_joints, 1, 2).
+            hidden_state: The buffer of the hidden states. Shape is (num_layers, num_envs * num_joints, hidden_dim).
+            cell_state: The buffer of the cell states. Shape is (num_layers, num_envs * num_joints, hidden_dim).
+        """
+        self.sea_input = sea_input
+        self.sea_hidden_state = hidden_state
+        self.sea_cell_state = cell_state
+        # reshape via views (doesn't change the actual memory layout)
+        layer_shape_per_env = (hidden_state.shape[0], self._num_envs, self.num_joints, hidden_state.shape[2])
+        self.sea_hidden_state_per_env = self.sea_hidden_state.view(layer_shape_per_env)
+        self.sea_cell_state_per_env = self.sea_cell_state.view(layer_shape_per_env)
+
+    def _update_network_input(
+        self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
+    ):
+        """Writes the network inputs of the current step into :attr:`sea_input`."""
+        self.sea_input[:, 0, 0] = (control_action.joint_positions - joint_pos).flatten()
+        self.sea_input[:, 0, 1] = joint_vel.flatten()
+        # save current joint vel for dc-motor clipping
+        self._joint_vel[:] = joint_vel
+
+    def _process_network_output(
+        self, torques: torch.Tensor, control_action: ArticulationActions
+    ) -> ArticulationActions:
+        """Computes the joint efforts from the network outputs. Shape of the outputs is (num_envs * num_joints, 1)."""
         self.computed_effort = torques.reshape(self._num_envs, self.num_joints)
 
         # clip the computed effort based on the motor limits
@@ -113,9 +175,15 @@ class ActuatorNetMLP(DCMotor):
     and velocities which are used to provide input to the neural network. The model is loaded
     as a TorchScript.
 
+    The scaled joint position errors and velocities are stored in a :class:`~isaaclab.utils.buffers.JointHistoryBuffer`
+    in the input order of the network, so that the network input is read from the history with a single gather.
+
     Note:
         Only the desired joint positions are used as inputs to the network.
 
+    Note:
+        The network is shared by all the actuator models that load the same network file on the same device.
+
     """
 
     cfg: ActuatorNetMLPCfg
@@ -125,15 +193,18 @@ class ActuatorNetMLP(DCMotor):
         super().__init__(cfg, *args, **kwargs)
 
         # load the model from JIT file
-        file_bytes = read_file(self.cfg.network_file)
-        self.network = torch.jit.load(file_bytes, map_location=self._device).eval()
+        self.network = _load_network(self.cfg.network_file, self._device)
 
+        # check the order of the inputs
+        if self.cfg.input_order not in ("pos_vel", "vel_pos"):
+            raise ValueError(
+                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
+            )
         # create buffers for MLP history
+        # note: the joint position errors and velocities are stored as two channels in the input order
         history_length = max(self.cfg.input_idx) + 1
-        self._joint_pos_error_history = torch.zeros(
-            self._num_envs, history_length, self.num_joints, device=self._device
-        )
-        self._joint_vel_history = torch.zeros(self._num_envs, history_length, self.num_joints, device=self._device)
+        self._history = JointHistoryBuffer(history_length, self._num_envs, self.num_joints, 2, device=self._device)
+        self._history_input_index = self._history.create_lags_index(self.cfg.input_idx)
 
     """
     Operations.
@@ -141,42 +212,48 @@ class ActuatorNetMLP(DCMotor):
 
     def reset(self, env_ids: Sequence[int]):
         # reset the history for the specified environments
-        self._joint_pos_error_history[env_ids] = 0.0
-        self._joint_vel_history[env_ids] = 0.0
+        self._history.reset(env_ids)
 
     def compute(
         self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
     ) -> ArticulationActions:
-        # move history queue by 1 and update top of history
+        # compute network inputs
+        network_input = self._compute_network_input(control_action, joint_pos, joint_vel)
+
+        # run network inference
+        with torch.inference_mode():
+            torques = self.network(network_input)
+        return self._process_network_output(torques, control_action)
+
+    """
+    Internal helpers.
+    """
+
+    def _compute_network_input(
+        self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
+    ) -> torch.Tensor:
+        """Updates the history and returns the network inputs. Shape is (num_envs * num_joints, input_dim)."""
+        # update top of history with the scaled inputs
         # -- positions
-        self._joint_pos_error_history = self._joint_pos_error_history.roll(1, 1)
-        self._joint_pos_error_history[:, 0] = control_action.joint_positions - joint_pos
+        pos_input = (control_action.joint_positions - joint_pos).mul_(self.cfg.pos_scale)
         # -- velocity
-        self._joint_vel_history = self._joint_vel_history.roll(1, 1)
-        self._joint_vel_history[:, 0] = joint_vel
+        vel_input = joint_vel * self.cfg.vel_scale
+        if self.cfg.input_order == "pos_vel":
+            self._history.append((pos_input, vel_input))
+        else:
+            self._history.append((vel_input, pos_input))
         # save current joint vel for dc-motor clipping
         self._joint_vel[:] = joint_vel
 
         # compute network inputs
-        # -- positions
-        pos_input = torch.cat([self._joint_pos_error_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        pos_input = pos_input.view(self._num_envs * self.num_joints, -1)
-        # -- velocity
-        vel_input = torch.cat([self._joint_vel_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        vel_input = vel_input.view(self._num_envs * self.num_joints, -1)
-        # -- scale and concatenate inputs
-        if self.cfg.input_order == "pos_vel":
-            network_input = torch.cat([pos_input * self.cfg.pos_scale, vel_input * self.cfg.vel_scale], dim=1)
-        elif self.cfg.input_order == "vel_pos":
-            network_input = torch.cat([vel_input * self.cfg.vel_scale, pos_input * self.cfg.pos_scale], dim=1)
-        else:
-            raise ValueError(
-                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
-            )
+        # note: the history is read as (num_envs, num_joints, 2, len(input_idx)) in the input order of the network
+        network_input = self._history.read_lags(self._history_input_index)
+        return network_input.reshape(self._num_envs * self.num_joints, -1)
 
-        # run network inference
-        with torch.inference_mode():
-            torques = self.network(network_input).view(self._num_envs, self.num_joints)
+    def _process_network_output(
+        self, torques: torch.Tensor, control_action: ArticulationActions
+    ) -> ArticulationActions:
+        """Computes the joint efforts from the network outputs. Shape of the outputs is (num_envs * num_joints, 1)."""
         self.computed_effort = torques.view(self._num_envs, self.num_joints) * self.cfg.torque_scale
 
         # clip the computed effort based on the motor limits
@@ -187,3 +264,138 @@ class ActuatorNetMLP(DCMotor):
         control_action.joint_positions = None
         control_action.joint_velocities = None
         return control_action
+
+
+class ActuatorNetGroup:
+    """Runs the network inference of several actuator models that share the same network in a single batch.
+
+    Robots often have several actuator groups that use the same actuator network, for instance one group per leg.
+    Instead of running a small inference per actuator model, the group concatenates the network inputs of all its
+    actuator models, runs the network once, and splits the network outputs back to the actuator models. For the
+    LSTM actuator models, the network inputs and the LSTM states of the actuator models are slices of buffers of
+    the group, so that no data is concatenated at every step.
+
+    The groups are created with :meth:`from_actuators` and used by the :class:`~isaaclab.assets.Articulation`
+    class in place of the :meth:`~isaaclab.actuators.ActuatorBase.compute` method of the actuator models when
+    simulating on the GPU, where batching saves kernel launches. On the CPU, the larger batch is usually slower.
+    """
+
+    def __init__(self, actuators: Sequence[ActuatorNetMLP] | Sequence[ActuatorNetLSTM]):
+        """Initializes the group.
+
+        Args:
+            actuators: The actuator models of the group.
+
+        Raises:
+            ValueError: If the actuator models do not have the same type and network.
+        """
+        if len(actuators) == 0:
+            raise ValueError("An actuator network group requires at least one actuator model.")
+        if any(type(actuator) is not type(actuators[0]) for actuator in actuators):
+            raise ValueError("The actuator models of an actuator network group must have the same type.")
+        if any(actuator.network is not actuators[0].network for actuator in actuators):
+            raise ValueError("The actuator models of an actuator network group must share the same network.")
+        self._actuators = list(actuators)
+        self._network = actuators[0].network
+        # number of network inputs of each actuator model
+        self._num_rows = [actuator._num_envs * actuator.num_joints for actuator in actuators]
+
+        # allocate the buffers of the LSTM inputs and states, and share their slices with the actuator models
+        if isinstance(actuators[0], ActuatorNetLSTM):
+            self._sea_input = torch.cat([actuator.sea_input for actuator in actuators])
+            self._sea_hidden_state = torch.cat([actuator.sea_hidden_state for actuator in actuators], dim=1)
+            self._sea_cell_state = torch.cat([actuator.sea_cell_state for actuator in actuators], dim=1)
+            start = 0
+            for actuator, num_rows in zip(actuators, self._num_rows):
+                rows = slice(start, start + num_rows)
+                actuator._set_network_buffers(
+                    self._sea_input[rows], self._sea_hidden_state[:, rows], self._sea_cell_state[:, rows]
+                )
+                start += num_rows
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the group."""
+        return (
+            f"<ActuatorNetGroup> of {len(self._actuators)} '{type(self._actuators[0]).__name__}' actuator models"
+            f" with {sum(self._num_rows)} network inputs"
+        )
+
+    """
+    Properties.
+    """
+
+    @property
+    def actuators(self) -> list[ActuatorNetMLP] | list[ActuatorNetLSTM]:
+        """The actuator models of the group."""
+        return self._actuators
+
+    @property
+    def network(self) -> torch.jit.ScriptModule:
+        """The network shared by the actuator models of the group."""
+        return self._network
+
+    """
+    Operations.
+    """
+
+    @staticmethod
+    def from_actuators(actuators: Iterable[ActuatorBase]) -> list[ActuatorNetGroup]:
+        """Groups the actuator models that share the same network.
+
+        Only the :class:`ActuatorNetMLP` and :class:`ActuatorNetLSTM` actuator models that do not override
+        their :meth:`compute` method are grouped, and only the groups of at least two actuator models are created.
+
+        Args:
+            actuators: The actuator models to group.
+
+        Returns:
+            The groups of actuator models that share the same network.
+        """
+        groups: dict[tuple[type, int], list[ActuatorBase]] = dict()
+        for actuator in actuators:
+            if type(actuator).compute in (ActuatorNetMLP.compute, ActuatorNetLSTM.compute):
+                groups.setdefault((type(actuator), id(actuator.network)), []).append(actuator)
+        return [ActuatorNetGroup(group) for group in groups.values() if len(group) > 1]
+
+    def compute(
+        self,
+        control_actions: Sequence[ArticulationActions],
+        joint_pos: Sequence[torch.Tensor],
+        joint_vel: Sequence[torch.Tensor],
+    ) -> list[ArticulationActions]:
+        """Computes the joint efforts of all the actuator models of the group.
+
+        This is equivalent to calling the :meth:`~isaaclab.actuators.ActuatorBase.compute` method of each
+        actuator model, with a single network inference.
+
+        Args:
+            control_actions: The joint commands of each actuator model.
+            joint_pos: The current joint positions of the joints of each actuator model.
+            joint_vel: The current joint velocities of the joints of each actuator model.
+
+        Returns:
+            The joint commands of each actuator model, with the computed joint efforts.
+        """
+        actuator_inputs = list(zip(self._actuators, control_actions, joint_pos, joint_vel))
+        # run network inference
+        if isinstance(self._actuators[0], ActuatorNetLSTM):
+            for actuator, control_action, actuator_joint_pos, actuator_joint_vel in actuator_inputs:
+                actuator._update_network_input(control_action, actuator_joint_pos, actuator_joint_vel)
+            with torch.inference_mode():
+                torques, (self._sea_hidden_state[:], self._sea_cell_state[:]) = self._network(
+                    self._sea_input, (self._sea_hidden_state, self._sea_cell_state)
+                )
+        else:
+            network_input = torch.cat([
+                actuator._compute_network_input(control_action, actuator_joint_pos, actuator_joint_vel)
+                for actuator, control_action, actuator_joint_pos, actuator_joint_vel in actuator_inputs
+            ])
+            with torch.inference_mode():
+                torques = self._network(network_input)
+        # split the network outputs of the actuator models
+        return [
+            actuator._process_network_output(actuator_torques, control_action)
+            for actuator, control_action, actuator_torques in zip(
+                self._actuators, control_actions, torques.split(self._num_rows)
+            )
+        ]
@@ -9,7 +9,7 @@ import torch
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
-from isaaclab.utils import DelayBuffer, LinearInterpolation
+from isaaclab.utils import JointHistoryBuffer, LinearInterpolation
 from isaaclab.utils.types import ArticulationActions
 
 from .actuator_base import ActuatorBase
@@ -244,6 +244,9 @@ class DelayedPDActuator(IdealPDActuator):
     The amount of time lag is configurable and can be set to a random value between the minimum and maximum time
     lag bounds at every reset. The minimum and maximum time lag values are set in the configuration instance passed
     to the class.
+
+    The joint position, velocity and effort commands are stored as the channels of a single
+    :class:`~isaaclab.utils.buffers.JointHistoryBuffer`, so that all the commands are delayed with a single gather.
     """
 
     cfg: DelayedPDActuatorCfg
@@ -251,10 +254,16 @@ class DelayedPDActuator(IdealPDActuator):
 
     def __init__(self, cfg: DelayedPDActuatorCfg, *args, **kwargs):
         super().__init__(cfg, *args, **kwargs)
-        # instantiate the delay buffers
-        self.positions_delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
-        self.velocities_delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
-        self.efforts_delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
+        # check that the delays are feasible
+        if cfg.min_delay < 0 or cfg.max_delay < cfg.min_delay:
+            raise ValueError(
+                f"Invalid delays for the delayed PD actuator: min_delay={cfg.min_delay}, max_delay={cfg.max_delay}."
+                " The delays must satisfy 0 <= min_delay <= max_delay."
+            )
+        # instantiate the delay buffer of the position, velocity and effort commands
+        self.delay_buffer = JointHistoryBuffer(cfg.max_delay + 1, self._num_envs, self.num_joints, 3, self._device)
+        # the time lag of each environment
+        self.time_lags = torch.zeros(self._num_envs, dtype=torch.long, device=self._device)
         # all of the envs
         self._ALL_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self._device)
 
@@ -266,29 +275,28 @@ class DelayedPDActuator(IdealPDActuator):
         else:
             num_envs = len(env_ids)
         # set a new random delay for environments in env_ids
-        time_lags = torch.randint(
+        # note: the delays are sampled within the bounds of the configuration, so they are not checked on the host
+        self.time_lags[env_ids] = torch.randint(
             low=self.cfg.min_delay,
             high=self.cfg.max_delay + 1,
             size=(num_envs,),
-            dtype=torch.int,
+            dtype=torch.long,
             device=self._device,
         )
-        # set delays
-        self.positions_delay_buffer.set_time_lag(time_lags, env_ids)
-        self.velocities_delay_buffer.set_time_lag(time_lags, env_ids)
-        self.efforts_delay_buffer.set_time_lag(time_lags, env_ids)
         # reset buffers
-        self.positions_delay_buffer.reset(env_ids)
-        self.velocities_delay_buffer.reset(env_ids)
-        self.efforts_delay_buffer.reset(env_ids)
+        self.delay_buffer.reset(env_ids)
 
     def compute(
         self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
     ) -> ArticulationActions:
         # apply delay based on the delay the model for all the setpoints
-        control_action.joint_positions = self.positions_delay_buffer.compute(control_action.joint_positions)
-        control_action.joint_velocities = self.velocities_delay_buffer.compute(control_action.joint_velocities)
-        control_action.joint_efforts = self.efforts_delay_buffer.compute(control_action.joint_efforts)
+        self.delay_buffer.append(
+            (control_action.joint_positions, control_action.joint_velocities, control_action.joint_efforts)
+        )
+        delayed_data = self.delay_buffer.read_lag(self.time_lags)
+        control_action.joint_positions = delayed_data[..., 0]
+        control_action.joint_velocities = delayed_data[..., 1]
+        control_action.joint_efforts = delayed_data[..., 2]
         # compte actuator model
         return super().compute(control_action, joint_pos, joint_vel)
 
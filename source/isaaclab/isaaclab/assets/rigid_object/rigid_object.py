@@ -209,6 +209,8 @@ class RigidObject(AssetBase):
         # convert root quaternion from wxyz to xyzw
         root_poses_xyzw = self._data.root_state_w[:, :7].clone()
         root_poses_xyzw[:, 3:] = math_utils.convert_quat(root_poses_xyzw[:, 3:], to="xyzw")
+        # invalidate the derived quantities of the root state
+        self._data._invalidate_derived_buffers()
         # set into simulation
         self.root_physx_view.set_transforms(root_poses_xyzw, indices=physx_env_ids)
 
@@ -233,6 +235,8 @@ class RigidObject(AssetBase):
         # convert root quaternion from wxyz to xyzw
         root_poses_xyzw = self._data.root_link_state_w[:, :7].clone()
         root_poses_xyzw[:, 3:] = math_utils.convert_quat(root_poses_xyzw[:, 3:], to="xyzw")
+        # invalidate the derived quantities of the root state
+        self._data._invalidate_derived_buffers()
         # set into simulation
         self.root_physx_view.set_transforms(root_poses_xyzw, indices=physx_env_ids)
 
@@ -284,6 +288,8 @@ class RigidObject(AssetBase):
         # set into internal buffers
         self._data.root_state_w[env_ids, 7:] = root_velocity.clone()
         self._data.body_acc_w[env_ids] = 0.0
+        # invalidate the derived quantities of the root state
+        self._data._invalidate_derived_buffers()
         # set into simulation
         self.root_physx_view.set_velocities(self._data.root_state_w[:, 7:], indices=physx_env_ids)
 
@@ -308,6 +314,8 @@ class RigidObject(AssetBase):
         self._data.root_com_state_w[env_ids, 7:] = root_velocity.clone()
         self._data.root_state_w[env_ids, 7:] = self._data.root_com_state_w[env_ids, 7:]
         self._data.body_acc_w[env_ids] = 0.0
+        # invalidate the derived quantities of the root state
+        self._data._invalidate_derived_buffers()
         # set into simulation
         self.root_physx_view.set_velocities(self._data.root_com_state_w[:, 7:], indices=physx_env_ids)
 
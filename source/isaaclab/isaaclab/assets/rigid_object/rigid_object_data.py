@@ -68,6 +68,19 @@ class RigidObjectData:
         self._root_com_state_w = TimestampedBuffer()
         self._body_acc_w = TimestampedBuffer()
 
+        # Initialize the lazy buffers of the derived quantities.
+        # note: these are computed at most once per simulation timestamp and invalidated when the root state is written
+        self._projected_gravity_b = TimestampedBuffer()
+        self._heading_w = TimestampedBuffer()
+        self._root_lin_vel_b = TimestampedBuffer()
+        self._root_ang_vel_b = TimestampedBuffer()
+        self._root_link_lin_vel_b = TimestampedBuffer()
+        self._root_link_ang_vel_b = TimestampedBuffer()
+        self._root_com_lin_vel_b = TimestampedBuffer()
+        self._root_com_ang_vel_b = TimestampedBuffer()
+        # Number of accesses of the derived quantities that reused the buffers
+        self._num_derived_cache_hits = 0
+
     def update(self, dt: float):
         """Updates the data for the rigid object.
 
@@ -77,6 +90,31 @@ class RigidObjectData:
         # update the simulation timestamp
         self._sim_timestamp += dt
 
+    @property
+    def num_derived_cache_hits(self) -> int:
+        """Number of accesses of the derived quantities that reused the values computed at the same timestamp.
+
+        The derived quantities, such as :attr:`projected_gravity_b`, :attr:`heading_w` and the root velocities in
+        the base frame, are computed at most once per simulation timestamp. This counter is meant for debugging
+        and reports how many recomputations were avoided since the creation of the data container.
+        """
+        return self._num_derived_cache_hits
+
+    def _invalidate_derived_buffers(self):
+        """Invalidates the buffers of the derived quantities.
+
+        This is called by the rigid object when the root state is written into the simulation, so that the
+        derived quantities are recomputed from the new state.
+        """
+        self._projected_gravity_b.timestamp = -1.0
+        self._heading_w.timestamp = -1.0
+        self._root_lin_vel_b.timestamp = -1.0
+        self._root_ang_vel_b.timestamp = -1.0
+        self._root_link_lin_vel_b.timestamp = -1.0
+        self._root_link_ang_vel_b.timestamp = -1.0
+        self._root_com_lin_vel_b.timestamp = -1.0
+        self._root_com_ang_vel_b.timestamp = -1.0
+
     ##
     # Names.
     ##
@@ -218,7 +256,12 @@ class RigidObjectData:
     @property
     def projected_gravity_b(self):
         """Projection of the gravity direction on base frame. Shape is (num_instances, 3)."""
-        return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.GRAVITY_VEC_W)
+        if self._projected_gravity_b.timestamp < self._sim_timestamp:
+            self._projected_gravity_b.data = math_utils.quat_rotate_inverse(self.root_link_quat_w, self.GRAVITY_VEC_W)
+            self._projected_gravity_b.timestamp = self._sim_timestamp
+        else:
+            self._num_derived_cache_hits += 1
+        return self._projected_gravity_b.data
 
     @property
     def heading_w(self):
@@ -228,8 +271,13 @@ class RigidObjectData:
             This quantity is computed by assuming that the forward-direction of the base
             frame is along x-direction, i.e. :math:`(1, 0, 0)`.
         """
-        forward_w = math_utils.quat_apply(self.root_link_quat_w, self.FORWARD_VEC_B)
-        return torch.atan2(forward_w[:, 1], forward_w[:, 0])
+        if self._heading_w.timestamp < self._sim_timestamp:
+            forward_w = math_utils.quat_apply(self.root_link_quat_w, self.FORWARD_VEC_B)
+            self._heading_w.data = torch.atan2(forward_w[:, 1], forward_w[:, 0])
+            self._heading_w.timestamp = self._sim_timestamp
+        else:
+            self._num_derived_cache_hits += 1
+        return self._heading_w.data
 
     ##
     # Derived properties.
@@ -282,7 +330,12 @@ class RigidObjectData:
         This quantity is the linear velocity of the root rigid body's center of mass frame with respect to the
         rigid body's actor frame.
         """
-        return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_lin_vel_w)
+        if self._root_lin_vel_b.timestamp < self._sim_timestamp:
+            self._root_lin_vel_b.data = math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_lin_vel_w)
+            self._root_lin_vel_b.timestamp = self._sim_timestamp
+        else:
+            self._num_derived_cache_hits += 1
+        return self._root_lin_vel_b.data
 
     @property
     def root_ang_vel_b(self) -> torch.Tensor:
@@ -291,7 +344,12 @@ class RigidObjectData:
         This quantity is the angular velocity of the root rigid body's center of mass frame with respect to the
         rigid body's actor frame.
         """
-        return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_ang_vel_w)
+        if self._root_ang_vel_b.timestamp < self._sim_timestamp:
+            self._root_ang_vel_b.data = math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_ang_vel_w)
+            self._root_ang_vel_b.timestamp = self._sim_timestamp
+        else:
+            self._num_derived_cache_hits += 1
+        return self._root_ang_vel_b.data
 
     @property
     def root_link_pos_w(self) -> torch.Tensor:
@@ -350,7 +408,14 @@ class RigidObjectData:
         This quantity is the linear velocity of the actor frame of the root rigid body frame with respect to the
         rigid body's actor frame.
         """
-        return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_link_lin_vel_w)
+        if self._root_link_lin_vel_b.timestamp < self._sim_timestamp:
+            self._root_link_lin_vel_b.data = math_utils.quat_rotate_inverse(
+                self.root_link_quat_w, self.root_link_lin_vel_w
+            )
+            self._root_link_lin_vel_b.timestamp = self._sim_timestamp
+        else:
+            self._num_derived_cache_hits += 1
+        return self._root_link_lin_vel_b.data
 
     @property
     def root_link_ang_vel_b(self) -> torch.Tensor:
@@ -359,7 +424,14 @@ class RigidObjectData:
         This quantity is the angular velocity of the actor frame of the root rigid body frame with respect to the
         rigid body's actor frame.
         """
-        return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_link_ang_vel_w)
+        if self._root_link_ang_vel_b.timestamp < self._sim_timestamp:
+            self._root_link_ang_vel_b.data = math_utils.quat_rotate_inverse(
+                self.root_link_quat_w, self.root_link_ang_vel_w
+            )
+            self._root_link_ang_vel_b.timestamp = self._sim_timestamp
+        else:
+            self._num_derived_cache_hits += 1
+        return self._root_link_ang_vel_b.data
 
     @property
     def root_com_pos_w(self) -> torch.Tensor:
@@ -420,7 +492,14 @@ class RigidObjectData:
         This quantity is the linear velocity of the root rigid body's center of mass frame with respect to the
         rigid body's actor frame.
         """
-        return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_com_lin_vel_w)
+        if self._root_com_lin_vel_b.timestamp < self._sim_timestamp:
+            self._root_com_lin_vel_b.data = math_utils.quat_rotate_inverse(
+                self.root_link_quat_w, self.root_com_lin_vel_w
+            )
+            self._root_com_lin_vel_b.timestamp = self._sim_timestamp
+        else:
+            self._num_derived_cache_hits += 1
+        return self._root_com_lin_vel_b.data
 
     @property
     def root_com_ang_vel_b(self) -> torch.Tensor:
@@ -429,7 +508,14 @@ class RigidObjectData:
         This quantity is the angular velocity of the root rigid body's center of mass frame with respect to the
         rigid body's actor frame.
         """
-        return math_utils.quat_rotate_inverse(self.root_link_quat_w, self.root_com_ang_vel_w)
+        if self._root_com_ang_vel_b.timestamp < self._sim_timestamp:
+            self._root_com_ang_vel_b.data = math_utils.quat_rotate_inverse(
+                self.root_link_quat_w, self.root_com_ang_vel_w
+            )
+            self._root_com_ang_vel_b.timestamp = self._sim_timestamp
+        else:
+            self._num_derived_cache_hits += 1
+        return self._root_com_ang_vel_b.data
 
     @property
     def body_pos_w(self) -> torch.Tensor:
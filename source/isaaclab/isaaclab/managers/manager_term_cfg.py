@@ -230,6 +230,37 @@ class ObservationGroupCfg:
     ObservationGroupCfg.history_length is set.
     """
 
+    modifiers: list[ModifierCfg] | None = None
+    """The list of data modifiers to apply to the concatenated observations of the group in order. Defaults to None,
+    in which case no modifications will be applied.
+
+    The modifiers are applied once to the observations of all the terms, after the terms are post-processed. This
+    is more efficient than applying the same modifier to each term, for instance to low-pass filter all the terms
+    of the group with a :class:`~isaaclab.utils.modifiers.DigitalFilter`. It requires :attr:`concatenate_terms` to
+    be True.
+
+    For more information on modifiers, see the :class:`~isaaclab.utils.modifiers.ModifierCfg` class.
+    """
+
+    noise_block_length: int | None = None
+    """Number of steps of noise to pre-sample at once for the terms of the group. Defaults to None, in which case
+    the noise of each term is sampled by its noise function at every step.
+
+    If set and :attr:`enable_corruption` is True, the uniform and gaussian noise of all the terms of the group are
+    sampled in a single block of steps with a :class:`~isaaclab.utils.noise.BlockNoiseSampler`, which is refilled
+    once every :attr:`noise_block_length` computations of the group. The noise models that are not supported by the
+    sampler are still applied by their noise function at every step.
+    """
+
+    noise_seed: int | None = None
+    """Seed of the counter-based random number generator of the pre-sampled noise. Defaults to None, in which case
+    the noise is drawn from the global torch random number generator.
+
+    If set, the noise of each environment only depends on the seed, the number of resets of the environment and
+    the number of steps since its last reset, which makes it reproducible across runs. It requires
+    :attr:`noise_block_length` to be set.
+    """
+
 
 ##
 # Event manager
@@ -14,7 +14,7 @@ from collections.abc import Sequence
 from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
-from isaaclab.utils import modifiers
+from isaaclab.utils import modifiers, noise
 from isaaclab.utils.buffers import CircularBuffer
 
 from .manager_base import ManagerBase, ManagerTermBase
@@ -83,6 +83,9 @@ class ObservationManager(ManagerBase):
 
         # compute combined vector for obs group
         self._group_obs_dim: dict[str, tuple[int, ...] | list[tuple[int, ...]]] = dict()
+        # slices of the terms along the last dimension of the concatenated observations and shape of the latter
+        self._group_obs_term_slices: dict[str, list[slice]] = dict()
+        self._group_obs_concatenated_shape: dict[str, tuple[int, ...]] = dict()
         for group_name, group_term_dims in self._group_obs_term_dim.items():
             # if terms are concatenated, compute the combined shape into a single tuple
             # otherwise, keep the list of shapes as is
@@ -97,6 +100,21 @@ class ObservationManager(ManagerBase):
                         " Please ensure that the shapes are compatible for concatenation."
                         " Otherwise, set 'concatenate_terms' to False in the group configuration."
                     )
+                # compute the slices in which the terms are written when concatenating them
+                term_slices = list()
+                term_start = 0
+                for dims in group_term_dims:
+                    term_slices.append(slice(term_start, term_start + dims[-1]))
+                    term_start += dims[-1]
+                self._group_obs_term_slices[group_name] = term_slices
+                self._group_obs_concatenated_shape[group_name] = (*group_term_dims[0][:-1], term_start)
+                # prepare the modifiers of the concatenated observations
+                if group_name in self._group_obs_modifiers:
+                    self._prepare_modifiers(
+                        self._group_obs_modifiers[group_name],
+                        (self._env.num_envs, *self._group_obs_concatenated_shape[group_name]),
+                        f"observation group '{group_name}'",
+                    )
             else:
                 self._group_obs_dim[group_name] = group_term_dims
 
@@ -231,6 +249,9 @@ class ObservationManager(ManagerBase):
         # call all modifiers that are classes
         for mod in self._group_obs_class_modifiers:
             mod.reset(env_ids=env_ids)
+        # reset the noise streams of the pre-sampled noise
+        for noise_sampler in self._group_obs_noise_sampler.values():
+            noise_sampler.reset(env_ids=env_ids)
 
         # nothing to log here
         return {}
@@ -268,15 +289,22 @@ class ObservationManager(ManagerBase):
 
         1. Compute observation term by calling the function
         2. Apply custom modifiers in the order specified in :attr:`ObservationTermCfg.modifiers`
-        3. Apply corruption/noise model based on :attr:`ObservationTermCfg.noise`
+        3. Apply corruption/noise model based on :attr:`ObservationTermCfg.noise`, or the pre-sampled noise of
+           the group if :attr:`ObservationGroupCfg.noise_block_length` is set
         4. Apply clipping based on :attr:`ObservationTermCfg.clip`
         5. Apply scaling based on :attr:`ObservationTermCfg.scale`
 
+        If the group has modifiers (see :attr:`ObservationGroupCfg.modifiers`), they are applied to the concatenated
+        observations of the group after all the terms are computed.
+
         We apply noise to the computed term first to maintain the integrity of how noise affects the data
         as it truly exists in the real world. If the noise is applied after clipping or scaling, the noise
         could be artificially constrained or amplified, which might misrepresent how noise naturally occurs
         in the data.
 
+        If the terms of the group are concatenated, each term is written into its slice of the concatenated
+        observations and post-processed there, instead of being concatenated with the other terms afterwards.
+
         Args:
             group_name: The name of the group for which to compute the observations. Defaults to None,
                 in which case observations for all the groups are computed and returned.
@@ -299,18 +327,44 @@ class ObservationManager(ManagerBase):
         group_term_names = self._group_obs_term_names[group_name]
         # buffer to store obs per group
         group_obs = dict.fromkeys(group_term_names, None)
+        # if the terms are concatenated, they are written directly into the slices of the concatenated observations
+        # note: a new tensor is used at every call since the returned observations may be kept by the caller
+        if self._group_obs_concatenate[group_name]:
+            group_obs_buffer = torch.empty(
+                (self._env.num_envs, *self._group_obs_concatenated_shape[group_name]),
+                dtype=self._group_obs_dtype[group_name],
+                device=self._env.device,
+            )
+            term_slices = self._group_obs_term_slices[group_name]
+        else:
+            group_obs_buffer = None
+            term_slices = [None] * len(group_term_names)
+        # move to the next step of the pre-sampled noise of the group
+        noise_sampler = self._group_obs_noise_sampler.get(group_name)
+        if noise_sampler is not None:
+            noise_sampler.step()
+        term_noise_ids = self._group_obs_term_noise_ids[group_name]
         # read attributes for each term
-        obs_terms = zip(group_term_names, self._group_obs_term_cfgs[group_name])
+        obs_terms = zip(group_term_names, self._group_obs_term_cfgs[group_name], term_slices, term_noise_ids)
 
         # evaluate terms: compute, add noise, clip, scale, custom modifiers
-        for term_name, term_cfg in obs_terms:
+        for term_name, term_cfg, term_slice, noise_id in obs_terms:
             # compute term's value
-            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
+            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params)
+            # copy the term's value before post-processing it in-place
+            # note: terms without history are post-processed directly in their slice of the concatenated observations
+            if group_obs_buffer is not None and term_cfg.history_length == 0:
+                obs_out = group_obs_buffer[..., term_slice]
+                obs = obs_out.copy_(obs)
+            else:
+                obs = obs.clone()
             # apply post-processing
             if term_cfg.modifiers is not None:
                 for modifier in term_cfg.modifiers:
                     obs = modifier.func(obs, **modifier.params)
-            if term_cfg.noise:
+            if noise_id is not None:
+                obs = noise_sampler.apply(noise_id, obs)
+            elif term_cfg.noise:
                 obs = term_cfg.noise.func(obs, term_cfg.noise)
             if term_cfg.clip:
                 obs = obs.clip_(min=term_cfg.clip[0], max=term_cfg.clip[1])
@@ -318,19 +372,30 @@ class ObservationManager(ManagerBase):
                 obs = obs.mul_(term_cfg.scale)
             # Update the history buffer if observation term has history enabled
             if term_cfg.history_length > 0:
-                self._group_obs_term_history_buffer[group_name][term_name].append(obs)
+                circular_buffer = self._group_obs_term_history_buffer[group_name][term_name]
+                circular_buffer.append(obs)
+                # read the ordered history as a view of the circular buffer (flattening it does not copy either)
+                obs = circular_buffer.buffer_view
                 if term_cfg.flatten_history_dim:
-                    group_obs[term_name] = self._group_obs_term_history_buffer[group_name][term_name].buffer.reshape(
-                        self._env.num_envs, -1
-                    )
+                    obs = obs.reshape(self._env.num_envs, -1)
+                # the view changes with the next append: it is copied once, into the concatenated observations or here
+                if group_obs_buffer is not None:
+                    group_obs_buffer[..., term_slice] = obs
                 else:
-                    group_obs[term_name] = self._group_obs_term_history_buffer[group_name][term_name].buffer
+                    group_obs[term_name] = obs.clone()
+            elif group_obs_buffer is not None:
+                # write back the result of the post-processing functions that are not in-place
+                if obs is not obs_out:
+                    obs_out.copy_(obs)
             else:
                 group_obs[term_name] = obs
 
-        # concatenate all observations in the group together
-        if self._group_obs_concatenate[group_name]:
-            return torch.cat(list(group_obs.values()), dim=-1)
+        # return the concatenated observations or the observations of each term
+        if group_obs_buffer is not None:
+            # apply the modifiers of the group to all the concatenated observations at once
+            for modifier in self._group_obs_modifiers.get(group_name, []):
+                group_obs_buffer = modifier.func(group_obs_buffer, **modifier.params)
+            return group_obs_buffer
         else:
             return group_obs
 
@@ -348,9 +413,15 @@ class ObservationManager(ManagerBase):
         self._group_obs_class_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_concatenate: dict[str, bool] = dict()
         self._group_obs_term_history_buffer: dict[str, dict] = dict()
+        self._group_obs_dtype: dict[str, torch.dtype] = dict()
         # create a list to store modifiers that are classes
         # we store it as a separate list to only call reset on them and prevent unnecessary calls
         self._group_obs_class_modifiers: list[modifiers.ModifierBase] = list()
+        # modifiers applied to the concatenated observations of each group
+        self._group_obs_modifiers: dict[str, list[modifiers.ModifierCfg]] = dict()
+        # samplers of the pre-sampled noise of each group and index of the noise of each term in the sampler
+        self._group_obs_noise_sampler: dict[str, noise.BlockNoiseSampler] = dict()
+        self._group_obs_term_noise_ids: dict[str, list[int | None]] = dict()
 
         # check if config is dict already
         if isinstance(self.cfg, dict):
@@ -373,9 +444,30 @@ class ObservationManager(ManagerBase):
             self._group_obs_term_dim[group_name] = list()
             self._group_obs_term_cfgs[group_name] = list()
             self._group_obs_class_term_cfgs[group_name] = list()
+            self._group_obs_term_noise_ids[group_name] = list()
             group_entry_history_buffer: dict[str, CircularBuffer] = dict()
+            group_obs_dtype = None
             # read common config for the group
             self._group_obs_concatenate[group_name] = group_cfg.concatenate_terms
+            # note: the modifiers of the group are prepared once the shape of the concatenated observations is known
+            if group_cfg.modifiers is not None:
+                if not group_cfg.concatenate_terms:
+                    raise ValueError(
+                        f"Observation group '{group_name}' has modifiers but does not concatenate its terms."
+                        " Please set 'concatenate_terms' to True or move the modifiers to the terms."
+                    )
+                self._group_obs_modifiers[group_name] = group_cfg.modifiers
+            # create the sampler of the pre-sampled noise of the group
+            if group_cfg.noise_seed is not None and group_cfg.noise_block_length is None:
+                raise ValueError(
+                    f"Observation group '{group_name}' has a noise seed but no noise block length."
+                    " Please set 'noise_block_length' to pre-sample the noise of the group."
+                )
+            if group_cfg.enable_corruption and group_cfg.noise_block_length is not None:
+                noise_sampler = noise.BlockNoiseSampler(
+                    self._env.num_envs, self._env.device, group_cfg.noise_block_length, seed=group_cfg.noise_seed
+                )
+                self._group_obs_noise_sampler[group_name] = noise_sampler
             # check if config is dict already
             if isinstance(group_cfg, dict):
                 group_cfg_items = group_cfg.items()
@@ -384,7 +476,15 @@ class ObservationManager(ManagerBase):
             # iterate over all the terms in each group
             for term_name, term_cfg in group_cfg_items:
                 # skip non-obs settings
-                if term_name in ["enable_corruption", "concatenate_terms", "history_length", "flatten_history_dim"]:
+                if term_name in [
+                    "enable_corruption",
+                    "concatenate_terms",
+                    "history_length",
+                    "flatten_history_dim",
+                    "modifiers",
+                    "noise_block_length",
+                    "noise_seed",
+                ]:
                     continue
                 # check for non config
                 if term_cfg is None:
@@ -408,7 +508,12 @@ class ObservationManager(ManagerBase):
                 self._group_obs_term_names[group_name].append(term_name)
                 self._group_obs_term_cfgs[group_name].append(term_cfg)
                 # call function the first time to fill up dimensions
-                obs_dims = tuple(term_cfg.func(self._env, **term_cfg.params).shape)
+                obs = term_cfg.func(self._env, **term_cfg.params)
+                obs_dims = tuple(obs.shape)
+                # resolve the data type of the concatenated observations as done by concatenation
+                group_obs_dtype = (
+                    obs.dtype if group_obs_dtype is None else torch.promote_types(group_obs_dtype, obs.dtype)
+                )
                 # create history buffers and calculate history term dimensions
                 if term_cfg.history_length > 0:
                     group_entry_history_buffer[term_name] = CircularBuffer(
@@ -440,50 +545,16 @@ class ObservationManager(ManagerBase):
                     term_cfg.scale = torch.tensor(term_cfg.scale, dtype=torch.float, device=self._env.device)
 
                 # prepare modifiers for each observation
+                # note: the modifiers are applied before the history, so they are sized with the term's shape
                 if term_cfg.modifiers is not None:
-                    # initialize list of modifiers for term
-                    for mod_cfg in term_cfg.modifiers:
-                        # check if class modifier and initialize with observation size when adding
-                        if isinstance(mod_cfg, modifiers.ModifierCfg):
-                            # to list of modifiers
-                            if inspect.isclass(mod_cfg.func):
-                                if not issubclass(mod_cfg.func, modifiers.ModifierBase):
-                                    raise TypeError(
-                                        f"Modifier function '{mod_cfg.func}' for observation term '{term_name}'"
-                                        f" is not a subclass of 'ModifierBase'. Received: '{type(mod_cfg.func)}'."
-                                    )
-                                mod_cfg.func = mod_cfg.func(cfg=mod_cfg, data_dim=obs_dims, device=self._env.device)
-
-                                # add to list of class modifiers
-                                self._group_obs_class_modifiers.append(mod_cfg.func)
-                        else:
-                            raise TypeError(
-                                f"Modifier configuration '{mod_cfg}' of observation term '{term_name}' is not of"
-                                f" required type ModifierCfg, Received: '{type(mod_cfg)}'"
-                            )
-
-                        # check if function is callable
-                        if not callable(mod_cfg.func):
-                            raise AttributeError(
-                                f"Modifier '{mod_cfg}' of observation term '{term_name}' is not callable."
-                                f" Received: {mod_cfg.func}"
-                            )
-
-                        # check if term's arguments are matched by params
-                        term_params = list(mod_cfg.params.keys())
-                        args = inspect.signature(mod_cfg.func).parameters
-                        args_with_defaults = [arg for arg in args if args[arg].default is not inspect.Parameter.empty]
-                        args_without_defaults = [arg for arg in args if args[arg].default is inspect.Parameter.empty]
-                        args = args_without_defaults + args_with_defaults
-                        # ignore first two arguments for env and env_ids
-                        # Think: Check for cases when kwargs are set inside the function?
-                        if len(args) > 1:
-                            if set(args[1:]) != set(term_params + args_with_defaults):
-                                raise ValueError(
-                                    f"Modifier '{mod_cfg}' of observation term '{term_name}' expects"
-                                    f" mandatory parameters: {args_without_defaults[1:]}"
-                                    f" and optional parameters: {args_with_defaults}, but received: {term_params}."
-                                )
+                    self._prepare_modifiers(term_cfg.modifiers, tuple(obs.shape), f"observation term '{term_name}'")
+
+                # register the noise of the term in the sampler of the group if it can be pre-sampled
+                noise_id = None
+                if group_name in self._group_obs_noise_sampler and term_cfg.noise is not None:
+                    if noise.BlockNoiseSampler.is_supported(term_cfg.noise):
+                        noise_id = self._group_obs_noise_sampler[group_name].register(term_cfg.noise, obs.shape[1:])
+                self._group_obs_term_noise_ids[group_name].append(noise_id)
 
                 # add term in a separate list if term is a class
                 if isinstance(term_cfg.func, ManagerTermBase):
@@ -492,3 +563,56 @@ class ObservationManager(ManagerBase):
                     term_cfg.func.reset()
             # add history buffers for each group
             self._group_obs_term_history_buffer[group_name] = group_entry_history_buffer
+            self._group_obs_dtype[group_name] = group_obs_dtype if group_obs_dtype is not None else torch.float
+
+    def _prepare_modifiers(self, modifier_cfgs: list[modifiers.ModifierCfg], data_dim: tuple[int, ...], owner: str):
+        """Prepares the modifiers of an observation term or group.
+
+        The modifiers that are classes are initialized with the shape of the data they modify and added to the
+        list of class modifiers, so that they are reset with the manager.
+
+        Args:
+            modifier_cfgs: The configurations of the modifiers.
+            data_dim: The shape of the data to modify.
+            owner: The description of the observation term or group, used in the error messages.
+        """
+        # initialize list of modifiers for term
+        for mod_cfg in modifier_cfgs:
+            # check if class modifier and initialize with observation size when adding
+            if isinstance(mod_cfg, modifiers.ModifierCfg):
+                # to list of modifiers
+                if inspect.isclass(mod_cfg.func):
+                    if not issubclass(mod_cfg.func, modifiers.ModifierBase):
+                        raise TypeError(
+                            f"Modifier function '{mod_cfg.func}' for {owner}"
+                            f" is not a subclass of 'ModifierBase'. Received: '{type(mod_cfg.func)}'."
+                        )
+                    mod_cfg.func = mod_cfg.func(cfg=mod_cfg, data_dim=data_dim, device=self._env.device)
+
+                    # add to list of class modifiers
+                    self._group_obs_class_modifiers.append(mod_cfg.func)
+            else:
+                raise TypeError(
+                    f"Modifier configuration '{mod_cfg}' of {owner} is not of"
+                    f" required type ModifierCfg, Received: '{type(mod_cfg)}'"
+                )
+
+            # check if function is callable
+            if not callable(mod_cfg.func):
+                raise AttributeError(f"Modifier '{mod_cfg}' of {owner} is not callable. Received: {mod_cfg.func}")
+
+            # check if term's arguments are matched by params
+            term_params = list(mod_cfg.params.keys())
+            args = inspect.signature(mod_cfg.func).parameters
+            args_with_defaults = [arg for arg in args if args[arg].default is not inspect.Parameter.empty]
+            args_without_defaults = [arg for arg in args if args[arg].default is inspect.Parameter.empty]
+            args = args_without_defaults + args_with_defaults
+            # ignore first two arguments for env and env_ids
+            # Think: Check for cases when kwargs are set inside the function?
+            if len(args) > 1:
+                if set(args[1:]) != set(term_params + args_with_defaults):
+                    raise ValueError(
+                        f"Modifier '{mod_cfg}' of {owner} expects"
+                        f" mandatory parameters: {args_without_defaults[1:]}"
+                        f" and optional parameters: {args_with_defaults}, but received: {term_params}."
+                    )
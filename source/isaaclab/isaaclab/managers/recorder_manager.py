@@ -15,7 +15,7 @@ from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
 from isaaclab.utils import configclass
-from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+from isaaclab.utils.datasets import BatchedEpisodeData, EpisodeData, HDF5DatasetFileHandler, HDF5DatasetLayoutCfg
 
 from .manager_base import ManagerBase, ManagerTermBase
 from .manager_term_cfg import RecorderTermCfg
@@ -38,6 +38,19 @@ class RecorderManagerBaseCfg:
     """Base class for configuring recorder manager terms."""
 
     dataset_file_handler_class_type: type = HDF5DatasetFileHandler
+    """The class type of the dataset file handler used to export the episodes. Defaults to
+    :class:`~isaaclab.utils.datasets.HDF5DatasetFileHandler`.
+
+    Use :class:`~isaaclab.utils.datasets.AsyncHDF5DatasetFileHandler` to write the exported episodes in a
+    background thread instead of on the simulation loop.
+    """
+
+    dataset_layout_cfg: HDF5DatasetLayoutCfg | None = None
+    """The storage layout of the exported datasets, such as the chunk shapes and the compression filters.
+    Defaults to None, in which case the default layout of the dataset file handler is used.
+
+    If set, it is passed to the dataset file handler as the ``layout_cfg`` argument.
+    """
 
     dataset_export_dir_path: str = "/tmp/isaaclab/logs"
     """The directory path where the recorded datasets are exported."""
@@ -51,6 +64,19 @@ class RecorderManagerBaseCfg:
     export_in_record_pre_reset: bool = True
     """Whether to export episodes in the record_pre_reset call."""
 
+    batched_recording: bool = False
+    """Whether to record the episodes of all the environments into shared batched storage. Defaults to False.
+
+    When enabled, the recorded values are written into a single tensor of shape (max_steps, num_envs, ...) per key
+    on the environment's device (see :class:`~isaaclab.utils.datasets.BatchedEpisodeData`). The per-step recording
+    cost then no longer scales with the number of environments, and the per-environment episodes are only sliced
+    out when they are exported.
+
+    Note:
+        In this mode, :meth:`RecorderManager.get_episode` returns a copy of the recorded episode. Modifying the
+        returned episode does not affect the exported data.
+    """
+
 
 class RecorderTerm(ManagerTermBase):
     """Base class for recorder terms.
@@ -153,21 +179,32 @@ class RecorderManager(ManagerBase):
 
         # create episode data buffer indexed by environment id
         self._episodes: dict[int, EpisodeData] = dict()
-        for env_id in range(env.num_envs):
-            self._episodes[env_id] = EpisodeData()
+        self._batched_episodes: BatchedEpisodeData | None = None
+        if cfg.batched_recording:
+            self._batched_episodes = BatchedEpisodeData(env.num_envs, env.device)
+        else:
+            for env_id in range(env.num_envs):
+                self._episodes[env_id] = EpisodeData()
 
         env_name = getattr(env.cfg, "env_name", None)
 
+        # resolve the arguments of the dataset file handlers
+        dataset_file_handler_kwargs = dict()
+        if cfg.dataset_layout_cfg is not None:
+            dataset_file_handler_kwargs["layout_cfg"] = cfg.dataset_layout_cfg
+
         self._dataset_file_handler = None
         if cfg.dataset_export_mode != DatasetExportMode.EXPORT_NONE:
-            self._dataset_file_handler = cfg.dataset_file_handler_class_type()
+            self._dataset_file_handler = cfg.dataset_file_handler_class_type(**dataset_file_handler_kwargs)
             self._dataset_file_handler.create(
                 os.path.join(cfg.dataset_export_dir_path, cfg.dataset_filename), env_name=env_name
             )
 
         self._failed_episode_dataset_file_handler = None
         if cfg.dataset_export_mode == DatasetExportMode.EXPORT_SUCCEEDED_FAILED_IN_SEPARATE_FILES:
-            self._failed_episode_dataset_file_handler = cfg.dataset_file_handler_class_type()
+            self._failed_episode_dataset_file_handler = cfg.dataset_file_handler_class_type(
+                **dataset_file_handler_kwargs
+            )
             self._failed_episode_dataset_file_handler.create(
                 os.path.join(cfg.dataset_export_dir_path, f"{cfg.dataset_filename}_failed"), env_name=env_name
             )
@@ -268,8 +305,11 @@ class RecorderManager(ManagerBase):
         for term in self._terms.values():
             term.reset(env_ids=env_ids)
 
-        for env_id in env_ids:
-            self._episodes[env_id] = EpisodeData()
+        if self._batched_episodes is not None:
+            self._batched_episodes.reset(env_ids)
+        else:
+            for env_id in env_ids:
+                self._episodes[env_id] = EpisodeData()
 
         # nothing to log here
         return {}
@@ -281,8 +321,11 @@ class RecorderManager(ManagerBase):
             env_id: The environment id.
 
         Returns:
-            The episode data for the given environment id.
+            The episode data for the given environment id. When batched recording is enabled, this is a copy
+            of the recorded data.
         """
+        if self._batched_episodes is not None:
+            return self._batched_episodes.get_episode(env_id)
         return self._episodes.get(env_id, EpisodeData())
 
     def add_to_episodes(self, key: str, value: torch.Tensor | dict, env_ids: Sequence[int] | None = None):
@@ -303,6 +346,10 @@ class RecorderManager(ManagerBase):
         # resolve environment ids
         if key is None:
             return
+        # write the values of all the environments at once
+        if self._batched_episodes is not None:
+            self._batched_episodes.add(key, value, env_ids)
+            return
         if env_ids is None:
             env_ids = list(range(self._env.num_envs))
         if isinstance(env_ids, torch.Tensor):
@@ -330,6 +377,10 @@ class RecorderManager(ManagerBase):
         if len(self.active_terms) == 0:
             return
 
+        if self._batched_episodes is not None:
+            self._batched_episodes.set_success(env_ids, success_values)
+            return
+
         # resolve environment ids
         if env_ids is None:
             env_ids = list(range(self._env.num_envs))
@@ -418,11 +469,18 @@ class RecorderManager(ManagerBase):
         if isinstance(env_ids, torch.Tensor):
             env_ids = env_ids.tolist()
 
+        # Slice the episodes to export out of the batched storage
+        if self._batched_episodes is not None:
+            episodes = {env_id: self._batched_episodes.get_episode(env_id) for env_id in env_ids}
+            self._batched_episodes.reset(env_ids)
+        else:
+            episodes = self._episodes
+
         # Export episode data through dataset exporter
         need_to_flush = False
         for env_id in env_ids:
-            if env_id in self._episodes and not self._episodes[env_id].is_empty():
-                episode_succeeded = self._episodes[env_id].success
+            if env_id in episodes and not episodes[env_id].is_empty():
+                episode_succeeded = episodes[env_id].success
                 target_dataset_file_handler = None
                 if (self.cfg.dataset_export_mode == DatasetExportMode.EXPORT_ALL) or (
                     self.cfg.dataset_export_mode == DatasetExportMode.EXPORT_SUCCEEDED_ONLY and episode_succeeded
@@ -434,7 +492,9 @@ class RecorderManager(ManagerBase):
                     else:
                         target_dataset_file_handler = self._failed_episode_dataset_file_handler
                 if target_dataset_file_handler is not None:
-                    target_dataset_file_handler.write_episode(self._episodes[env_id])
+                    # release the spare capacity of the storage, as the episode may be kept in the write queue
+                    episodes[env_id].finalize()
+                    target_dataset_file_handler.write_episode(episodes[env_id])
                     need_to_flush = True
                 # Update episode count
                 if episode_succeeded:
@@ -444,7 +504,8 @@ class RecorderManager(ManagerBase):
                 else:
                     self._exported_failed_episode_count[env_id] = self._exported_failed_episode_count.get(env_id, 0) + 1
             # Reset the episode buffer for the given environment after export
-            self._episodes[env_id] = EpisodeData()
+            if self._batched_episodes is None:
+                self._episodes[env_id] = EpisodeData()
 
         if need_to_flush:
             if self._dataset_file_handler is not None:
@@ -467,10 +528,12 @@ class RecorderManager(ManagerBase):
             # skip non-term settings
             if term_name in [
                 "dataset_file_handler_class_type",
+                "dataset_layout_cfg",
                 "dataset_filename",
                 "dataset_export_dir_path",
                 "dataset_export_mode",
                 "export_in_record_pre_reset",
+                "batched_recording",
             ]:
                 continue
             # check if term config is None
@@ -27,3 +27,4 @@ actions to the scene. All these are handled by different "managers" in the frame
 
 from .interactive_scene import InteractiveScene
 from .interactive_scene_cfg import InteractiveSceneCfg
+from .sensor_scheduler import SensorUpdateScheduler
@@ -25,10 +25,11 @@ from isaaclab.assets import (
     RigidObjectCollection,
     RigidObjectCollectionCfg,
 )
-from isaaclab.sensors import ContactSensorCfg, FrameTransformerCfg, SensorBase, SensorBaseCfg
+from isaaclab.sensors import ContactSensorCfg, FrameTransformerCfg, RayCasterCfg, SensorBase, SensorBaseCfg
 from isaaclab.terrains import TerrainImporter, TerrainImporterCfg
 
 from .interactive_scene_cfg import InteractiveSceneCfg
+from .sensor_scheduler import SensorUpdateScheduler
 
 
 class InteractiveScene:
@@ -118,6 +119,8 @@ class InteractiveScene:
         self._rigid_object_collections = dict()
         self._sensors = dict()
         self._extras = dict()
+        # scheduler for updating the sensors in groups of equal update period
+        self._sensor_scheduler = SensorUpdateScheduler(self._sensors, record_timings=self.cfg.record_sensor_timings)
         # obtain the current stage
         self.stage = omni.usd.get_context().get_stage()
         # physics scene path
@@ -336,6 +339,14 @@ class InteractiveScene:
         """A dictionary of the sensors in the scene, such as cameras and contact reporters."""
         return self._sensors
 
+    @property
+    def sensor_scheduler(self) -> SensorUpdateScheduler:
+        """The scheduler that updates the sensors in the scene.
+
+        It can be used to inspect the groups of sensors and the update counters of each sensor.
+        """
+        return self._sensor_scheduler
+
     @property
     def extras(self) -> dict[str, XFormPrim]:
         """A dictionary of miscellaneous simulation objects that neither inherit from assets nor sensors.
@@ -509,8 +520,7 @@ class InteractiveScene:
         for rigid_object_collection in self._rigid_object_collections.values():
             rigid_object_collection.update(dt)
         # -- sensors
-        for sensor in self._sensors.values():
-            sensor.update(dt, force_recompute=not self.cfg.lazy_sensor_update)
+        self._sensor_scheduler.update(dt, force_recompute=not self.cfg.lazy_sensor_update)
 
     """
     Operations: Iteration.
@@ -621,6 +631,15 @@ class InteractiveScene:
                     for filter_prim_path in asset_cfg.filter_prim_paths_expr:
                         updated_filter_prim_paths_expr.append(filter_prim_path.format(ENV_REGEX_NS=self.env_regex_ns))
                     asset_cfg.filter_prim_paths_expr = updated_filter_prim_paths_expr
+                elif isinstance(asset_cfg, RayCasterCfg):
+                    asset_cfg.mesh_prim_paths = [
+                        mesh_prim_path.format(ENV_REGEX_NS=self.env_regex_ns)
+                        for mesh_prim_path in asset_cfg.mesh_prim_paths
+                    ]
+                    asset_cfg.dynamic_mesh_prim_paths = [
+                        mesh_prim_path.format(ENV_REGEX_NS=self.env_regex_ns)
+                        for mesh_prim_path in asset_cfg.dynamic_mesh_prim_paths
+                    ]
 
                 self._sensors[asset_name] = asset_cfg.class_type(asset_cfg)
             elif isinstance(asset_cfg, AssetBaseCfg):
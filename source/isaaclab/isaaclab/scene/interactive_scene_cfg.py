@@ -84,6 +84,14 @@ class InteractiveSceneCfg:
     data is updated every time sensors are updated.
     """
 
+    record_sensor_timings: bool = False
+    """Whether to record the time spent in the update of each sensor. Default is False.
+
+    The sensors are updated by the :class:`~isaaclab.scene.SensorUpdateScheduler` of the scene, which always counts
+    the updates of each sensor. If this flag is true, it also records their time. On CUDA devices, the device is
+    synchronized after each sensor update, so this should only be enabled for profiling.
+    """
+
     replicate_physics: bool = True
     """Enable/disable replication of physics schemas when using the Cloner APIs. Default is True.
 
@@ -0,0 +1,249 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Scheduler for updating the sensors of a scene in groups of equal update period."""
+
+from __future__ import annotations
+
+import time
+import torch
+from typing import TYPE_CHECKING
+
+from isaaclab.sensors import SensorBase
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class SensorUpdateScheduler:
+    """Updates the sensors of a scene in groups that share the same update period.
+
+    Each :class:`~isaaclab.sensors.SensorBase` tracks the elapsed time and the outdated environments of its own
+    instances. Updating the sensors one by one thus launches the same timestamp and outdated-mask operations
+    for every sensor, and queries the device for the outdated environments of every sensor that is updated
+    eagerly.
+
+    The scheduler groups the sensors by their update period, number of instances and device. The timestamps
+    and outdated flags of the sensors of a group are stacked into tensors of shape (S, N), where S is the number
+    of sensors in the group and N is the number of instances, and the buffers of each sensor are replaced with
+    views of its row. This way, the timestamps and the outdated mask are computed once per group, while the
+    sensors keep reading and resetting their own rows. The sensors that are updated eagerly are then only
+    dispatched if they have outdated instances, which is checked once per group.
+
+    The sensors that override :meth:`~isaaclab.sensors.SensorBase.update` are not grouped and are updated
+    through their own method.
+
+    The scheduler also counts the updates of the sensor buffers and, if enabled, their time. For the grouped
+    sensors, the buffer updates are counted whether they are dispatched by the scheduler or triggered by
+    accessing the data of the sensor. The sensors that are not grouped are counted at every call of their
+    update method.
+    """
+
+    def __init__(self, sensors: Mapping[str, SensorBase], record_timings: bool = False):
+        """Initializes the scheduler.
+
+        The groups are created on the first update after the sensors are initialized, and are recreated if the
+        sensors are initialized again (for example, when the simulation is stopped and played).
+
+        Args:
+            sensors: The sensors to update, keyed by their name. The mapping is read at every update,
+                so sensors can be added to it after the scheduler is created.
+            record_timings: Whether to record the time of the sensor updates. If the sensors are on a CUDA
+                device, the device is synchronized after each sensor update so that the time is attributed to
+                the right sensor. This slows down the simulation and should only be used for profiling.
+                Defaults to False.
+        """
+        # store inputs
+        self._sensors = sensors
+        self.record_timings = record_timings
+        # groups of sensors with the same update period, number of instances and device
+        self._groups: list[_SensorGroup] = []
+        # sensors that are updated through their own update method
+        self._ungrouped_sensor_names: list[str] = []
+        # the sensors for which the groups were created
+        self._grouped_sensors: dict[str, SensorBase] = {}
+        # counters of the dispatched updates
+        self._num_updates: dict[str, int] = {}
+        self._update_time: dict[str, float] = {}
+
+    def __str__(self) -> str:
+        """Returns: A string with the groups of sensors and the update counters."""
+        msg = f"<SensorUpdateScheduler> with {len(self._groups)} groups and {len(self._sensors)} sensors\n"
+        for group in self._groups:
+            msg += f"\tupdate period {group.update_period} s: {', '.join(group.sensor_names)}\n"
+        if self._ungrouped_sensor_names:
+            msg += f"\tungrouped: {', '.join(self._ungrouped_sensor_names)}\n"
+        for name, timing in self.timings.items():
+            msg += f"\t{name}: {timing['num_updates']} updates, {1000.0 * timing['total_time']:.3f} ms\n"
+        return msg
+
+    """
+    Properties
+    """
+
+    @property
+    def group_names(self) -> list[list[str]]:
+        """The names of the sensors in each group."""
+        return [group.sensor_names for group in self._groups]
+
+    @property
+    def timings(self) -> dict[str, dict[str, float]]:
+        """The update counters of each sensor, keyed by the sensor name.
+
+        Each entry contains the number of updates of the sensor buffers (``"num_updates"``), their
+        total time in seconds (``"total_time"``) and their mean time in seconds (``"mean_time"``). The times are
+        zero if :attr:`record_timings` is False.
+        """
+        timings = {}
+        for name, num_updates in self._num_updates.items():
+            total_time = self._update_time[name]
+            timings[name] = {
+                "num_updates": num_updates,
+                "total_time": total_time,
+                "mean_time": total_time / num_updates if num_updates > 0 else 0.0,
+            }
+        return timings
+
+    """
+    Operations
+    """
+
+    def reset_timings(self):
+        """Resets the update counters of all the sensors."""
+        self._num_updates.clear()
+        self._update_time.clear()
+
+    def update(self, dt: float, force_recompute: bool = False):
+        """Updates the timestamps of the sensors and the buffers of the sensors that are due.
+
+        Similar to :meth:`~isaaclab.sensors.SensorBase.update`, the buffers of a sensor are updated if
+        :attr:`force_recompute` is True, the sensor is visualizing its data or it has a history.
+
+        Args:
+            dt: The amount of time passed from last update.
+            force_recompute: Whether to update the buffers of all the sensors that are due, instead of only
+                when their data is accessed. Defaults to False.
+        """
+        # create the groups if the sensors changed or were initialized again
+        if self._needs_regroup():
+            self._create_groups()
+        # update the grouped sensors
+        for group in self._groups:
+            # update the timestamps and the outdated mask of all the sensors of the group
+            group.timestamp += dt
+            if group.update_period > 0.0:
+                group.is_outdated |= group.timestamp - group.timestamp_last_update + 1e-6 >= group.update_period
+            else:
+                # note: the sensors are outdated at every update
+                group.is_outdated.fill_(True)
+            # resolve the sensors to update eagerly
+            sensor_ids = [
+                index
+                for index, name in enumerate(group.sensor_names)
+                if force_recompute or self._sensors[name]._is_visualizing or self._sensors[name].cfg.history_length > 0
+            ]
+            if not sensor_ids:
+                continue
+            # check which sensors have outdated instances with a single query for the group
+            if group.update_period > 0.0:
+                is_due = group.is_outdated.any(dim=1).tolist()
+                sensor_ids = [index for index in sensor_ids if is_due[index]]
+            # update the buffers
+            # note: the updates are counted by the wrapped buffer update functions of the sensors
+            for index in sensor_ids:
+                self._sensors[group.sensor_names[index]]._update_outdated_buffers()
+        # update the sensors that are not grouped
+        for name in self._ungrouped_sensor_names:
+            self._dispatch(name, lambda sensor=self._sensors[name]: sensor.update(dt, force_recompute))
+
+    """
+    Helper functions.
+    """
+
+    def _dispatch(self, name: str, func):
+        """Calls the update function of a sensor and increments its counters."""
+        if self.record_timings:
+            sensor = self._sensors[name]
+            start_time = time.perf_counter()
+            func()
+            if torch.device(sensor.device).type == "cuda":
+                torch.cuda.synchronize(sensor.device)
+            self._update_time[name] = self._update_time.get(name, 0.0) + time.perf_counter() - start_time
+        else:
+            func()
+            self._update_time.setdefault(name, 0.0)
+        self._num_updates[name] = self._num_updates.get(name, 0) + 1
+
+    def _wrap_update_buffers_impl(self, name: str, sensor: SensorBase):
+        """Replaces the buffer update function of a sensor with one that increments its counters.
+
+        The function is wrapped on the sensor instance, so that the updates triggered by accessing the data of
+        the sensor are counted as well.
+        """
+        update_buffers_impl = type(sensor)._update_buffers_impl.__get__(sensor)
+
+        def _update_buffers_impl(env_ids):
+            self._dispatch(name, lambda: update_buffers_impl(env_ids))
+
+        sensor._update_buffers_impl = _update_buffers_impl
+
+    def _needs_regroup(self) -> bool:
+        """Checks whether the sensors changed since the groups were created."""
+        if self._grouped_sensors.keys() != self._sensors.keys():
+            return True
+        for group in self._groups:
+            for index, name in enumerate(group.sensor_names):
+                sensor = self._sensors[name]
+                if sensor is not self._grouped_sensors[name] or sensor._timestamp is not group.timestamp_rows[index]:
+                    return True
+        for name in self._ungrouped_sensor_names:
+            sensor = self._sensors[name]
+            if sensor is not self._grouped_sensors[name] or (sensor.is_initialized and self._is_groupable(sensor)):
+                return True
+        return False
+
+    def _is_groupable(self, sensor: SensorBase) -> bool:
+        """Checks whether the sensor can be updated as part of a group."""
+        return type(sensor).update is SensorBase.update
+
+    def _create_groups(self):
+        """Groups the sensors and replaces their timestamps and outdated flags with views of the groups."""
+        self._groups.clear()
+        self._ungrouped_sensor_names.clear()
+        # restore the buffer update functions of the previously grouped sensors
+        for sensor in self._grouped_sensors.values():
+            sensor.__dict__.pop("_update_buffers_impl", None)
+        self._grouped_sensors = dict(self._sensors)
+        # collect the sensors of each group
+        groups: dict[tuple[float, int, str], list[str]] = {}
+        for name, sensor in self._sensors.items():
+            # note: the sensors that are not initialized or have their own update method are updated individually
+            if not sensor.is_initialized or not self._is_groupable(sensor):
+                self._ungrouped_sensor_names.append(name)
+                continue
+            key = (float(sensor.cfg.update_period), sensor.num_instances, str(sensor.device))
+            groups.setdefault(key, []).append(name)
+            self._wrap_update_buffers_impl(name, sensor)
+        # create the stacked buffers of each group
+        for (update_period, _, _), sensor_names in groups.items():
+            self._groups.append(_SensorGroup(update_period, sensor_names, [self._sensors[n] for n in sensor_names]))
+
+
+class _SensorGroup:
+    """Stacked timestamps and outdated flags of sensors with the same update period."""
+
+    def __init__(self, update_period: float, sensor_names: list[str], sensors: list[SensorBase]):
+        self.update_period = update_period
+        self.sensor_names = sensor_names
+        # stack the current buffers of the sensors
+        self.timestamp = torch.stack([sensor._timestamp for sensor in sensors])
+        self.timestamp_last_update = torch.stack([sensor._timestamp_last_update for sensor in sensors])
+        self.is_outdated = torch.stack([sensor._is_outdated for sensor in sensors])
+        # replace the buffers of the sensors with views of their row
+        self.timestamp_rows = list(self.timestamp.unbind(0))
+        for index, sensor in enumerate(sensors):
+            sensor._timestamp = self.timestamp_rows[index]
+            sensor._timestamp_last_update = self.timestamp_last_update[index]
+            sensor._is_outdated = self.is_outdated[index]
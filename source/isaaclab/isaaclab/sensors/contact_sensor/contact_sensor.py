@@ -141,9 +141,9 @@ class ContactSensor(SensorBase):
             env_ids = slice(None)
         # reset accumulative data buffers
         self._data.net_forces_w[env_ids] = 0.0
-        self._data.net_forces_w_history[env_ids] = 0.0
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history[env_ids] = 0.0
+            self._data.net_forces_w_history_ring[env_ids] = 0.0
+        self._data._net_forces_w_history = None
         # reset force matrix
         if len(self.cfg.filter_prim_paths_expr) != 0:
             self._data.force_matrix_w[env_ids] = 0.0
@@ -288,12 +288,15 @@ class ContactSensor(SensorBase):
         self._data.net_forces_w = torch.zeros(self._num_envs, self._num_bodies, 3, device=self._device)
         # optional buffers
         # -- history of net forces
+        #    note: the history is stored as a ring buffer with a write index for each sensor
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history = torch.zeros(
+            self._data.net_forces_w_history_ring = torch.zeros(
                 self._num_envs, self.cfg.history_length, self._num_bodies, 3, device=self._device
             )
+            self._data.net_forces_w_history_index = torch.zeros(self._num_envs, dtype=torch.long, device=self._device)
         else:
-            self._data.net_forces_w_history = self._data.net_forces_w.unsqueeze(1)
+            self._data.net_forces_w_history_ring = self._data.net_forces_w.unsqueeze(1)
+        self._ALL_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self._device)
         # -- pose of sensor origins
         if self.cfg.track_pose:
             self._data.pos_w = torch.zeros(self._num_envs, self._num_bodies, 3, device=self._device)
@@ -323,9 +326,14 @@ class ContactSensor(SensorBase):
         net_forces_w = self.contact_physx_view.get_net_contact_forces(dt=self._sim_physics_dt)
         self._data.net_forces_w[env_ids, :, :] = net_forces_w.view(-1, self._num_bodies, 3)[env_ids]
         # update contact force history
+        # note: the forces overwrite the oldest entry of the ring buffer, so no entry is shifted
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history[env_ids, 1:] = self._data.net_forces_w_history[env_ids, :-1].clone()
-            self._data.net_forces_w_history[env_ids, 0] = self._data.net_forces_w[env_ids]
+            history_env_ids = self._ALL_INDICES[env_ids]
+            history_ids = self._data.net_forces_w_history_index[history_env_ids]
+            self._data.net_forces_w_history_ring[history_env_ids, history_ids] = self._data.net_forces_w[env_ids]
+            self._data.net_forces_w_history_index[history_env_ids] = (history_ids + 1) % self.cfg.history_length
+        # the ordered history is gathered again on its next access
+        self._data._net_forces_w_history = None
 
         # obtain the contact force matrix
         if len(self.cfg.filter_prim_paths_expr) != 0:
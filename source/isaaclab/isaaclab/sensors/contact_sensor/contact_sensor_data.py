@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 import torch
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -42,17 +42,25 @@ class ContactSensorData:
         with the total contact forces acting on the sensor bodies (which also includes the tangential forces).
     """
 
-    net_forces_w_history: torch.Tensor | None = None
-    """The net normal contact forces in world frame.
+    net_forces_w_history_ring: torch.Tensor | None = None
+    """The history of the net normal contact forces in world frame, stored as a ring buffer.
 
     Shape is (N, T, B, 3), where N is the number of sensors, T is the configured history length
     and B is the number of bodies in each sensor.
 
-    In the history dimension, the first index is the most recent and the last index is the oldest.
+    The history dimension is not in chronological order. The most recent entry of each sensor is at the index
+    before :attr:`net_forces_w_history_index` (modulo T). Reductions over the history that do not depend on the
+    order, such as the maximum, can be computed on this buffer directly. For the ordered history, please use
+    :attr:`net_forces_w_history`.
+    """
+
+    net_forces_w_history_index: torch.Tensor | None = None
+    """The index of the next entry to write in :attr:`net_forces_w_history_ring` for each sensor.
+
+    Shape is (N,), where N is the number of sensors.
 
     Note:
-        This quantity is the sum of the normal contact forces acting on the sensor bodies. It must not be confused
-        with the total contact forces acting on the sensor bodies (which also includes the tangential forces).
+        If the :attr:`ContactSensorCfg.history_length` is 0, then this quantity is None.
     """
 
     force_matrix_w: torch.Tensor | None = None
@@ -100,3 +108,35 @@ class ContactSensorData:
     Note:
         If the :attr:`ContactSensorCfg.track_air_time` is False, then this quantity is None.
     """
+
+    _net_forces_w_history: torch.Tensor | None = field(default=None, repr=False)
+    """The cached ordered history of the net normal contact forces. None if it is outdated."""
+
+    @property
+    def net_forces_w_history(self) -> torch.Tensor | None:
+        """The net normal contact forces in world frame.
+
+        Shape is (N, T, B, 3), where N is the number of sensors, T is the configured history length
+        and B is the number of bodies in each sensor.
+
+        In the history dimension, the first index is the most recent and the last index is the oldest.
+        The ordered history is gathered from :attr:`net_forces_w_history_ring` on the first access after
+        the sensor is updated.
+
+        Note:
+            This quantity is the sum of the normal contact forces acting on the sensor bodies. It must not be confused
+            with the total contact forces acting on the sensor bodies (which also includes the tangential forces).
+        """
+        if self._net_forces_w_history is None and self.net_forces_w_history_ring is not None:
+            num_sensors, history_length = self.net_forces_w_history_ring.shape[:2]
+            if history_length == 1:
+                # note: a single entry is always in order
+                self._net_forces_w_history = self.net_forces_w_history_ring
+            else:
+                # order the entries from the most recent to the oldest
+                device = self.net_forces_w_history_ring.device
+                history_ids = self.net_forces_w_history_index.unsqueeze(1) - 1
+                history_ids = (history_ids - torch.arange(history_length, device=device)) % history_length
+                sensor_ids = torch.arange(num_sensors, device=device).unsqueeze(1)
+                self._net_forces_w_history = self.net_forces_w_history_ring[sensor_ids, history_ids]
+        return self._net_forces_w_history
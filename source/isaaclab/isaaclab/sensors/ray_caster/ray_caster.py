@@ -15,13 +15,13 @@ import omni.log
 import omni.physics.tensors.impl.api as physx
 import warp as wp
 from isaacsim.core.prims import XFormPrim
-from pxr import UsdGeom, UsdPhysics
+from pxr import Usd, UsdGeom, UsdPhysics
 
 import isaaclab.sim as sim_utils
 from isaaclab.markers import VisualizationMarkers
 from isaaclab.terrains.trimesh.utils import make_plane
-from isaaclab.utils.math import convert_quat, quat_apply, quat_apply_yaw
-from isaaclab.utils.warp import convert_to_warp_mesh, raycast_mesh
+from isaaclab.utils.math import convert_quat, matrix_from_quat, quat_apply, quat_apply_yaw
+from isaaclab.utils.warp import RaycastEngine, convert_to_warp_mesh, refit_mesh
 
 from ..sensor_base import SensorBase
 from .ray_caster_data import RayCasterData
@@ -38,12 +38,15 @@ class RayCaster(SensorBase):
     a set of meshes with a given ray pattern.
 
     The meshes are parsed from the list of primitive paths provided in the configuration. These are then
-    converted to warp meshes and stored in the `warp_meshes` list. The ray-caster then ray-casts against
-    these warp meshes using the ray pattern provided in the configuration.
-
-    .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
+    converted to warp meshes and stored in the :attr:`meshes` dictionary. A primitive path can match multiple
+    prims, such as an obstacle in each environment, in which case their meshes are combined into a single
+    warp mesh. The ray-caster then ray-casts against all the warp meshes in a single kernel launch using the
+    ray pattern provided in the configuration, and returns the closest hit of each ray.
+
+    The meshes are static by default. The meshes whose primitive paths are listed in
+    :attr:`RayCasterCfg.dynamic_mesh_prim_paths` follow the poses of their prims. At every update, their
+    points are moved to the current poses of the prims and their BVH is refit, instead of rebuilding the
+    warp mesh.
     """
 
     cfg: RayCasterCfg
@@ -71,6 +74,10 @@ class RayCaster(SensorBase):
         self._data = RayCasterData()
         # the warp meshes used for raycasting.
         self.meshes: dict[str, wp.Mesh] = {}
+        # the views, points (in the frames of the prims) and instance ids of the dynamic meshes.
+        self._dynamic_meshes: dict[
+            str, tuple[XFormPrim | physx.RigidBodyView | physx.ArticulationView, wp.array, wp.array]
+        ] = {}
 
     def __str__(self) -> str:
         """Returns: A string containing information about the instance."""
@@ -121,27 +128,13 @@ class RayCaster(SensorBase):
         # create simulation view
         self._physics_sim_view = physx.create_simulation_view(self._backend)
         self._physics_sim_view.set_subspace_roots("/")
-        # check if the prim at path is an articulated or rigid prim
-        # we do this since for physics-based view classes we can access their data directly
-        # otherwise we need to use the xform view class which is slower
-        found_supported_prim_class = False
+        # create the view to track the poses of the sensors
         prim = sim_utils.find_first_matching_prim(self.cfg.prim_path)
         if prim is None:
             raise RuntimeError(f"Failed to find a prim at path expression: {self.cfg.prim_path}")
-        # create view based on the type of prim
-        if prim.HasAPI(UsdPhysics.ArticulationRootAPI):
-            self._view = self._physics_sim_view.create_articulation_view(self.cfg.prim_path.replace(".*", "*"))
-            found_supported_prim_class = True
-        elif prim.HasAPI(UsdPhysics.RigidBodyAPI):
-            self._view = self._physics_sim_view.create_rigid_body_view(self.cfg.prim_path.replace(".*", "*"))
-            found_supported_prim_class = True
-        else:
-            self._view = XFormPrim(self.cfg.prim_path, reset_xform_properties=False)
-            found_supported_prim_class = True
+        self._view = self._create_prim_view(self.cfg.prim_path, prim)
+        if isinstance(self._view, XFormPrim):
             omni.log.warn(f"The prim at path {prim.GetPath().pathString} is not a physics prim! Using XFormPrim.")
-        # check if prim view class is found
-        if not found_supported_prim_class:
-            raise RuntimeError(f"Failed to find a valid prim view class for the prim paths: {self.cfg.prim_path}")
 
         # load the meshes by parsing the stage
         self._initialize_warp_meshes()
@@ -149,40 +142,61 @@ class RayCaster(SensorBase):
         self._initialize_rays_impl()
 
     def _initialize_warp_meshes(self):
-        # check number of mesh prims provided
-        if len(self.cfg.mesh_prim_paths) != 1:
-            raise NotImplementedError(
-                f"RayCaster currently only supports one mesh prim. Received: {len(self.cfg.mesh_prim_paths)}"
-            )
+        # check that the dynamic meshes are ray-cast
+        for mesh_prim_path in self.cfg.dynamic_mesh_prim_paths:
+            if mesh_prim_path not in self.cfg.mesh_prim_paths:
+                raise ValueError(
+                    f"Dynamic mesh prim path '{mesh_prim_path}' is not in the mesh prim paths:"
+                    f" {self.cfg.mesh_prim_paths}"
+                )
 
         # read prims to ray-cast
         for mesh_prim_path in self.cfg.mesh_prim_paths:
             # check if the prim is a plane - handle PhysX plane as a special case
             # if a plane exists then we need to create an infinite mesh that is a plane
+            prims = sim_utils.find_matching_prims(mesh_prim_path)
+            if len(prims) == 0:
+                raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
             mesh_prim = sim_utils.get_first_matching_child_prim(
-                mesh_prim_path, lambda prim: prim.GetTypeName() == "Plane"
+                prims[0].GetPath(), lambda prim: prim.GetTypeName() == "Plane"
             )
-            # if we did not find a plane then we need to read the mesh
+            # if we did not find a plane then we need to read the meshes
             if mesh_prim is None:
-                # obtain the mesh prim
-                mesh_prim = sim_utils.get_first_matching_child_prim(
-                    mesh_prim_path, lambda prim: prim.GetTypeName() == "Mesh"
-                )
-                # check if valid
-                if mesh_prim is None or not mesh_prim.IsValid():
-                    raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
-                # cast into UsdGeomMesh
-                mesh_prim = UsdGeom.Mesh(mesh_prim)
-                # read the vertices and faces
-                points = np.asarray(mesh_prim.GetPointsAttr().Get())
-                transform_matrix = np.array(omni.usd.get_world_transform_matrix(mesh_prim)).T
-                points = np.matmul(points, transform_matrix[:3, :3].T)
-                points += transform_matrix[:3, 3]
-                indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
+                if mesh_prim_path in self.cfg.dynamic_mesh_prim_paths:
+                    # create a view to track the poses of the prims
+                    # note: the instances of the mesh follow the order of the prims in the view
+                    view = self._create_prim_view(mesh_prim_path, prims[0])
+                    prim_paths = view.prim_paths
+                else:
+                    view = None
+                    prim_paths = [prim.GetPath().pathString for prim in prims]
+                # read the meshes of all the matching prims in the world frame
+                points, indices, instance_ids = [], [], []
+                for instance_id, prim_path in enumerate(prim_paths):
+                    instance_points, instance_indices = self._read_mesh_prim(prim_path)
+                    indices.append(instance_indices + sum(len(p) for p in points))
+                    points.append(instance_points)
+                    instance_ids.append(np.full(len(instance_points), instance_id, dtype=np.int32))
+                points = np.concatenate(points)
+                indices = np.concatenate(indices)
                 wp_mesh = convert_to_warp_mesh(points, indices, device=self.device)
+                # store the points of the dynamic meshes in the frames of their prims
+                if view is not None:
+                    instance_ids = np.concatenate(instance_ids)
+                    pos_w, quat_w = self._get_prim_view_poses(view)
+                    pos_w = pos_w.cpu().numpy()[instance_ids]
+                    rot_w = matrix_from_quat(quat_w.cpu()).numpy()[instance_ids]
+                    # note: p_local = R^T (p_w - t)
+                    local_points = np.einsum("nji,nj->ni", rot_w, points - pos_w)
+                    self._dynamic_meshes[mesh_prim_path] = (
+                        view,
+                        wp.array(local_points.astype(np.float32), dtype=wp.vec3, device=self.device),
+                        wp.array(instance_ids, dtype=wp.int32, device=self.device),
+                    )
                 # print info
                 omni.log.info(
-                    f"Read mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and {len(indices)} faces."
+                    f"Read {len(prim_paths)} mesh prim(s) at: {mesh_prim_path} with {len(points)} vertices and"
+                    f" {len(indices)} faces."
                 )
             else:
                 mesh = make_plane(size=(2e6, 2e6), height=0.0, center_zero=True)
@@ -198,6 +212,91 @@ class RayCaster(SensorBase):
                 f"No meshes found for ray-casting! Please check the mesh prim paths: {self.cfg.mesh_prim_paths}"
             )
 
+    def _read_mesh_prim(self, prim_path: str) -> tuple[np.ndarray, np.ndarray]:
+        """Reads the first mesh under the prim path in the world frame.
+
+        Args:
+            prim_path: The path of the prim to read the mesh from.
+
+        Returns:
+            The points of the mesh in the world frame and the vertex indices of its triangles.
+
+        Raises:
+            RuntimeError: If no valid mesh prim is found under the prim path.
+        """
+        # obtain the mesh prim
+        mesh_prim = sim_utils.get_first_matching_child_prim(prim_path, lambda prim: prim.GetTypeName() == "Mesh")
+        # check if valid
+        if mesh_prim is None or not mesh_prim.IsValid():
+            raise RuntimeError(f"Invalid mesh prim path: {prim_path}")
+        # cast into UsdGeomMesh
+        mesh_prim = UsdGeom.Mesh(mesh_prim)
+        # read the vertices and faces
+        points = np.asarray(mesh_prim.GetPointsAttr().Get())
+        transform_matrix = np.array(omni.usd.get_world_transform_matrix(mesh_prim)).T
+        points = np.matmul(points, transform_matrix[:3, :3].T)
+        points += transform_matrix[:3, 3]
+        indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
+        return points, indices
+
+    def _create_prim_view(
+        self, prim_path_expr: str, prim: Usd.Prim
+    ) -> XFormPrim | physx.ArticulationView | physx.RigidBodyView:
+        """Creates a view to track the poses of the prims matching a path expression.
+
+        For physics prims, the poses are read directly from the physics views, since the transforms of the prims
+        on the USD stage are not updated by the simulation when fabric is enabled. Otherwise, the xform view class
+        is used, which is slower.
+
+        Args:
+            prim_path_expr: The path expression of the prims.
+            prim: The first prim matching the path expression, whose type determines the type of the view.
+
+        Returns:
+            The view of the prims.
+        """
+        if prim.HasAPI(UsdPhysics.ArticulationRootAPI):
+            return self._physics_sim_view.create_articulation_view(prim_path_expr.replace(".*", "*"))
+        elif prim.HasAPI(UsdPhysics.RigidBodyAPI):
+            return self._physics_sim_view.create_rigid_body_view(prim_path_expr.replace(".*", "*"))
+        else:
+            return XFormPrim(prim_path_expr, reset_xform_properties=False)
+
+    def _get_prim_view_poses(
+        self, view: XFormPrim | physx.ArticulationView | physx.RigidBodyView, env_ids: Sequence[int] | None = None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Reads the world poses of the prims of a view created by :meth:`_create_prim_view`.
+
+        Args:
+            view: The view of the prims.
+            env_ids: The indices of the prims to read. Defaults to None, in which case all the prims are read.
+
+        Returns:
+            The positions and the orientations (w, x, y, z) of the prims in the world frame.
+
+        Raises:
+            RuntimeError: If the type of the view is not supported.
+        """
+        if isinstance(view, XFormPrim):
+            return view.get_world_poses(env_ids)
+        # resolve None for indexing the transforms of the physics views
+        if env_ids is None:
+            env_ids = slice(None)
+        if isinstance(view, physx.ArticulationView):
+            pos_w, quat_w = view.get_root_transforms()[env_ids].split([3, 4], dim=-1)
+        elif isinstance(view, physx.RigidBodyView):
+            pos_w, quat_w = view.get_transforms()[env_ids].split([3, 4], dim=-1)
+        else:
+            raise RuntimeError(f"Unsupported view type: {type(view)}")
+        # note: the physics views store the orientations in (x, y, z, w) format
+        return pos_w, convert_quat(quat_w, to="wxyz")
+
+    def _update_dynamic_meshes(self):
+        """Moves the dynamic meshes to the current poses of their prims and refits their BVH."""
+        for mesh_prim_path, (view, local_points, instance_ids) in self._dynamic_meshes.items():
+            pos_w, quat_w = self._get_prim_view_poses(view)
+            refit_mesh(self.meshes[mesh_prim_path], local_points, instance_ids, pos_w, quat_w)
+
     def _initialize_rays_impl(self):
         # compute ray stars and directions
         self.ray_starts, self.ray_directions = self.cfg.pattern_cfg.func(self.cfg.pattern_cfg, self._device)
@@ -216,20 +315,19 @@ class RayCaster(SensorBase):
         self._data.pos_w = torch.zeros(self._view.count, 3, device=self._device)
         self._data.quat_w = torch.zeros(self._view.count, 4, device=self._device)
         self._data.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
+        # create the ray-cast engine that writes the hits directly into the data buffer
+        self._raycast_engine = RaycastEngine(
+            list(self.meshes.values()),
+            num_envs=self._view.count,
+            num_rays=self.num_rays,
+            max_dist=self.cfg.max_distance,
+            ray_hits=self._data.ray_hits_w,
+        )
 
     def _update_buffers_impl(self, env_ids: Sequence[int]):
         """Fills the buffers of the sensor data."""
         # obtain the poses of the sensors
-        if isinstance(self._view, XFormPrim):
-            pos_w, quat_w = self._view.get_world_poses(env_ids)
-        elif isinstance(self._view, physx.ArticulationView):
-            pos_w, quat_w = self._view.get_root_transforms()[env_ids].split([3, 4], dim=-1)
-            quat_w = convert_quat(quat_w, to="wxyz")
-        elif isinstance(self._view, physx.RigidBodyView):
-            pos_w, quat_w = self._view.get_transforms()[env_ids].split([3, 4], dim=-1)
-            quat_w = convert_quat(quat_w, to="wxyz")
-        else:
-            raise RuntimeError(f"Unsupported view type: {type(self._view)}")
+        pos_w, quat_w = self._get_prim_view_poses(self._view, env_ids)
         # note: we clone here because we are read-only operations
         pos_w = pos_w.clone()
         quat_w = quat_w.clone()
@@ -250,14 +348,13 @@ class RayCaster(SensorBase):
             ray_starts_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
             ray_starts_w += pos_w.unsqueeze(1)
             ray_directions_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
-        # ray cast and store the hits
-        # TODO: Make this work for multiple meshes?
-        self._data.ray_hits_w[env_ids] = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
-            max_dist=self.cfg.max_distance,
-            mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
-        )[0]
+        self._raycast_engine.ray_starts[env_ids] = ray_starts_w
+        self._raycast_engine.ray_directions[env_ids] = ray_directions_w
+        # move the dynamic meshes to their current poses
+        self._update_dynamic_meshes()
+        # ray cast against all the meshes
+        # note: the engine writes the closest hits directly into the data buffer
+        self._raycast_engine.raycast(env_ids)
 
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
@@ -15,7 +15,7 @@ from isaacsim.core.prims import XFormPrim
 
 import isaaclab.utils.math as math_utils
 from isaaclab.sensors.camera import CameraData
-from isaaclab.utils.warp import raycast_mesh
+from isaaclab.utils.warp import RaycastEngine
 
 from .ray_caster import RayCaster
 
@@ -31,17 +31,13 @@ class RayCasterCamera(RayCaster):
     :class:`isaaclab.sensors.Camera` that implements the camera class through USD camera prims.
     However, this class provides a faster image generation. The sensor converts meshes from the list of
     primitive paths provided in the configuration to Warp meshes. The camera then ray-casts against these
-    Warp meshes only.
+    Warp meshes only. Please check the :class:`RayCaster` for the handling of multiple and dynamic meshes.
 
     Currently, only the following annotators are supported:
 
     - ``"distance_to_camera"``: An image containing the distance to camera optical center.
     - ``"distance_to_image_plane"``: An image containing distances of 3D points from camera plane along camera's z-axis.
     - ``"normals"``: An image containing the local surface normal vectors at each pixel.
-
-    .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
     """
 
     cfg: RayCasterCameraCfg
@@ -247,6 +243,21 @@ class RayCasterCamera(RayCaster):
         self.num_rays = self.ray_directions.shape[1]
         # create buffer to store ray hits
         self.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
+        # create the ray-cast engine that writes the hits directly into the buffer
+        # note: we set max distance to 1e6 during the ray-casting. THis is because we clip the distance
+        # to the image plane and distance to the camera to the maximum distance afterwards in-order to
+        # match the USD camera behavior.
+        self._raycast_engine = RaycastEngine(
+            list(self.meshes.values()),
+            num_envs=self._view.count,
+            num_rays=self.num_rays,
+            max_dist=1e6,
+            return_distance=any(
+                [name in self.cfg.data_types for name in ["distance_to_image_plane", "distance_to_camera"]]
+            ),
+            return_normal="normals" in self.cfg.data_types,
+            ray_hits=self.ray_hits_w,
+        )
         # set offsets
         quat_w = math_utils.convert_camera_frame_orientation_convention(
             torch.tensor([self.cfg.offset.rot], device=self._device), origin=self.cfg.offset.convention, target="world"
@@ -270,23 +281,16 @@ class RayCasterCamera(RayCaster):
         ray_starts_w += pos_w.unsqueeze(1)
         ray_directions_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
 
+        self._raycast_engine.ray_starts[env_ids] = ray_starts_w
+        self._raycast_engine.ray_directions[env_ids] = ray_directions_w
+        # move the dynamic meshes to their current poses
+        self._update_dynamic_meshes()
         # ray cast and store the hits
-        # note: we set max distance to 1e6 during the ray-casting. THis is because we clip the distance
-        # to the image plane and distance to the camera to the maximum distance afterwards in-order to
-        # match the USD camera behavior.
-
-        # TODO: Make ray-casting work for multiple meshes?
-        # necessary for regular dictionaries.
-        self.ray_hits_w, ray_depth, ray_normal, _ = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
-            mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
-            max_dist=1e6,
-            return_distance=any(
-                [name in self.cfg.data_types for name in ["distance_to_image_plane", "distance_to_camera"]]
-            ),
-            return_normal="normals" in self.cfg.data_types,
-        )
+        self._raycast_engine.raycast(env_ids)
+        if self._raycast_engine.return_distance:
+            ray_depth = self._raycast_engine.ray_distance[env_ids]
+        if self._raycast_engine.return_normal:
+            ray_normal = self._raycast_engine.ray_normal[env_ids]
         # update output buffers
         if "distance_to_image_plane" in self.cfg.data_types:
             # note: data is in camera frame so we only take the first component (z-axis of camera frame)
@@ -35,9 +35,18 @@ class RayCasterCfg(SensorBaseCfg):
     mesh_prim_paths: list[str] = MISSING
     """The list of mesh primitive paths to ray cast against.
 
-    Note:
-        Currently, only a single static mesh is supported. We are working on supporting multiple
-        static meshes and dynamic meshes.
+    Each path can be a regex expression, such as ``"{ENV_REGEX_NS}/Obstacle"``. The meshes of all the matching
+    prims are combined into a single warp mesh. The rays return the closest hit over all the meshes.
+    """
+
+    dynamic_mesh_prim_paths: list[str] = []
+    """The list of mesh primitive paths whose poses are tracked. Defaults to an empty list.
+
+    The paths must be part of :attr:`mesh_prim_paths`. The meshes of these paths are moved to the current world
+    poses of the matching prims at every update of the sensor and their BVH is refit. This is meant for rigidly
+    moving meshes, such as movable obstacles, since the shape of the meshes is not updated. The poses of rigid
+    bodies and articulation roots are read from the physics views, and the poses of other prims from their
+    transforms on the USD stage.
     """
 
     offset: OffsetCfg = OffsetCfg()
@@ -18,7 +18,9 @@ if TYPE_CHECKING:
 
 
 @height_field_to_mesh
-def random_uniform_terrain(difficulty: float, cfg: hf_terrains_cfg.HfRandomUniformTerrainCfg) -> np.ndarray:
+def random_uniform_terrain(
+    difficulty: float, cfg: hf_terrains_cfg.HfRandomUniformTerrainCfg, rng: np.random.Generator | None = None
+) -> np.ndarray:
     """Generate a terrain with height sampled uniformly from a specified range.
 
     .. image:: ../../_static/terrains/height_field/random_uniform_terrain.jpg
@@ -31,6 +33,8 @@ def random_uniform_terrain(difficulty: float, cfg: hf_terrains_cfg.HfRandomUnifo
     Args:
         difficulty: The difficulty of the terrain. This is a value between 0 and 1.
         cfg: The configuration for the terrain.
+        rng: The random number generator to sample the terrain. Defaults to None, in which case a new
+            generator is seeded from the global NumPy random state.
 
     Returns:
         The height field of the terrain as a 2D numpy array with discretized heights.
@@ -40,6 +44,9 @@ def random_uniform_terrain(difficulty: float, cfg: hf_terrains_cfg.HfRandomUnifo
     Raises:
         ValueError: When the downsampled scale is smaller than the horizontal scale.
     """
+    # resolve the random number generator
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(0, 2**32 - 1, dtype=np.int64))
     # check parameters
     # -- horizontal scale
     if cfg.downsampled_scale is None:
@@ -65,7 +72,7 @@ def random_uniform_terrain(difficulty: float, cfg: hf_terrains_cfg.HfRandomUnifo
     # create range of heights possible
     height_range = np.arange(height_min, height_max + height_step, height_step)
     # sample heights randomly from the range along a grid
-    height_field_downsampled = np.random.choice(height_range, size=(width_downsampled, length_downsampled))
+    height_field_downsampled = rng.choice(height_range, size=(width_downsampled, length_downsampled))
     # create interpolation function for the sampled heights
     x = np.linspace(0, cfg.size[0] * cfg.horizontal_scale, width_downsampled)
     y = np.linspace(0, cfg.size[1] * cfg.horizontal_scale, length_downsampled)
@@ -210,7 +217,9 @@ def pyramid_stairs_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidStai
 
 
 @height_field_to_mesh
-def discrete_obstacles_terrain(difficulty: float, cfg: hf_terrains_cfg.HfDiscreteObstaclesTerrainCfg) -> np.ndarray:
+def discrete_obstacles_terrain(
+    difficulty: float, cfg: hf_terrains_cfg.HfDiscreteObstaclesTerrainCfg, rng: np.random.Generator | None = None
+) -> np.ndarray:
     """Generate a terrain with randomly generated obstacles as pillars with positive and negative heights.
 
     The terrain is a flat platform at the center of the terrain with randomly generated obstacles as pillars
@@ -225,12 +234,17 @@ def discrete_obstacles_terrain(difficulty: float, cfg: hf_terrains_cfg.HfDiscret
     Args:
         difficulty: The difficulty of the terrain. This is a value between 0 and 1.
         cfg: The configuration for the terrain.
+        rng: The random number generator to sample the terrain. Defaults to None, in which case a new
+            generator is seeded from the global NumPy random state.
 
     Returns:
         The height field of the terrain as a 2D numpy array with discretized heights.
         The shape of the array is (width, length), where width and length are the number of points
         along the x and y axis, respectively.
     """
+    # resolve the random number generator
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(0, 2**32 - 1, dtype=np.int64))
     # resolve terrain configuration
     obs_height = cfg.obstacle_height_range[0] + difficulty * (
         cfg.obstacle_height_range[1] - cfg.obstacle_height_range[0]
@@ -261,16 +275,16 @@ def discrete_obstacles_terrain(difficulty: float, cfg: hf_terrains_cfg.HfDiscret
     for _ in range(cfg.num_obstacles):
         # sample size
         if cfg.obstacle_height_mode == "choice":
-            height = np.random.choice([-obs_height, -obs_height // 2, obs_height // 2, obs_height])
+            height = rng.choice([-obs_height, -obs_height // 2, obs_height // 2, obs_height])
         elif cfg.obstacle_height_mode == "fixed":
             height = obs_height
         else:
             raise ValueError(f"Unknown obstacle height mode '{cfg.obstacle_height_mode}'. Must be 'choice' or 'fixed'.")
-        width = int(np.random.choice(obs_width_range))
-        length = int(np.random.choice(obs_length_range))
+        width = int(rng.choice(obs_width_range))
+        length = int(rng.choice(obs_length_range))
         # sample position
-        x_start = int(np.random.choice(obs_x_range))
-        y_start = int(np.random.choice(obs_y_range))
+        x_start = int(rng.choice(obs_x_range))
+        y_start = int(rng.choice(obs_y_range))
         # clip start position to the terrain
         if x_start + width > width_pixels:
             x_start = width_pixels - width
@@ -350,7 +364,9 @@ def wave_terrain(difficulty: float, cfg: hf_terrains_cfg.HfWaveTerrainCfg) -> np
 
 
 @height_field_to_mesh
-def stepping_stones_terrain(difficulty: float, cfg: hf_terrains_cfg.HfSteppingStonesTerrainCfg) -> np.ndarray:
+def stepping_stones_terrain(
+    difficulty: float, cfg: hf_terrains_cfg.HfSteppingStonesTerrainCfg, rng: np.random.Generator | None = None
+) -> np.ndarray:
     """Generate a terrain with a stepping stones pattern.
 
     The terrain is a stepping stones pattern which trims to a flat platform at the center of the terrain.
@@ -362,12 +378,17 @@ def stepping_stones_terrain(difficulty: float, cfg: hf_terrains_cfg.HfSteppingSt
     Args:
         difficulty: The difficulty of the terrain. This is a value between 0 and 1.
         cfg: The configuration for the terrain.
+        rng: The random number generator to sample the terrain. Defaults to None, in which case a new
+            generator is seeded from the global NumPy random state.
 
     Returns:
         The height field of the terrain as a 2D numpy array with discretized heights.
         The shape of the array is (width, length), where width and length are the number of points
         along the x and y axis, respectively.
     """
+    # resolve the random number generator
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(0, 2**32 - 1, dtype=np.int64))
     # resolve terrain configuration
     stone_width = cfg.stone_width_range[1] - difficulty * (cfg.stone_width_range[1] - cfg.stone_width_range[0])
     stone_distance = cfg.stone_distance_range[0] + difficulty * (
@@ -399,14 +420,14 @@ def stepping_stones_terrain(difficulty: float, cfg: hf_terrains_cfg.HfSteppingSt
             # ensure that stone stops along y-axis
             stop_y = min(length_pixels, start_y + stone_width)
             # randomly sample x-position
-            start_x = np.random.randint(0, stone_width)
+            start_x = rng.integers(0, stone_width)
             stop_x = max(0, start_x - stone_distance)
             # fill first stone
-            hf_raw[0:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
+            hf_raw[0:stop_x, start_y:stop_y] = rng.choice(stone_height_range)
             # fill row with stones
             while start_x < width_pixels:
                 stop_x = min(width_pixels, start_x + stone_width)
-                hf_raw[start_x:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
+                hf_raw[start_x:stop_x, start_y:stop_y] = rng.choice(stone_height_range)
                 start_x += stone_width + stone_distance
             # update y-position
             start_y += stone_width + stone_distance
@@ -415,14 +436,14 @@ def stepping_stones_terrain(difficulty: float, cfg: hf_terrains_cfg.HfSteppingSt
             # ensure that stone stops along x-axis
             stop_x = min(width_pixels, start_x + stone_width)
             # randomly sample y-position
-            start_y = np.random.randint(0, stone_width)
+            start_y = rng.integers(0, stone_width)
             stop_y = max(0, start_y - stone_distance)
             # fill first stone
-            hf_raw[start_x:stop_x, 0:stop_y] = np.random.choice(stone_height_range)
+            hf_raw[start_x:stop_x, 0:stop_y] = rng.choice(stone_height_range)
             # fill column with stones
             while start_y < length_pixels:
                 stop_y = min(length_pixels, start_y + stone_width)
-                hf_raw[start_x:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
+                hf_raw[start_x:stop_x, start_y:stop_y] = rng.choice(stone_height_range)
                 start_y += stone_width + stone_distance
             # update x-position
             start_x += stone_width + stone_distance
@@ -28,6 +28,12 @@ class HfTerrainBaseCfg(SubTerrainBaseCfg):
     slope_threshold: float | None = None
     """The slope threshold above which surfaces are made vertical. Defaults to None,
     in which case no correction is applied."""
+    decimate: bool = False
+    """Whether to merge the coplanar cells of the height field into larger rectangles. Defaults to False.
+
+    This reduces the number of vertices and triangles of the flat regions of the terrain mesh. Please refer to
+    :func:`~isaaclab.terrains.height_field.utils.convert_height_field_to_mesh` for more details.
+    """
 
 
 """
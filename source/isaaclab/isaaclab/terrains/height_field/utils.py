@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import copy
 import functools
+import inspect
 import numpy as np
 import trimesh
 from collections.abc import Callable
@@ -23,6 +24,9 @@ def height_field_to_mesh(func: Callable) -> Callable:
     at a specified resolution and performing interpolation to obtain the intermediate heights.
     Additionally, it adds a border around the terrain to avoid artifacts at the edges.
 
+    The mesh function takes an optional random number generator argument ``rng``. It is passed on to the height
+    field function if the latter has a ``rng`` argument.
+
     Args:
         func: The height field function to convert. The function should return a 2D numpy array
             with the heights of the terrain.
@@ -32,8 +36,11 @@ def height_field_to_mesh(func: Callable) -> Callable:
         mesh objects and the origin of the terrain.
     """
 
+    # check if the height field function samples from a given random number generator
+    has_rng_arg = "rng" in inspect.signature(func).parameters
+
     @functools.wraps(func)
-    def wrapper(difficulty: float, cfg: HfTerrainBaseCfg):
+    def wrapper(difficulty: float, cfg: HfTerrainBaseCfg, rng: np.random.Generator | None = None):
         # check valid border width
         if cfg.border_width > 0 and cfg.border_width < cfg.horizontal_scale:
             raise ValueError(
@@ -52,7 +59,7 @@ def height_field_to_mesh(func: Callable) -> Callable:
         terrain_size = copy.deepcopy(cfg.size)
         cfg.size = tuple(sub_terrain_size)
         # generate the height field
-        z_gen = func(difficulty, cfg)
+        z_gen = func(difficulty, cfg, rng=rng) if has_rng_arg else func(difficulty, cfg)
         # handle the border for the terrain
         heights[border_pixels:-border_pixels, border_pixels:-border_pixels] = z_gen
         # set terrain size back to config
@@ -60,7 +67,7 @@ def height_field_to_mesh(func: Callable) -> Callable:
 
         # convert to trimesh
         vertices, triangles = convert_height_field_to_mesh(
-            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold
+            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold, decimate=cfg.decimate
         )
         mesh = trimesh.Trimesh(vertices=vertices, faces=triangles)
         # compute origin
@@ -77,7 +84,11 @@ def height_field_to_mesh(func: Callable) -> Callable:
 
 
 def convert_height_field_to_mesh(
-    height_field: np.ndarray, horizontal_scale: float, vertical_scale: float, slope_threshold: float | None = None
+    height_field: np.ndarray,
+    horizontal_scale: float,
+    vertical_scale: float,
+    slope_threshold: float | None = None,
+    decimate: bool = False,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Convert a height-field array to a triangle mesh represented by vertices and triangles.
 
@@ -102,12 +113,20 @@ def convert_height_field_to_mesh(
                   /  |
         (x_1,y_1)A---A'(x_1',y_1)
 
+    If :attr:`decimate` is True, adjacent cells of the height field that lie on the same plane are merged into
+    larger rectangles, each of which is represented by two triangles. Only the cells whose vertices are not moved
+    by the slope correction are merged. This reduces the number of vertices and triangles of flat regions (such
+    as platforms, stair treads or obstacle tops) significantly. The merged rectangles share their corner vertices
+    with the neighboring cells, but the intermediate vertices along their edges become T-junctions. Since these
+    vertices lie exactly on the edges of the rectangles, the surface of the mesh is unchanged.
+
     Args:
         height_field: The input height-field array.
         horizontal_scale: The discretization of the terrain along the x and y axis.
         vertical_scale: The discretization of the terrain along the z axis.
         slope_threshold: The slope threshold above which surfaces are made vertical.
             Defaults to None, in which case no correction is applied.
+        decimate: Whether to merge the coplanar cells into larger rectangles. Defaults to False.
 
     Returns:
         The vertices and triangles of the mesh:
@@ -126,6 +145,8 @@ def convert_height_field_to_mesh(
     hf = height_field.copy()
 
     # correct vertical surfaces above the slope threshold
+    # note: the slope correction only moves the vertices in the xy-plane
+    moved = np.zeros((num_rows, num_cols), dtype=bool)
     if slope_threshold is not None:
         # scale slope threshold based on the horizontal and vertical scale
         slope_threshold *= horizontal_scale / vertical_scale
@@ -146,28 +167,102 @@ def convert_height_field_to_mesh(
         move_corners[1:num_rows, 1:num_cols] -= (
             hf[: num_rows - 1, : num_cols - 1] - hf[1:num_rows, 1:num_cols] > slope_threshold
         )
-        xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
-        yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+        offset_x = move_x + move_corners * (move_x == 0)
+        offset_y = move_y + move_corners * (move_y == 0)
+        xx += offset_x * horizontal_scale
+        yy += offset_y * horizontal_scale
+        moved = (offset_x != 0) | (offset_y != 0)
 
     # create vertices for the mesh
     vertices = np.zeros((num_rows * num_cols, 3), dtype=np.float32)
     vertices[:, 0] = xx.flatten()
     vertices[:, 1] = yy.flatten()
     vertices[:, 2] = hf.flatten() * vertical_scale
+
+    # create the rectangles of the mesh as the range of rows and columns of the covered cells
+    # note: the end indices are the indices of the last vertices, i.e. a cell is given by (i, i + 1, j, j + 1)
+    if decimate:
+        rectangles = _merge_coplanar_cells(hf, moved)
+    else:
+        cell_rows, cell_cols = np.meshgrid(np.arange(num_rows - 1), np.arange(num_cols - 1), indexing="ij")
+        rectangles = np.stack([cell_rows, cell_rows + 1, cell_cols, cell_cols + 1], axis=-1).reshape(-1, 4)
     # create triangles for the mesh
-    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
-    for i in range(num_rows - 1):
-        ind0 = np.arange(0, num_cols - 1) + i * num_cols
-        ind1 = ind0 + 1
-        ind2 = ind0 + num_cols
-        ind3 = ind2 + 1
-        start = 2 * i * (num_cols - 1)
-        stop = start + 2 * (num_cols - 1)
-        triangles[start:stop:2, 0] = ind0
-        triangles[start:stop:2, 1] = ind3
-        triangles[start:stop:2, 2] = ind1
-        triangles[start + 1 : stop : 2, 0] = ind0
-        triangles[start + 1 : stop : 2, 1] = ind2
-        triangles[start + 1 : stop : 2, 2] = ind3
+    # each rectangle is split into two triangles along its diagonal
+    ind0 = rectangles[:, 0] * num_cols + rectangles[:, 2]
+    ind1 = rectangles[:, 0] * num_cols + rectangles[:, 3]
+    ind2 = rectangles[:, 1] * num_cols + rectangles[:, 2]
+    ind3 = rectangles[:, 1] * num_cols + rectangles[:, 3]
+    triangles = np.empty((2 * len(rectangles), 3), dtype=np.uint32)
+    triangles[0::2] = np.stack([ind0, ind3, ind1], axis=-1)
+    triangles[1::2] = np.stack([ind0, ind2, ind3], axis=-1)
+
+    # remove the vertices that are not used by any triangle
+    if decimate:
+        used_vertices = np.zeros(num_rows * num_cols, dtype=bool)
+        used_vertices[triangles] = True
+        vertex_ids = np.cumsum(used_vertices, dtype=np.int64) - 1
+        vertices = vertices[used_vertices]
+        triangles = vertex_ids[triangles].astype(np.uint32)
 
     return vertices, triangles
+
+
+def _merge_coplanar_cells(height_field: np.ndarray, moved: np.ndarray) -> np.ndarray:
+    """Merge the adjacent coplanar cells of a height field into rectangles.
+
+    A cell is planar if its four vertices lie on a plane, which for integer heights means that the height
+    difference along the x-axis is the same on both of its sides. Planar cells that are not moved by the slope
+    correction are merged with their neighbors on the same plane. Along each row, the runs of these cells are
+    merged first. Afterwards, the runs with the same extent and plane in consecutive rows are merged into rectangles.
+    All other cells are kept as they are.
+
+    Args:
+        height_field: The height field array. Shape is (num_rows, num_cols).
+        moved: Whether the vertices are moved in the xy-plane by the slope correction. Shape is (num_rows, num_cols).
+
+    Returns:
+        The rectangles as the start and end vertex indices along the rows and columns. Shape is (N, 4), where
+        each row is (row_start, row_end, col_start, col_end).
+    """
+    hf = height_field.astype(np.int64)
+    num_cell_rows, num_cell_cols = hf.shape[0] - 1, hf.shape[1] - 1
+    # compute the gradients of the cells along the x and y axis
+    grad_x = hf[1:, :-1] - hf[:-1, :-1]
+    grad_y = hf[:-1, 1:] - hf[:-1, :-1]
+    # find the cells that can be merged
+    mergeable = hf[1:, 1:] - hf[:-1, 1:] == grad_x
+    mergeable &= ~(moved[:-1, :-1] | moved[1:, :-1] | moved[:-1, 1:] | moved[1:, 1:])
+    # compute the planes of the cells: h(i, j) = offset + grad_x * i + grad_y * j
+    cell_rows, cell_cols = np.meshgrid(np.arange(num_cell_rows), np.arange(num_cell_cols), indexing="ij")
+    offset = hf[:-1, :-1] - grad_x * cell_rows - grad_y * cell_cols
+    planes = np.stack([grad_x, grad_y, offset], axis=-1)
+    # find the runs of mergeable cells on the same plane along each row
+    same_plane = mergeable[:, 1:] & mergeable[:, :-1] & (planes[:, 1:] == planes[:, :-1]).all(axis=-1)
+    is_run_start = mergeable.copy()
+    is_run_start[:, 1:] &= ~same_plane
+    is_run_end = mergeable.copy()
+    is_run_end[:, :-1] &= ~same_plane
+    run_rows, run_starts = np.nonzero(is_run_start)
+    run_ends = np.nonzero(is_run_end)[1] + 1
+    run_planes = planes[run_rows, run_starts]
+
+    # merge the runs with the same extent and plane in consecutive rows
+    rectangles = list()
+    open_rectangles = dict()
+    run_index = 0
+    for row in range(num_cell_rows + 1):
+        # continue the open rectangles with the runs of the current row
+        next_open_rectangles = dict()
+        while run_index < len(run_rows) and run_rows[run_index] == row:
+            key = (run_starts[run_index], run_ends[run_index], *run_planes[run_index])
+            next_open_rectangles[key] = open_rectangles.pop(key, row)
+            run_index += 1
+        # close the rectangles that are not continued
+        for (col_start, col_end, *_), row_start in open_rectangles.items():
+            rectangles.append((row_start, row, col_start, col_end))
+        open_rectangles = next_open_rectangles
+
+    # add the cells that are not merged
+    rows, cols = np.nonzero(~mergeable)
+    cells = np.stack([rows, rows + 1, cols, cols + 1], axis=-1)
+    return np.concatenate([np.array(rectangles, dtype=np.int64).reshape(-1, 4), cells], axis=0)
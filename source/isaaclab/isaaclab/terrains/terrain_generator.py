@@ -3,10 +3,13 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import inspect
+import multiprocessing
 import numpy as np
 import os
 import torch
 import trimesh
+from concurrent.futures import ProcessPoolExecutor
 
 import omni.log
 
@@ -16,9 +19,9 @@ from isaaclab.utils.timer import Timer
 from isaaclab.utils.warp import convert_to_warp_mesh
 
 from .height_field import HfTerrainBaseCfg
-from .terrain_generator_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg, TerrainGeneratorCfg
+from .terrain_generator_cfg import SubTerrainBaseCfg, TerrainGeneratorCfg
 from .trimesh.utils import make_border
-from .utils import color_meshes_by_height, find_flat_patches
+from .utils import color_meshes_by_height, find_flat_patches_batched
 
 
 class TerrainGenerator:
@@ -66,7 +69,14 @@ class TerrainGenerator:
     If the flag :attr:`~TerrainGeneratorCfg.use_cache` is set to True, the terrains are cached based on their
     sub-terrain configurations. This means that if the same sub-terrain configuration is used
     multiple times, the terrain is only generated once and then reused. This is useful when
-    generating complex sub-terrains that take a long time to generate.
+    generating complex sub-terrains that take a long time to generate. Additionally, the complete terrain
+    is cached based on the terrain generator configuration. If it exists in the cache, the combined terrain
+    mesh, the origins and the flat patches are loaded directly and no sub-terrain is generated.
+
+    The sub-terrains can be generated in parallel in a process pool by setting the
+    :attr:`~TerrainGeneratorCfg.num_workers` parameter. The random numbers of each sub-terrain are drawn from
+    an independent random number generator seeded from the terrain generator seed and the row and column of the
+    sub-terrain. Thus, the generated terrain does not depend on the number of workers.
 
     .. attention::
 
@@ -79,7 +89,10 @@ class TerrainGenerator:
     terrain_mesh: trimesh.Trimesh
     """A single trimesh.Trimesh object for all the generated sub-terrains."""
     terrain_meshes: list[trimesh.Trimesh]
-    """List of trimesh.Trimesh objects for all the generated sub-terrains."""
+    """List of trimesh.Trimesh objects for all the generated sub-terrains.
+
+    If the complete terrain is loaded from the cache, the list only contains the combined terrain mesh.
+    """
     terrain_origins: np.ndarray
     """The origin of each sub-terrain. Shape is (num_rows, num_cols, 3)."""
     flat_patches: dict[str, torch.Tensor]
@@ -134,6 +147,16 @@ class TerrainGenerator:
         # note: we create a new random number generator to avoid affecting the global state
         #  in the other places where random numbers are used.
         self.np_rng = np.random.default_rng(seed)
+        # store the seed to derive the seeds of the sub-terrains
+        self._seed = int(seed)
+
+        # check if the complete terrain exists in the cache - if true, load it and return
+        if self.cfg.use_cache:
+            terrain_cache_filename = os.path.join(self.cfg.cache_dir, self._get_terrain_hash(), "terrain.npz")
+            if os.path.exists(terrain_cache_filename):
+                with Timer("[INFO] Loading terrain from cache took"):
+                    self._load_terrain_from_cache(terrain_cache_filename)
+                return
 
         # buffer for storing valid patches
         self.flat_patches = {}
@@ -178,6 +201,10 @@ class TerrainGenerator:
         for name, value in self.flat_patches.items():
             self.flat_patches[name] = value + terrain_origins_torch
 
+        # if caching is enabled, save the complete terrain
+        if self.cfg.use_cache:
+            self._save_terrain_to_cache(os.path.join(self.cfg.cache_dir, self._get_terrain_hash(), "terrain.npz"))
+
     def __str__(self):
         """Return a string representation of the terrain generator."""
         msg = "Terrain Generator:"
@@ -189,9 +216,11 @@ class TerrainGenerator:
         msg += f"\n\tCurriculum: {self.cfg.curriculum}"
         msg += f"\n\tDifficulty range: {self.cfg.difficulty_range}"
         msg += f"\n\tColor scheme: {self.cfg.color_scheme}"
+        msg += f"\n\tNumber of workers: {self.cfg.num_workers}"
         msg += f"\n\tUse cache: {self.cfg.use_cache}"
         if self.cfg.use_cache:
             msg += f"\n\tCache directory: {self.cfg.cache_dir}"
+            msg += f"\n\tCache format: {self.cfg.cache_format}"
 
         return msg
 
@@ -208,6 +237,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # randomly sample sub-terrains
+        sub_terrains = list()
         for index in range(self.cfg.num_rows * self.cfg.num_cols):
             # coordinate index of the sub-terrain
             (sub_row, sub_col) = np.unravel_index(index, (self.cfg.num_rows, self.cfg.num_cols))
@@ -215,10 +245,9 @@ class TerrainGenerator:
             sub_index = self.np_rng.choice(len(proportions), p=proportions)
             # randomly sample difficulty parameter
             difficulty = self.np_rng.uniform(*self.cfg.difficulty_range)
-            # generate terrain
-            mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_index])
-            # add to sub-terrains
-            self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_index])
+            sub_terrains.append((int(sub_row), int(sub_col), difficulty, sub_terrains_cfgs[sub_index]))
+        # generate terrains and add them to sub-terrains
+        self._generate_sub_terrains(sub_terrains)
 
     def _generate_curriculum_terrains(self):
         """Add terrains based on the difficulty parameter."""
@@ -237,6 +266,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # curriculum-based sub-terrains
+        sub_terrains = list()
         for sub_col in range(self.cfg.num_cols):
             for sub_row in range(self.cfg.num_rows):
                 # vary the difficulty parameter linearly over the number of rows
@@ -248,15 +278,177 @@ class TerrainGenerator:
                 lower, upper = self.cfg.difficulty_range
                 difficulty = (sub_row + self.np_rng.uniform()) / self.cfg.num_rows
                 difficulty = lower + (upper - lower) * difficulty
-                # generate terrain
-                mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_indices[sub_col]])
-                # add to sub-terrains
-                self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_indices[sub_col]])
+                sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_indices[sub_col]]))
+        # generate terrains and add them to sub-terrains
+        self._generate_sub_terrains(sub_terrains)
 
     """
     Internal helper functions.
     """
 
+    def _generate_sub_terrains(self, sub_terrains: list[tuple[int, int, float, SubTerrainBaseCfg]]):
+        """Generate the meshes of the sub-terrains and add them to the list of sub-terrains.
+
+        The meshes are generated sequentially or in a process pool, based on :attr:`TerrainGeneratorCfg.num_workers`.
+        In both cases, the sub-terrains are added in the order of the input list.
+
+        Args:
+            sub_terrains: The row index, column index, difficulty and configuration of each sub-terrain.
+        """
+        # arguments of the generation of each sub-terrain
+        arguments = [
+            (difficulty, sub_cfg, self._get_sub_terrain_seed(row, col), self.cfg)
+            for row, col, difficulty, sub_cfg in sub_terrains
+        ]
+        num_workers = self.cfg.num_workers
+        if num_workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            omni.log.warn("Parallel terrain generation requires the 'fork' start method. Generating sequentially.")
+            num_workers = 1
+        # generate the meshes
+        if num_workers <= 1 or len(sub_terrains) <= 1:
+            results = [_get_terrain_mesh(*args) for args in arguments]
+        else:
+            # note: the workers are forked so that they do not re-import the main module of the application
+            with ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("fork")) as pool:
+                chunk_size = max(1, len(arguments) // (4 * num_workers))
+                results = list(pool.map(_get_terrain_mesh, *zip(*arguments), chunksize=chunk_size))
+        # add the meshes in order
+        for (row, col, _, _), (mesh, origin) in zip(sub_terrains, results):
+            self._add_sub_terrain(mesh, origin, row, col)
+        # sample flat patches on all the sub-terrains at once
+        self._sample_flat_patches(sub_terrains, [mesh for mesh, _ in results])
+
+    def _sample_flat_patches(
+        self, sub_terrains: list[tuple[int, int, float, SubTerrainBaseCfg]], meshes: list[trimesh.Trimesh]
+    ):
+        """Sample the flat patches of the sub-terrains if specified.
+
+        The meshes of the sub-terrains with flat patch sampling are combined into a single warp mesh. The flat
+        patches of all these sub-terrains and patch configurations are then searched at once, with each search
+        restricted to the bounds and the faces of its sub-terrain. The patches of each sub-terrain are sampled
+        from a random number generator seeded with the seed of the sub-terrain, so that they do not depend on
+        the other sub-terrains.
+
+        Args:
+            sub_terrains: The row index, column index, difficulty and configuration of each sub-terrain.
+            meshes: The meshes of the sub-terrains at their position in the terrain.
+        """
+        # collect the searches of all the sub-terrains
+        search_keys, search_meshes, origins, bounds, face_ranges, patch_cfgs, generators = [], [], [], [], [], [], []
+        num_faces = 0
+        for (row, col, _, sub_cfg), mesh in zip(sub_terrains, meshes):
+            if sub_cfg.flat_patch_sampling is None:
+                continue
+            search_meshes.append(mesh)
+            # note: the random number generator is seeded for reproducibility
+            generator = torch.Generator(device=self.device).manual_seed(self._get_sub_terrain_seed(row, col))
+            for name, patch_cfg in sub_cfg.flat_patch_sampling.items():
+                search_keys.append((name, row, col))
+                origins.append(self.terrain_origins[row, col])
+                bounds.append(mesh.bounds)
+                face_ranges.append((num_faces, num_faces + len(mesh.faces)))
+                patch_cfgs.append(patch_cfg)
+                generators.append(generator)
+            num_faces += len(mesh.faces)
+        # check if there is anything to sample
+        if len(patch_cfgs) == 0:
+            return
+        omni.log.info(f"Sampling flat patches for {len(search_meshes)} sub-terrains.")
+
+        # convert the meshes to a warp mesh
+        mesh = trimesh.util.concatenate(search_meshes)
+        wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+        # sample flat patches based on each patch configuration for the sub-terrains
+        flat_patches = find_flat_patches_batched(
+            wp_mesh=wp_mesh,
+            origins=torch.tensor(np.array(origins), dtype=torch.float),
+            patch_cfgs=patch_cfgs,
+            bounds=torch.tensor(np.array(bounds), dtype=torch.float),
+            face_ranges=torch.tensor(face_ranges, dtype=torch.long),
+            generator=generators,
+        )
+        # add the flat patches to the tensors
+        for (name, row, col), patches in zip(search_keys, flat_patches):
+            # create the flat patches tensor (if not already created)
+            if name not in self.flat_patches:
+                self.flat_patches[name] = torch.zeros(
+                    (self.cfg.num_rows, self.cfg.num_cols, len(patches), 3), device=self.device
+                )
+            self.flat_patches[name][row, col] = patches
+
+    def _get_sub_terrain_seed(self, row: int, col: int) -> int:
+        """Derive the seed of a sub-terrain from the seed of the terrain generator and its grid position.
+
+        Args:
+            row: The row index of the sub-terrain.
+            col: The column index of the sub-terrain.
+
+        Returns:
+            The seed of the sub-terrain.
+        """
+        seed_sequence = np.random.SeedSequence(entropy=self._seed, spawn_key=(row, col))
+        return int(seed_sequence.generate_state(1)[0])
+
+    def _get_terrain_hash(self) -> str:
+        """Compute the hash of the complete terrain.
+
+        The hash is computed from the terrain generator configuration, including the sub-terrain and flat patch
+        sampling configurations, and the resolved seed of the terrain generator. The settings that do not change
+        the generated terrain, such as the number of workers and the cache settings, are excluded.
+
+        Returns:
+            The hash of the complete terrain.
+        """
+        cfg_dict = self.cfg.to_dict()
+        for key in ["use_cache", "cache_dir", "cache_format", "num_workers"]:
+            cfg_dict.pop(key)
+        cfg_dict["seed"] = self._seed
+        return dict_to_md5_hash(cfg_dict)
+
+    def _save_terrain_to_cache(self, filename: str):
+        """Save the complete terrain into the cache.
+
+        The combined terrain mesh, the vertex colors (if any), the origins and the flat patches of the
+        sub-terrains are stored as uncompressed NumPy arrays in a single file.
+
+        Args:
+            filename: The path of the cache file.
+        """
+        data = {
+            "vertices": self.terrain_mesh.vertices,
+            "faces": self.terrain_mesh.faces,
+            "terrain_origins": self.terrain_origins,
+        }
+        if self.cfg.color_scheme != "none":
+            data["vertex_colors"] = self.terrain_mesh.visual.vertex_colors
+        for name, value in self.flat_patches.items():
+            data[f"flat_patches/{name}"] = value.cpu().numpy()
+        # create the cache directory
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        dump_yaml(os.path.join(os.path.dirname(filename), "cfg.yaml"), self.cfg)
+        _save_arrays(filename, data)
+
+    def _load_terrain_from_cache(self, filename: str):
+        """Load the complete terrain from the cache.
+
+        Args:
+            filename: The path of the cache file.
+        """
+        with np.load(filename) as data:
+            self.terrain_mesh = trimesh.Trimesh(
+                vertices=data["vertices"],
+                faces=data["faces"],
+                vertex_colors=data["vertex_colors"] if "vertex_colors" in data else None,
+                process=False,
+            )
+            self.terrain_origins = data["terrain_origins"]
+            self.flat_patches = {
+                key.removeprefix("flat_patches/"): torch.from_numpy(data[key]).to(self.device)
+                for key in data.files
+                if key.startswith("flat_patches/")
+            }
+        self.terrain_meshes = [self.terrain_mesh]
+
     def _add_terrain_border(self):
         """Add a surrounding border over all the sub-terrains into the terrain meshes."""
         # border parameters
@@ -279,13 +471,11 @@ class TerrainGenerator:
         # add the border to the list of meshes
         self.terrain_meshes.append(border)
 
-    def _add_sub_terrain(
-        self, mesh: trimesh.Trimesh, origin: np.ndarray, row: int, col: int, sub_terrain_cfg: SubTerrainBaseCfg
-    ):
+    def _add_sub_terrain(self, mesh: trimesh.Trimesh, origin: np.ndarray, row: int, col: int):
         """Add input sub-terrain to the list of sub-terrains.
 
         This function adds the input sub-terrain mesh to the list of sub-terrains and updates the origin
-        of the sub-terrain in the list of origins. It also samples flat patches if specified.
+        of the sub-terrain in the list of origins.
 
         Args:
             mesh: The mesh of the sub-terrain.
@@ -293,31 +483,6 @@ class TerrainGenerator:
             row: The row index of the sub-terrain.
             col: The column index of the sub-terrain.
         """
-        # sample flat patches if specified
-        if sub_terrain_cfg.flat_patch_sampling is not None:
-            omni.log.info(f"Sampling flat patches for sub-terrain at (row, col):  ({row}, {col})")
-            # convert the mesh to warp mesh
-            wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-            # sample flat patches based on each patch configuration for that sub-terrain
-            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
-                patch_cfg: FlatPatchSamplingCfg
-                # create the flat patches tensor (if not already created)
-                if name not in self.flat_patches:
-                    self.flat_patches[name] = torch.zeros(
-                        (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
-                    )
-                # add the flat patches to the tensor
-                self.flat_patches[name][row, col] = find_flat_patches(
-                    wp_mesh=wp_mesh,
-                    origin=origin,
-                    num_patches=patch_cfg.num_patches,
-                    patch_radius=patch_cfg.patch_radius,
-                    x_range=patch_cfg.x_range,
-                    y_range=patch_cfg.y_range,
-                    z_range=patch_cfg.z_range,
-                    max_height_diff=patch_cfg.max_height_diff,
-                )
-
         # transform the mesh to the correct position
         transform = np.eye(4)
         transform[0:2, -1] = (row + 0.5) * self.cfg.size[0], (col + 0.5) * self.cfg.size[1]
@@ -327,61 +492,120 @@ class TerrainGenerator:
         # add origin to the list
         self.terrain_origins[row, col] = origin + transform[:3, -1]
 
-    def _get_terrain_mesh(self, difficulty: float, cfg: SubTerrainBaseCfg) -> tuple[trimesh.Trimesh, np.ndarray]:
-        """Generate a sub-terrain mesh based on the input difficulty parameter.
 
-        If caching is enabled, the sub-terrain is cached and loaded from the cache if it exists.
-        The cache is stored in the cache directory specified in the configuration.
+"""
+Helper functions.
+"""
 
-        .. Note:
-            This function centers the 2D center of the mesh and its specified origin such that the
-            2D center becomes :math:`(0, 0)` instead of :math:`(size[0] / 2, size[1] / 2).
 
-        Args:
-            difficulty: The difficulty parameter.
-            cfg: The configuration of the sub-terrain.
+def _get_terrain_mesh(
+    difficulty: float, cfg: SubTerrainBaseCfg, seed: int, generator_cfg: TerrainGeneratorCfg
+) -> tuple[trimesh.Trimesh, np.ndarray]:
+    """Generate a sub-terrain mesh based on the input difficulty parameter.
 
-        Returns:
-            The sub-terrain mesh and origin.
-        """
-        # copy the configuration
-        cfg = cfg.copy()
-        # add other parameters to the sub-terrain configuration
-        cfg.difficulty = float(difficulty)
-        cfg.seed = self.cfg.seed
-        # generate hash for the sub-terrain
-        sub_terrain_hash = dict_to_md5_hash(cfg.to_dict())
-        # generate the file name
-        sub_terrain_cache_dir = os.path.join(self.cfg.cache_dir, sub_terrain_hash)
-        sub_terrain_obj_filename = os.path.join(sub_terrain_cache_dir, "mesh.obj")
-        sub_terrain_csv_filename = os.path.join(sub_terrain_cache_dir, "origin.csv")
-        sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
-
-        # check if hash exists - if true, load the mesh and origin and return
-        if self.cfg.use_cache and os.path.exists(sub_terrain_obj_filename):
+    If caching is enabled, the sub-terrain is cached and loaded from the cache if it exists.
+    The cache is stored in the cache directory specified in the configuration.
+
+    If the terrain function has a ``rng`` argument, it receives a :class:`numpy.random.Generator` seeded with the
+    seed of the sub-terrain. For terrain functions that draw from the global random number generators instead,
+    the global NumPy and PyTorch (CPU) generators are seeded with the seed of the sub-terrain while the terrain
+    is generated, and restored afterwards. The function is defined at the module level so that it can be run in
+    the process pool of the terrain generator.
+
+    .. Note:
+        This function centers the 2D center of the mesh and its specified origin such that the
+        2D center becomes :math:`(0, 0)` instead of :math:`(size[0] / 2, size[1] / 2).
+
+    Args:
+        difficulty: The difficulty parameter.
+        cfg: The configuration of the sub-terrain.
+        seed: The seed of the random number generators for the sub-terrain.
+        generator_cfg: The configuration of the terrain generator.
+
+    Returns:
+        The sub-terrain mesh and origin.
+    """
+    # copy the configuration
+    cfg = cfg.copy()
+    # add other parameters to the sub-terrain configuration
+    cfg.difficulty = float(difficulty)
+    # note: the seed of the sub-terrain is derived from its grid position, so sub-terrains with the same
+    #   configuration and difficulty at different positions are cached separately
+    cfg.seed = seed
+    # generate hash for the sub-terrain
+    sub_terrain_hash = dict_to_md5_hash(cfg.to_dict())
+    # generate the file name
+    sub_terrain_cache_dir = os.path.join(generator_cfg.cache_dir, sub_terrain_hash)
+    sub_terrain_npz_filename = os.path.join(sub_terrain_cache_dir, "mesh.npz")
+    sub_terrain_obj_filename = os.path.join(sub_terrain_cache_dir, "mesh.obj")
+    sub_terrain_csv_filename = os.path.join(sub_terrain_cache_dir, "origin.csv")
+    sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
+
+    # check if hash exists - if true, load the mesh and origin and return
+    if generator_cfg.use_cache:
+        if generator_cfg.cache_format == "npz" and os.path.exists(sub_terrain_npz_filename):
+            # load existing mesh
+            with np.load(sub_terrain_npz_filename) as data:
+                mesh = trimesh.Trimesh(vertices=data["vertices"], faces=data["faces"], process=False)
+                origin = data["origin"]
+            # return the generated mesh
+            return mesh, origin
+        if generator_cfg.cache_format == "obj" and os.path.exists(sub_terrain_obj_filename):
             # load existing mesh
             mesh = trimesh.load_mesh(sub_terrain_obj_filename, process=False)
             origin = np.loadtxt(sub_terrain_csv_filename, delimiter=",")
             # return the generated mesh
             return mesh, origin
 
-        # generate the terrain
-        meshes, origin = cfg.function(difficulty, cfg)
-        mesh = trimesh.util.concatenate(meshes)
-        # offset mesh such that they are in their center
-        transform = np.eye(4)
-        transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
-        mesh.apply_transform(transform)
-        # change origin to be in the center of the sub-terrain
-        origin += transform[0:3, -1]
-
-        # if caching is enabled, save the mesh and origin
-        if self.cfg.use_cache:
-            # create the cache directory
-            os.makedirs(sub_terrain_cache_dir, exist_ok=True)
-            # save the data
+    # generate the terrain with the random number generators seeded for the sub-terrain
+    function_kwargs = dict()
+    if "rng" in inspect.signature(cfg.function).parameters:
+        function_kwargs["rng"] = np.random.default_rng(seed)
+    np_rng_state = np.random.get_state()
+    torch_rng_state = torch.get_rng_state()
+    np.random.seed(seed)
+    torch.random.default_generator.manual_seed(seed)
+    try:
+        meshes, origin = cfg.function(difficulty, cfg, **function_kwargs)
+    finally:
+        np.random.set_state(np_rng_state)
+        torch.set_rng_state(torch_rng_state)
+    mesh = trimesh.util.concatenate(meshes)
+    # offset mesh such that they are in their center
+    transform = np.eye(4)
+    transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
+    mesh.apply_transform(transform)
+    # change origin to be in the center of the sub-terrain
+    origin += transform[0:3, -1]
+
+    # if caching is enabled, save the mesh and origin
+    if generator_cfg.use_cache:
+        # create the cache directory
+        os.makedirs(sub_terrain_cache_dir, exist_ok=True)
+        # save the data
+        if generator_cfg.cache_format == "npz":
+            _save_arrays(sub_terrain_npz_filename, {"vertices": mesh.vertices, "faces": mesh.faces, "origin": origin})
+        elif generator_cfg.cache_format == "obj":
             mesh.export(sub_terrain_obj_filename)
             np.savetxt(sub_terrain_csv_filename, origin, delimiter=",", header="x,y,z")
-            dump_yaml(sub_terrain_meta_filename, cfg)
-        # return the generated mesh
-        return mesh, origin
+        else:
+            raise ValueError(f"Invalid cache format: {generator_cfg.cache_format}.")
+        dump_yaml(sub_terrain_meta_filename, cfg)
+    # return the generated mesh
+    return mesh, origin
+
+
+def _save_arrays(filename: str, data: dict[str, np.ndarray]):
+    """Save the arrays into an uncompressed NumPy archive.
+
+    The archive is first written to a temporary file and then moved to its final location. This ensures
+    that processes reading the cache never see a partially written file.
+
+    Args:
+        filename: The path of the archive.
+        data: The arrays to save, keyed by their names.
+    """
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    with open(tmp_filename, "wb") as f:
+        np.savez(f, **data)
+    os.replace(tmp_filename, filename)
@@ -77,6 +77,9 @@ class SubTerrainBaseCfg:
 
     This function must take as input the terrain difficulty and the configuration parameters and
     return a tuple with a list of ``trimesh`` mesh objects and the terrain origin.
+
+    If the function has a ``rng`` argument, the terrain generator passes a :class:`numpy.random.Generator`
+    seeded for the sub-terrain, from which all the random numbers of the terrain should be drawn.
     """
 
     proportion: float = 1.0
@@ -198,3 +201,30 @@ class TerrainGeneratorCfg:
 
     cache_dir: str = "/tmp/isaaclab/terrains"
     """The directory where the terrain cache is stored. Defaults to "/tmp/isaaclab/terrains"."""
+
+    cache_format: Literal["npz", "obj"] = "npz"
+    """The file format of the cached sub-terrains. Defaults to "npz".
+
+    The available formats are:
+
+    - "npz": The vertices, faces and origin of the sub-terrain are stored as binary NumPy arrays.
+    - "obj": The mesh is stored as a Wavefront OBJ file and the origin as a CSV file. This is slower to load,
+      but the meshes can be inspected with external tools.
+
+    Independent of this setting, the complete terrain (the combined mesh, the origins and the flat patches of
+    the sub-terrains) is also cached as binary NumPy arrays. It is keyed by the hash of this configuration,
+    so that an unchanged terrain is loaded directly without generating or combining the sub-terrains.
+    """
+
+    num_workers: int = 1
+    """The number of processes used to generate the sub-terrains. Defaults to 1.
+
+    If greater than 1, the sub-terrains are generated in a pool of forked processes. The random numbers of each
+    sub-terrain are drawn from a generator seeded from the terrain generator seed and the row and column of the
+    sub-terrain (see :attr:`SubTerrainBaseCfg.function`), so the generated terrain is the same for any number
+    of workers.
+
+    Note:
+        The sub-terrain functions are run in the worker processes. They must not use CUDA, which cannot be
+        used in forked processes.
+    """
@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import inspect
 import numpy as np
 import scipy.spatial.transform as tf
 import torch
@@ -248,7 +249,7 @@ def inverted_pyramid_stairs_terrain(
 
 
 def random_grid_terrain(
-    difficulty: float, cfg: mesh_terrains_cfg.MeshRandomGridTerrainCfg
+    difficulty: float, cfg: mesh_terrains_cfg.MeshRandomGridTerrainCfg, rng: np.random.Generator | None = None
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
     """Generate a terrain with cells of random heights and fixed width.
 
@@ -269,6 +270,8 @@ def random_grid_terrain(
     Args:
         difficulty: The difficulty of the terrain. This is a value between 0 and 1.
         cfg: The configuration for the terrain.
+        rng: The random number generator to sample the terrain. Defaults to None, in which case a new
+            generator is seeded from the global NumPy random state.
 
     Returns:
         A tuple containing the tri-mesh of the terrain and the origin of the terrain (in m).
@@ -277,6 +280,9 @@ def random_grid_terrain(
         ValueError: If the terrain is not square. This method only supports square terrains.
         RuntimeError: If the grid width is large such that the border width is negative.
     """
+    # resolve the random number generator
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(0, 2**32 - 1, dtype=np.int64))
     # check to ensure square terrain
     if cfg.size[0] != cfg.size[1]:
         raise ValueError(f"The terrain must be square. Received size: {cfg.size}.")
@@ -290,7 +296,9 @@ def random_grid_terrain(
     num_boxes_y = int(cfg.size[1] / cfg.grid_width)
     # constant parameters
     terrain_height = 1.0
-    device = torch.device("cuda") if torch.cuda.is_available() else torch.device("cpu")
+    # note: the grid is generated on the CPU so that the function can run in the worker processes
+    #   of the terrain generator
+    device = torch.device("cpu")
 
     # generate the border
     border_width = cfg.size[0] - min(num_boxes_x, num_boxes_y) * cfg.grid_width
@@ -344,7 +352,7 @@ def random_grid_terrain(
     num_boxes = len(vertices)
     # create noise for the z-axis
     h_noise = torch.zeros((num_boxes, 3), device=device)
-    h_noise[:, 2].uniform_(-grid_height, grid_height)
+    h_noise[:, 2] = torch.from_numpy(rng.uniform(-grid_height, grid_height, num_boxes))
     # reshape noise to match the vertices (num_boxes, 4, 3)
     # only the top vertices of the box are affected
     vertices_noise = torch.zeros((num_boxes, 4, 3), device=device)
@@ -719,7 +727,7 @@ def star_terrain(
 
 
 def repeated_objects_terrain(
-    difficulty: float, cfg: mesh_terrains_cfg.MeshRepeatedObjectsTerrainCfg
+    difficulty: float, cfg: mesh_terrains_cfg.MeshRepeatedObjectsTerrainCfg, rng: np.random.Generator | None = None
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
     """Generate a terrain with a set of repeated objects.
 
@@ -744,6 +752,8 @@ def repeated_objects_terrain(
     Args:
         difficulty: The difficulty of the terrain. This is a value between 0 and 1.
         cfg: The configuration for the terrain.
+        rng: The random number generator to sample the terrain. Defaults to None, in which case a new
+            generator is seeded from the global NumPy random state.
 
     Returns:
         A tuple containing the tri-mesh of the terrain and the origin of the terrain (in m).
@@ -751,6 +761,9 @@ def repeated_objects_terrain(
     Raises:
         ValueError: If the object type is not supported. It must be either a string or a callable.
     """
+    # resolve the random number generator
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(0, 2**32 - 1, dtype=np.int64))
     # import the object functions -- this is done here to avoid circular imports
     from .mesh_terrains_cfg import (
         MeshRepeatedBoxesTerrainCfg,
@@ -765,6 +778,8 @@ def repeated_objects_terrain(
         object_func = cfg.object_type
     if not callable(object_func):
         raise ValueError(f"The attribute 'object_type' must be a string or a callable. Received: {object_func}")
+    # pass the random number generator to the object function if it samples from one
+    object_rng_kwargs = {"rng": rng} if "rng" in inspect.signature(object_func).parameters else {}
 
     # Resolve the terrain configuration
     # -- pass parameters to make calling simpler
@@ -823,8 +838,8 @@ def repeated_objects_terrain(
     while np.any(mask_objects_left):
         # only sample the centers of the remaining invalid objects
         num_objects_left = mask_objects_left.sum()
-        object_centers[mask_objects_left, 0] = np.random.uniform(0, cfg.size[0], num_objects_left)
-        object_centers[mask_objects_left, 1] = np.random.uniform(0, cfg.size[1], num_objects_left)
+        object_centers[mask_objects_left, 0] = rng.uniform(0, cfg.size[0], num_objects_left)
+        object_centers[mask_objects_left, 1] = rng.uniform(0, cfg.size[1], num_objects_left)
         # filter out the centers that are on the platform
         is_within_platform_x = np.logical_and(
             object_centers[mask_objects_left, 0] >= platform_corners[0, 0],
@@ -840,9 +855,11 @@ def repeated_objects_terrain(
     # generate obstacles (but keep platform clean)
     for index in range(len(object_centers)):
         # randomize the height of the object
-        ob_height = height + np.random.uniform(-cfg.max_height_noise, cfg.max_height_noise)
+        ob_height = height + rng.uniform(-cfg.max_height_noise, cfg.max_height_noise)
         if ob_height > 0.0:
-            object_mesh = object_func(center=object_centers[index], height=ob_height, **object_kwargs)
+            object_mesh = object_func(
+                center=object_centers[index], height=ob_height, **object_kwargs, **object_rng_kwargs
+            )
             meshes_list.append(object_mesh)
 
     # generate a ground plane for the terrain
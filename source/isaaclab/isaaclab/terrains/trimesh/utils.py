@@ -104,6 +104,7 @@ def make_box(
     center: tuple[float, float, float],
     max_yx_angle: float = 0,
     degrees: bool = True,
+    rng: np.random.Generator | None = None,
 ) -> trimesh.Trimesh:
     """Generate a box mesh with a random orientation.
 
@@ -114,15 +115,20 @@ def make_box(
         center: The center of the cylinder (in m).
         max_yx_angle: The maximum angle along the y and x axis. Defaults to 0.
         degrees: Whether the angle is in degrees. Defaults to True.
+        rng: The random number generator to sample the orientation. Defaults to None, in which case a new
+            generator is seeded from the global NumPy random state.
 
     Returns:
         A trimesh.Trimesh object for the cylinder.
     """
+    # resolve the random number generator
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(0, 2**32 - 1, dtype=np.int64))
     # create a pose for the cylinder
     transform = np.eye(4)
     transform[0:3, -1] = np.asarray(center)
     # -- create a random rotation
-    euler_zyx = tf.Rotation.random().as_euler("zyx")  # returns rotation of shape (3,)
+    euler_zyx = tf.Rotation.random(random_state=rng).as_euler("zyx")  # returns rotation of shape (3,)
     # -- cap the rotation along the y and x axis
     if degrees:
         max_yx_angle = max_yx_angle / 180.0
@@ -135,7 +141,12 @@ def make_box(
 
 
 def make_cylinder(
-    radius: float, height: float, center: tuple[float, float, float], max_yx_angle: float = 0, degrees: bool = True
+    radius: float,
+    height: float,
+    center: tuple[float, float, float],
+    max_yx_angle: float = 0,
+    degrees: bool = True,
+    rng: np.random.Generator | None = None,
 ) -> trimesh.Trimesh:
     """Generate a cylinder mesh with a random orientation.
 
@@ -145,15 +156,20 @@ def make_cylinder(
         center: The center of the cylinder (in m).
         max_yx_angle: The maximum angle along the y and x axis. Defaults to 0.
         degrees: Whether the angle is in degrees. Defaults to True.
+        rng: The random number generator to sample the orientation. Defaults to None, in which case a new
+            generator is seeded from the global NumPy random state.
 
     Returns:
         A trimesh.Trimesh object for the cylinder.
     """
+    # resolve the random number generator
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(0, 2**32 - 1, dtype=np.int64))
     # create a pose for the cylinder
     transform = np.eye(4)
     transform[0:3, -1] = np.asarray(center)
     # -- create a random rotation
-    euler_zyx = tf.Rotation.random().as_euler("zyx")  # returns rotation of shape (3,)
+    euler_zyx = tf.Rotation.random(random_state=rng).as_euler("zyx")  # returns rotation of shape (3,)
     # -- cap the rotation along the y and x axis
     if degrees:
         max_yx_angle = max_yx_angle / 180.0
@@ -161,11 +177,16 @@ def make_cylinder(
     # -- apply the rotation
     transform[0:3, 0:3] = tf.Rotation.from_euler("zyx", euler_zyx).as_matrix()
     # create the cylinder
-    return trimesh.creation.cylinder(radius, height, sections=np.random.randint(4, 6), transform=transform)
+    return trimesh.creation.cylinder(radius, height, sections=int(rng.integers(4, 6)), transform=transform)
 
 
 def make_cone(
-    radius: float, height: float, center: tuple[float, float, float], max_yx_angle: float = 0, degrees: bool = True
+    radius: float,
+    height: float,
+    center: tuple[float, float, float],
+    max_yx_angle: float = 0,
+    degrees: bool = True,
+    rng: np.random.Generator | None = None,
 ) -> trimesh.Trimesh:
     """Generate a cone mesh with a random orientation.
 
@@ -175,15 +196,20 @@ def make_cone(
         center: The center of the cone (in m).
         max_yx_angle: The maximum angle along the y and x axis. Defaults to 0.
         degrees: Whether the angle is in degrees. Defaults to True.
+        rng: The random number generator to sample the orientation. Defaults to None, in which case a new
+            generator is seeded from the global NumPy random state.
 
     Returns:
         A trimesh.Trimesh object for the cone.
     """
+    # resolve the random number generator
+    if rng is None:
+        rng = np.random.default_rng(np.random.randint(0, 2**32 - 1, dtype=np.int64))
     # create a pose for the cylinder
     transform = np.eye(4)
     transform[0:3, -1] = np.asarray(center)
     # -- create a random rotation
-    euler_zyx = tf.Rotation.random().as_euler("zyx")  # returns rotation of shape (3,)
+    euler_zyx = tf.Rotation.random(random_state=rng).as_euler("zyx")  # returns rotation of shape (3,)
     # -- cap the rotation along the y and x axis
     if degrees:
         max_yx_angle = max_yx_angle / 180.0
@@ -191,4 +217,4 @@ def make_cone(
     # -- apply the rotation
     transform[0:3, 0:3] = tf.Rotation.from_euler("zyx", euler_zyx).as_matrix()
     # create the cone
-    return trimesh.creation.cone(radius, height, sections=np.random.randint(4, 6), transform=transform)
+    return trimesh.creation.cone(radius, height, sections=int(rng.integers(4, 6)), transform=transform)
@@ -14,6 +14,8 @@ import warp as wp
 
 from isaaclab.utils.warp import raycast_mesh
 
+from .terrain_generator_cfg import FlatPatchSamplingCfg
+
 
 def color_meshes_by_height(meshes: list[trimesh.Trimesh], **kwargs) -> trimesh.Trimesh:
     """
@@ -156,6 +158,9 @@ def find_flat_patches(
     3. Reject patches that are outside the z range or have a height difference that is too large.
     4. Keep sampling until all patches are valid.
 
+    Please check the function :func:`find_flat_patches_batched` to search for the patches of multiple
+    origins and configurations at once.
+
     Args:
         wp_mesh: The warp mesh to find patches in.
         num_patches: The desired number of patches to find.
@@ -176,100 +181,210 @@ def find_flat_patches(
         RuntimeError: If the function fails to find valid patches. This can happen if the input parameters
             are not suitable for finding valid patches and maximum number of iterations is reached.
     """
-    # set device to warp mesh device
-    device = wp.device_to_torch(wp_mesh.device)
-
-    # resolve inputs to consistent type
-    # -- patch radii
-    if isinstance(patch_radius, float):
-        patch_radius = [patch_radius]
-    # -- origin
+    # resolve the origin to a tensor
     if isinstance(origin, np.ndarray):
-        origin = torch.from_numpy(origin).to(torch.float).to(device)
-    elif isinstance(origin, torch.Tensor):
-        origin = origin.to(device)
-    else:
-        origin = torch.tensor(origin, dtype=torch.float, device=device)
-
-    # create ranges for the x and y coordinates around the origin.
-    # The provided ranges are bounded by the mesh's bounding box.
-    x_range = (
-        max(x_range[0] + origin[0].item(), wp_mesh.points.numpy()[:, 0].min()),
-        min(x_range[1] + origin[0].item(), wp_mesh.points.numpy()[:, 0].max()),
-    )
-    y_range = (
-        max(y_range[0] + origin[1].item(), wp_mesh.points.numpy()[:, 1].min()),
-        min(y_range[1] + origin[1].item(), wp_mesh.points.numpy()[:, 1].max()),
-    )
-    z_range = (
-        z_range[0] + origin[2].item(),
-        z_range[1] + origin[2].item(),
+        origin = torch.from_numpy(origin)
+    elif not isinstance(origin, torch.Tensor):
+        origin = torch.tensor(origin)
+    # create the sampling configuration
+    patch_cfg = FlatPatchSamplingCfg(
+        num_patches=num_patches,
+        patch_radius=patch_radius,
+        x_range=x_range,
+        y_range=y_range,
+        z_range=z_range,
+        max_height_diff=max_height_diff,
     )
+    return find_flat_patches_batched(wp_mesh, origin.unsqueeze(0), [patch_cfg])[0]
+
 
-    # create a circle of points around (0, 0) to query validity of the patches
+def find_flat_patches_batched(
+    wp_mesh: wp.Mesh,
+    origins: torch.Tensor,
+    patch_cfgs: list[FlatPatchSamplingCfg],
+    bounds: torch.Tensor | None = None,
+    face_ranges: torch.Tensor | None = None,
+    generator: torch.Generator | list[torch.Generator] | None = None,
+    max_iterations: int = 10000,
+) -> list[torch.Tensor]:
+    """Finds flat patches in the input mesh for multiple searches at once.
+
+    Each search is defined by an origin in the mesh frame and a flat patch sampling configuration. Please check
+    the function :func:`find_flat_patches` for the definition of the search space and the validity of a patch.
+
+    At every iteration, the candidate patches of all the searches that are still missing patches are sampled
+    and checked with a single ray-casting query. The first valid candidates of each search are kept. The number
+    of candidates of a search is the number of its missing patches divided by its observed acceptance rate, with
+    a margin of 20%, such that most searches complete within a few iterations. A search fails if it does not find all its patches
+    after sampling :attr:`max_iterations` times its number of patches.
+
+    The search spaces are bounded by the input bounds, and the candidate patches whose query points lie outside
+    the bounds are rejected. This allows searching the patches of several sub-terrains in a single mesh that
+    combines them, while each search is restricted to its own sub-terrain. If no bounds are provided, the
+    bounding box of the mesh is used. Additionally, the ranges of the face ids of the searches can be provided,
+    in which case the candidate patches whose rays hit faces outside the range of their search are rejected, for
+    instance faces of a neighboring sub-terrain that overhang the bounds.
+
+    Args:
+        wp_mesh: The warp mesh to find patches in.
+        origins: The origins defining the centers of the search spaces. Shape is (N, 3), where N is the number
+            of searches. These are specified in the mesh frame.
+        patch_cfgs: The flat patch sampling configurations of the searches. The list has length N.
+        bounds: The minimum and maximum corners of the regions of the searches. Shape is (N, 2, 2) or (N, 2, 3),
+            in which case the z coordinates are ignored. Defaults to None, in which case the bounding box of
+            the mesh is used for all searches.
+        face_ranges: The start (inclusive) and end (exclusive) of the face ids of the searches in the mesh.
+            Shape is (N, 2). Defaults to None, in which case the rays can hit any face of the mesh.
+        generator: The random number generator to sample the patches. If a list is provided, it contains one
+            generator per search, and the patches of each search are sampled from its own generator independently
+            of the other searches. Defaults to None, in which case the global random number generator of
+            PyTorch is used.
+        max_iterations: The number of candidates that can be sampled by a search, in multiples of its number of
+            patches. Defaults to 10000.
+
+    Returns:
+        A list of tensors with the flat patches of each search. Each tensor has shape (num_patches, 3) and
+        contains the patches relative to the origin of the search.
+
+    Raises:
+        RuntimeError: If the function fails to find valid patches for any search.
+    """
+    # set device to warp mesh device
+    device = wp.device_to_torch(wp_mesh.device)
+    num_searches = len(patch_cfgs)
+    origins = origins.to(device=device, dtype=torch.float).view(num_searches, 3)
+
+    # resolve the bounds of the searches
+    if bounds is None:
+        # note: the bounding box of the mesh is computed once
+        points = wp_mesh.points.numpy()
+        mesh_bounds = torch.tensor(np.stack([points[:, :2].min(axis=0), points[:, :2].max(axis=0)]), device=device)
+        bounds = mesh_bounds.to(torch.float).expand(num_searches, 2, 2)
+    else:
+        bounds = bounds.to(device=device, dtype=torch.float)[..., :2]
+    # resolve the face ranges of the searches
+    if face_ranges is not None:
+        face_ranges = face_ranges.to(device=device, dtype=torch.long).view(num_searches, 2)
+
+    # create ranges for the x and y coordinates around the origins.
+    # The provided ranges are bounded by the bounds of the searches.
+    xy_ranges = torch.tensor([[cfg.x_range, cfg.y_range] for cfg in patch_cfgs], device=device).transpose(1, 2)
+    xy_ranges = xy_ranges + origins[:, None, :2]
+    xy_lower = torch.maximum(xy_ranges[:, 0], bounds[:, 0])
+    xy_extent = torch.minimum(xy_ranges[:, 1], bounds[:, 1]) - xy_lower
+    # create ranges for the z coordinates and the maximum height differences
+    z_ranges = torch.tensor([cfg.z_range for cfg in patch_cfgs], device=device) + origins[:, 2:]
+    max_height_diff = torch.tensor([cfg.max_height_diff for cfg in patch_cfgs], device=device)
+
+    # create circles of points around (0, 0) to query validity of the patches
     # the ring of points is uniformly distributed around the circle
+    # note: the lists of radii are padded with their last radius to have the same length for all searches
+    radii = [
+        [cfg.patch_radius] if isinstance(cfg.patch_radius, float) else list(cfg.patch_radius) for cfg in patch_cfgs
+    ]
+    num_radii = max(len(search_radii) for search_radii in radii)
+    radii = torch.tensor([r + r[-1:] * (num_radii - len(r)) for r in radii], device=device)
     angle = torch.linspace(0, 2 * np.pi, 10, device=device)
-    query_x = []
-    query_y = []
-    for radius in patch_radius:
-        query_x.append(radius * torch.cos(angle))
-        query_y.append(radius * torch.sin(angle))
-    query_x = torch.cat(query_x).unsqueeze(1)  # dim: (num_radii * 10, 1)
-    query_y = torch.cat(query_y).unsqueeze(1)  # dim: (num_radii * 10, 1)
-    # dim: (num_radii * 10, 3)
-    query_points = torch.cat([query_x, query_y, torch.zeros_like(query_x)], dim=-1)
+    # dim: (num_searches, num_radii * 10, 2)
+    query_points = radii[..., None, None] * torch.stack([torch.cos(angle), torch.sin(angle)], dim=-1)
+    query_points = query_points.view(num_searches, -1, 2)
 
     # create buffers
-    # -- a buffer to store indices of points that are not valid
-    points_ids = torch.arange(num_patches, device=device)
+    # -- the number of patches that each search should find
+    num_patches = torch.tensor([cfg.num_patches for cfg in patch_cfgs], device=device)
+    # -- the statistics of the searches
+    num_found = torch.zeros(num_searches, dtype=torch.long, device=device)
+    num_sampled = torch.zeros(num_searches, dtype=torch.long, device=device)
+    num_accepted = torch.zeros(num_searches, dtype=torch.long, device=device)
     # -- a buffer to store the flat patches locations
-    flat_patches = torch.zeros(num_patches, 3, device=device)
+    flat_patches = torch.zeros(num_searches, int(num_patches.max()), 3, device=device)
 
     # sample points and raycast to find the height.
     # 1. Reject points that are outside the z_range or have a height difference that is too large.
     # 2. Keep sampling until all points are valid.
+    max_samples = max_iterations * num_patches
     iter_count = 0
-    while len(points_ids) > 0 and iter_count < 10000:
-        # sample points in the 2D region around the origin
-        pos_x = torch.empty(len(points_ids), device=device).uniform_(*x_range)
-        pos_y = torch.empty(len(points_ids), device=device).uniform_(*y_range)
-        flat_patches[points_ids, :2] = torch.stack([pos_x, pos_y], dim=-1)
-
+    while True:
+        # find the searches that are still missing patches
+        num_missing = num_patches - num_found
+        active = (num_missing > 0) & (num_sampled < max_samples)
+        if not torch.any(active):
+            break
+        # compute the number of candidates from the observed acceptance rates
+        acceptance_rate = (num_accepted + 1) / (num_sampled + 1)
+        num_candidates = torch.ceil(1.2 * num_missing / acceptance_rate).long()
+        num_candidates = torch.minimum(num_candidates, 64 * num_missing)
+        num_candidates = torch.minimum(num_candidates, max_samples - num_sampled)
+        num_candidates = torch.where(active, num_candidates, 0)
+        # note: the candidates are grouped by their search
+        search_ids = torch.repeat_interleave(torch.arange(num_searches, device=device), num_candidates)
+
+        # sample points in the 2D regions around the origins
+        if isinstance(generator, list):
+            # note: each search draws its candidates from its own generator
+            pos_xy = torch.cat([
+                torch.rand(int(num_search_candidates), 2, device=device, generator=generator[index])
+                for index, num_search_candidates in enumerate(num_candidates.tolist())
+                if num_search_candidates > 0
+            ])
+        else:
+            pos_xy = torch.rand(len(search_ids), 2, device=device, generator=generator)
+        pos_xy = xy_lower[search_ids] + pos_xy * xy_extent[search_ids]
         # define the query points to check validity of the patch
-        # dim: (num_patches, num_radii * 10, 3)
-        points = flat_patches[points_ids].unsqueeze(1) + query_points
-        points[..., 2] = 100.0
+        # dim: (num_candidates, num_radii * 10, 3)
+        points_xy = pos_xy.unsqueeze(1) + query_points[search_ids]
+        points = torch.cat([points_xy, torch.full_like(points_xy[..., :1], 100.0)], dim=-1)
         # ray-cast direction is downwards
         dirs = torch.zeros_like(points)
         dirs[..., 2] = -1.0
 
         # ray-cast to find the height of the patches
-        ray_hits = raycast_mesh(points.view(-1, 3), dirs.view(-1, 3), wp_mesh)[0]
-        heights = ray_hits.view(points.shape)[..., 2]
-        # set the height of the patches
-        # note: for invalid patches, they would be overwritten in the next iteration
-        #   so it's safe to set the height to the last value
-        flat_patches[points_ids, 2] = heights[..., -1]
+        ray_hits, _, _, face_ids = raycast_mesh(points, dirs, wp_mesh, return_face_id=face_ranges is not None)
+        heights = ray_hits[..., 2]
 
         # check validity
         # -- height is within the z range
-        not_valid = torch.any(torch.logical_or(heights < z_range[0], heights > z_range[1]), dim=1)
+        z_range = z_ranges[search_ids]
+        valid = torch.all((heights >= z_range[:, :1]) & (heights <= z_range[:, 1:]), dim=1)
         # -- height difference is within the max height difference
-        not_valid = torch.logical_or(not_valid, (heights.max(dim=1)[0] - heights.min(dim=1)[0]) > max_height_diff)
-
-        # remove invalid patches indices
-        points_ids = points_ids[not_valid]
+        valid &= (heights.max(dim=1)[0] - heights.min(dim=1)[0]) <= max_height_diff[search_ids]
+        # -- query points are within the bounds
+        search_bounds = bounds[search_ids]
+        valid &= torch.all(
+            (points_xy >= search_bounds[:, None, 0]) & (points_xy <= search_bounds[:, None, 1]), dim=(1, 2)
+        )
+        # -- rays hit the faces of the search
+        if face_ranges is not None:
+            search_face_ranges = face_ranges[search_ids]
+            valid &= torch.all((face_ids >= search_face_ranges[:, :1]) & (face_ids < search_face_ranges[:, 1:]), dim=1)
+
+        # keep the first valid candidates of each search
+        num_valid = torch.zeros_like(num_found).index_add_(0, search_ids, valid.long())
+        rank = torch.cumsum(valid, dim=0) - 1 - (torch.cumsum(num_valid, dim=0) - num_valid)[search_ids]
+        keep = valid & (rank < num_missing[search_ids])
+        # set the location of the patches
+        # note: the height of the patch is the height of the last query point
+        flat_patches[search_ids[keep], num_found[search_ids[keep]] + rank[keep], :2] = pos_xy[keep]
+        flat_patches[search_ids[keep], num_found[search_ids[keep]] + rank[keep], 2] = heights[keep, -1]
+
+        # update the statistics
+        num_found += torch.minimum(num_valid, num_missing)
+        num_sampled += num_candidates
+        num_accepted += num_valid
         # increment count
         iter_count += 1
 
     # check all patches are valid
-    if len(points_ids) > 0:
+    failed = num_found < num_patches
+    if torch.any(failed):
         raise RuntimeError(
             "Failed to find valid patches! Please check the input parameters."
             f"\n\tMaximum number of iterations reached: {iter_count}"
-            f"\n\tNumber of invalid patches: {len(points_ids)}"
-            f"\n\tMaximum height difference: {max_height_diff}"
+            f"\n\tNumber of failed searches: {int(failed.sum())} / {num_searches}"
+            f"\n\tNumber of invalid patches: {int((num_patches - num_found).sum())}"
+            f"\n\tMaximum height difference: {max_height_diff[failed].tolist()}"
         )
 
     # return the flat patches (in the mesh frame)
-    return flat_patches - origin
+    flat_patches = flat_patches - origins.unsqueeze(1)
+    return [flat_patches[index, : cfg.num_patches] for index, cfg in enumerate(patch_cfgs)]
@@ -7,4 +7,5 @@
 
 from .circular_buffer import CircularBuffer
 from .delay_buffer import DelayBuffer
+from .joint_history_buffer import JointHistoryBuffer
 from .timestamped_buffer import TimestampedBuffer
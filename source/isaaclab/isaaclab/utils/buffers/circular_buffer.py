@@ -17,6 +17,12 @@ class CircularBuffer:
 
     The shape of the appended data is expected to be (batch_size, ...), where the first dimension is the
     batch dimension. Correspondingly, the shape of the ring buffer is (max_len, batch_size, ...).
+
+    Internally, the data is stored twice in a mirrored storage of shape (batch_size, 2 * max_len, ...). This allows
+    returning the history in chronological order as a slice of the storage (see :attr:`buffer_view`), without
+    rolling or copying the data. Since the storage is batch-major, the history of each batch entry is contiguous
+    in memory and the slice can be flattened to (batch_size, -1) without a copy. None of the operations
+    synchronize the device with the host.
     """
 
     def __init__(self, max_len: int, batch_size: int, device: str):
@@ -37,12 +43,16 @@ class CircularBuffer:
         self._device = device
         self._ALL_INDICES = torch.arange(batch_size, device=device)
 
+        self._max_length = max_len
         # max length tensor for comparisons
         self._max_len = torch.full((batch_size,), max_len, dtype=torch.int, device=device)
         # number of data pushes passed since the last call to :meth:`reset`
         self._num_pushes = torch.zeros(batch_size, dtype=torch.long, device=device)
         # the pointer to the current head of the circular buffer (-1 means not initialized)
         self._pointer: int = -1
+        # the batch indices that have no data since the last reset (None if all batch indices have data)
+        # note: the indices are kept on the device so that the rows are filled without querying the device
+        self._empty_batch_ids: torch.Tensor | slice | None = slice(None)
         # the actual buffer for data storage
         # note: this is initialized on the first call to :meth:`append`
         self._buffer: torch.Tensor = None  # type: ignore
@@ -64,7 +74,7 @@ class CircularBuffer:
     @property
     def max_length(self) -> int:
         """The maximum length of the ring buffer."""
-        return int(self._max_len[0].item())
+        return self._max_length
 
     @property
     def current_length(self) -> torch.Tensor:
@@ -81,15 +91,28 @@ class CircularBuffer:
         Returns:
             Complete circular buffer with most recent entry at the end and oldest entry at the beginning of dimension 1. The shape is [batch_size, max_length, data.shape[1:]].
         """
-        buf = self._buffer.clone()
-        buf = torch.roll(buf, shifts=self.max_length - self._pointer - 1, dims=0)
-        return torch.transpose(buf, dim0=0, dim1=1)
+        return self.buffer_view.clone()
+
+    @property
+    def buffer_view(self) -> torch.Tensor:
+        """View of the complete circular buffer with most recent entry at the end and oldest entry at the beginning.
+
+        Unlike :attr:`buffer`, the returned tensor is not a copy. It shares the memory of the circular buffer, and its
+        contents change on the next call to :meth:`append` or :meth:`reset`. It must not be modified in place.
+
+        Returns:
+            View of the complete circular buffer with most recent entry at the end and oldest entry at the beginning
+            of dimension 1. The shape is [batch_size, max_length, data.shape[1:]].
+        """
+        # the mirrored storage holds the history in chronological order right after the head
+        start = self._pointer + 1
+        return self._buffer[:, start : start + self._max_length]
 
     """
     Operations.
     """
 
-    def reset(self, batch_ids: Sequence[int] | None = None):
+    def reset(self, batch_ids: Sequence[int] | slice | None = None):
         """Reset the circular buffer at the specified batch indices.
 
         Args:
@@ -98,11 +121,22 @@ class CircularBuffer:
         # resolve all indices
         if batch_ids is None:
             batch_ids = slice(None)
+        elif not isinstance(batch_ids, slice) and len(batch_ids) == 0:
+            return
         # reset the number of pushes for the specified batch indices
         self._num_pushes[batch_ids] = 0
+        # keep track of the reset batch indices so that the next append fills only their rows
+        if isinstance(batch_ids, slice):
+            batch_ids = slice(None) if batch_ids == slice(None) else self._ALL_INDICES[batch_ids]
+        else:
+            batch_ids = torch.as_tensor(batch_ids, dtype=torch.long, device=self._device)
+        if self._empty_batch_ids is None or isinstance(batch_ids, slice):
+            self._empty_batch_ids = batch_ids
+        elif not isinstance(self._empty_batch_ids, slice):
+            self._empty_batch_ids = torch.cat((self._empty_batch_ids, batch_ids))
         if self._buffer is not None:
             # set buffer at batch_id reset indices to 0.0 so that the buffer() getter returns the cleared circular buffer after reset.
-            self._buffer[:, batch_ids, :] = 0.0
+            self._buffer[batch_ids] = 0.0
 
     def append(self, data: torch.Tensor):
         """Append the data to the circular buffer.
@@ -121,16 +155,19 @@ class CircularBuffer:
         # at the first call, initialize the buffer size
         if self._buffer is None:
             self._pointer = -1
-            self._buffer = torch.empty((self.max_length, *data.shape), dtype=data.dtype, device=self._device)
+            self._buffer = torch.empty(
+                (data.shape[0], 2 * self._max_length, *data.shape[1:]), dtype=data.dtype, device=self._device
+            )
+        data = data.to(self._device)
         # move the head to the next slot
-        self._pointer = (self._pointer + 1) % self.max_length
-        # add the new data to the last layer
-        self._buffer[self._pointer] = data.to(self._device)
-        # Check for batches with zero pushes and initialize all values in batch to first append
-        if 0 in self._num_pushes.tolist():
-            fill_ids = [i for i, x in enumerate(self._num_pushes.tolist()) if x == 0]
-            self._num_pushes.tolist().index(0) if 0 in self._num_pushes.tolist() else None
-            self._buffer[:, fill_ids, :] = data.to(self._device)[fill_ids]
+        self._pointer = (self._pointer + 1) % self._max_length
+        # add the new data to the last layer of both halves of the mirrored storage
+        self._buffer[:, self._pointer] = data
+        self._buffer[:, self._pointer + self._max_length] = data
+        # initialize all values of the batches reset since the last append to the first append
+        if self._empty_batch_ids is not None:
+            self._buffer[self._empty_batch_ids] = data[self._empty_batch_ids].unsqueeze(1)
+            self._empty_batch_ids = None
         # increment number of number of pushes for all batches
         self._num_pushes += 1
 
@@ -155,12 +192,12 @@ class CircularBuffer:
         if len(key) != self.batch_size:
             raise ValueError(f"The argument 'key' has length {key.shape[0]}, while expecting {self.batch_size}")
         # check if the buffer is empty
-        if torch.any(self._num_pushes == 0) or self._buffer is None:
+        if self._empty_batch_ids is not None or self._buffer is None:
             raise RuntimeError("Attempting to retrieve data on an empty circular buffer. Please append data first.")
 
         # admissible lag
         valid_keys = torch.minimum(key, self._num_pushes - 1)
         # the index in the circular buffer (pointer points to the last+1 index)
-        index_in_buffer = torch.remainder(self._pointer - valid_keys, self.max_length)
+        index_in_buffer = torch.remainder(self._pointer - valid_keys, self._max_length)
         # return output
-        return self._buffer[index_in_buffer, self._ALL_INDICES]
+        return self._buffer[self._ALL_INDICES, index_in_buffer]
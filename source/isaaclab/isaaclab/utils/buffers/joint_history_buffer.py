@@ -0,0 +1,162 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import torch
+from collections.abc import Sequence
+
+
+class JointHistoryBuffer:
+    """Ring buffer for storing a history of joint data, which is read at given time lags with a single gather.
+
+    This class stores the history of several channels of joint data, such as joint position errors and joint
+    velocities, for the actuator models that depend on past joint states or commands. The appended data is expected
+    to have the shape (num_envs, num_joints, num_channels).
+
+    Unlike rolling a history tensor, appending data only writes the new data at the head of the ring buffer. Like
+    the :class:`CircularBuffer`, the data is stored twice in a mirrored storage of shape
+    (2 * max_len, num_envs, num_joints, num_channels), so that the entry at a given time lag is always at the index
+    ``pointer + max_len - lag`` of the storage, without a remainder operation. Since the storage is time-major, the
+    data of a step is contiguous in memory and the channels can be stacked directly into it. The history can then
+    be read:
+
+    * at fixed time lags for all the environments, with :meth:`read_lags`. The gather index of the time lags is
+      precomputed for each position of the head by :meth:`create_lags_index`, so that reading the history is a
+      single gather.
+    * at a time lag per environment, with :meth:`read_lag`. The time lag is clamped to the data appended since the
+      last reset, which returns the oldest appended data for larger time lags.
+
+    The entries of the history that were not appended since the last reset are zero. None of the operations
+    synchronize the device with the host.
+    """
+
+    def __init__(self, max_len: int, num_envs: int, num_joints: int, num_channels: int, device: str):
+        """Initialize the joint history buffer.
+
+        Args:
+            max_len: The maximum length of the history, i.e. the largest time lag that can be read plus one.
+                The minimum allowed value is 1.
+            num_envs: The number of environments.
+            num_joints: The number of joints.
+            num_channels: The number of channels of joint data.
+            device: The device used for processing.
+
+        Raises:
+            ValueError: If the maximum length is less than one.
+        """
+        if max_len < 1:
+            raise ValueError(f"The history length should be greater than zero. However, it is set to {max_len}!")
+        # set the parameters
+        self._max_length = max_len
+        self._num_envs = num_envs
+        self._device = device
+        # the pointer to the current head of the ring buffer
+        # note: the first append writes the data at index 0
+        self._pointer = max_len - 1
+        # number of data pushes passed since the last call to :meth:`reset`
+        self._num_pushes = torch.zeros(num_envs, dtype=torch.long, device=device)
+        # the mirrored storage of the history
+        self._buffer = torch.zeros(2 * max_len, num_envs, num_joints, num_channels, device=device)
+        self._ALL_INDICES = torch.arange(num_envs, device=device)
+
+    """
+    Properties.
+    """
+
+    @property
+    def max_length(self) -> int:
+        """The maximum length of the history."""
+        return self._max_length
+
+    @property
+    def num_envs(self) -> int:
+        """The number of environments."""
+        return self._num_envs
+
+    @property
+    def device(self) -> str:
+        """The device used for processing."""
+        return self._device
+
+    """
+    Operations.
+    """
+
+    def create_lags_index(self, lags: Sequence[int]) -> torch.Tensor:
+        """Precomputes the gather index of fixed time lags for :meth:`read_lags`.
+
+        Args:
+            lags: The time lags to read. The time lag *0* corresponds to the latest appended data, while *n*
+                corresponds to the data appended *n* calls before.
+
+        Returns:
+            The gather index of the time lags for each position of the head. Shape is (max_len, len(lags)).
+
+        Raises:
+            ValueError: If a time lag is negative or larger than the history length.
+        """
+        lags = list(lags)
+        if any(lag < 0 or lag >= self._max_length for lag in lags):
+            raise ValueError(f"The time lags should be in [0, {self._max_length - 1}]. Received: {lags}.")
+        lags = torch.tensor(lags, dtype=torch.long, device=self._device)
+        pointers = torch.arange(self._max_length, device=self._device).unsqueeze(1)
+        return pointers + self._max_length - lags
+
+    def reset(self, env_ids: Sequence[int] | slice | None = None):
+        """Reset the history at the specified environments.
+
+        Args:
+            env_ids: The environment indices to reset. Default is None, which resets all the environments.
+        """
+        if env_ids is None:
+            env_ids = slice(None)
+        self._buffer[:, env_ids] = 0.0
+        self._num_pushes[env_ids] = 0
+
+    def append(self, data: torch.Tensor | Sequence[torch.Tensor]):
+        """Append the data to the history.
+
+        Args:
+            data: The data to append. Shape is (num_envs, num_joints, num_channels). It can also be a sequence
+                of the data of each channel, of shape (num_envs, num_joints), which are stacked into the history.
+        """
+        # move the head to the next slot
+        self._pointer = (self._pointer + 1) % self._max_length
+        # add the new data to both halves of the mirrored storage
+        head = self._buffer[self._pointer]
+        if isinstance(data, torch.Tensor):
+            head.copy_(data)
+        else:
+            torch.stack(tuple(data), dim=-1, out=head)
+        self._buffer[self._pointer + self._max_length] = head
+        self._num_pushes += 1
+
+    def read_lags(self, lags_index: torch.Tensor) -> torch.Tensor:
+        """Read the history at fixed time lags for all the environments.
+
+        Args:
+            lags_index: The gather index of the time lags returned by :meth:`create_lags_index`.
+
+        Returns:
+            The history at the time lags. Shape is (num_envs, num_joints, num_channels, num_lags). It is a
+            permuted view of the gathered data, which is not contiguous.
+        """
+        return torch.index_select(self._buffer, 0, lags_index[self._pointer]).permute(1, 2, 3, 0)
+
+    def read_lag(self, lags: torch.Tensor) -> torch.Tensor:
+        """Read the history at a time lag per environment.
+
+        If the time lag of an environment is larger than the number of appends since the last reset, the oldest
+        appended data is returned.
+
+        Args:
+            lags: The time lag of each environment. Shape is (num_envs,).
+
+        Returns:
+            The history at the time lags. Shape is (num_envs, num_joints, num_channels).
+        """
+        # admissible lags
+        # note: the lag is also clamped to zero for the environments without data since the last reset
+        valid_lags = torch.minimum(lags, self._num_pushes - 1).clamp_(min=0)
+        return self._buffer[self._pointer + self._max_length - valid_lags, self._ALL_INDICES]
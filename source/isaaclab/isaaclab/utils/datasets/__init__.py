@@ -7,6 +7,12 @@
 Submodule for datasets classes and methods.
 """
 
+from .async_hdf5_dataset_file_handler import AsyncHDF5DatasetFileHandler
+from .batched_episode_data import BatchedEpisodeData
 from .dataset_file_handler_base import DatasetFileHandlerBase
 from .episode_data import EpisodeData
+from .episode_index import EpisodeIndex
 from .hdf5_dataset_file_handler import HDF5DatasetFileHandler
+from .hdf5_dataset_layout_cfg import HDF5DatasetKeyLayoutCfg, HDF5DatasetLayoutCfg
+from .hdf5_dataset_merge import DatasetMergeSummary, DatasetSourceSummary, merge_hdf5_datasets
+from .lazy_episode_data import LazyEpisodeData
@@ -0,0 +1,192 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import queue
+import threading
+
+from .episode_data import EpisodeData
+from .hdf5_dataset_file_handler import HDF5DatasetFileHandler
+from .hdf5_dataset_layout_cfg import HDF5DatasetLayoutCfg
+
+
+class AsyncHDF5DatasetFileHandler(HDF5DatasetFileHandler):
+    """HDF5 dataset file handler that writes the episodes in a background thread.
+
+    Calling :meth:`write_episode` hands the episode over to a bounded queue and returns immediately. A writer
+    thread then copies the episode data from the device to the host, compresses it according to the layout
+    configuration and writes it to the file. This keeps the device-to-host copies, the compression and the file
+    writes off the simulation loop.
+
+    If the queue is full, :meth:`write_episode` blocks until the writer thread catches up. This bounds the memory
+    held by the pending episodes. Calling :meth:`flush` does not block, the writer thread flushes the file once
+    all the episodes queued before it are written. :meth:`wait` blocks until the queue is drained. :meth:`close`
+    drains the queue before closing the file.
+
+    Note:
+        The handed over episodes are not copied. They should not be modified after calling :meth:`write_episode`.
+        Errors raised in the writer thread are re-raised on every later call to :meth:`write_episode`,
+        :meth:`flush`, :meth:`wait` or :meth:`close` until another file is opened or created. The episodes queued
+        after the error are not written, and their number is reported in the raised error.
+    """
+
+    _FLUSH_REQUEST = "flush"
+    """Queue entry to request flushing the file."""
+
+    _STOP_REQUEST = "stop"
+    """Queue entry to request stopping the writer thread."""
+
+    def __init__(self, layout_cfg: HDF5DatasetLayoutCfg | None = None, max_queue_size: int = 16):
+        """Initializes the asynchronous HDF5 dataset file handler.
+
+        Args:
+            layout_cfg: The storage layout of the written datasets. Defaults to None, in which case the datasets
+                are stored contiguously and uncompressed.
+            max_queue_size: The maximum number of pending write requests. Defaults to 16.
+        """
+        super().__init__(layout_cfg)
+        self._max_queue_size = max_queue_size
+        self._write_queue: queue.Queue | None = None
+        self._writer_thread: threading.Thread | None = None
+        self._writer_error: BaseException | None = None
+        # number of episodes in the file when it was opened, number of episodes queued since then and number of
+        # queued episodes that were not written because of an error in the writer thread
+        self._num_initial_episodes = 0
+        self._num_queued_episodes = 0
+        self._num_dropped_episodes = 0
+
+    def open(self, file_path: str, mode: str = "r"):
+        """Open an existing dataset file."""
+        super().open(file_path, mode)
+        self._reset_episode_counters()
+        if mode != "r":
+            self._start_writer()
+
+    def create(self, file_path: str, env_name: str = None):
+        """Create a new dataset file."""
+        super().create(file_path, env_name)
+        self._reset_episode_counters()
+        self._start_writer()
+
+    """
+    Properties
+    """
+
+    def get_num_episodes(self) -> int:
+        """Get number of episodes in the file, including the episodes queued for writing.
+
+        The queued episodes that were not written because of an error in the writer thread are not counted.
+        """
+        return self._num_initial_episodes + self._num_queued_episodes - self._num_dropped_episodes
+
+    @property
+    def demo_count(self) -> int:
+        """The number of demos collected so far, including the demos queued for writing."""
+        return self.get_num_episodes()
+
+    @property
+    def num_pending_episodes(self) -> int:
+        """The number of episodes queued but not written to the file yet."""
+        return self.get_num_episodes() - self._demo_count
+
+    """
+    Operations.
+    """
+
+    def write_episode(self, episode: EpisodeData):
+        """Queue an episode for writing to the dataset.
+
+        This call blocks if the write queue is full.
+
+        Args:
+            episode: The episode data to add.
+        """
+        self._raise_if_not_initialized()
+        self._raise_if_writer_failed()
+        if episode.is_empty():
+            return
+        if self._writer_thread is None:
+            raise RuntimeError("HDF5 dataset file stream is not opened for writing")
+
+        self._num_queued_episodes += 1
+        self._write_queue.put(episode)
+
+    def flush(self):
+        """Request the writer thread to flush the file once the queued episodes are written."""
+        self._raise_if_not_initialized()
+        self._raise_if_writer_failed()
+        if self._writer_thread is None:
+            super().flush()
+        else:
+            self._write_queue.put(self._FLUSH_REQUEST)
+
+    def wait(self):
+        """Block until all the queued episodes are written to the file."""
+        if self._write_queue is not None:
+            self._write_queue.join()
+        self._raise_if_writer_failed()
+
+    def close(self):
+        """Write the queued episodes and close the dataset file handler."""
+        if self._writer_thread is not None:
+            # stop the writer thread once it drained the queue
+            self._write_queue.put(self._STOP_REQUEST)
+            self._writer_thread.join()
+            self._writer_thread = None
+            self._write_queue = None
+        super().close()
+        self._raise_if_writer_failed()
+
+    """
+    Helper functions.
+    """
+
+    def _reset_episode_counters(self):
+        """Reset the episode counters and the writer error for a newly opened file."""
+        self._writer_error = None
+        self._num_initial_episodes = self._demo_count
+        self._num_queued_episodes = 0
+        self._num_dropped_episodes = 0
+
+    def _start_writer(self):
+        """Start the writer thread."""
+        self._write_queue = queue.Queue(maxsize=self._max_queue_size)
+        self._writer_thread = threading.Thread(target=self._run_writer, name="hdf5-dataset-writer", daemon=True)
+        self._writer_thread.start()
+
+    def _run_writer(self):
+        """Write the queued episodes until a stop request is received."""
+        while True:
+            request = self._write_queue.get()
+            try:
+                if request is self._STOP_REQUEST:
+                    return
+                # skip the remaining requests after an error, they are reported on the main thread
+                if self._writer_error is not None:
+                    if request is not self._FLUSH_REQUEST:
+                        self._num_dropped_episodes += 1
+                    continue
+                if request is self._FLUSH_REQUEST:
+                    self._hdf5_file_stream.flush()
+                else:
+                    self._write_episode(request)
+            except Exception as e:
+                self._writer_error = e
+                if request is not self._FLUSH_REQUEST:
+                    self._num_dropped_episodes += 1
+            finally:
+                self._write_queue.task_done()
+
+    def _raise_if_writer_failed(self):
+        """Raise the error that occurred in the writer thread, if any.
+
+        The error is not cleared, so that no episode queued after it is silently lost.
+        """
+        if self._writer_error is not None:
+            raise RuntimeError(
+                "Failed to write the episode data in the background writer thread."
+                f" {self._num_dropped_episodes} queued episode(s) were not written."
+            ) from self._writer_error
@@ -0,0 +1,207 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+from .episode_data import EpisodeData
+
+
+class BatchedEpisodeData:
+    """Class to store the episode data of a batch of environments.
+
+    Unlike :class:`EpisodeData`, which stores the data of a single episode, this class records the data of all the
+    environments into a single storage tensor of shape (capacity, num_envs, ...) per key. Each environment has
+    its own write cursor per key, so recording a step for all the environments is a single indexed write on the
+    device, independently of the number of environments. The per-environment episodes are only sliced out of
+    the storage when they are requested through :meth:`get_episode`, for instance when they are exported.
+
+    The capacity of the storage grows geometrically when an environment reaches the end of it. To avoid
+    synchronizing with the device on every step, a host-side upper bound of the write cursors is tracked and
+    the actual cursors are only read back when this bound reaches the capacity.
+    """
+
+    def __init__(self, num_envs: int, device: str, initial_capacity: int = 16, growth_factor: float = 2.0):
+        """Initializes the batched episode data class.
+
+        Args:
+            num_envs: The number of environments.
+            device: The device used for storing the recorded data.
+            initial_capacity: The number of steps preallocated for a key when it is first added. Defaults to 16.
+            growth_factor: The factor by which the capacity of a key's storage is multiplied when it is full.
+                Defaults to 2.0.
+
+        Raises:
+            ValueError: If the initial capacity is not positive or the growth factor is not greater than 1.
+        """
+        if initial_capacity < 1:
+            raise ValueError(f"The initial capacity should be greater than zero. Received: {initial_capacity}.")
+        if growth_factor <= 1.0:
+            raise ValueError(f"The growth factor should be greater than one. Received: {growth_factor}.")
+        self._num_envs = num_envs
+        self._device = device
+        self._initial_capacity = initial_capacity
+        self._growth_factor = growth_factor
+        self._ALL_INDICES = torch.arange(num_envs, dtype=torch.long, device=device)
+        # storage of shape (capacity, num_envs, ...) and write cursors (keyed by the full "/" separated key)
+        self._buffers: dict[str, torch.Tensor] = dict()
+        self._lengths: dict[str, torch.Tensor] = dict()
+        # host-side upper bound of the write cursors of each key
+        self._max_lengths: dict[str, int] = dict()
+        # task success values
+        self._success = torch.zeros(num_envs, dtype=torch.bool, device=device)
+        self._success_set = torch.zeros(num_envs, dtype=torch.bool, device=device)
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """The number of environments."""
+        return self._num_envs
+
+    @property
+    def device(self) -> str:
+        """The device used for storing the recorded data."""
+        return self._device
+
+    @property
+    def keys(self) -> list[str]:
+        """The full "/" separated names of the recorded keys."""
+        return list(self._buffers.keys())
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Clear the recorded episodes of the given environments.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        if env_ids is None:
+            env_ids = slice(None)
+        for lengths in self._lengths.values():
+            lengths[env_ids] = 0
+        self._success[env_ids] = False
+        self._success_set[env_ids] = False
+
+    def is_empty(self, env_id: int) -> bool:
+        """Check if the episode of an environment is empty.
+
+        Args:
+            env_id: The environment id.
+        """
+        return not any(lengths[env_id].item() > 0 for lengths in self._lengths.values())
+
+    def add(self, key: str, value: torch.Tensor | dict, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Add a step of data to the episodes of the given environments.
+
+        The key can be nested by using the "/" character.
+        For example: "obs/joint_pos".
+
+        Args:
+            key: The key name.
+            value: The corresponding value of tensor type or of dict type. The shape of a tensor in the value
+                is (len(env_ids), ...).
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        # check datatype
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                self.add(f"{key}/{sub_key}", sub_value, env_ids)
+            return
+
+        # resolve environment ids
+        if env_ids is None:
+            env_ids = self._ALL_INDICES
+        elif not isinstance(env_ids, torch.Tensor):
+            env_ids = torch.tensor(env_ids, dtype=torch.long, device=self._device)
+        if len(env_ids) == 0:
+            return
+
+        # allocate the storage for a new key
+        if key not in self._buffers:
+            self._buffers[key] = torch.zeros(
+                (self._initial_capacity, self._num_envs, *value.shape[1:]), dtype=value.dtype, device=self._device
+            )
+            self._lengths[key] = torch.zeros(self._num_envs, dtype=torch.long, device=self._device)
+            self._max_lengths[key] = 0
+        # grow the storage if an environment may reach the end of it
+        if self._max_lengths[key] == self._buffers[key].shape[0]:
+            self._grow_buffer(key)
+
+        # write the step at the cursors of the environments
+        # note: the i-th row of the value corresponds to the i-th environment id
+        lengths = self._lengths[key]
+        env_lengths = lengths[env_ids]
+        self._buffers[key][env_lengths, env_ids] = value[: len(env_ids)].to(self._device)
+        lengths[env_ids] = env_lengths + 1
+        self._max_lengths[key] += 1
+
+    def set_success(self, env_ids: Sequence[int] | torch.Tensor | None, success_values: torch.Tensor):
+        """Set the task success values of the episodes of the given environments.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+            success_values: The task success values. The shape of the tensor is (len(env_ids), 1) or (len(env_ids),).
+        """
+        if env_ids is None:
+            env_ids = slice(None)
+        self._success[env_ids] = success_values.reshape(-1).to(device=self._device, dtype=torch.bool)
+        self._success_set[env_ids] = True
+
+    def get_episode(self, env_id: int) -> EpisodeData:
+        """Slice the recorded episode of an environment out of the storage.
+
+        Args:
+            env_id: The environment id.
+
+        Returns:
+            A copy of the recorded episode data of the environment.
+        """
+        episode = EpisodeData()
+        episode.env_id = env_id
+        data = dict()
+        for key, buffer in self._buffers.items():
+            length = self._lengths[key][env_id].item()
+            if length == 0:
+                continue
+            sub_keys = key.split("/")
+            current_dataset_pointer = data
+            for sub_key in sub_keys[:-1]:
+                if sub_key not in current_dataset_pointer:
+                    current_dataset_pointer[sub_key] = dict()
+                current_dataset_pointer = current_dataset_pointer[sub_key]
+            current_dataset_pointer[sub_keys[-1]] = buffer[:length, env_id].clone()
+        episode.data = data
+        if self._success_set[env_id]:
+            episode.success = self._success[env_id].item()
+        return episode
+
+    """
+    Helper functions.
+    """
+
+    def _grow_buffer(self, key: str):
+        """Grow the storage of a key if one of the environments reached the end of it.
+
+        Args:
+            key: The full "/" separated key name.
+        """
+        buffer = self._buffers[key]
+        # read back the actual cursors to refresh the upper bound
+        max_length = int(self._lengths[key].max().item())
+        self._max_lengths[key] = max_length
+        if max_length < buffer.shape[0]:
+            return
+        capacity = max(int(buffer.shape[0] * self._growth_factor), buffer.shape[0] + 1)
+        new_buffer = torch.zeros((capacity, *buffer.shape[1:]), dtype=buffer.dtype, device=buffer.device)
+        new_buffer[: buffer.shape[0]] = buffer
+        self._buffers[key] = new_buffer
@@ -9,11 +9,37 @@ import torch
 
 
 class EpisodeData:
-    """Class to store episode data."""
+    """Class to store episode data.
 
-    def __init__(self) -> None:
-        """Initializes episode data class."""
+    The per-step values added through :meth:`add` are written into preallocated storage tensors whose capacity
+    grows geometrically when full. This keeps appending a step to an episode an amortized O(1) operation instead of
+    re-concatenating the whole history of every key on each call. The tensors exposed through :attr:`data` are
+    views of the storage trimmed to the number of recorded steps. Calling :meth:`finalize` releases the unused
+    capacity once recording of the episode is complete.
+    """
+
+    def __init__(self, initial_capacity: int = 16, growth_factor: float = 2.0) -> None:
+        """Initializes episode data class.
+
+        Args:
+            initial_capacity: The number of steps preallocated for a key when it is first added. Defaults to 16.
+            growth_factor: The factor by which the capacity of a key's storage is multiplied when it is full.
+                Defaults to 2.0.
+
+        Raises:
+            ValueError: If the initial capacity is not positive or the growth factor is not greater than 1.
+        """
+        if initial_capacity < 1:
+            raise ValueError(f"The initial capacity should be greater than zero. Received: {initial_capacity}.")
+        if growth_factor <= 1.0:
+            raise ValueError(f"The growth factor should be greater than one. Received: {growth_factor}.")
+        self._initial_capacity = initial_capacity
+        self._growth_factor = growth_factor
+        # nested dictionary of the recorded values trimmed to their lengths
         self._data = dict()
+        # preallocated storage and number of recorded steps of the leaf tensors (keyed by the full "/" separated key)
+        self._buffers: dict[str, torch.Tensor] = dict()
+        self._lengths: dict[str, int] = dict()
         self._next_action_index = 0
         self._next_state_index = 0
         self._seed = None
@@ -29,6 +55,9 @@ class EpisodeData:
     def data(self, data: dict):
         """Set the episode data."""
         self._data = data
+        # the tensors of the new data are adopted as storage on the next call to :meth:`add`
+        self._buffers = dict()
+        self._lengths = dict()
 
     @property
     def seed(self):
@@ -102,20 +131,35 @@ class EpisodeData:
 
         sub_keys = key.split("/")
         current_dataset_pointer = self._data
-        for sub_key_index in range(len(sub_keys)):
-            if sub_key_index == len(sub_keys) - 1:
-                # Add value to the final dict layer
-                if sub_keys[sub_key_index] not in current_dataset_pointer:
-                    current_dataset_pointer[sub_keys[sub_key_index]] = value.unsqueeze(0).clone()
-                else:
-                    current_dataset_pointer[sub_keys[sub_key_index]] = torch.cat(
-                        (current_dataset_pointer[sub_keys[sub_key_index]], value.unsqueeze(0))
-                    )
-                break
-            # key index
-            if sub_keys[sub_key_index] not in current_dataset_pointer:
-                current_dataset_pointer[sub_keys[sub_key_index]] = dict()
-            current_dataset_pointer = current_dataset_pointer[sub_keys[sub_key_index]]
+        for sub_key in sub_keys[:-1]:
+            if sub_key not in current_dataset_pointer:
+                current_dataset_pointer[sub_key] = dict()
+            current_dataset_pointer = current_dataset_pointer[sub_key]
+        # add value to the final dict layer
+        current_dataset_pointer[sub_keys[-1]] = self._append_to_buffer(
+            key, current_dataset_pointer.get(sub_keys[-1]), value
+        )
+
+    def finalize(self):
+        """Trim the storage of all the keys to the number of recorded steps.
+
+        This releases the spare capacity preallocated by :meth:`add`. It should be called once no more steps are
+        going to be added to the episode, for instance before the episode is exported or kept in memory. Adding
+        new values afterwards is still possible, but re-allocates the storage of the affected keys.
+        """
+        for key, buffer in self._buffers.items():
+            length = self._lengths[key]
+            if length == buffer.shape[0]:
+                continue
+            # replace the view in the nested dictionary with the trimmed tensor
+            sub_keys = key.split("/")
+            current_dataset_pointer = self._data
+            for sub_key in sub_keys[:-1]:
+                current_dataset_pointer = current_dataset_pointer[sub_key]
+            current_dataset_pointer[sub_keys[-1]] = buffer[:length].clone()
+        # the trimmed tensors are adopted as storage on the next call to :meth:`add`
+        self._buffers = dict()
+        self._lengths = dict()
 
     def get_initial_state(self) -> torch.Tensor | None:
         """Get the initial state from the dataset."""
@@ -169,3 +213,41 @@ class EpisodeData:
         if state is not None:
             self._next_state_index += 1
         return state
+
+    """
+    Helper functions.
+    """
+
+    def _append_to_buffer(self, key: str, current_value: torch.Tensor | None, value: torch.Tensor) -> torch.Tensor:
+        """Append a value to the storage of a leaf key.
+
+        Args:
+            key: The full "/" separated key name.
+            current_value: The tensor currently stored for the key in the data dictionary. None if the key
+                does not exist yet.
+            value: The value to append.
+
+        Returns:
+            The view of the storage trimmed to the number of recorded steps.
+        """
+        buffer = self._buffers.get(key)
+        if buffer is not None:
+            length = self._lengths[key]
+        elif current_value is not None:
+            # adopt the tensor assigned through the data setter or trimmed by finalize as storage
+            buffer = current_value
+            length = current_value.shape[0]
+        else:
+            # allocate the storage for a new key
+            buffer = torch.empty((self._initial_capacity, *value.shape), dtype=value.dtype, device=value.device)
+            length = 0
+        # grow the storage geometrically if it is full
+        if length == buffer.shape[0]:
+            capacity = max(int(length * self._growth_factor), length + 1, self._initial_capacity)
+            new_buffer = torch.empty((capacity, *buffer.shape[1:]), dtype=buffer.dtype, device=buffer.device)
+            new_buffer[:length] = buffer[:length]
+            buffer = new_buffer
+        buffer[length] = value
+        self._buffers[key] = buffer
+        self._lengths[key] = length + 1
+        return buffer[: length + 1]
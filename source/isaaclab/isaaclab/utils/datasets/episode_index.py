@@ -0,0 +1,261 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import h5py
+import numpy as np
+import re
+from collections.abc import Sequence
+
+
+def episode_sort_key(episode_name: str) -> tuple[str, int]:
+    """Sort key ordering episodes by the numerical suffix of their names, e.g. "demo_2" before "demo_10".
+
+    Args:
+        episode_name: The name of the episode.
+
+    Returns:
+        The sort key of the episode.
+    """
+    match = re.fullmatch(r"(.*?)(\d+)", episode_name)
+    if match is None:
+        return episode_name, -1
+    return match.group(1), int(match.group(2))
+
+
+class EpisodeIndex:
+    """Array-backed table of the metadata of the episodes in a dataset.
+
+    The table stores one row per episode with the episode name, the offset of its first sample in the
+    concatenation of all the episodes, its number of samples, its success flag and its seed. Filtering and
+    sampling episodes only touches these arrays, without opening the episode groups of the dataset.
+
+    Unknown success flags are stored as -1, and unknown seeds as -1.
+    """
+
+    COLUMNS = ("name", "offset", "num_samples", "success", "seed")
+    """The names of the columns of the table."""
+
+    def __init__(self, initial_capacity: int = 64):
+        """Initializes an empty episode index.
+
+        Args:
+            initial_capacity: The number of rows preallocated. Defaults to 64.
+        """
+        self._size = 0
+        self._names = np.empty(initial_capacity, dtype=object)
+        self._offsets = np.zeros(initial_capacity, dtype=np.int64)
+        self._num_samples = np.zeros(initial_capacity, dtype=np.int64)
+        self._success = np.full(initial_capacity, -1, dtype=np.int8)
+        self._seeds = np.full(initial_capacity, -1, dtype=np.int64)
+        # mapping from the episode names to their rows (built lazily on the first lookup)
+        self._rows: dict[str, int] | None = None
+
+    def __len__(self) -> int:
+        """Returns: The number of episodes in the index."""
+        return self._size
+
+    """
+    Properties.
+    """
+
+    @property
+    def names(self) -> np.ndarray:
+        """The names of the episodes. Shape is (num_episodes,)."""
+        return self._names[: self._size]
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """The offsets of the first sample of the episodes. Shape is (num_episodes,)."""
+        return self._offsets[: self._size]
+
+    @property
+    def num_samples(self) -> np.ndarray:
+        """The number of samples of the episodes. Shape is (num_episodes,)."""
+        return self._num_samples[: self._size]
+
+    @property
+    def success(self) -> np.ndarray:
+        """The success flags of the episodes (1: success, 0: failure, -1: unknown). Shape is (num_episodes,)."""
+        return self._success[: self._size]
+
+    @property
+    def seeds(self) -> np.ndarray:
+        """The seeds of the episodes (-1 if unknown). Shape is (num_episodes,)."""
+        return self._seeds[: self._size]
+
+    @property
+    def total_num_samples(self) -> int:
+        """The total number of samples of the episodes."""
+        return int(self.num_samples.sum())
+
+    """
+    Operations.
+    """
+
+    def append(self, name: str, num_samples: int, success: bool | None = None, seed: int | None = None):
+        """Append an episode to the index.
+
+        Args:
+            name: The name of the episode.
+            num_samples: The number of samples of the episode.
+            success: The success flag of the episode. Defaults to None (unknown).
+            seed: The seed of the episode. Defaults to None (unknown).
+        """
+        # grow the storage geometrically if it is full
+        if self._size == len(self._names):
+            capacity = max(2 * self._size, 1)
+            for attr in ("_names", "_offsets", "_num_samples", "_success", "_seeds"):
+                array = getattr(self, attr)
+                fill_value = -1 if attr in ("_success", "_seeds") else 0
+                new_array = np.full(capacity, fill_value, dtype=array.dtype)
+                new_array[: self._size] = array[: self._size]
+                setattr(self, attr, new_array)
+        index = self._size
+        self._names[index] = name
+        self._offsets[index] = self._offsets[index - 1] + self._num_samples[index - 1] if index > 0 else 0
+        self._num_samples[index] = num_samples
+        self._success[index] = -1 if success is None else int(bool(success))
+        self._seeds[index] = -1 if seed is None else int(seed)
+        if self._rows is not None:
+            self._rows[name] = index
+        self._size += 1
+
+    def find(self, name: str) -> int | None:
+        """Finds the row of an episode in the index.
+
+        Args:
+            name: The name of the episode.
+
+        Returns:
+            The row of the episode. None if the episode is not in the index.
+        """
+        if self._rows is None:
+            self._rows = {episode_name: row for row, episode_name in enumerate(self.names)}
+        return self._rows.get(name)
+
+    def select(self, indices: np.ndarray | Sequence[int]) -> EpisodeIndex:
+        """Create an index with a subset of the episodes.
+
+        The offsets of the selected episodes are the offsets in the original dataset.
+
+        Args:
+            indices: The row indices or boolean mask of the episodes to select.
+
+        Returns:
+            The index of the selected episodes.
+        """
+        indices = np.arange(self._size)[np.asarray(indices)]
+        episode_index = EpisodeIndex(initial_capacity=max(len(indices), 1))
+        episode_index._size = len(indices)
+        episode_index._names[: len(indices)] = self.names[indices]
+        episode_index._offsets[: len(indices)] = self.offsets[indices]
+        episode_index._num_samples[: len(indices)] = self.num_samples[indices]
+        episode_index._success[: len(indices)] = self.success[indices]
+        episode_index._seeds[: len(indices)] = self.seeds[indices]
+        return episode_index
+
+    def filter(
+        self,
+        success: bool | None = None,
+        min_num_samples: int | None = None,
+        max_num_samples: int | None = None,
+    ) -> EpisodeIndex:
+        """Create an index with the episodes matching the given criteria.
+
+        Args:
+            success: The success flag of the selected episodes. Defaults to None, in which case episodes are
+                not filtered by success. Episodes with unknown success are never selected when it is set.
+            min_num_samples: The minimum number of samples of the selected episodes. Defaults to None.
+            max_num_samples: The maximum number of samples of the selected episodes. Defaults to None.
+
+        Returns:
+            The index of the selected episodes.
+        """
+        mask = np.ones(self._size, dtype=bool)
+        if success is not None:
+            mask &= self.success == int(bool(success))
+        if min_num_samples is not None:
+            mask &= self.num_samples >= min_num_samples
+        if max_num_samples is not None:
+            mask &= self.num_samples <= max_num_samples
+        return self.select(mask)
+
+    def sample(self, num_episodes: int, replace: bool = False, rng: np.random.Generator | None = None) -> list[str]:
+        """Randomly sample episode names from the index.
+
+        Args:
+            num_episodes: The number of episodes to sample.
+            replace: Whether to sample with replacement. Defaults to False.
+            rng: The random number generator. Defaults to None, in which case a new generator is created.
+
+        Returns:
+            The names of the sampled episodes.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        indices = rng.choice(self._size, size=num_episodes, replace=replace)
+        return self.names[indices].tolist()
+
+    """
+    Serialization.
+    """
+
+    @classmethod
+    def load(cls, group: h5py.Group) -> EpisodeIndex:
+        """Load the index from the columns stored in an HDF5 group.
+
+        Args:
+            group: The group containing one dataset per column.
+
+        Returns:
+            The loaded index.
+        """
+        size = group["name"].shape[0]
+        episode_index = cls(initial_capacity=max(size, 1))
+        episode_index._size = size
+        episode_index._names[:size] = group["name"].asstr()[:]
+        episode_index._offsets[:size] = group["offset"][:]
+        episode_index._num_samples[:size] = group["num_samples"][:]
+        episode_index._success[:size] = group["success"][:]
+        episode_index._seeds[:size] = group["seed"][:]
+        return episode_index
+
+    def save(self, group: h5py.Group):
+        """Store the index as one resizable dataset per column in an HDF5 group.
+
+        Any existing columns in the group are replaced.
+
+        Args:
+            group: The group in which the columns are stored.
+        """
+        for column, values in zip(self.COLUMNS, self._columns()):
+            if column in group:
+                del group[column]
+            dtype = h5py.string_dtype() if column == "name" else values.dtype
+            group.create_dataset(column, data=values.astype(dtype), maxshape=(None,), chunks=(256,), dtype=dtype)
+
+    def save_last(self, group: h5py.Group):
+        """Append the last row of the index to the columns stored in an HDF5 group.
+
+        This is used to update a stored index incrementally after :meth:`append`.
+
+        Args:
+            group: The group containing one dataset per column, with one row less than the index.
+        """
+        index = self._size - 1
+        for column, values in zip(self.COLUMNS, self._columns()):
+            dataset = group[column]
+            dataset.resize((self._size,))
+            dataset[index] = values[index]
+
+    """
+    Helper functions.
+    """
+
+    def _columns(self) -> tuple[np.ndarray, ...]:
+        """The arrays of the columns, in the order of :attr:`COLUMNS`."""
+        return self.names, self.offsets, self.num_samples, self.success, self.seeds
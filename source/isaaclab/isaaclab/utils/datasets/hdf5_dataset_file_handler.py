@@ -7,22 +7,41 @@ import h5py
 import json
 import numpy as np
 import os
+import re
 import torch
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 from .dataset_file_handler_base import DatasetFileHandlerBase
 from .episode_data import EpisodeData
+from .episode_index import EpisodeIndex, episode_sort_key
+from .hdf5_dataset_layout_cfg import HDF5DatasetKeyLayoutCfg, HDF5DatasetLayoutCfg
+from .lazy_episode_data import LazyEpisodeData, has_allowed_keys
 
 
 class HDF5DatasetFileHandler(DatasetFileHandlerBase):
-    """HDF5 dataset file handler for storing and loading episode data."""
+    """HDF5 dataset file handler for storing and loading episode data.
 
-    def __init__(self):
-        """Initializes the HDF5 dataset file handler."""
+    Besides the episodes stored in the ``data`` group, the file contains an index of the episode metadata in the
+    ``episode_index`` group (see :class:`EpisodeIndex`). The index is updated as episodes are written, and rebuilt
+    from the episode groups when it is missing or out of date.
+    """
+
+    EPISODE_INDEX_GROUP_NAME = "episode_index"
+    """The name of the root group in which the episode index is stored."""
+
+    def __init__(self, layout_cfg: HDF5DatasetLayoutCfg | None = None):
+        """Initializes the HDF5 dataset file handler.
+
+        Args:
+            layout_cfg: The storage layout of the written datasets. Defaults to None, in which case the datasets
+                are stored contiguously and uncompressed.
+        """
+        self._layout_cfg = layout_cfg if layout_cfg is not None else HDF5DatasetLayoutCfg()
         self._hdf5_file_stream = None
         self._hdf5_data_group = None
         self._demo_count = 0
         self._env_args = {}
+        self._episode_index: EpisodeIndex | None = None
 
     def open(self, file_path: str, mode: str = "r"):
         """Open an existing dataset file."""
@@ -31,6 +50,8 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         self._hdf5_file_stream = h5py.File(file_path, mode)
         self._hdf5_data_group = self._hdf5_file_stream["data"]
         self._demo_count = len(self._hdf5_data_group)
+        # the episode index is loaded from the file on first access
+        self._episode_index = None
 
     def create(self, file_path: str, env_name: str = None):
         """Create a new dataset file."""
@@ -48,6 +69,10 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         self._hdf5_data_group.attrs["total"] = 0
         self._demo_count = 0
 
+        # set up an empty episode index, which is updated as episodes are written
+        self._episode_index = EpisodeIndex()
+        self._episode_index.save(self._hdf5_file_stream.create_group(self.EPISODE_INDEX_GROUP_NAME))
+
         # set environment arguments
         # the environment type (we use gym environment type) is set to be compatible with robomimic
         # Ref: https://github.com/ARISE-Initiative/robomimic/blob/master/robomimic/envs/env_base.py#L15
@@ -82,9 +107,23 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         return None
 
     def get_episode_names(self) -> Iterable[str]:
-        """Get the names of the episodes in the file."""
-        self._raise_if_not_initialized()
-        return self._hdf5_data_group.keys()
+        """Get the names of the episodes in the file, ordered by episode index."""
+        return self.get_episode_index().names.tolist()
+
+    def get_episode_length(self, episode_name: str) -> int | None:
+        """Get the number of samples of an episode in the file.
+
+        Args:
+            episode_name: The name of the episode.
+
+        Returns:
+            The number of samples of the episode. None if the episode is not in the file.
+        """
+        episode_index = self.get_episode_index()
+        row = episode_index.find(episode_name)
+        if row is None:
+            return None
+        return int(episode_index.num_samples[row])
 
     def get_num_episodes(self) -> int:
         """Get number of episodes in the file."""
@@ -95,31 +134,71 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         """The number of demos collected so far."""
         return self._demo_count
 
+    def get_episode_index(self) -> EpisodeIndex:
+        """Get the index of the episode metadata in the file.
+
+        The index stored in the file is loaded if it matches the number of episodes in the file. Otherwise, it is
+        rebuilt from the attributes of the episode groups and stored in the file if the file is writable.
+
+        Returns:
+            The index of the episodes, ordered by episode index.
+        """
+        self._raise_if_not_initialized()
+        if self._episode_index is None:
+            self._episode_index = self._load_or_build_episode_index()
+        return self._episode_index
+
     """
     Operations.
     """
 
-    def load_episode(self, episode_name: str, device: str) -> EpisodeData | None:
-        """Load episode data from the file."""
+    def load_episode(
+        self, episode_name: str, device: str, keys: Sequence[str] | None = None, lazy: bool = False
+    ) -> EpisodeData | None:
+        """Load episode data from the file.
+
+        Args:
+            episode_name: The name of the episode.
+            device: The device on which the loaded tensors are stored.
+            keys: The allow-list of keys to load. A key is loaded if it is listed or nested under a listed key,
+                for instance ``["actions", "states"]``. Defaults to None, in which case all keys are loaded.
+            lazy: Whether to read the datasets of the episode on demand instead of loading them all at once.
+                In this case, the returned episode is a :class:`LazyEpisodeData` and the file must remain
+                open while it is accessed. Defaults to False.
+
+        Returns:
+            The loaded episode data. None if the episode does not exist in the file.
+        """
         self._raise_if_not_initialized()
         if episode_name not in self._hdf5_data_group:
             return None
-        episode = EpisodeData()
         h5_episode_group = self._hdf5_data_group[episode_name]
 
-        def load_dataset_helper(group):
-            """Helper method to load dataset that contains recursive dict objects."""
-            data = {}
-            for key in group:
-                if isinstance(group[key], h5py.Group):
-                    data[key] = load_dataset_helper(group[key])
-                else:
-                    # Converting group[key] to numpy array greatly improves the performance
-                    # when converting to torch tensor
-                    data[key] = torch.tensor(np.array(group[key]), device=device)
-            return data
-
-        episode.data = load_dataset_helper(h5_episode_group)
+        if lazy:
+            episode = LazyEpisodeData(h5_episode_group, device, keys)
+        else:
+            episode = EpisodeData()
+
+            def load_dataset_helper(group, key_path):
+                """Helper method to load dataset that contains recursive dict objects."""
+                data = {}
+                for key in group:
+                    sub_key_path = f"{key_path}/{key}" if key_path else key
+                    if not has_allowed_keys(sub_key_path, keys):
+                        continue
+                    if isinstance(group[key], h5py.Group):
+                        data[key] = load_dataset_helper(group[key], sub_key_path)
+                    else:
+                        # Converting group[key] to numpy array greatly improves the performance
+                        # when converting to torch tensor
+                        value = np.array(group[key])
+                        # restore the data type of downcasted datasets
+                        if "dtype" in group[key].attrs:
+                            value = value.astype(group[key].attrs["dtype"])
+                        data[key] = torch.tensor(value, device=device)
+                return data
+
+            episode.data = load_dataset_helper(h5_episode_group, "")
 
         if "seed" in h5_episode_group.attrs:
             episode.seed = h5_episode_group.attrs["seed"]
@@ -141,6 +220,31 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         if episode.is_empty():
             return
 
+        self._write_episode(episode)
+
+    def flush(self):
+        """Flush the episode data to disk."""
+        self._raise_if_not_initialized()
+
+        self._hdf5_file_stream.flush()
+
+    def close(self):
+        """Close the dataset file handler."""
+        if self._hdf5_file_stream is not None:
+            self._hdf5_file_stream.close()
+            self._hdf5_file_stream = None
+        self._episode_index = None
+
+    """
+    Helper functions.
+    """
+
+    def _write_episode(self, episode: EpisodeData):
+        """Write a non-empty episode to the dataset file.
+
+        Args:
+            episode: The episode data to write.
+        """
         # create episode group based on demo count
         h5_episode_group = self._hdf5_data_group.create_group(f"demo_{self._demo_count}")
 
@@ -156,17 +260,17 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         if episode.success is not None:
             h5_episode_group.attrs["success"] = episode.success
 
-        def create_dataset_helper(group, key, value):
+        def create_dataset_helper(group, key, value, key_path):
             """Helper method to create dataset that contains recursive dict objects."""
             if isinstance(value, dict):
                 key_group = group.create_group(key)
                 for sub_key, sub_value in value.items():
-                    create_dataset_helper(key_group, sub_key, sub_value)
+                    create_dataset_helper(key_group, sub_key, sub_value, f"{key_path}/{sub_key}")
             else:
-                group.create_dataset(key, data=value.cpu().numpy())
+                self._create_dataset(group, key, value.cpu().numpy(), self._resolve_layout_cfg(key_path))
 
         for key, value in episode.data.items():
-            create_dataset_helper(h5_episode_group, key, value)
+            create_dataset_helper(h5_episode_group, key, value, key)
 
         # increment total step counts
         self._hdf5_data_group.attrs["total"] += h5_episode_group.attrs["num_samples"]
@@ -174,17 +278,77 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         # increment total demo counts
         self._demo_count += 1
 
-    def flush(self):
-        """Flush the episode data to disk."""
-        self._raise_if_not_initialized()
+        # update the episode index
+        self._append_to_episode_index(h5_episode_group)
+
+    def _load_or_build_episode_index(self) -> EpisodeIndex:
+        """Load the episode index stored in the file or rebuild it from the episode groups."""
+        file_stream = self._hdf5_file_stream
+        index_group = file_stream.get(self.EPISODE_INDEX_GROUP_NAME)
+        if index_group is not None and all(column in index_group for column in EpisodeIndex.COLUMNS):
+            if index_group["name"].shape[0] == len(self._hdf5_data_group):
+                return EpisodeIndex.load(index_group)
+        # rebuild the index from the attributes of the episode groups
+        episode_index = EpisodeIndex(initial_capacity=max(len(self._hdf5_data_group), 1))
+        for episode_name in sorted(self._hdf5_data_group.keys(), key=episode_sort_key):
+            attrs = self._hdf5_data_group[episode_name].attrs
+            episode_index.append(episode_name, attrs.get("num_samples", 0), attrs.get("success"), attrs.get("seed"))
+        # store the rebuilt index if the file is writable
+        if file_stream.mode != "r":
+            if index_group is None:
+                index_group = file_stream.create_group(self.EPISODE_INDEX_GROUP_NAME)
+            episode_index.save(index_group)
+        return episode_index
+
+    def _append_to_episode_index(self, h5_episode_group: h5py.Group):
+        """Append a written episode to the episode index and to the index stored in the file."""
+        if self._episode_index is None:
+            # the index is (re)built including the written episode
+            self._episode_index = self._load_or_build_episode_index()
+            return
+        attrs = h5_episode_group.attrs
+        episode_name = h5_episode_group.name.split("/")[-1]
+        self._episode_index.append(episode_name, attrs["num_samples"], attrs.get("success"), attrs.get("seed"))
+        self._episode_index.save_last(self._hdf5_file_stream[self.EPISODE_INDEX_GROUP_NAME])
 
-        self._hdf5_file_stream.flush()
+    def _resolve_layout_cfg(self, key_path: str) -> HDF5DatasetKeyLayoutCfg:
+        """Resolve the storage layout of a dataset from its full "/" separated key."""
+        for pattern, key_layout_cfg in self._layout_cfg.keys.items():
+            if re.fullmatch(pattern, key_path):
+                return key_layout_cfg
+        return self._layout_cfg.default
 
-    def close(self):
-        """Close the dataset file handler."""
-        if self._hdf5_file_stream is not None:
-            self._hdf5_file_stream.close()
-            self._hdf5_file_stream = None
+    def _create_dataset(self, group: h5py.Group, key: str, value: np.ndarray, layout_cfg: HDF5DatasetKeyLayoutCfg):
+        """Create a dataset with the given storage layout.
+
+        Args:
+            group: The group in which the dataset is created.
+            key: The name of the dataset.
+            value: The data of the dataset.
+            layout_cfg: The storage layout of the dataset.
+        """
+        attrs = dict()
+        if layout_cfg.float16 and np.issubdtype(value.dtype, np.floating) and value.dtype != np.float16:
+            attrs["dtype"] = value.dtype.str
+            value = value.astype(np.float16)
+        kwargs = dict()
+        # datasets with a zero-sized dimension cannot be chunked
+        if value.size > 0 and value.ndim > 0:
+            if layout_cfg.chunk_shape is not None:
+                if len(layout_cfg.chunk_shape) != value.ndim:
+                    raise ValueError(
+                        f"The chunk shape {layout_cfg.chunk_shape} of the dataset '{group.name}/{key}' does not match"
+                        f" the number of dimensions of its data: {value.shape}."
+                    )
+                kwargs["chunks"] = tuple(max(1, min(c, s)) for c, s in zip(layout_cfg.chunk_shape, value.shape))
+            if layout_cfg.compression is not None:
+                kwargs["compression"] = layout_cfg.compression
+                if layout_cfg.compression == "gzip" and layout_cfg.compression_level is not None:
+                    kwargs["compression_opts"] = layout_cfg.compression_level
+            if layout_cfg.shuffle:
+                kwargs["shuffle"] = True
+        dataset = group.create_dataset(key, data=value, **kwargs)
+        dataset.attrs.update(attrs)
 
     def _raise_if_not_initialized(self):
         """Raise an error if the dataset file handler is not initialized."""
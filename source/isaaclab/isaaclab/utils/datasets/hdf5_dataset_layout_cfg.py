@@ -0,0 +1,79 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+from typing import Literal
+
+from isaaclab.utils import configclass
+
+
+@configclass
+class HDF5DatasetKeyLayoutCfg:
+    """Configuration for the storage layout of the datasets written for a key of the episode data."""
+
+    chunk_shape: tuple[int, ...] | None = None
+    """The chunk shape of the dataset. Defaults to None.
+
+    The first dimension corresponds to the steps of the episode. Dimensions larger than the data are clamped
+    to the data shape. If None, the dataset is stored contiguously unless compression or shuffling is enabled,
+    in which case the chunk shape is guessed by h5py.
+    """
+
+    compression: Literal["gzip", "lzf"] | None = None
+    """The compression filter applied to the dataset. Defaults to None (no compression).
+
+    The "gzip" filter achieves better compression ratios, while the "lzf" filter is faster to write and read.
+    """
+
+    compression_level: int | None = None
+    """The compression level of the "gzip" filter, between 0 and 9. Defaults to None (h5py default level)."""
+
+    shuffle: bool = False
+    """Whether to apply the byte shuffle filter before the compression. Defaults to False.
+
+    Shuffling usually improves the compression ratio of floating point data.
+    """
+
+    float16: bool = False
+    """Whether to downcast floating point data to half precision. Defaults to False.
+
+    The original data type is stored in the ``dtype`` attribute of the dataset and restored when the episode is
+    loaded through :meth:`~isaaclab.utils.datasets.HDF5DatasetFileHandler.load_episode`.
+    """
+
+
+@configclass
+class HDF5DatasetLayoutCfg:
+    """Configuration for the storage layout of the episode data written by the HDF5 dataset file handler.
+
+    The layout of a dataset is resolved from its full "/" separated key in the episode data, for instance
+    "obs/policy/joint_pos". The first pattern in :attr:`keys` that fully matches the key is used. If none matches,
+    the :attr:`default` layout is used.
+
+    Usage:
+
+    .. code-block:: python
+
+        from isaaclab.utils.datasets import HDF5DatasetKeyLayoutCfg, HDF5DatasetLayoutCfg
+
+        layout_cfg = HDF5DatasetLayoutCfg(
+            default=HDF5DatasetKeyLayoutCfg(compression="lzf"),
+            keys={
+                # camera images are compressed frame by frame
+                "obs/.*_rgb": HDF5DatasetKeyLayoutCfg(chunk_shape=(1, 480, 640, 3), compression="gzip"),
+                # other observations are stored in half precision
+                "obs/.*": HDF5DatasetKeyLayoutCfg(compression="lzf", shuffle=True, float16=True),
+            },
+        )
+    """
+
+    default: HDF5DatasetKeyLayoutCfg = HDF5DatasetKeyLayoutCfg()
+    """The layout of the datasets whose key does not match any pattern in :attr:`keys`.
+    Defaults to contiguous, uncompressed storage."""
+
+    keys: dict[str, HDF5DatasetKeyLayoutCfg] = dict()
+    """The layout of the datasets keyed by a regular expression matched against the full dataset key.
+    Defaults to an empty dictionary."""
@@ -0,0 +1,231 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sub-module for merging HDF5 dataset files."""
+
+from __future__ import annotations
+
+import h5py
+import json
+import os
+import warnings
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from prettytable import PrettyTable
+from typing import Literal
+
+from .episode_index import episode_sort_key
+from .hdf5_dataset_file_handler import HDF5DatasetFileHandler
+
+
+@dataclass
+class DatasetSourceSummary:
+    """Summary of the episodes merged from a source dataset file."""
+
+    file_path: str
+    """The path to the source dataset file."""
+
+    env_name: str | None = None
+    """The environment name stored in the source dataset file. None if it is not set."""
+
+    num_episodes: int = 0
+    """The number of episodes merged from the source dataset file."""
+
+    num_samples: int = 0
+    """The total number of samples of the merged episodes."""
+
+    num_successful_episodes: int = 0
+    """The number of merged episodes that are flagged as successful."""
+
+
+@dataclass
+class DatasetMergeSummary:
+    """Summary of a merge of dataset files."""
+
+    output_file: str
+    """The path to the merged dataset file."""
+
+    mode: str
+    """The merge mode. See :func:`merge_hdf5_datasets` for the available modes."""
+
+    sources: list[DatasetSourceSummary] = field(default_factory=list)
+    """The summaries of the source dataset files, in the order of the merge."""
+
+    @property
+    def num_episodes(self) -> int:
+        """The total number of merged episodes."""
+        return sum(source.num_episodes for source in self.sources)
+
+    @property
+    def num_samples(self) -> int:
+        """The total number of samples of the merged episodes."""
+        return sum(source.num_samples for source in self.sources)
+
+    @property
+    def num_successful_episodes(self) -> int:
+        """The total number of merged episodes that are flagged as successful."""
+        return sum(source.num_successful_episodes for source in self.sources)
+
+    def __str__(self) -> str:
+        """Returns: A table with the number of episodes, samples and successes per source dataset file."""
+        table = PrettyTable()
+        table.title = f"Merged dataset: {self.output_file} (mode: {self.mode})"
+        table.field_names = ["Source", "Env name", "Episodes", "Samples", "Successful"]
+        table.align["Source"] = "l"
+        for source in self.sources:
+            table.add_row([
+                source.file_path,
+                source.env_name,
+                source.num_episodes,
+                source.num_samples,
+                source.num_successful_episodes,
+            ])
+        table.add_row(["Total", "", self.num_episodes, self.num_samples, self.num_successful_episodes])
+        return table.get_string()
+
+
+def merge_hdf5_datasets(
+    input_files: Sequence[str],
+    output_file: str,
+    mode: Literal["copy", "external_link", "virtual"] = "copy",
+) -> DatasetMergeSummary:
+    """Merge a set of HDF5 dataset files into a single dataset file.
+
+    The episodes of the input files are renamed to ``demo_<index>`` in the order of the input files and of the
+    episode indices within each file. The ``num_samples`` attribute of the episodes, the ``total`` attribute
+    of the merged data group and the episode index are recomputed. The environment arguments of the first input
+    file are kept.
+
+    The input files are read one after the other, since the HDF5 library serializes the accesses to the files
+    within a process. The episodes are merged with one of the following modes:
+
+    * ``"copy"``: The episodes are copied into the output file with HDF5's native object copy, which streams the
+      data without decoding it in Python.
+    * ``"external_link"``: The output file only contains external links to the episode groups of the input files.
+      No data is copied, but the input files must remain next to the output file.
+    * ``"virtual"``: The output file contains virtual datasets that map to the datasets of the input files.
+      No data is copied, but the input files must remain next to the output file. Unlike external links, the
+      episodes appear as regular groups, whose attributes can be modified.
+
+    Args:
+        input_files: The paths to the dataset files to merge.
+        output_file: The path to the merged dataset file.
+        mode: The merge mode. Defaults to "copy".
+
+    Returns:
+        The summary of the merged episodes per input file.
+
+    Raises:
+        FileNotFoundError: If an input file does not exist.
+        ValueError: If the merge mode is not supported.
+    """
+    if mode not in ("copy", "external_link", "virtual"):
+        raise ValueError(f"Unsupported merge mode: '{mode}'. Expected 'copy', 'external_link' or 'virtual'.")
+    for file_path in input_files:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The dataset file {file_path} does not exist.")
+
+    # scan the episodes of the input files
+    scan_results = [_scan_dataset_file(file_path) for file_path in input_files]
+
+    # check that the input files were recorded in the same environment
+    env_names = {env_args.get("env_name") for env_args, _ in scan_results}
+    if len(env_names) > 1:
+        warnings.warn(f"Merging datasets recorded in different environments: {env_names}.")
+
+    summary = DatasetMergeSummary(output_file=output_file, mode=mode)
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    os.makedirs(output_dir, exist_ok=True)
+    with h5py.File(output_file, "w") as output:
+        output_data_group = output.create_group("data")
+        output_data_group.attrs["env_args"] = json.dumps(scan_results[0][0] if scan_results else {})
+        episode_index = 0
+        for file_path, (env_args, episodes) in zip(input_files, scan_results):
+            source_summary = DatasetSourceSummary(file_path=file_path, env_name=env_args.get("env_name"))
+            # links to the input files are stored relative to the output file
+            relative_file_path = os.path.relpath(os.path.abspath(file_path), output_dir)
+            with h5py.File(file_path, "r") as input:
+                for episode_name, num_samples, success in episodes:
+                    output_episode_name = f"demo_{episode_index}"
+                    source_episode_path = f"/data/{episode_name}"
+                    if mode == "copy":
+                        input.copy(input[source_episode_path], output_data_group, output_episode_name)
+                        output_data_group[output_episode_name].attrs["num_samples"] = num_samples
+                    elif mode == "external_link":
+                        output_data_group[output_episode_name] = h5py.ExternalLink(
+                            relative_file_path, source_episode_path
+                        )
+                    else:
+                        _create_virtual_group(
+                            input[source_episode_path], output_data_group, output_episode_name, relative_file_path
+                        )
+                        output_data_group[output_episode_name].attrs["num_samples"] = num_samples
+                    episode_index += 1
+                    # update the summary of the input file
+                    source_summary.num_episodes += 1
+                    source_summary.num_samples += num_samples
+                    source_summary.num_successful_episodes += int(bool(success))
+            summary.sources.append(source_summary)
+        output_data_group.attrs["total"] = summary.num_samples
+
+    # build and store the episode index of the merged file
+    dataset_file_handler = HDF5DatasetFileHandler()
+    dataset_file_handler.open(output_file, "r+")
+    dataset_file_handler.get_episode_index()
+    dataset_file_handler.close()
+
+    return summary
+
+
+"""
+Helper functions.
+"""
+
+
+def _scan_dataset_file(file_path: str) -> tuple[dict, list[tuple[str, int, bool | None]]]:
+    """Read the environment arguments and the episode metadata of a dataset file.
+
+    Args:
+        file_path: The path to the dataset file.
+
+    Returns:
+        A tuple containing the environment arguments and a list of the name, number of samples and success flag
+        of each episode, ordered by episode index.
+    """
+    with h5py.File(file_path, "r") as input:
+        data_group = input["data"]
+        env_args = json.loads(data_group.attrs["env_args"]) if "env_args" in data_group.attrs else {}
+        episodes = []
+        for episode_name in sorted(data_group.keys(), key=episode_sort_key):
+            episode_group = data_group[episode_name]
+            # recompute the number of samples from the recorded actions
+            if "actions" in episode_group:
+                num_samples = int(episode_group["actions"].shape[0])
+            else:
+                num_samples = int(episode_group.attrs.get("num_samples", 0))
+            success = episode_group.attrs.get("success")
+            episodes.append((episode_name, num_samples, None if success is None else bool(success)))
+    return env_args, episodes
+
+
+def _create_virtual_group(source_group: h5py.Group, parent_group: h5py.Group, name: str, source_file_path: str):
+    """Mirror a group of a source file with virtual datasets.
+
+    Args:
+        source_group: The group to mirror.
+        parent_group: The group in which the mirrored group is created.
+        name: The name of the mirrored group.
+        source_file_path: The path to the source file stored in the virtual datasets.
+    """
+    group = parent_group.create_group(name)
+    group.attrs.update(source_group.attrs)
+    for key, value in source_group.items():
+        if isinstance(value, h5py.Group):
+            _create_virtual_group(value, group, key, source_file_path)
+        else:
+            layout = h5py.VirtualLayout(shape=value.shape, dtype=value.dtype)
+            layout[...] = h5py.VirtualSource(source_file_path, value.name, shape=value.shape, dtype=value.dtype)
+            dataset = group.create_virtual_dataset(key, layout)
+            dataset.attrs.update(value.attrs)
@@ -0,0 +1,244 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import h5py
+import numpy as np
+import torch
+from collections.abc import Iterator, Mapping, Sequence
+
+from .episode_data import EpisodeData
+
+
+def is_key_allowed(key_path: str, keys: Sequence[str] | None) -> bool:
+    """Check if a "/" separated key is selected by an allow-list of keys.
+
+    A key is selected if it is equal to one of the listed keys, or if it is nested under one of them. For instance,
+    the allow-list ``["actions", "obs/policy"]`` selects "actions" and "obs/policy/joint_pos", but not "obs/critic".
+
+    Args:
+        key_path: The full "/" separated key.
+        keys: The allow-list of keys. If None, all keys are selected.
+
+    Returns:
+        True if the key is selected.
+    """
+    if keys is None:
+        return True
+    return any(key_path == key or key_path.startswith(f"{key}/") for key in keys)
+
+
+def has_allowed_keys(key_path: str, keys: Sequence[str] | None) -> bool:
+    """Check if a "/" separated group key is selected or contains a key selected by an allow-list of keys.
+
+    Args:
+        key_path: The full "/" separated key of the group.
+        keys: The allow-list of keys. If None, all keys are selected.
+
+    Returns:
+        True if the group or one of its nested keys is selected.
+    """
+    if keys is None:
+        return True
+    return is_key_allowed(key_path, keys) or any(key.startswith(f"{key_path}/") for key in keys)
+
+
+class LazyEpisodeData(EpisodeData):
+    """Class to access the episode data stored in an HDF5 file on demand.
+
+    Unlike :class:`EpisodeData`, the datasets of the episode are not loaded when the episode is created. They are
+    read the first time they are accessed through :attr:`data`, or partially through :meth:`read`,
+    :meth:`get_action` and :meth:`get_state`. Contiguous, uncompressed datasets are read through a memory
+    map of the file, so only the touched bytes are read from disk.
+
+    Note:
+        The HDF5 file of the episode must remain open while the episode is accessed. The episode is read-only,
+        adding values to it is not supported.
+    """
+
+    def __init__(self, h5_episode_group: h5py.Group, device: str, keys: Sequence[str] | None = None):
+        """Initializes the lazy episode data class.
+
+        Args:
+            h5_episode_group: The HDF5 group of the episode.
+            device: The device on which the read tensors are stored.
+            keys: The allow-list of keys that can be accessed. A key is accessible if it is listed or nested under a
+                listed key. Defaults to None, in which case all keys are accessible.
+        """
+        super().__init__()
+        self._h5_episode_group = h5_episode_group
+        self._device = device
+        self._keys = keys
+        # memory maps of the contiguous datasets keyed by the full "/" separated key
+        self._memory_maps: dict[str, np.memmap | None] = dict()
+        self._data = _LazyDatasetGroup(self, h5_episode_group, "")
+
+    @property
+    def data(self):
+        """Returns the episode data as a read-only mapping that reads the datasets on first access."""
+        return self._data
+
+    @data.setter
+    def data(self, data: dict):
+        """Set the episode data."""
+        raise RuntimeError("The data of a lazily loaded episode cannot be replaced.")
+
+    """
+    Operations.
+    """
+
+    def add(self, key: str, value: torch.Tensor | dict):
+        """Adding values to a lazily loaded episode is not supported."""
+        raise RuntimeError("Values cannot be added to a lazily loaded episode.")
+
+    def get_num_samples(self, key: str) -> int | None:
+        """Get the number of steps stored for a key without reading its data.
+
+        Args:
+            key: The full "/" separated key of the dataset.
+
+        Returns:
+            The length of the first dimension of the dataset. None if the key does not exist or is not accessible.
+        """
+        dataset = self._get_dataset(key)
+        if dataset is None:
+            return None
+        return dataset.shape[0]
+
+    def read(self, key: str, index: int | slice | Sequence[int] = slice(None)) -> torch.Tensor | None:
+        """Read the given steps of a dataset.
+
+        Args:
+            key: The full "/" separated key of the dataset.
+            index: The steps to read along the first dimension of the dataset. Defaults to all steps.
+
+        Returns:
+            The read tensor. None if the key does not exist or is not accessible.
+        """
+        dataset = self._get_dataset(key)
+        if dataset is None:
+            return None
+        memory_map = self._get_memory_map(key, dataset)
+        value = memory_map[index] if memory_map is not None else dataset[index]
+        value = np.array(value)
+        # restore the data type of downcasted datasets
+        if "dtype" in dataset.attrs:
+            value = value.astype(dataset.attrs["dtype"])
+        return torch.tensor(value, device=self._device)
+
+    def get_initial_state(self) -> torch.Tensor | dict | None:
+        """Get the initial state from the dataset."""
+        if "initial_state" not in self._data:
+            return None
+        initial_state = self._data["initial_state"]
+        if isinstance(initial_state, _LazyDatasetGroup):
+            return initial_state.to_dict()
+        return initial_state
+
+    def get_action(self, action_index) -> torch.Tensor | None:
+        """Get the action of the specified index from the dataset."""
+        num_actions = self.get_num_samples("actions")
+        if num_actions is None or action_index >= num_actions:
+            return None
+        return self.read("actions", action_index)
+
+    def get_state(self, state_index) -> dict | None:
+        """Get the state of the specified index from the dataset."""
+        if not has_allowed_keys("states", self._keys) or "states" not in self._h5_episode_group:
+            return None
+
+        def get_state_helper(group: h5py.Group, key_path: str) -> dict | torch.Tensor | None:
+            if isinstance(group, h5py.Group):
+                output_state = dict()
+                for key in group:
+                    sub_key_path = f"{key_path}/{key}"
+                    if not has_allowed_keys(sub_key_path, self._keys):
+                        continue
+                    output_state[key] = get_state_helper(group[key], sub_key_path)
+                    if output_state[key] is None:
+                        return None
+            else:
+                if state_index >= group.shape[0]:
+                    return None
+                output_state = self.read(key_path, state_index)
+            return output_state
+
+        return get_state_helper(self._h5_episode_group["states"], "states")
+
+    """
+    Helper functions.
+    """
+
+    def _get_dataset(self, key: str) -> h5py.Dataset | None:
+        """Get the HDF5 dataset of a key if it exists and is accessible."""
+        if not is_key_allowed(key, self._keys) or key not in self._h5_episode_group:
+            return None
+        dataset = self._h5_episode_group[key]
+        if not isinstance(dataset, h5py.Dataset):
+            return None
+        return dataset
+
+    def _get_memory_map(self, key: str, dataset: h5py.Dataset) -> np.memmap | None:
+        """Get the memory map of a contiguous, uncompressed dataset.
+
+        Returns:
+            The memory map of the dataset. None if the dataset cannot be memory mapped.
+        """
+        if key not in self._memory_maps:
+            memory_map = None
+            # only contiguous datasets without filters are stored as raw bytes in the file
+            if dataset.chunks is None and dataset.compression is None and dataset.size > 0:
+                offset = dataset.id.get_offset()
+                if offset is not None:
+                    memory_map = np.memmap(
+                        dataset.file.filename, mode="r", dtype=dataset.dtype, offset=offset, shape=dataset.shape
+                    )
+            self._memory_maps[key] = memory_map
+        return self._memory_maps[key]
+
+
+class _LazyDatasetGroup(Mapping):
+    """Read-only mapping over an HDF5 group that reads its datasets on first access."""
+
+    def __init__(self, episode: LazyEpisodeData, h5_group: h5py.Group, key_path: str):
+        self._episode = episode
+        self._h5_group = h5_group
+        self._key_path = key_path
+        self._cache: dict[str, torch.Tensor | _LazyDatasetGroup] = dict()
+
+    def _sub_key_path(self, key: str) -> str:
+        return f"{self._key_path}/{key}" if self._key_path else key
+
+    def _accessible_keys(self) -> list[str]:
+        return [key for key in self._h5_group if has_allowed_keys(self._sub_key_path(key), self._episode._keys)]
+
+    def __getitem__(self, key: str) -> torch.Tensor | _LazyDatasetGroup:
+        if key not in self._cache:
+            if key not in self:
+                raise KeyError(key)
+            sub_key_path = self._sub_key_path(key)
+            if isinstance(self._h5_group[key], h5py.Group):
+                self._cache[key] = _LazyDatasetGroup(self._episode, self._h5_group[key], sub_key_path)
+            else:
+                self._cache[key] = self._episode.read(sub_key_path)
+        return self._cache[key]
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            isinstance(key, str)
+            and key in self._h5_group
+            and has_allowed_keys(self._sub_key_path(key), self._episode._keys)
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._accessible_keys())
+
+    def __len__(self) -> int:
+        return len(self._accessible_keys())
+
+    def to_dict(self) -> dict:
+        """Read all the accessible datasets of the group into a nested dictionary."""
+        return {key: value.to_dict() if isinstance(value, _LazyDatasetGroup) else value for key, value in self.items()}
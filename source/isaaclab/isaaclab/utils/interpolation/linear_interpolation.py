@@ -17,9 +17,18 @@ class LinearInterpolation:
     interpolating between the corresponding y values. For the query points that are outside the input points,
     the class does a zero-order-hold extrapolation based on the boundary values. This means that the class
     returns the value of the closest point in x.
+
+    The closest points are found with a binary search, which scales with O(N log M) for N query points and M
+    samples. If the samples are evenly spaced, the closest points are instead computed directly from the spacing
+    of the samples, which scales with O(N).
+
+    The class also supports a batch of lookup tables, for instance a different curve for each joint or for each
+    environment. In this case, the samples have a shape of (*batch_shape, num_samples) and the query points must
+    have a shape of (..., *batch_shape), i.e. each query point is interpolated with the lookup table of its
+    trailing indices.
     """
 
-    def __init__(self, x: torch.Tensor, y: torch.Tensor, device: str):
+    def __init__(self, x: torch.Tensor, y: torch.Tensor, device: str, uniform: bool | None = None):
         """Initializes the linear interpolation.
 
         The scalar function maps from real values, x, to real values, y. The input to the class is a set of samples
@@ -30,56 +39,138 @@ class LinearInterpolation:
 
         Args:
             x: An vector of samples from the function's domain. The values should be sorted in ascending order.
-                Shape is (num_samples,)
-            y: The function's values associated to the input x. Shape is (num_samples,)
+                Shape is (num_samples,) or (*batch_shape, num_samples) for a batch of lookup tables.
+            y: The function's values associated to the input x. Shape is (num_samples,) or
+                (*batch_shape, num_samples) for a batch of lookup tables.
             device: The device used for processing.
+            uniform: Whether the samples x are evenly spaced, in which case the closest points are computed from
+                the spacing of the samples instead of with a binary search. Defaults to None, in which case this
+                is detected from the samples.
 
         Raises:
             ValueError: If the input tensors are empty or have different sizes.
             ValueError: If the input tensor x is not sorted in ascending order.
+            ValueError: If :attr:`uniform` is True and the input tensor x is not evenly spaced.
         """
-        # make sure that input tensors are 1D of size (num_samples,)
-        self._x = x.view(-1).clone().to(device=device)
-        self._y = y.view(-1).clone().to(device=device)
-
+        # make sure that input tensors have the samples along the last dimension
+        if x.dim() == 0:
+            x = x.view(1)
+        if y.dim() == 0:
+            y = y.view(1)
         # make sure sizes are correct
-        if self._x.numel() == 0:
+        if x.numel() == 0:
             raise ValueError("Input tensor x is empty!")
-        if self._x.numel() != self._y.numel():
-            raise ValueError(f"Input tensors x and y have different sizes: {self._x.numel()} != {self._y.numel()}")
+        if x.shape != y.shape:
+            # note: for a single lookup table, the samples are flattened for backwards compatibility
+            if x.numel() != y.numel() or (x.dim() > 1 and y.dim() > 1):
+                raise ValueError(f"Input tensors x and y have different sizes: {tuple(x.shape)} != {tuple(y.shape)}")
+            x, y = x.view(-1), y.view(-1)
+        self._x = x.clone().to(device=device).contiguous()
+        self._y = y.clone().to(device=device).contiguous()
         # make sure that x is sorted
-        if torch.any(self._x[1:] < self._x[:-1]):
+        if torch.any(self._x[..., 1:] < self._x[..., :-1]):
             raise ValueError("Input tensor x is not sorted in ascending order!")
 
+        # flatten the lookup tables to shape (num_tables, num_samples)
+        self._batch_shape = self._x.shape[:-1]
+        self._x_2d = self._x.view(-1, self.num_samples)
+        self._y_2d = self._y.view(-1, self.num_samples)
+        # offsets of the lookup tables in the flattened samples
+        num_tables = self._x_2d.shape[0]
+        self._table_offsets = torch.arange(num_tables, device=device).unsqueeze(1) * self.num_samples
+
+        # check whether the samples are evenly spaced, up to the rounding errors relative to their range
+        is_uniform = False
+        if self.num_samples > 1:
+            x_start, x_range = self._x_2d[:, :1], self._x_2d[:, -1:] - self._x_2d[:, :1]
+            x_step = x_range / (self.num_samples - 1)
+            x_grid = x_start + x_step * torch.arange(self.num_samples, device=device)
+            is_uniform = bool(torch.all(x_range > 0.0) and torch.all((self._x_2d - x_grid).abs() <= 1e-5 * x_range))
+        if uniform and not is_uniform:
+            raise ValueError("Input tensor x is not evenly spaced!")
+        self._is_uniform = is_uniform if uniform is None else uniform
+        if self._is_uniform:
+            self._x_start = x_start.clone()
+            self._x_step = x_step
+
+    """
+    Properties
+    """
+
+    @property
+    def num_samples(self) -> int:
+        """Number of samples in each lookup table."""
+        return self._x.shape[-1]
+
+    @property
+    def batch_shape(self) -> torch.Size:
+        """Shape of the batch of lookup tables. It is empty for a single lookup table."""
+        return self._batch_shape
+
+    @property
+    def is_uniform(self) -> bool:
+        """Whether the closest points are computed from the spacing of the samples."""
+        return self._is_uniform
+
+    """
+    Operations
+    """
+
     def compute(self, q: torch.Tensor) -> torch.Tensor:
         """Calculates a linearly interpolated values for the query points.
 
         Args:
-           q: The query points. It can have any arbitrary shape.
+           q: The query points. It can have any arbitrary shape for a single lookup table. For a batch of lookup
+                tables, its trailing dimensions must match the batch shape, i.e. its shape is (..., *batch_shape).
 
         Returns:
             The interpolated values at query points. It has the same shape as the input tensor.
+
+        Raises:
+            ValueError: If the trailing dimensions of the query points do not match the batch of lookup tables.
         """
-        # serialized q
-        q_1d = q.view(-1)
-        # Number of elements in the x that are strictly smaller than query points (use int32 instead of int64)
-        num_smaller_elements = torch.sum(self._x.unsqueeze(1) < q_1d.unsqueeze(0), dim=0, dtype=torch.int)
-
-        # The index pointing to the first element in x such that x[lower_bound_i] < q_i
-        # If a point is smaller that all x elements, it will assign 0
-        lower_bound = torch.clamp(num_smaller_elements - 1, min=0)
-        # The index pointing to the first element in x such that x[upper_bound_i] >= q_i
-        # If a point is greater than all x elements, it will assign the last elements' index
-        upper_bound = torch.clamp(num_smaller_elements, max=self._x.numel() - 1)
-
-        # compute the weight as: (q_i - x_lb) / (x_ub - x_lb)
-        weight = (q_1d - self._x[lower_bound]) / (self._x[upper_bound] - self._x[lower_bound])
-        # If a point is out of bounds assign weight 0.0
-        weight[upper_bound == lower_bound] = 0.0
+        # serialize q into shape (num_tables, num_queries_per_table)
+        num_batch_dims = len(self._batch_shape)
+        if q.shape[q.dim() - num_batch_dims :] != self._batch_shape:
+            raise ValueError(
+                f"The trailing dimensions of the query points {tuple(q.shape)} do not match the batch shape of the"
+                f" lookup tables {tuple(self._batch_shape)}."
+            )
+        q_2d = q.reshape(-1, self._x_2d.shape[0]).t()
+        # special case: a single sample is a constant function
+        if self.num_samples == 1:
+            fq = self._y_2d.expand_as(q_2d)
+            return fq.t().reshape(q.shape)
+
+        if self._is_uniform:
+            # compute the lower bound from the spacing of the samples
+            position = (q_2d - self._x_start) / self._x_step
+            lower_bound = torch.clamp(torch.floor(position), 0, self.num_samples - 2).long()
+            upper_bound = lower_bound + 1
+            # compute the weight as: (q_i - x_lb) / (x_ub - x_lb)
+            # note: the weight is clamped for a zero-order-hold extrapolation of the points out of bounds
+            weight = torch.clamp(position - lower_bound, 0.0, 1.0)
+            lower_bound = lower_bound + self._table_offsets
+            upper_bound = upper_bound + self._table_offsets
+        else:
+            # Number of elements in the x that are strictly smaller than query points
+            num_smaller_elements = torch.searchsorted(self._x_2d, q_2d.contiguous())
+            # The index pointing to the first element in x such that x[lower_bound_i] < q_i
+            # If a point is smaller that all x elements, it will assign 0
+            lower_bound = torch.clamp(num_smaller_elements - 1, min=0) + self._table_offsets
+            # The index pointing to the first element in x such that x[upper_bound_i] >= q_i
+            # If a point is greater than all x elements, it will assign the last elements' index
+            upper_bound = torch.clamp(num_smaller_elements, max=self.num_samples - 1) + self._table_offsets
+            # compute the weight as: (q_i - x_lb) / (x_ub - x_lb)
+            x_lower, x_upper = torch.take(self._x, lower_bound), torch.take(self._x, upper_bound)
+            weight = (q_2d - x_lower) / (x_upper - x_lower)
+            # If a point is out of bounds assign weight 0.0
+            weight = torch.where(upper_bound == lower_bound, 0.0, weight)
 
         # Perform linear interpolation
-        fq = self._y[lower_bound] + weight * (self._y[upper_bound] - self._y[lower_bound])
+        y_lower, y_upper = torch.take(self._y, lower_bound), torch.take(self._y, upper_bound)
+        fq = y_lower + weight * (y_upper - y_lower)
 
-        # deserialized fq
-        fq = fq.view(q.shape)
+        # deserialize fq
+        fq = fq.t().reshape(q.shape)
         return fq
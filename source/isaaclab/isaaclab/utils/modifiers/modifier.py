@@ -150,9 +150,36 @@ class DigitalFilter(ModifierBase):
         self.A = torch.tensor(self._cfg.A, device=self._device).unsqueeze(1)
         self.B = torch.tensor(self._cfg.B, device=self._device).unsqueeze(1)
 
-        # create buffer for input and output history
-        self.x_n = torch.zeros(self._data_dim + (self.B.shape[0],), device=self._device)
-        self.y_n = torch.zeros(self._data_dim + (self.A.shape[0],), device=self._device)
+        # create ring buffers for input and output history with the time along the first dimension
+        # note: the slots are overwritten in place, so the history is never shifted or reallocated
+        self._x_history = torch.zeros((self.B.shape[0], *self._data_dim), device=self._device)
+        self._y_history = torch.zeros((self.A.shape[0], *self._data_dim), device=self._device)
+        # slots of the latest input and output in the ring buffers
+        self._x_pointer = 0
+        self._y_pointer = 0
+        # coefficients of the ring buffer slots for each position of the latest input and output
+        # note: this rotates the coefficients instead of the history, e.g. row p of the input coefficients
+        #  weighs the slot p with B[0], the slot p - 1 with B[1] and so on.
+        self._B_ring = self._create_ring_coefficients(self.B.squeeze(1))
+        self._A_ring = self._create_ring_coefficients(self.A.squeeze(1))
+
+    """
+    Properties.
+    """
+
+    @property
+    def x_n(self) -> torch.Tensor:
+        """The history of the inputs, from the current to the oldest input. Shape is (*data_dim, len(B))."""
+        return self._read_ring_buffer(self._x_history, self._x_pointer)
+
+    @property
+    def y_n(self) -> torch.Tensor:
+        """The history of the outputs, from the latest to the oldest output. Shape is (*data_dim, len(A))."""
+        return self._read_ring_buffer(self._y_history, self._y_pointer)
+
+    """
+    Operations.
+    """
 
     def reset(self, env_ids: Sequence[int] | None = None):
         """Resets digital filter history.
@@ -164,8 +191,8 @@ class DigitalFilter(ModifierBase):
         if env_ids is None:
             env_ids = slice(None)
         # reset history buffers
-        self.x_n[env_ids] = 0.0
-        self.y_n[env_ids] = 0.0
+        self._x_history[:, env_ids] = 0.0
+        self._y_history[:, env_ids] = 0.0
 
     def __call__(self, data: torch.Tensor) -> torch.Tensor:
         """Applies digital filter modification with a rolling history window inputs and outputs.
@@ -176,20 +203,50 @@ class DigitalFilter(ModifierBase):
         Returns:
             Filtered data. Shape is the same as data.
         """
-        # move history window for input
-        self.x_n = torch.roll(self.x_n, shifts=1, dims=-1)
-        self.x_n[..., 0] = data
+        # store the input in the next slot of the input history
+        self._x_pointer = (self._x_pointer + 1) % self._x_history.shape[0]
+        self._x_history[self._x_pointer] = data
 
-        # calculate current filter value: y[i] = Y*A - X*B
-        y_i = torch.matmul(self.x_n, self.B) - torch.matmul(self.y_n, self.A)
-        y_i.squeeze_(-1)
+        # calculate current filter value: y[i] = X*B - Y*A
+        # note: the sums over the history windows are fused into matrix-vector products
+        x_history = self._x_history.view(self._x_history.shape[0], -1)
+        y_history = self._y_history.view(self._y_history.shape[0], -1)
+        y_i = torch.mv(x_history.t(), self._B_ring[self._x_pointer])
+        y_i = torch.addmv(y_i, y_history.t(), self._A_ring[self._y_pointer], alpha=-1.0).view(data.shape)
 
-        # move history window for output and add current filter value to history
-        self.y_n = torch.roll(self.y_n, shifts=1, dims=-1)
-        self.y_n[..., 0] = y_i
+        # store the output in the next slot of the output history
+        self._y_pointer = (self._y_pointer + 1) % self._y_history.shape[0]
+        self._y_history[self._y_pointer] = y_i
 
         return y_i
 
+    """
+    Helper functions.
+    """
+
+    def _create_ring_coefficients(self, coefficients: torch.Tensor) -> torch.Tensor:
+        """Creates the coefficients of the ring buffer slots for each position of the latest entry.
+
+        Args:
+            coefficients: The filter coefficients, from the latest to the oldest entry. Shape is (N,).
+
+        Returns:
+            The coefficients of the slots. Row p contains the coefficients when the latest entry is at slot p.
+            Shape is (N, N).
+        """
+        num_slots = coefficients.shape[0]
+        slots = torch.arange(num_slots, device=self._device)
+        # the coefficient j is applied to the slot (p - j) % N
+        ring_coefficients = torch.zeros(num_slots, num_slots, device=self._device)
+        ring_coefficients[slots.unsqueeze(1), (slots.unsqueeze(1) - slots) % num_slots] = coefficients
+        return ring_coefficients
+
+    def _read_ring_buffer(self, history: torch.Tensor, pointer: int) -> torch.Tensor:
+        """Reads the entries of a ring buffer from the latest to the oldest along the last dimension."""
+        num_slots = history.shape[0]
+        slots = (pointer - torch.arange(num_slots, device=self._device)) % num_slots
+        return history[slots].movedim(0, -1)
+
 
 class Integrator(ModifierBase):
     r"""Modifier that applies a numerical forward integration based on a middle Reimann sum.
@@ -252,8 +309,10 @@ class Integrator(ModifierBase):
             Integral of input signal. Shape is the same as data.
         """
         # integrate using middle Riemann sum
-        self.integral += (data + self.y_prev) / 2 * self._cfg.dt
+        # note: the two terms are accumulated in place to avoid allocating intermediate tensors
+        self.integral.add_(data, alpha=0.5 * self._cfg.dt).add_(self.y_prev, alpha=0.5 * self._cfg.dt)
         # update previous value
-        self.y_prev[:] = data
+        self.y_prev.copy_(data)
 
-        return self.integral
+        # return a copy since the integral is stored in place and the output may be post-processed in place
+        return self.integral.clone()
@@ -28,6 +28,7 @@ Usage:
 from .noise_cfg import NoiseCfg  # noqa: F401
 from .noise_cfg import ConstantNoiseCfg, GaussianNoiseCfg, NoiseModelCfg, NoiseModelWithAdditiveBiasCfg, UniformNoiseCfg
 from .noise_model import NoiseModel, NoiseModelWithAdditiveBias, constant_noise, gaussian_noise, uniform_noise
+from .noise_sampler import BlockNoiseSampler
 
 # Backward compatibility
 ConstantBiasNoiseCfg = ConstantNoiseCfg
@@ -0,0 +1,320 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sampler that pre-samples the noise of several terms in blocks of steps."""
+
+from __future__ import annotations
+
+import math
+import torch
+from collections.abc import Sequence
+
+from . import noise_cfg, noise_model
+
+
+class BlockNoiseSampler:
+    """Pre-samples the noise of several terms for a block of steps at once.
+
+    The functions :func:`~isaaclab.utils.noise.gaussian_noise` and :func:`~isaaclab.utils.noise.uniform_noise`
+    draw a new random tensor for every term at every step, which launches one random number generation kernel
+    (and a few arithmetic kernels) per term and step. The sampler instead stores the noise of all the registered
+    terms in a block per distribution of shape (block_length, num_envs, D), where D is the total number of noise
+    elements of the terms of the distribution per environment. Each block is refilled once every
+    :attr:`block_length` steps with a single sampling kernel, and the noise of all its terms is scaled and offset
+    at once at refill time. At every step, the noise of a term is then applied from a view of its block.
+
+    By default, the noise is drawn from the global torch random number generator. If a seed is given, the noise
+    is instead computed with a counter-based random number generator: the noise of an environment is a hash of
+    the seed, the environment index, the number of resets of the environment, the number of steps since its last
+    reset and the index of the noise element. The noise of an environment is thus reproducible regardless of the
+    resets of the other environments and of the other random numbers drawn in the simulation, which is useful to
+    replay the exact noise of an episode.
+
+    Only the noise configurations :class:`~isaaclab.utils.noise.UniformNoiseCfg` and
+    :class:`~isaaclab.utils.noise.GaussianNoiseCfg` with their default functions are supported. See
+    :meth:`is_supported`.
+
+    Usage:
+
+    .. code-block:: python
+
+        sampler = BlockNoiseSampler(num_envs=4096, device="cuda:0", block_length=32)
+        joint_pos_noise_id = sampler.register(GaussianNoiseCfg(std=0.01), shape=(12,))
+        joint_vel_noise_id = sampler.register(UniformNoiseCfg(n_min=-0.1, n_max=0.1), shape=(12,))
+
+        # at every step
+        sampler.step()
+        joint_pos = sampler.apply(joint_pos_noise_id, joint_pos)
+        joint_vel = sampler.apply(joint_vel_noise_id, joint_vel)
+
+    """
+
+    def __init__(self, num_envs: int, device: str, block_length: int = 32, seed: int | None = None):
+        """Initializes the sampler.
+
+        Args:
+            num_envs: The number of environments.
+            device: The device to sample the noise on.
+            block_length: The number of steps of noise sampled at once. Defaults to 32.
+            seed: The seed of the counter-based random number generator. Defaults to None, in which case the
+                global torch random number generator is used.
+
+        Raises:
+            ValueError: If the block length is not positive.
+        """
+        if block_length < 1:
+            raise ValueError(f"The block length of the noise sampler must be positive. Received: {block_length}.")
+        # store inputs
+        self._num_envs = num_envs
+        self._device = device
+        self._block_length = block_length
+        self._seed = seed
+        # registered noise terms: configuration, shape, distribution and columns in the block of the distribution
+        # note: the distribution index is 0 for the uniform noise and 1 for the gaussian noise
+        self._noise_cfgs: list[noise_cfg.NoiseCfg] = []
+        self._shapes: list[tuple[int, ...]] = []
+        self._distributions: list[int] = []
+        self._columns: list[slice] = []
+        # the blocks, and the scale and offset of their columns, are allocated on the first step
+        # once all the terms are registered
+        self._blocks: list[torch.Tensor] = []
+        self._scales: list[torch.Tensor] = []
+        self._offsets: list[torch.Tensor] = []
+        # row of the block used at the current step
+        # note: the first step refills the block
+        self._row = block_length - 1
+        # counters of the counter-based random number generator
+        # note: the block start step is the number of steps since the last reset of each environment at row 0
+        self._ALL_INDICES = torch.arange(num_envs, device=device)
+        self._block_start_step = torch.full((num_envs,), -block_length, dtype=torch.long, device=device)
+        self._num_resets = torch.zeros(num_envs, dtype=torch.long, device=device)
+        if seed is not None:
+            self._seed_key = _hash_uint32(torch.tensor(seed, dtype=torch.long, device=device))
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the sampler."""
+        msg = f"<BlockNoiseSampler> with {len(self._noise_cfgs)} terms and {self.num_elements} elements per env\n"
+        msg += f"\tblock length: {self._block_length} steps\n"
+        msg += f"\trandom number generator: {'torch' if self._seed is None else f'counter-based (seed {self._seed})'}"
+        return msg
+
+    """
+    Properties
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """The number of environments."""
+        return self._num_envs
+
+    @property
+    def block_length(self) -> int:
+        """The number of steps of noise sampled at once."""
+        return self._block_length
+
+    @property
+    def num_elements(self) -> int:
+        """The number of noise elements per environment of all the registered terms."""
+        return sum(math.prod(shape) for shape in self._shapes)
+
+    """
+    Operations
+    """
+
+    @staticmethod
+    def is_supported(cfg: noise_cfg.NoiseCfg) -> bool:
+        """Checks whether the noise configuration can be pre-sampled by the sampler.
+
+        Args:
+            cfg: The noise configuration.
+
+        Returns:
+            True if the configuration is a uniform or gaussian noise with its default function.
+        """
+        if isinstance(cfg, noise_cfg.UniformNoiseCfg):
+            return cfg.func is noise_model.uniform_noise
+        if isinstance(cfg, noise_cfg.GaussianNoiseCfg):
+            return cfg.func is noise_model.gaussian_noise
+        return False
+
+    def register(self, cfg: noise_cfg.NoiseCfg, shape: Sequence[int]) -> int:
+        """Registers the noise of a term.
+
+        Args:
+            cfg: The noise configuration of the term.
+            shape: The shape of the data of the term for one environment.
+
+        Returns:
+            The index of the term, to pass to :meth:`apply`.
+
+        Raises:
+            ValueError: If the noise configuration is not supported.
+            RuntimeError: If the sampler already started sampling.
+        """
+        if not self.is_supported(cfg):
+            raise ValueError(f"The noise configuration is not supported by the noise sampler. Received: {cfg}.")
+        if self._blocks:
+            raise RuntimeError("Noise terms cannot be registered after the noise sampler started sampling.")
+        # assign the columns of the term in the block of its distribution
+        distribution = 0 if isinstance(cfg, noise_cfg.UniformNoiseCfg) else 1
+        start = sum(c.stop - c.start for d, c in zip(self._distributions, self._columns) if d == distribution)
+        self._noise_cfgs.append(cfg)
+        self._shapes.append(tuple(shape))
+        self._distributions.append(distribution)
+        self._columns.append(slice(start, start + math.prod(shape)))
+        return len(self._noise_cfgs) - 1
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        """Resets the noise streams of the environments.
+
+        With the counter-based random number generator, the remaining rows of the block are sampled again for
+        the reset environments, so that their noise restarts at the first step of a new episode. Otherwise,
+        nothing is done.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        if self._seed is None:
+            return
+        if env_ids is None:
+            env_ids = self._ALL_INDICES
+        # the next row of the block is the first step of the new episode
+        self._block_start_step[env_ids] = -(self._row + 1)
+        self._num_resets[env_ids] += 1
+        # sample the remaining rows of the block again
+        if self._blocks and self._row + 1 < self._block_length:
+            for distribution in range(len(self._blocks)):
+                self._fill_block(distribution, slice(self._row + 1, None), env_ids)
+
+    def step(self):
+        """Moves to the noise of the next step and refills the block if all its rows were used."""
+        self._row += 1
+        if self._row == self._block_length:
+            self._row = 0
+            self._block_start_step += self._block_length
+            # allocate the blocks on the first step
+            if not self._blocks:
+                self._allocate_blocks()
+            for distribution in range(len(self._blocks)):
+                self._fill_block(distribution, slice(None), slice(None))
+
+    def apply(self, term_id: int, data: torch.Tensor) -> torch.Tensor:
+        """Applies the noise of a term at the current step to its data.
+
+        Args:
+            term_id: The index of the term returned by :meth:`register`.
+            data: The data to apply the noise to. Shape is (num_envs, *shape).
+
+        Returns:
+            The data with the noise applied. Shape is the same as the input data.
+
+        Raises:
+            RuntimeError: If :meth:`step` was not called before.
+            ValueError: If the operation of the noise configuration is unknown.
+        """
+        if not self._blocks:
+            raise RuntimeError("The noise sampler must be stepped before applying the noise.")
+        cfg = self._noise_cfgs[term_id]
+        block = self._blocks[self._distributions[term_id]]
+        noise = block[self._row, :, self._columns[term_id]].view(self._num_envs, *self._shapes[term_id])
+        if cfg.operation == "add":
+            return data + noise
+        elif cfg.operation == "scale":
+            return data * noise
+        elif cfg.operation == "abs":
+            return noise.clone()
+        else:
+            raise ValueError(f"Unknown operation in noise: {cfg.operation}")
+
+    """
+    Helper functions.
+    """
+
+    def _allocate_blocks(self):
+        """Allocates the block of each distribution and the scale and offset of its columns."""
+        for distribution in range(2):
+            scales, offsets = [], []
+            for cfg, shape, term_distribution in zip(self._noise_cfgs, self._shapes, self._distributions):
+                if term_distribution != distribution:
+                    continue
+                if distribution == 0:
+                    scale, offset = cfg.n_max - cfg.n_min, cfg.n_min
+                else:
+                    scale, offset = cfg.std, cfg.mean
+                # broadcast the parameters of the term to its shape
+                scales.append(torch.broadcast_to(torch.as_tensor(scale, device=self._device), shape).reshape(-1))
+                offsets.append(torch.broadcast_to(torch.as_tensor(offset, device=self._device), shape).reshape(-1))
+            num_elements = sum(scale.numel() for scale in scales)
+            self._blocks.append(torch.empty(self._block_length, self._num_envs, num_elements, device=self._device))
+            self._scales.append(torch.cat(scales).float() if scales else torch.empty(0, device=self._device))
+            self._offsets.append(torch.cat(offsets).float() if offsets else torch.empty(0, device=self._device))
+
+    def _fill_block(self, distribution: int, rows: slice, env_ids: Sequence[int] | torch.Tensor | slice):
+        """Samples the noise of the given rows and environments of the block of a distribution."""
+        # note: indexing the environments with a tensor or a list returns a copy of the block
+        block = self._blocks[distribution][rows, env_ids]
+        if block.numel() == 0:
+            return
+        # sample the standard noise of all the terms at once
+        if self._seed is None:
+            if distribution == 0:
+                block.uniform_()
+            else:
+                block.normal_()
+        else:
+            h = self._counter_hash(rows, env_ids, distribution, block.shape[-1])
+            if distribution == 0:
+                block.copy_(_uniform_from_hash(h))
+            else:
+                # note: the normal noise is computed from two uniform numbers with the Box-Muller transform
+                u1, u2 = _uniform_from_hash(h), _uniform_from_hash(_hash_uint32(h))
+                torch.mul(torch.sqrt(-2.0 * torch.log1p(-u1)), torch.cos(2.0 * math.pi * u2), out=block)
+        # scale and offset the noise of all the terms at once
+        block.mul_(self._scales[distribution]).add_(self._offsets[distribution])
+        # write back the rows of the environments
+        if not isinstance(env_ids, slice):
+            self._blocks[distribution][rows, env_ids] = block
+
+    def _counter_hash(
+        self, rows: slice, env_ids: Sequence[int] | torch.Tensor | slice, distribution: int, num_elements: int
+    ) -> torch.Tensor:
+        """Hashes the counters of the given rows, environments and elements of the block of a distribution.
+
+        The counters of each environment and of each element are hashed separately, so that only the last hash
+        is computed over the whole block.
+
+        Returns:
+            The 32-bit hashes. Shape is (num_rows, num_envs, num_elements).
+        """
+        env_ids = self._ALL_INDICES[env_ids]
+        rows = torch.arange(self._block_length, device=self._device)[rows]
+        # hash the environment index and its number of resets
+        env_key = _hash_uint32(_hash_uint32(env_ids ^ self._seed_key) ^ self._num_resets[env_ids])
+        # hash the number of steps since the last reset of each environment
+        steps = self._block_start_step[env_ids].unsqueeze(0) + rows.unsqueeze(1)
+        step_key = _hash_uint32(env_key.unsqueeze(0) ^ steps)
+        # hash the elements of the distribution
+        element_key = _hash_uint32(torch.arange(num_elements, device=self._device) + (distribution << 24))
+        return _hash_uint32(step_key.unsqueeze(-1) ^ element_key)
+
+
+def _hash_uint32(x: torch.Tensor) -> torch.Tensor:
+    """Mixes the lower 32 bits of an integer tensor into a 32-bit hash.
+
+    The hash is computed on 64-bit integers to avoid overflows, since torch does not support unsigned integers
+    on all devices.
+    """
+    x = (x + 0x9E3779B9) & 0xFFFFFFFF
+    x = ((x >> 16) ^ x) * 0x45D9F3B & 0xFFFFFFFF
+    x = ((x >> 16) ^ x) * 0x45D9F3B & 0xFFFFFFFF
+    return (x >> 16) ^ x
+
+
+def _uniform_from_hash(h: torch.Tensor) -> torch.Tensor:
+    """Converts 32-bit hashes to uniform numbers in [0, 1).
+
+    The upper 24 bits of the hashes are used, since they are exactly representable in single precision.
+    """
+    return (h >> 8).float() * 2.0**-24
@@ -5,4 +5,5 @@
 
 """Sub-module containing operations based on warp."""
 
-from .ops import convert_to_warp_mesh, raycast_mesh
+from .ops import convert_to_warp_mesh, raycast_mesh, raycast_meshes, refit_mesh
+from .raycast_engine import RaycastEngine
@@ -75,6 +75,207 @@ def raycast_mesh_kernel(
             ray_face_id[tid] = f
 
 
+@wp.func
+def raycast_closest_mesh(
+    meshes: wp.array(dtype=wp.uint64),
+    ray_start: wp.vec3,
+    ray_direction: wp.vec3,
+    max_dist: float,
+):
+    """Ray-casts a ray against multiple meshes and returns the closest hit.
+
+    The ray is cast against the meshes in order, with the maximum distance reduced to the closest hit found
+    so far. This allows the BVH queries of the following meshes to skip all the nodes that are farther than
+    the closest hit.
+
+    Args:
+        meshes: The ids of the meshes. Shape is (M,).
+        ray_start: The start position of the ray.
+        ray_direction: The direction of the ray.
+        max_dist: The maximum ray-cast distance.
+
+    Returns:
+        The hit distance, the normal of the hit face, the index of the hit face in its mesh and the index
+        of the hit mesh in `meshes`. The mesh index is -1 if the ray misses all the meshes.
+    """
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # closest hit over all the meshes
+    closest_t = float(max_dist)
+    closest_n = wp.vec3()
+    closest_f = int(-1)
+    closest_mesh = int(-1)
+
+    for mesh_id in range(meshes.shape[0]):
+        hit_success = wp.mesh_query_ray(meshes[mesh_id], ray_start, ray_direction, closest_t, t, u, v, sign, n, f)
+        if hit_success and t < closest_t:
+            closest_t = t
+            closest_n = n
+            closest_f = f
+            closest_mesh = mesh_id
+
+    return closest_t, closest_n, closest_f, closest_mesh
+
+
+@wp.kernel(enable_backward=False)
+def raycast_meshes_kernel(
+    meshes: wp.array(dtype=wp.uint64),
+    ray_starts: wp.array(dtype=wp.vec3),
+    ray_directions: wp.array(dtype=wp.vec3),
+    ray_hits: wp.array(dtype=wp.vec3),
+    ray_distance: wp.array(dtype=wp.float32),
+    ray_normal: wp.array(dtype=wp.vec3),
+    ray_face_id: wp.array(dtype=wp.int32),
+    ray_mesh_id: wp.array(dtype=wp.int32),
+    max_dist: float = 1e6,
+    return_distance: int = False,
+    return_normal: int = False,
+    return_face_id: int = False,
+    return_mesh_id: int = False,
+):
+    """Performs ray-casting against multiple meshes and keeps the closest hit.
+
+    This function performs ray-casting against all the given meshes using :func:`raycast_closest_mesh`.
+
+    Args:
+        meshes: The ids of the input meshes. Shape is (M,).
+        ray_starts: The input ray start positions. Shape is (N, 3).
+        ray_directions: The input ray directions. Shape is (N, 3).
+        ray_hits: The output ray hit positions. Shape is (N, 3).
+        ray_distance: The output ray hit distances. Shape is (N,), if `return_distance` is True. Otherwise,
+            this array is not used.
+        ray_normal: The output ray hit normals. Shape is (N, 3), if `return_normal` is True. Otherwise,
+            this array is not used.
+        ray_face_id: The output ray hit face ids. Shape is (N,), if `return_face_id` is True. Otherwise,
+            this array is not used.
+        ray_mesh_id: The output indices of the hit meshes in `meshes`. Shape is (N,), if `return_mesh_id`
+            is True. Otherwise, this array is not used.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        return_distance: Whether to return the ray hit distances. Defaults to False.
+        return_normal: Whether to return the ray hit normals. Defaults to False`.
+        return_face_id: Whether to return the ray hit face ids. Defaults to False.
+        return_mesh_id: Whether to return the indices of the hit meshes. Defaults to False.
+    """
+    # get the thread id
+    tid = wp.tid()
+
+    # ray cast against the meshes and keep the closest hit
+    closest_t, closest_n, closest_f, closest_mesh = raycast_closest_mesh(
+        meshes, ray_starts[tid], ray_directions[tid], max_dist
+    )
+
+    # if the ray hit, store the hit data
+    if closest_mesh >= 0:
+        ray_hits[tid] = ray_starts[tid] + closest_t * ray_directions[tid]
+        if return_distance == 1:
+            ray_distance[tid] = closest_t
+        if return_normal == 1:
+            ray_normal[tid] = closest_n
+        if return_face_id == 1:
+            ray_face_id[tid] = closest_f
+        if return_mesh_id == 1:
+            ray_mesh_id[tid] = closest_mesh
+
+
+@wp.kernel(enable_backward=False)
+def raycast_meshes_indexed_kernel(
+    meshes: wp.array(dtype=wp.uint64),
+    env_ids: wp.array(dtype=wp.int32),
+    ray_starts: wp.array2d(dtype=wp.vec3),
+    ray_directions: wp.array2d(dtype=wp.vec3),
+    ray_hits: wp.array2d(dtype=wp.vec3),
+    ray_distance: wp.array2d(dtype=wp.float32),
+    ray_normal: wp.array2d(dtype=wp.vec3),
+    ray_face_id: wp.array2d(dtype=wp.int32),
+    ray_mesh_id: wp.array2d(dtype=wp.int32),
+    max_dist: float = 1e6,
+    return_distance: int = False,
+    return_normal: int = False,
+    return_face_id: int = False,
+    return_mesh_id: int = False,
+):
+    """Performs ray-casting against multiple meshes for a subset of the environments.
+
+    The kernel is launched with the shape (len(env_ids), R), where R is the number of rays per environment.
+    The rays and the outputs are indexed by the environment ids, so that the kernel reads and writes the
+    rows of persistent buffers directly. Unlike :func:`raycast_meshes_kernel`, the outputs of the missed
+    rays are also written, so the output buffers do not need to be reset before the launch.
+
+    Args:
+        meshes: The ids of the input meshes. Shape is (M,).
+        env_ids: The environment ids to ray-cast. Shape is (E,).
+        ray_starts: The input ray start positions. Shape is (N, R, 3).
+        ray_directions: The input ray directions. Shape is (N, R, 3).
+        ray_hits: The output ray hit positions. Shape is (N, R, 3). Contains inf for missed hits.
+        ray_distance: The output ray hit distances. Shape is (N, R), if `return_distance` is True. Otherwise,
+            this array is not used. Contains inf for missed hits.
+        ray_normal: The output ray hit normals. Shape is (N, R, 3), if `return_normal` is True. Otherwise,
+            this array is not used. Contains inf for missed hits.
+        ray_face_id: The output ray hit face ids. Shape is (N, R), if `return_face_id` is True. Otherwise,
+            this array is not used. Contains -1 for missed hits.
+        ray_mesh_id: The output indices of the hit meshes in `meshes`. Shape is (N, R), if `return_mesh_id`
+            is True. Otherwise, this array is not used. Contains -1 for missed hits.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        return_distance: Whether to return the ray hit distances. Defaults to False.
+        return_normal: Whether to return the ray hit normals. Defaults to False`.
+        return_face_id: Whether to return the ray hit face ids. Defaults to False.
+        return_mesh_id: Whether to return the indices of the hit meshes. Defaults to False.
+    """
+    # get the thread id
+    tid, ray_id = wp.tid()
+    env_id = env_ids[tid]
+
+    # ray cast against the meshes and keep the closest hit
+    ray_start = ray_starts[env_id, ray_id]
+    ray_direction = ray_directions[env_id, ray_id]
+    closest_t, closest_n, closest_f, closest_mesh = raycast_closest_mesh(meshes, ray_start, ray_direction, max_dist)
+
+    # store the hit data or the values of a missed hit
+    if closest_mesh >= 0:
+        ray_hits[env_id, ray_id] = ray_start + closest_t * ray_direction
+    else:
+        ray_hits[env_id, ray_id] = wp.vec3(wp.inf, wp.inf, wp.inf)
+        closest_t = wp.inf
+        closest_n = wp.vec3(wp.inf, wp.inf, wp.inf)
+    if return_distance == 1:
+        ray_distance[env_id, ray_id] = closest_t
+    if return_normal == 1:
+        ray_normal[env_id, ray_id] = closest_n
+    if return_face_id == 1:
+        ray_face_id[env_id, ray_id] = closest_f
+    if return_mesh_id == 1:
+        ray_mesh_id[env_id, ray_id] = closest_mesh
+
+
+@wp.kernel(enable_backward=False)
+def transform_mesh_points_kernel(
+    local_points: wp.array(dtype=wp.vec3),
+    instance_ids: wp.array(dtype=wp.int32),
+    positions: wp.array(dtype=wp.vec3),
+    orientations: wp.array(dtype=wp.quat),
+    points: wp.array(dtype=wp.vec3),
+):
+    """Transforms the points of a mesh from the frames of its instances to the world frame.
+
+    Args:
+        local_points: The input points in the frame of their instance. Shape is (N, 3).
+        instance_ids: The index of the instance of each point. Shape is (N,).
+        positions: The positions of the instances. Shape is (K, 3).
+        orientations: The orientations of the instances as quaternions (x, y, z, w). Shape is (K, 4).
+        points: The output points in the world frame. Shape is (N, 3).
+    """
+    # get the thread id
+    tid = wp.tid()
+    # transform the point with the pose of its instance
+    instance_id = instance_ids[tid]
+    points[tid] = wp.quat_rotate(orientations[instance_id], local_points[tid]) + positions[instance_id]
+
+
 @wp.kernel(enable_backward=False)
 def reshape_tiled_image(
     tiled_image_buffer: Any,
@@ -127,6 +127,174 @@ def raycast_mesh(
     return ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id
 
 
+def raycast_meshes(
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    meshes: list[wp.Mesh],
+    max_dist: float = 1e6,
+    return_distance: bool = False,
+    return_normal: bool = False,
+    return_face_id: bool = False,
+    return_mesh_id: bool = False,
+) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
+    """Performs ray-casting against multiple meshes and returns the closest hits.
+
+    All the meshes are ray-cast in a single kernel launch. The meshes must be on the same device. Please check
+    the function :func:`raycast_mesh` for the requirements on the input tensors.
+
+    Args:
+        ray_starts: The starting position of the rays. Shape (N, 3).
+        ray_directions: The ray directions for each ray. Shape (N, 3).
+        meshes: The warp meshes to ray-cast against.
+        max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+        return_distance: Whether to return the distance of the ray until it hits the mesh. Defaults to False.
+        return_normal: Whether to return the normal of the mesh face the ray hits. Defaults to False.
+        return_face_id: Whether to return the face id of the mesh face the ray hits. Defaults to False.
+        return_mesh_id: Whether to return the index of the mesh the ray hits. Defaults to False.
+
+    Returns:
+        The ray hit position. Shape (N, 3).
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit distance. Shape (N,).
+            Will only return if :attr:`return_distance` is True, else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit normal. Shape (N, 3).
+            Will only return if :attr:`return_normal` is True else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit face id in the hit mesh. Shape (N,).
+            Will only return if :attr:`return_face_id` is True else returns None.
+            The returned tensor contains :obj:`int(-1)` for missed hits.
+        The index of the hit mesh in the input list. Shape (N,).
+            Will only return if :attr:`return_mesh_id` is True else returns None.
+            The returned tensor contains :obj:`int(-1)` for missed hits.
+    """
+    # extract device and shape information
+    shape = ray_starts.shape
+    device = ray_starts.device
+    # device of the meshes
+    torch_device = wp.device_to_torch(meshes[0].device)
+    # reshape the tensors
+    ray_starts = ray_starts.to(torch_device).view(-1, 3).contiguous()
+    ray_directions = ray_directions.to(torch_device).view(-1, 3).contiguous()
+    num_rays = ray_starts.shape[0]
+    # create output tensor for the ray hits
+    ray_hits = torch.full((num_rays, 3), float("inf"), device=torch_device).contiguous()
+
+    # map the memory to warp arrays
+    mesh_ids_wp = wp.array([mesh.id for mesh in meshes], dtype=wp.uint64, device=meshes[0].device)
+    ray_starts_wp = wp.from_torch(ray_starts, dtype=wp.vec3)
+    ray_directions_wp = wp.from_torch(ray_directions, dtype=wp.vec3)
+    ray_hits_wp = wp.from_torch(ray_hits, dtype=wp.vec3)
+
+    if return_distance:
+        ray_distance = torch.full((num_rays,), float("inf"), device=torch_device).contiguous()
+        ray_distance_wp = wp.from_torch(ray_distance, dtype=wp.float32)
+    else:
+        ray_distance = None
+        ray_distance_wp = wp.empty((1,), dtype=wp.float32, device=torch_device)
+
+    if return_normal:
+        ray_normal = torch.full((num_rays, 3), float("inf"), device=torch_device).contiguous()
+        ray_normal_wp = wp.from_torch(ray_normal, dtype=wp.vec3)
+    else:
+        ray_normal = None
+        ray_normal_wp = wp.empty((1,), dtype=wp.vec3, device=torch_device)
+
+    if return_face_id:
+        ray_face_id = torch.full((num_rays,), -1, dtype=torch.int32, device=torch_device).contiguous()
+        ray_face_id_wp = wp.from_torch(ray_face_id, dtype=wp.int32)
+    else:
+        ray_face_id = None
+        ray_face_id_wp = wp.empty((1,), dtype=wp.int32, device=torch_device)
+
+    if return_mesh_id:
+        ray_mesh_id = torch.full((num_rays,), -1, dtype=torch.int32, device=torch_device).contiguous()
+        ray_mesh_id_wp = wp.from_torch(ray_mesh_id, dtype=wp.int32)
+    else:
+        ray_mesh_id = None
+        ray_mesh_id_wp = wp.empty((1,), dtype=wp.int32, device=torch_device)
+
+    # launch the warp kernel
+    wp.launch(
+        kernel=kernels.raycast_meshes_kernel,
+        dim=num_rays,
+        inputs=[
+            mesh_ids_wp,
+            ray_starts_wp,
+            ray_directions_wp,
+            ray_hits_wp,
+            ray_distance_wp,
+            ray_normal_wp,
+            ray_face_id_wp,
+            ray_mesh_id_wp,
+            float(max_dist),
+            int(return_distance),
+            int(return_normal),
+            int(return_face_id),
+            int(return_mesh_id),
+        ],
+        device=meshes[0].device,
+    )
+    wp.synchronize()
+
+    if return_distance:
+        ray_distance = ray_distance.to(device).view(shape[:-1])
+    if return_normal:
+        ray_normal = ray_normal.to(device).view(shape)
+    if return_face_id:
+        ray_face_id = ray_face_id.to(device).view(shape[:-1])
+    if return_mesh_id:
+        ray_mesh_id = ray_mesh_id.to(device).view(shape[:-1])
+
+    return ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id, ray_mesh_id
+
+
+def refit_mesh(
+    mesh: wp.Mesh,
+    local_points: wp.array,
+    instance_ids: wp.array,
+    positions: torch.Tensor,
+    orientations: torch.Tensor,
+):
+    """Moves the instances of a mesh to the given poses and refits its BVH.
+
+    The mesh combines the geometry of one or more instances, such as the copies of an object in each
+    environment. The points of the mesh are recomputed from their coordinates in the frame of their instance
+    and the poses of the instances. The BVH of the mesh is then refit to the new points, which is much faster
+    than rebuilding the mesh since its topology is unchanged.
+
+    Args:
+        mesh: The warp mesh to update.
+        local_points: The points of the mesh in the frame of their instance. Shape is (N, 3), where N is
+            the number of points of the mesh.
+        instance_ids: The index of the instance of each point. Shape is (N,).
+        positions: The positions of the instances in the world frame. Shape is (K, 3), where K is the number
+            of instances.
+        orientations: The orientations (w, x, y, z) of the instances in the world frame. Shape is (K, 4).
+    """
+    # device of the mesh
+    torch_device = wp.device_to_torch(mesh.device)
+    # convert the poses to warp arrays
+    # note: warp quaternions are in (x, y, z, w) format
+    positions = positions.to(torch_device, dtype=torch.float32).contiguous()
+    orientations = orientations.to(torch_device, dtype=torch.float32)[:, [1, 2, 3, 0]].contiguous()
+    # transform the points of the mesh
+    wp.launch(
+        kernel=kernels.transform_mesh_points_kernel,
+        dim=len(local_points),
+        inputs=[
+            local_points,
+            instance_ids,
+            wp.from_torch(positions, dtype=wp.vec3),
+            wp.from_torch(orientations, dtype=wp.quat),
+            mesh.points,
+        ],
+        device=mesh.device,
+    )
+    # refit the BVH of the mesh
+    mesh.refit()
+
+
 def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -> wp.Mesh:
     """Create a warp mesh object with a mesh defined from vertices and triangles.
 
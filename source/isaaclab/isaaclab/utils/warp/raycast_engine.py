@@ -0,0 +1,232 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Stateful ray-casting against warp meshes with persistent buffers."""
+
+# needed to import for allowing type-hinting: torch.Tensor | None
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+import warp as wp
+
+from . import kernels
+
+
+class RaycastEngine:
+    """Ray-casts a fixed number of rays per environment against multiple warp meshes.
+
+    Unlike the function :func:`~isaaclab.utils.warp.raycast_meshes`, the engine owns persistent input and output
+    buffers sized for all the environments, together with their warp arrays. A ray-cast only converts the
+    environment ids and launches a kernel that reads the rays and writes the results of these environments
+    directly into the buffers. The outputs of missed rays are written by the kernel, so no buffer is allocated
+    or reset at every call.
+
+    The kernel is launched on the current torch stream of the device of the meshes, after the work pending on
+    the current warp stream (such as the refit of moving meshes). The host is not synchronized with the device,
+    so the results can be consumed by the following torch operations without a stall.
+
+    Usage:
+
+    .. code-block:: python
+
+        engine = RaycastEngine(meshes, num_envs=4, num_rays=100, return_distance=True)
+        engine.ray_starts[env_ids] = ray_starts_w
+        engine.ray_directions[env_ids] = ray_directions_w
+        engine.raycast(env_ids)
+        ray_hits, ray_distance = engine.ray_hits[env_ids], engine.ray_distance[env_ids]
+
+    """
+
+    def __init__(
+        self,
+        meshes: list[wp.Mesh],
+        num_envs: int,
+        num_rays: int,
+        max_dist: float = 1e6,
+        return_distance: bool = False,
+        return_normal: bool = False,
+        return_face_id: bool = False,
+        return_mesh_id: bool = False,
+        ray_hits: torch.Tensor | None = None,
+    ):
+        """Initializes the engine and allocates its buffers.
+
+        Args:
+            meshes: The warp meshes to ray-cast against. The meshes must be on the same device. Their points
+                can be moved and refit between the ray-casts, but the list of meshes is fixed.
+            num_envs: The number of environments.
+            num_rays: The number of rays per environment.
+            max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+            return_distance: Whether to compute the distance of the rays until they hit a mesh. Defaults to False.
+            return_normal: Whether to compute the normal of the mesh faces the rays hit. Defaults to False.
+            return_face_id: Whether to compute the face id of the mesh faces the rays hit. Defaults to False.
+            return_mesh_id: Whether to compute the index of the meshes the rays hit. Defaults to False.
+            ray_hits: The buffer to write the ray hit positions into. Shape is (num_envs, num_rays, 3). It must
+                be a contiguous float32 tensor on the device of the meshes. Defaults to None, in which case a
+                buffer is allocated.
+
+        Raises:
+            ValueError: If no meshes are given.
+            ValueError: If the buffer for the ray hit positions does not match the rays.
+        """
+        if len(meshes) == 0:
+            raise ValueError("The ray-cast engine requires at least one mesh.")
+        # store inputs
+        self.max_dist = max_dist
+        self.return_distance = return_distance
+        self.return_normal = return_normal
+        self.return_face_id = return_face_id
+        self.return_mesh_id = return_mesh_id
+        self._wp_device = meshes[0].device
+        self._device = torch.device(wp.device_to_torch(self._wp_device))
+        self._num_envs = num_envs
+
+        # create the input buffers
+        self.ray_starts = torch.zeros(num_envs, num_rays, 3, device=self._device)
+        """The start positions of the rays in the world frame. Shape is (num_envs, num_rays, 3)."""
+        self.ray_directions = torch.zeros(num_envs, num_rays, 3, device=self._device)
+        """The directions of the rays in the world frame. Shape is (num_envs, num_rays, 3)."""
+        # create the output buffers
+        if ray_hits is None:
+            ray_hits = torch.full((num_envs, num_rays, 3), float("inf"), device=self._device)
+        elif (
+            ray_hits.shape != (num_envs, num_rays, 3)
+            or ray_hits.dtype != torch.float32
+            or ray_hits.device != self._device
+            or not ray_hits.is_contiguous()
+        ):
+            raise ValueError(
+                "The buffer for the ray hits must be a contiguous float32 tensor of shape"
+                f" {(num_envs, num_rays, 3)} on the device '{self._device}'. Received: shape {tuple(ray_hits.shape)},"
+                f" dtype {ray_hits.dtype}, device '{ray_hits.device}'."
+            )
+        self.ray_hits = ray_hits
+        """The ray hit positions. Shape is (num_envs, num_rays, 3). Contains inf for missed hits."""
+        self.ray_distance = self._create_output_buffer(return_distance, (num_envs, num_rays), float("inf"))
+        """The ray hit distances. Shape is (num_envs, num_rays). Contains inf for missed hits.
+
+        None if :attr:`return_distance` is False.
+        """
+        self.ray_normal = self._create_output_buffer(return_normal, (num_envs, num_rays, 3), float("inf"))
+        """The normals of the hit faces. Shape is (num_envs, num_rays, 3). Contains inf for missed hits.
+
+        None if :attr:`return_normal` is False.
+        """
+        self.ray_face_id = self._create_output_buffer(return_face_id, (num_envs, num_rays), -1)
+        """The ids of the hit faces in their mesh. Shape is (num_envs, num_rays). Contains -1 for missed hits.
+
+        None if :attr:`return_face_id` is False.
+        """
+        self.ray_mesh_id = self._create_output_buffer(return_mesh_id, (num_envs, num_rays), -1)
+        """The indices of the hit meshes in the list of meshes. Shape is (num_envs, num_rays).
+        Contains -1 for missed hits.
+
+        None if :attr:`return_mesh_id` is False.
+        """
+
+        # map the buffers to warp arrays
+        # note: the outputs that are not computed are mapped to a single element since they are not used
+        self._mesh_ids_wp = wp.array([mesh.id for mesh in meshes], dtype=wp.uint64, device=self._wp_device)
+        self._all_env_ids = torch.arange(num_envs, dtype=torch.int32, device=self._device)
+        self._all_env_ids_wp = wp.from_torch(self._all_env_ids, dtype=wp.int32)
+        self._ray_starts_wp = wp.from_torch(self.ray_starts, dtype=wp.vec3)
+        self._ray_directions_wp = wp.from_torch(self.ray_directions, dtype=wp.vec3)
+        self._ray_hits_wp = wp.from_torch(self.ray_hits, dtype=wp.vec3)
+        self._ray_distance_wp = self._map_output_buffer(self.ray_distance, wp.float32)
+        self._ray_normal_wp = self._map_output_buffer(self.ray_normal, wp.vec3)
+        self._ray_face_id_wp = self._map_output_buffer(self.ray_face_id, wp.int32)
+        self._ray_mesh_id_wp = self._map_output_buffer(self.ray_mesh_id, wp.int32)
+        # make sure that the mesh ids are copied before the first launch on another stream
+        wp.synchronize_device(self._wp_device)
+
+    """
+    Properties
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """The number of environments."""
+        return self._num_envs
+
+    @property
+    def num_rays(self) -> int:
+        """The number of rays per environment."""
+        return self.ray_starts.shape[1]
+
+    @property
+    def device(self) -> torch.device:
+        """The device of the meshes and the buffers."""
+        return self._device
+
+    """
+    Operations
+    """
+
+    def raycast(self, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Ray-casts the rays of the given environments against the meshes.
+
+        The rays are read from :attr:`ray_starts` and :attr:`ray_directions`, and the results are written into
+        the rows of the output buffers of the given environments. The other rows are not modified.
+
+        Args:
+            env_ids: The unique environment ids to ray-cast. Defaults to None, in which case all the
+                environments are ray-cast.
+        """
+        # resolve the environment ids
+        # note: the environment ids are unique, so all the environments are ray-cast if there are as many ids
+        if env_ids is None:
+            env_ids_wp = self._all_env_ids_wp
+        elif isinstance(env_ids, slice):
+            env_ids_wp = wp.from_torch(self._all_env_ids[env_ids].contiguous(), dtype=wp.int32)
+        elif len(env_ids) == self._num_envs:
+            env_ids_wp = self._all_env_ids_wp
+        else:
+            env_ids = torch.as_tensor(env_ids, device=self._device).to(torch.int32).contiguous()
+            env_ids_wp = wp.from_torch(env_ids, dtype=wp.int32)
+        if env_ids_wp.shape[0] == 0:
+            return
+        # launch the kernel on the torch stream, after the work pending on the warp stream
+        stream = wp.stream_from_torch(self._device) if self._wp_device.is_cuda else None
+        with wp.ScopedStream(stream):
+            wp.launch(
+                kernel=kernels.raycast_meshes_indexed_kernel,
+                dim=(env_ids_wp.shape[0], self.num_rays),
+                inputs=[
+                    self._mesh_ids_wp,
+                    env_ids_wp,
+                    self._ray_starts_wp,
+                    self._ray_directions_wp,
+                    self._ray_hits_wp,
+                    self._ray_distance_wp,
+                    self._ray_normal_wp,
+                    self._ray_face_id_wp,
+                    self._ray_mesh_id_wp,
+                    float(self.max_dist),
+                    int(self.return_distance),
+                    int(self.return_normal),
+                    int(self.return_face_id),
+                    int(self.return_mesh_id),
+                ],
+                device=self._wp_device,
+            )
+
+    """
+    Helper functions.
+    """
+
+    def _create_output_buffer(self, enabled: bool, shape: tuple[int, ...], fill_value: float) -> torch.Tensor | None:
+        """Allocates an output buffer filled with the value of a missed hit, if the output is computed."""
+        if not enabled:
+            return None
+        dtype = torch.int32 if isinstance(fill_value, int) else torch.float32
+        return torch.full(shape, fill_value, dtype=dtype, device=self._device)
+
+    def _map_output_buffer(self, buffer: torch.Tensor | None, dtype: type) -> wp.array:
+        """Maps an output buffer to a warp array, or allocates a placeholder if the output is not computed."""
+        if buffer is None:
+            return wp.empty((1, 1), dtype=dtype, device=self._wp_device)
+        return wp.from_torch(buffer, dtype=dtype)
@@ -0,0 +1,147 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import os
+import tempfile
+import torch
+import unittest
+
+from isaaclab.actuators import ActuatorNetGroup, ActuatorNetLSTMCfg, ActuatorNetMLPCfg, DCMotorCfg
+from isaaclab.utils.types import ArticulationActions
+
+
+class LSTMNetwork(torch.nn.Module):
+    """LSTM network with the interface of the actuator networks."""
+
+    def __init__(self):
+        super().__init__()
+        self.lstm = torch.nn.LSTM(input_size=2, hidden_size=8, num_layers=2, batch_first=True)
+        self.linear = torch.nn.Linear(8, 1)
+
+    def forward(
+        self, x: torch.Tensor, hidden: tuple[torch.Tensor, torch.Tensor]
+    ) -> tuple[torch.Tensor, tuple[torch.Tensor, torch.Tensor]]:
+        y, (h, c) = self.lstm(x, hidden)
+        return self.linear(y[:, -1]), (h, c)
+
+
+class TestActuatorNet(unittest.TestCase):
+    """Test fixture for the actuator models based on neural networks."""
+
+    def setUp(self):
+        self.device = "cpu"
+        self.num_envs = 8
+        torch.manual_seed(0)
+        # save the networks to files
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.mlp_file = os.path.join(self.tmp_dir.name, "mlp.pt")
+        mlp = torch.nn.Sequential(torch.nn.Linear(6, 16), torch.nn.Softsign(), torch.nn.Linear(16, 1))
+        torch.jit.script(mlp).save(self.mlp_file)
+        self.lstm_file = os.path.join(self.tmp_dir.name, "lstm.pt")
+        torch.jit.script(LSTMNetwork()).save(self.lstm_file)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _create_actuators(self, cfg, num_joints: tuple[int, ...]):
+        """Creates an actuator model of each number of joints."""
+        actuators = []
+        for actuator_num_joints in num_joints:
+            joint_names = [f"joint_{i}" for i in range(actuator_num_joints)]
+            actuators.append(cfg.class_type(cfg, joint_names, slice(None), self.num_envs, self.device))
+        return actuators
+
+    def _mlp_cfg(self) -> ActuatorNetMLPCfg:
+        return ActuatorNetMLPCfg(
+            joint_names_expr=[".*"],
+            network_file=self.mlp_file,
+            pos_scale=-1.0,
+            vel_scale=0.5,
+            torque_scale=10.0,
+            input_order="pos_vel",
+            input_idx=[0, 1, 3],
+            saturation_effort=20.0,
+            effort_limit=15.0,
+            velocity_limit=5.0,
+        )
+
+    def _lstm_cfg(self) -> ActuatorNetLSTMCfg:
+        return ActuatorNetLSTMCfg(
+            joint_names_expr=[".*"],
+            network_file=self.lstm_file,
+            saturation_effort=20.0,
+            effort_limit=15.0,
+            velocity_limit=5.0,
+        )
+
+    def test_network_cache(self):
+        """Test that the actuator models that load the same network file share the network."""
+        mlp_actuators = self._create_actuators(self._mlp_cfg(), (3, 4))
+        lstm_actuators = self._create_actuators(self._lstm_cfg(), (3,))
+        self.assertIs(mlp_actuators[0].network, mlp_actuators[1].network)
+        self.assertIsNot(mlp_actuators[0].network, lstm_actuators[0].network)
+        # group only the actuator models that share a network
+        dc_motor_cfg = DCMotorCfg(
+            joint_names_expr=[".*"], saturation_effort=20.0, effort_limit=15.0, velocity_limit=5.0, stiffness=1.0
+        )
+        dc_motor_cfg.damping = 0.1
+        dc_motors = self._create_actuators(dc_motor_cfg, (2,))
+        groups = ActuatorNetGroup.from_actuators(mlp_actuators + lstm_actuators + dc_motors)
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(groups[0].actuators, mlp_actuators)
+
+    def test_group_compute(self):
+        """Test that the batched inference of a group matches the inference of each actuator model."""
+        num_joints = (3, 4, 2)
+        for name, cfg in (("mlp", self._mlp_cfg()), ("lstm", self._lstm_cfg())):
+            with self.subTest(network=name):
+                actuators = self._create_actuators(cfg, num_joints)
+                batched_actuators = self._create_actuators(cfg, num_joints)
+                group = ActuatorNetGroup(batched_actuators)
+                for step in range(10):
+                    # reset some environments
+                    if step == 6:
+                        for actuator in actuators + batched_actuators:
+                            actuator.reset([1, 5])
+                    targets = [torch.randn(self.num_envs, n, device=self.device) for n in num_joints]
+                    joint_pos = [torch.randn(self.num_envs, n, device=self.device) for n in num_joints]
+                    joint_vel = [torch.randn(self.num_envs, n, device=self.device) for n in num_joints]
+                    control_actions = [
+                        ArticulationActions(joint_positions=target.clone(), joint_velocities=torch.zeros_like(target))
+                        for target in targets
+                    ]
+                    batched_control_actions = group.compute(
+                        [ArticulationActions(joint_positions=target.clone()) for target in targets],
+                        joint_pos,
+                        joint_vel,
+                    )
+                    for actuator, control_action, batched_control_action, pos, vel in zip(
+                        actuators, control_actions, batched_control_actions, joint_pos, joint_vel
+                    ):
+                        control_action = actuator.compute(control_action, pos, vel)
+                        torch.testing.assert_close(batched_control_action.joint_efforts, control_action.joint_efforts)
+                        self.assertIsNone(batched_control_action.joint_positions)
+
+    def test_invalid_group(self):
+        """Test that actuator models with different networks cannot be grouped."""
+        with self.assertRaises(ValueError):
+            ActuatorNetGroup(
+                self._create_actuators(self._mlp_cfg(), (3,)) + self._create_actuators(self._lstm_cfg(), (3,))
+            )
+        with self.assertRaises(ValueError):
+            ActuatorNetGroup([])
+
+
+if __name__ == "__main__":
+    run_tests()
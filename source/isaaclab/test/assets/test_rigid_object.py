@@ -969,6 +969,52 @@ class TestRigidObject(unittest.TestCase):
                                     elif state_location == "link":
                                         torch.testing.assert_close(rand_state, cube_object.data.root_link_state_w)
 
+    def test_derived_quantities_memoization(self):
+        """Test that the derived quantities are computed once per timestamp and recomputed on writes."""
+        for num_cubes in (1, 2):
+            for device in ("cuda:0", "cpu"):
+                with self.subTest(num_cubes=num_cubes, device=device):
+                    with build_simulation_context(device=device, gravity_enabled=False, auto_add_lighting=True) as sim:
+                        sim._app_control_on_stop_handle = None
+                        # Create a scene with random cubes
+                        cube_object, _ = generate_cubes_scene(num_cubes=num_cubes, height=1.0, device=device)
+
+                        # Play sim
+                        sim.reset()
+                        sim.step()
+                        cube_object.update(sim.cfg.dt)
+
+                        # Check that the derived quantities are reused at the same timestamp
+                        num_hits = cube_object.data.num_derived_cache_hits
+                        projected_gravity_b = cube_object.data.projected_gravity_b
+                        root_lin_vel_b = cube_object.data.root_lin_vel_b
+                        self.assertIs(cube_object.data.projected_gravity_b, projected_gravity_b)
+                        self.assertIs(cube_object.data.root_lin_vel_b, root_lin_vel_b)
+                        self.assertEqual(cube_object.data.num_derived_cache_hits, num_hits + 2)
+
+                        # Write a rotated root state with a velocity
+                        root_state = cube_object.data.root_state_w.clone()
+                        root_state[:, 3:7] = random_orientation(num_cubes, device=device)
+                        root_state[:, 7:10] = torch.tensor([1.0, 0.0, 0.0], device=device)
+                        cube_object.write_root_state_to_sim(root_state)
+
+                        # Check that the derived quantities are recomputed from the written state
+                        torch.testing.assert_close(
+                            cube_object.data.projected_gravity_b,
+                            quat_rotate_inverse(root_state[:, 3:7], cube_object.data.GRAVITY_VEC_W),
+                        )
+                        torch.testing.assert_close(
+                            cube_object.data.root_lin_vel_b,
+                            quat_rotate_inverse(root_state[:, 3:7], root_state[:, 7:10]),
+                        )
+
+                        # Check that the derived quantities are recomputed at the next timestamp
+                        sim.step()
+                        cube_object.update(sim.cfg.dt)
+                        num_hits = cube_object.data.num_derived_cache_hits
+                        self.assertIsNot(cube_object.data.projected_gravity_b, projected_gravity_b)
+                        self.assertEqual(cube_object.data.num_derived_cache_hits, num_hits)
+
 
 if __name__ == "__main__":
     run_tests()
@@ -20,7 +20,7 @@ import unittest
 from collections import namedtuple
 
 from isaaclab.managers import ManagerTermBase, ObservationGroupCfg, ObservationManager, ObservationTermCfg
-from isaaclab.utils import configclass, modifiers
+from isaaclab.utils import configclass, modifiers, noise
 
 
 def grilled_chicken(env):
@@ -346,6 +346,14 @@ class TestObservationManager(unittest.TestCase):
         # -- between groups
         torch.testing.assert_close(obs_policy[:, 5:8], obs_critic[:, 0:3])
         torch.testing.assert_close(obs_policy[:, 8:11], obs_critic[:, 3:6])
+        # make sure that the terms are scaled without modifying the data they read
+        self.assertFalse(torch.equal(self.env.data.lin_vel_w, obs_critic[:, 3:6]))
+        # make sure that the next computation returns new observations
+        obs_critic_copy = obs_critic.clone()
+        observations = self.obs_man.compute()
+        self.assertNotEqual(observations["critic"].data_ptr(), obs_critic.data_ptr())
+        torch.testing.assert_close(obs_critic, obs_critic_copy)
+        torch.testing.assert_close(observations["critic"], obs_critic)
 
     def test_compute_with_history(self):
         """Test the observation computation with history buffers."""
@@ -442,6 +450,46 @@ class TestObservationManager(unittest.TestCase):
         self.assertEqual((self.env.num_envs, 163840), obs_policy_flat.shape)
         self.assertEqual((self.env.num_envs, HISTORY_LENGTH, 128, 256, 1), obs_policy.shape)
 
+    def test_compute_with_history_not_concatenated(self):
+        """Test that the returned history of non-concatenated groups is not modified by the next computation."""
+        HISTORY_LENGTH = 3
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                concatenate_terms = False
+                term_1 = ObservationTermCfg(
+                    func=complex_function_class, params={"interval": 0.5}, history_length=HISTORY_LENGTH
+                )
+                term_2 = ObservationTermCfg(
+                    func=complex_function_class,
+                    params={"interval": 0.5},
+                    history_length=HISTORY_LENGTH,
+                    flatten_history_dim=False,
+                )
+
+            policy: ObservationGroupCfg = PolicyCfg()
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        self.obs_man = ObservationManager(cfg, self.env)
+        # compute observations over more steps than the history length
+        observations = [self.obs_man.compute()["policy"] for _ in range(HISTORY_LENGTH + 2)]
+        # check the observation shapes
+        self.assertEqual((self.env.num_envs, HISTORY_LENGTH), observations[0]["term_1"].shape)
+        self.assertEqual((self.env.num_envs, HISTORY_LENGTH, 1), observations[0]["term_2"].shape)
+        # check that each returned history is ordered from oldest to newest and kept its values
+        for step, obs_policy in enumerate(observations):
+            times = [0.5 * max(1, step + 1 - lag) for lag in reversed(range(HISTORY_LENGTH))]
+            expected_obs = torch.tensor(times, device=self.env.device).repeat(self.env.num_envs, 1)
+            torch.testing.assert_close(obs_policy["term_1"], expected_obs)
+            torch.testing.assert_close(obs_policy["term_2"], expected_obs.unsqueeze(-1))
+
     def test_compute_with_group_history(self):
         """Test the observation computation with group level history buffer configuration."""
         TERM_HISTORY_LENGTH = 5
@@ -654,6 +702,125 @@ class TestObservationManager(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.obs_man = ObservationManager(cfg, self.env)
 
+    def test_group_modifier_compute(self):
+        """Test the observation computation with modifiers of the group."""
+
+        filter_cfg = modifiers.DigitalFilterCfg(A=[0.5], B=[0.5])
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                modifiers = [filter_cfg.replace()]
+                term_1 = ObservationTermCfg(func=pos_w_data)
+                term_2 = ObservationTermCfg(func=lin_vel_w_data, scale=2.0)
+
+            @configclass
+            class CriticCfg(ObservationGroupCfg):
+                """Test config class for critic observation group."""
+
+                term_1 = ObservationTermCfg(func=pos_w_data, modifiers=[filter_cfg.replace()])
+                term_2 = ObservationTermCfg(func=lin_vel_w_data, scale=2.0, modifiers=[filter_cfg.replace()])
+
+            policy: ObservationGroupCfg = PolicyCfg()
+            critic: ObservationGroupCfg = CriticCfg()
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        self.obs_man = ObservationManager(cfg, self.env)
+
+        for step in range(5):
+            # reset some environments
+            if step == 3:
+                self.obs_man.reset(env_ids=[0, 3])
+            # change the data and compute observation using manager
+            self.env.data.pos_w[:] = torch.rand_like(self.env.data.pos_w)
+            self.env.data.lin_vel_w[:] = torch.rand_like(self.env.data.lin_vel_w)
+            observations = self.obs_man.compute()
+            # check that filtering the group is the same as filtering each term
+            # note: the scale is linear so it commutes with the filter
+            torch.testing.assert_close(observations["policy"], observations["critic"])
+
+    def test_presampled_noise_compute(self):
+        """Test the observation computation with the noise of the group pre-sampled in blocks."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                enable_corruption = True
+                noise_block_length = 4
+                noise_seed = 0
+                term_1 = ObservationTermCfg(func=grilled_chicken, noise=noise.GaussianNoiseCfg(std=0.1))
+                term_2 = ObservationTermCfg(
+                    func=grilled_chicken_with_curry,
+                    params={"hot": False},
+                    noise=noise.UniformNoiseCfg(n_min=-0.5, n_max=0.5, operation="abs"),
+                )
+                term_3 = ObservationTermCfg(
+                    func=grilled_chicken_with_bbq, params={"bbq": True}, noise=noise.ConstantNoiseCfg(bias=0.5)
+                )
+
+            policy: ObservationGroupCfg = PolicyCfg()
+
+        # create two observation managers with the same noise seed
+        obs_man_1 = ObservationManager(MyObservationManagerCfg(), self.env)
+        obs_man_2 = ObservationManager(MyObservationManagerCfg(), self.env)
+
+        all_observations = []
+        for step in range(10):
+            # reset some environments
+            # note: the noise of an environment does not depend on the resets of the other environments
+            if step == 6:
+                obs_man_1.reset(env_ids=[0, 3])
+                obs_man_2.reset(env_ids=[3])
+            observations = obs_man_1.compute()["policy"]
+            observations_2 = obs_man_2.compute()["policy"]
+            torch.testing.assert_close(observations[1:], observations_2[1:])
+            if step < 6:
+                torch.testing.assert_close(observations[0], observations_2[0])
+            else:
+                self.assertTrue(torch.all(observations[0, :5] != observations_2[0, :5]))
+            all_observations.append(observations)
+            # check the noise of each term
+            self.assertTrue(torch.all(observations[:, 4].abs() <= 0.5))
+            torch.testing.assert_close(observations[:, 5], torch.full_like(observations[:, 5], 1.5))
+        # check that the noise changes at every step and in each environment
+        all_observations = torch.stack(all_observations)
+        self.assertTrue(torch.all(all_observations[1:, :, :5] != all_observations[:-1, :, :5]))
+        self.assertTrue(torch.all(all_observations[:, 1:, :5] != all_observations[:, :-1, :5]))
+
+    def test_group_modifier_invalid_config(self):
+        """Test modifiers of a group that does not concatenate its terms."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                concatenate_terms = False
+                modifiers = [modifiers.DigitalFilterCfg(A=[0.5], B=[0.5])]
+                term_1 = ObservationTermCfg(func=pos_w_data)
+
+            policy: ObservationGroupCfg = PolicyCfg()
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+
+        with self.assertRaises(ValueError):
+            self.obs_man = ObservationManager(cfg, self.env)
+
 
 if __name__ == "__main__":
     run_tests()
@@ -157,6 +157,60 @@ class TestRecorderManager(unittest.TestCase):
                     episode = recorder_manager.get_episode(env_id)
                     self.assertEqual(episode.data["record_post_reset"].shape, (1, 3))
 
+    def test_export_finalizes_episodes(self):
+        """Test that the exported episodes release the spare capacity of their storage."""
+        env = create_dummy_env()
+        # create recorder manager
+        recorder_manager = RecorderManager(self.create_dummy_recorder_manager_cfg(), env)
+
+        # record fewer steps than the initial capacity of the episode storage
+        for _ in range(3):
+            recorder_manager.record_pre_step()
+        episode = recorder_manager.get_episode(0)
+        data = episode.data["record_pre_step"]
+        self.assertGreater(data.untyped_storage().nbytes(), data.nbytes)
+
+        # export the episode and check that its storage is trimmed to the recorded steps
+        recorder_manager.export_episodes(env_ids=[0])
+        data = episode.data["record_pre_step"]
+        self.assertEqual(data.shape, (3, 4))
+        self.assertEqual(data.untyped_storage().nbytes(), data.nbytes)
+        self.assertTrue(recorder_manager.get_episode(0).is_empty())
+
+    def test_record_batched(self):
+        """Test the recording of the data into batched storage."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                env = create_dummy_env(device)
+                # create recorder manager
+                cfg = self.create_dummy_recorder_manager_cfg()
+                cfg.batched_recording = True
+                recorder_manager = RecorderManager(cfg, env)
+
+                # record more steps than the initial capacity of the batched storage
+                num_steps = 40
+                for _ in range(num_steps):
+                    recorder_manager.record_pre_step()
+                    recorder_manager.record_post_step()
+
+                # check the recorded data
+                for env_id in range(env.num_envs):
+                    episode = recorder_manager.get_episode(env_id)
+                    self.assertEqual(episode.data["record_pre_step"].shape, (num_steps, 4))
+                    self.assertEqual(episode.data["record_post_step"].shape, (num_steps, 5))
+
+                # Trigger pre-reset callbacks for a subset of the environments
+                recorder_manager.record_pre_reset(env_ids=[0, 1])
+                for env_id in range(env.num_envs):
+                    episode = recorder_manager.get_episode(env_id)
+                    self.assertEqual(episode.is_empty(), env_id in [0, 1])
+
+                recorder_manager.record_post_reset(env_ids=[0, 1])
+                for env_id in [0, 1]:
+                    episode = recorder_manager.get_episode(env_id)
+                    self.assertEqual(episode.data["record_post_reset"].shape, (1, 3))
+                    self.assertNotIn("record_pre_step", episode.data)
+
 
 if __name__ == "__main__":
     run_tests()
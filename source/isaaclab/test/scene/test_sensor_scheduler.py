@@ -0,0 +1,168 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+from collections.abc import Sequence
+
+from isaaclab.scene import SensorUpdateScheduler
+from isaaclab.sensors import SensorBase, SensorBaseCfg
+from isaaclab.utils import configclass
+
+
+class DummySensor(SensorBase):
+    """A sensor that counts the updates of the buffers of each instance."""
+
+    cfg: "DummySensorCfg"
+
+    def __init__(self, cfg: "DummySensorCfg"):
+        super().__init__(cfg)
+        # initialize the buffers without a simulation context
+        self._device = "cpu"
+        self._num_envs = cfg.num_envs
+        self._is_outdated = torch.ones(self._num_envs, dtype=torch.bool)
+        self._timestamp = torch.zeros(self._num_envs)
+        self._timestamp_last_update = torch.zeros(self._num_envs)
+        self._is_initialized = True
+        self._data = torch.zeros(self._num_envs, dtype=torch.long)
+
+    @property
+    def data(self) -> torch.Tensor:
+        self._update_outdated_buffers()
+        return self._data
+
+    def _initialize_impl(self):
+        pass
+
+    def _update_buffers_impl(self, env_ids: Sequence[int]):
+        self._data[env_ids] += 1
+
+
+class DummySensorWithOwnUpdate(DummySensor):
+    """A sensor that overrides the update method."""
+
+    def update(self, dt: float, force_recompute: bool = False):
+        super().update(dt, force_recompute)
+
+
+@configclass
+class DummySensorCfg(SensorBaseCfg):
+    """Configuration of the dummy sensor."""
+
+    class_type: type = DummySensor
+    prim_path: str = "/World/envs/env_.*/Sensor"
+    num_envs: int = 8
+
+
+class TestSensorUpdateScheduler(unittest.TestCase):
+    """Test the grouped updates of the sensors."""
+
+    def setUp(self):
+        self.cfgs = {
+            "fast_0": DummySensorCfg(update_period=0.0, history_length=1),
+            "fast_1": DummySensorCfg(update_period=0.0),
+            "slow_0": DummySensorCfg(update_period=0.02, history_length=2),
+            "slow_1": DummySensorCfg(update_period=0.02),
+            "slower": DummySensorCfg(update_period=0.05, history_length=1),
+            "own_update": DummySensorCfg(class_type=DummySensorWithOwnUpdate, update_period=0.02, history_length=1),
+        }
+
+    def _create_sensors(self) -> dict[str, DummySensor]:
+        return {name: cfg.class_type(cfg) for name, cfg in self.cfgs.items()}
+
+    def test_groups(self):
+        """Test that the sensors are grouped by their update period."""
+        sensors = self._create_sensors()
+        scheduler = SensorUpdateScheduler(sensors)
+        scheduler.update(0.01)
+        self.assertListEqual(scheduler.group_names, [["fast_0", "fast_1"], ["slow_0", "slow_1"], ["slower"]])
+        # check that the sensors read and write the rows of their group
+        sensors["slow_1"].reset(env_ids=[2])
+        self.assertEqual(sensors["slow_1"]._timestamp.data_ptr(), scheduler._groups[1].timestamp[1].data_ptr())
+        torch.testing.assert_close(scheduler._groups[1].timestamp[:, 2], torch.tensor([0.01, 0.0]))
+
+    def test_update(self):
+        """Test that the scheduled updates match the updates of the sensors one by one."""
+        for force_recompute in [False, True]:
+            with self.subTest(force_recompute=force_recompute):
+                sensors = self._create_sensors()
+                expected_sensors = self._create_sensors()
+                scheduler = SensorUpdateScheduler(sensors)
+                generator = torch.Generator().manual_seed(0)
+                for step in range(100):
+                    # reset some environments
+                    if step % 7 == 0:
+                        env_ids = torch.randperm(8, generator=generator)[:3]
+                        for name in sensors:
+                            sensors[name].reset(env_ids)
+                            expected_sensors[name].reset(env_ids)
+                    # update the sensors
+                    scheduler.update(0.005, force_recompute=force_recompute)
+                    for sensor in expected_sensors.values():
+                        sensor.update(0.005, force_recompute=force_recompute)
+                    # access the data of a lazy sensor from time to time
+                    if step % 5 == 0:
+                        torch.testing.assert_close(sensors["slow_1"].data, expected_sensors["slow_1"].data)
+                # check the buffers of all the sensors
+                for name, sensor in sensors.items():
+                    expected_sensor = expected_sensors[name]
+                    torch.testing.assert_close(sensor._data, expected_sensor._data)
+                    torch.testing.assert_close(sensor._timestamp, expected_sensor._timestamp)
+                    torch.testing.assert_close(sensor._timestamp_last_update, expected_sensor._timestamp_last_update)
+                    torch.testing.assert_close(sensor._is_outdated, expected_sensor._is_outdated)
+
+    def test_timings(self):
+        """Test the update counters of the sensors."""
+        sensors = self._create_sensors()
+        scheduler = SensorUpdateScheduler(sensors, record_timings=True)
+        for _ in range(10):
+            scheduler.update(0.01)
+        timings = scheduler.timings
+        # the lazy sensors without history are not updated
+        self.assertNotIn("fast_1", timings)
+        self.assertNotIn("slow_1", timings)
+        # the other sensors are only counted when they are due
+        self.assertEqual(timings["fast_0"]["num_updates"], 10)
+        self.assertEqual(timings["slow_0"]["num_updates"], 5)
+        self.assertEqual(timings["slower"]["num_updates"], 2)
+        self.assertEqual(timings["own_update"]["num_updates"], 10)
+        self.assertGreater(timings["fast_0"]["total_time"], 0.0)
+        # check that the updates triggered by accessing the data of a lazy sensor are counted
+        # note: accessing the data again without outdated instances does not update the buffers
+        for _ in range(2):
+            sensors["slow_1"].data
+        self.assertEqual(scheduler.timings["slow_1"]["num_updates"], 1)
+        self.assertGreater(scheduler.timings["slow_1"]["total_time"], 0.0)
+        # check that the counters are reset
+        scheduler.reset_timings()
+        self.assertDictEqual(scheduler.timings, {})
+
+    def test_regroup(self):
+        """Test that the sensors are grouped again when they are initialized again."""
+        sensors = self._create_sensors()
+        scheduler = SensorUpdateScheduler(sensors)
+        scheduler.update(0.01)
+        # re-create the buffers of a sensor as done on initialization
+        sensors["slow_0"]._timestamp = torch.zeros(8)
+        scheduler.update(0.01)
+        self.assertEqual(sensors["slow_0"]._timestamp.data_ptr(), scheduler._groups[1].timestamp[0].data_ptr())
+        torch.testing.assert_close(sensors["slow_0"]._timestamp, torch.full((8,), 0.01))
+        # check that the buffer updates are counted once after grouping again
+        sensors["slow_0"].reset()
+        sensors["slow_0"].data
+        self.assertEqual(scheduler.timings["slow_0"]["num_updates"], 2)
+
+
+if __name__ == "__main__":
+    run_tests()
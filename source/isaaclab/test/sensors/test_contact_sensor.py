@@ -295,6 +295,50 @@ class TestContactSensor(unittest.TestCase):
                             contact_sensor_2.data.force_matrix_w[:, :, 0], contact_sensor.data.force_matrix_w[:, :, 0]
                         )
 
+    def test_contact_force_history(self):
+        """Checks the history of the net contact forces stored in the ring buffer."""
+        for device in self.devices:
+            with self.subTest(device=device):
+                with build_simulation_context(device=device, dt=self.sim_dt, add_lighting=False) as sim:
+                    sim._app_control_on_stop_handle = None
+                    # Instance new scene with a cube falling on the ground in each environment.
+                    scene_cfg = ContactSensorSceneCfg(num_envs=4, env_spacing=1.0, lazy_sensor_update=False)
+                    scene_cfg.terrain = FLAT_TERRAIN_CFG.replace(prim_path="/World/ground")
+                    scene_cfg.shape = CUBE_CFG.replace(prim_path="{ENV_REGEX_NS}/Cube")
+                    scene_cfg.shape.init_state.pos = (0, -1.0, 0.25)
+                    scene_cfg.contact_sensor = ContactSensorCfg(
+                        prim_path="{ENV_REGEX_NS}/Cube", update_period=0.0, history_length=3
+                    )
+                    scene = InteractiveScene(scene_cfg)
+
+                    # Set variables internally for reference
+                    self.sim = sim
+                    self.scene = scene
+
+                    # Play the simulation
+                    self.sim.reset()
+                    self.scene.reset()
+                    contact_sensor: ContactSensor = self.scene["contact_sensor"]
+
+                    # Record the net forces of more steps than the history length
+                    net_forces_w = []
+                    for _ in range(7):
+                        self._perform_sim_step()
+                        net_forces_w.append(contact_sensor.data.net_forces_w.clone())
+                    # Check the history is ordered from the most recent to the oldest
+                    expected_history = torch.stack(net_forces_w[::-1][:3], dim=1)
+                    torch.testing.assert_close(contact_sensor.data.net_forces_w_history, expected_history)
+                    # Check the ring buffer contains the same entries
+                    torch.testing.assert_close(
+                        contact_sensor.data.net_forces_w_history_ring.norm(dim=-1).max(dim=1)[0],
+                        expected_history.norm(dim=-1).max(dim=1)[0],
+                    )
+                    # Check the history of the reset environments is cleared
+                    contact_sensor.reset(env_ids=[1, 2])
+                    history = contact_sensor.data.net_forces_w_history
+                    self.assertTrue(torch.all(history[1:3] == 0.0))
+                    torch.testing.assert_close(history[[0, 3]], expected_history[[0, 3]])
+
     def test_sensor_print(self):
         """Test sensor print is working correctly."""
         with build_simulation_context(device="cuda:0", dt=self.sim_dt, add_lighting=False) as sim:
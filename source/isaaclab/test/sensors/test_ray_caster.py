@@ -0,0 +1,109 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+import isaacsim.core.utils.prims as prim_utils
+import isaacsim.core.utils.stage as stage_utils
+
+import isaaclab.sim as sim_utils
+from isaaclab.assets import RigidObject, RigidObjectCfg
+from isaaclab.sensors.ray_caster import RayCaster, RayCasterCfg, patterns
+from isaaclab.terrains.trimesh.utils import make_plane
+from isaaclab.terrains.utils import create_prim_from_mesh
+
+
+class TestRayCaster(unittest.TestCase):
+    """Test for the ray-caster sensor."""
+
+    """
+    Test Setup and Teardown
+    """
+
+    def setUp(self):
+        """Create a blank new stage for each test."""
+        # Create a new stage
+        stage_utils.create_new_stage()
+        # create xform for the sensor above the origin
+        prim_utils.create_prim("/World/Sensor", "Xform", translation=(0.0, 0.0, 2.0))
+        # Simulation time-step
+        self.dt = 0.01
+        # Load kit helper
+        # note: fabric is enabled, so the transforms of the rigid bodies on the stage are not updated
+        sim_cfg = sim_utils.SimulationCfg(dt=self.dt, use_fabric=True)
+        self.sim: sim_utils.SimulationContext = sim_utils.SimulationContext(sim_cfg)
+        # Ground-plane
+        mesh = make_plane(size=(100, 100), height=0.0, center_zero=True)
+        create_prim_from_mesh("/World/defaultGroundPlane", mesh)
+        # load stage
+        stage_utils.update_stage()
+
+    def tearDown(self):
+        """Stops simulator after each test."""
+        # stop simulation
+        self.sim._timeline.stop()
+        # clear the stage
+        self.sim.clear_all_callbacks()
+        self.sim.clear_instance()
+
+    """
+    Tests
+    """
+
+    def test_dynamic_rigid_body_mesh(self):
+        """Test that the rays hit a moving rigid body at its pose in the simulation."""
+        # Create a movable obstacle that is not affected by gravity
+        obstacle_cfg = RigidObjectCfg(
+            prim_path="/World/Obstacle",
+            spawn=sim_utils.MeshCuboidCfg(
+                size=(1.0, 1.0, 0.5),
+                rigid_props=sim_utils.RigidBodyPropertiesCfg(disable_gravity=True),
+                mass_props=sim_utils.MassPropertiesCfg(mass=1.0),
+                collision_props=sim_utils.CollisionPropertiesCfg(),
+            ),
+            init_state=RigidObjectCfg.InitialStateCfg(pos=(0.0, 0.0, 0.25)),
+        )
+        obstacle = RigidObject(obstacle_cfg)
+        # Create a ray-caster that casts rays downwards onto the obstacle
+        ray_caster_cfg = RayCasterCfg(
+            prim_path="/World/Sensor",
+            mesh_prim_paths=["/World/defaultGroundPlane", "/World/Obstacle"],
+            dynamic_mesh_prim_paths=["/World/Obstacle"],
+            update_period=0,
+            pattern_cfg=patterns.GridPatternCfg(resolution=0.1, size=(0.4, 0.4)),
+        )
+        ray_caster = RayCaster(cfg=ray_caster_cfg)
+        # Play sim
+        self.sim.reset()
+        self.assertTrue(ray_caster.is_initialized)
+
+        # move the obstacle to different poses and check the height of the hits
+        # note: the last pose is rotated by 90 degrees about the y-axis, so its top is at half of its length
+        obstacle_poses = [
+            ([0.0, 0.0, 0.25, 1.0, 0.0, 0.0, 0.0], 0.5),
+            ([3.0, 0.0, 0.25, 1.0, 0.0, 0.0, 0.0], 0.0),
+            ([0.0, 0.0, 1.0, 0.7071068, 0.0, 0.7071068, 0.0], 1.5),
+        ]
+        for obstacle_pose, hit_height in obstacle_poses:
+            obstacle.write_root_pose_to_sim(torch.tensor([obstacle_pose], device=self.sim.device))
+            self.sim.step()
+            obstacle.update(self.dt)
+            ray_caster.update(self.dt)
+            ray_hits_w = ray_caster.data.ray_hits_w
+            torch.testing.assert_close(ray_hits_w[..., 2], torch.full_like(ray_hits_w[..., 2], hit_height))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,108 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import torch
+import trimesh
+import unittest
+
+import isaaclab.terrains as terrain_gen
+from isaaclab.terrains.height_field.utils import convert_height_field_to_mesh
+from isaaclab.utils.warp import convert_to_warp_mesh, raycast_mesh
+
+
+def sample_heights(vertices: np.ndarray, triangles: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Sample the heights of a mesh at the given xy-points by casting rays downwards."""
+    wp_mesh = convert_to_warp_mesh(vertices, triangles, device="cpu")
+    ray_starts = torch.zeros(1, len(points), 3)
+    ray_starts[0, :, :2] = torch.from_numpy(points)
+    ray_starts[0, :, 2] = 100.0
+    ray_directions = torch.zeros(1, len(points), 3)
+    ray_directions[0, :, 2] = -1.0
+    ray_hits = raycast_mesh(ray_starts, ray_directions, wp_mesh)[0]
+    return ray_hits[0, :, 2].numpy()
+
+
+class TestHeightFieldUtils(unittest.TestCase):
+    """Test the conversion of height fields to meshes."""
+
+    def test_convert_height_field_to_mesh(self):
+        """Test the vertices and triangles of a height field mesh."""
+        height_field = np.arange(12, dtype=np.int16).reshape(3, 4)
+        vertices, triangles = convert_height_field_to_mesh(height_field, horizontal_scale=0.1, vertical_scale=0.01)
+        # check the vertices
+        self.assertTupleEqual(vertices.shape, (12, 3))
+        np.testing.assert_allclose(vertices[5], [0.1, 0.1, 0.05], atol=1e-6)
+        # check the triangles: two triangles per cell in row-major order
+        self.assertTupleEqual(triangles.shape, (12, 3))
+        self.assertEqual(triangles.dtype, np.uint32)
+        np.testing.assert_array_equal(triangles[:2], [[0, 5, 1], [0, 4, 5]])
+        np.testing.assert_array_equal(triangles[-2:], [[6, 11, 7], [6, 10, 11]])
+
+    def test_decimate_flat_height_field(self):
+        """Test that a flat height field is decimated into a single rectangle."""
+        height_field = np.full((21, 31), 10, dtype=np.int16)
+        vertices, triangles = convert_height_field_to_mesh(
+            height_field, horizontal_scale=0.1, vertical_scale=0.01, slope_threshold=0.75, decimate=True
+        )
+        self.assertTupleEqual(vertices.shape, (4, 3))
+        self.assertTupleEqual(triangles.shape, (2, 3))
+        np.testing.assert_allclose(trimesh.Trimesh(vertices, triangles).area, 2.0 * 3.0, rtol=1e-6)
+
+    def test_decimate_surface(self):
+        """Test that the decimated mesh has the same surface as the full mesh."""
+        rng = np.random.default_rng(0)
+        # create a height field with flat regions, slopes and noise
+        height_field = np.zeros((41, 51), dtype=np.int16)
+        height_field[5:20, 10:30] = 40
+        height_field[25:35] = np.arange(51, dtype=np.int16) * 2
+        height_field[35:] = rng.integers(-5, 5, size=(6, 51))
+        points = rng.uniform(0.01, [3.99, 4.99], size=(1000, 2))
+
+        for slope_threshold in [None, 0.75]:
+            with self.subTest(slope_threshold=slope_threshold):
+                vertices, triangles = convert_height_field_to_mesh(height_field, 0.1, 0.005, slope_threshold)
+                vertices_dec, triangles_dec = convert_height_field_to_mesh(
+                    height_field, 0.1, 0.005, slope_threshold, decimate=True
+                )
+                # check that the mesh is smaller
+                self.assertLess(len(vertices_dec), len(vertices))
+                self.assertLess(len(triangles_dec), len(triangles))
+                # check that all the vertices are used
+                self.assertEqual(len(np.unique(triangles_dec)), len(vertices_dec))
+                # check that the surface is the same
+                mesh, mesh_dec = trimesh.Trimesh(vertices, triangles), trimesh.Trimesh(vertices_dec, triangles_dec)
+                np.testing.assert_allclose(mesh.area, mesh_dec.area, rtol=1e-5)
+                np.testing.assert_allclose(
+                    sample_heights(vertices, triangles, points),
+                    sample_heights(vertices_dec, triangles_dec, points),
+                    atol=1e-4,
+                )
+
+    def test_decimate_sub_terrain(self):
+        """Test the decimation of a height field sub-terrain."""
+        cfg = terrain_gen.HfPyramidStairsTerrainCfg(
+            size=(8.0, 8.0), step_height_range=(0.05, 0.23), step_width=0.3, platform_width=3.0, border_width=0.25
+        )
+        meshes, origin = cfg.function(0.5, cfg)
+        cfg.decimate = True
+        meshes_dec, origin_dec = cfg.function(0.5, cfg)
+        # check that the terrain is the same but with fewer triangles
+        np.testing.assert_allclose(origin, origin_dec)
+        np.testing.assert_allclose(meshes[0].bounds, meshes_dec[0].bounds, atol=1e-6)
+        self.assertLess(len(meshes_dec[0].faces), len(meshes[0].faces) // 4)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -12,25 +12,83 @@ simulation_app = AppLauncher(headless=True).app
 
 """Rest everything follows."""
 
+import hashlib
 import numpy as np
 import os
 import shutil
+import tempfile
 import torch
+import trimesh
 import unittest
 
 import isaacsim.core.utils.torch as torch_utils
 
+import isaaclab.terrains as terrain_gen
 from isaaclab.terrains import FlatPatchSamplingCfg, TerrainGenerator, TerrainGeneratorCfg
 from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG
+from isaaclab.terrains.utils import find_flat_patches_batched
+from isaaclab.utils.warp import convert_to_warp_mesh
+
+# sub-terrains that sample random numbers
+SUB_TERRAIN_CFGS = {
+    "random_uniform": terrain_gen.HfRandomUniformTerrainCfg(noise_range=(0.02, 0.10), noise_step=0.02),
+    "discrete_obstacles": terrain_gen.HfDiscreteObstaclesTerrainCfg(
+        num_obstacles=50, obstacle_width_range=(0.25, 0.75), obstacle_height_range=(0.05, 0.2), platform_width=1.5
+    ),
+    "stepping_stones": terrain_gen.HfSteppingStonesTerrainCfg(
+        stone_width_range=(0.25, 1.575), stone_height_max=0.2, stone_distance_range=(0.05, 0.1), platform_width=1.5
+    ),
+    "random_grid": terrain_gen.MeshRandomGridTerrainCfg(
+        grid_width=0.45, grid_height_range=(0.05, 0.2), platform_width=2.0
+    ),
+    "repeated_cylinders": terrain_gen.MeshRepeatedCylindersTerrainCfg(
+        platform_width=1.5,
+        max_height_noise=0.5,
+        object_params_start=terrain_gen.MeshRepeatedCylindersTerrainCfg.ObjectCfg(
+            num_objects=40, height=0.05, radius=0.6, max_yx_angle=0.0
+        ),
+        object_params_end=terrain_gen.MeshRepeatedCylindersTerrainCfg.ObjectCfg(
+            num_objects=80, height=0.15, radius=0.6, max_yx_angle=60.0
+        ),
+    ),
+    "repeated_boxes": terrain_gen.MeshRepeatedBoxesTerrainCfg(
+        platform_width=1.5,
+        max_height_noise=0.5,
+        object_params_start=terrain_gen.MeshRepeatedBoxesTerrainCfg.ObjectCfg(
+            num_objects=40, height=0.05, size=(0.6, 0.6), max_yx_angle=0.0
+        ),
+        object_params_end=terrain_gen.MeshRepeatedBoxesTerrainCfg.ObjectCfg(
+            num_objects=80, height=0.15, size=(0.6, 0.6), max_yx_angle=60.0
+        ),
+    ),
+    "repeated_pyramids": terrain_gen.MeshRepeatedPyramidsTerrainCfg(
+        platform_width=1.5,
+        max_height_noise=0.5,
+        object_params_start=terrain_gen.MeshRepeatedPyramidsTerrainCfg.ObjectCfg(
+            num_objects=40, height=0.05, radius=0.6, max_yx_angle=0.0
+        ),
+        object_params_end=terrain_gen.MeshRepeatedPyramidsTerrainCfg.ObjectCfg(
+            num_objects=80, height=0.15, radius=0.6, max_yx_angle=60.0
+        ),
+    ),
+}
+
+
+def hash_mesh(mesh: trimesh.Trimesh) -> str:
+    """Compute the hash of the vertices and faces of a mesh."""
+    return hashlib.md5(mesh.vertices.tobytes() + mesh.faces.tobytes()).hexdigest()
 
 
 class TestTerrainGenerator(unittest.TestCase):
     """Test the procedural terrain generator."""
 
     def setUp(self):
-        # Create directory to dump results
-        test_dir = os.path.dirname(os.path.abspath(__file__))
-        self.output_dir = os.path.join(test_dir, "output", "generator")
+        # Create temporary directory to dump results
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        # delete the temporary directory after the test
+        shutil.rmtree(self.output_dir, ignore_errors=True)
 
     def test_generation(self):
         """Generates assorted terrains and tests that the resulting mesh has the expected size."""
@@ -90,6 +148,74 @@ class TestTerrainGenerator(unittest.TestCase):
                         terrain_mesh_1.faces, terrain_mesh_2.faces, atol=1e-5, err_msg="Faces are not equal"
                     )
 
+    def test_generation_hash_reproducibility(self):
+        """Generates the terrain over several runs and worker layouts and tests that the mesh hashes are identical."""
+        for curriculum in [True, False]:
+            with self.subTest(curriculum=curriculum):
+                mesh_hashes = dict()
+                for run, num_workers in enumerate([1, 2, 3, 1, 3]):
+                    # disturb the global seed to ensure that the sub-terrain seeds make deterministic results
+                    torch_utils.set_seed(run)
+                    # create terrain generator
+                    cfg = ROUGH_TERRAINS_CFG.copy()
+                    cfg.use_cache = False
+                    cfg.seed = 10
+                    cfg.num_rows = 4
+                    cfg.num_cols = 5
+                    cfg.curriculum = curriculum
+                    cfg.num_workers = num_workers
+                    terrain_generator = TerrainGenerator(cfg=cfg)
+                    mesh_hashes[(run, num_workers)] = hash_mesh(terrain_generator.terrain_mesh)
+
+                # check that all the meshes are bit-identical
+                self.assertEqual(len(set(mesh_hashes.values())), 1, msg=f"Mesh hashes differ: {mesh_hashes}")
+
+                # check that a different seed generates a different terrain
+                cfg.seed = 11
+                terrain_generator = TerrainGenerator(cfg=cfg)
+                self.assertNotIn(hash_mesh(terrain_generator.terrain_mesh), mesh_hashes.values())
+
+    def test_sub_terrain_reproducibility(self):
+        """Generates each sub-terrain twice from the same random number generator seed and compares the mesh hashes.
+
+        The sub-terrain functions must draw all their random numbers from the given generator, and none from the
+        global random number generators.
+        """
+        for name, sub_terrain_cfg in SUB_TERRAIN_CFGS.items():
+            with self.subTest(sub_terrain=name):
+                mesh_hashes = list()
+                for seed in [0, 0, 1]:
+                    # keep the global state to check that it is not used
+                    np_rng_state = np.random.get_state()
+                    torch_rng_state = torch.get_rng_state()
+                    # generate the sub-terrain
+                    cfg = sub_terrain_cfg.copy()
+                    meshes, _ = cfg.function(0.5, cfg, rng=np.random.default_rng(seed))
+                    mesh_hashes.append(hash_mesh(trimesh.util.concatenate(meshes)))
+                    # check that the global random number generators were not used
+                    self.assertEqual(np.random.get_state()[1].tolist(), np_rng_state[1].tolist())
+                    self.assertTrue(torch.equal(torch.get_rng_state(), torch_rng_state))
+                # check that the same seed generates the same mesh and a different seed a different one
+                self.assertEqual(mesh_hashes[0], mesh_hashes[1])
+                self.assertNotEqual(mesh_hashes[0], mesh_hashes[2])
+
+    def test_sub_terrain_global_seed_reproducibility(self):
+        """Generates each sub-terrain twice without a random number generator after seeding the global one.
+
+        Without a given generator, the sub-terrain functions must derive their generator from the global state.
+        """
+        for name, sub_terrain_cfg in SUB_TERRAIN_CFGS.items():
+            with self.subTest(sub_terrain=name):
+                mesh_hashes = list()
+                for seed in [0, 0, 1]:
+                    np.random.seed(seed)
+                    cfg = sub_terrain_cfg.copy()
+                    meshes, _ = cfg.function(0.5, cfg)
+                    mesh_hashes.append(hash_mesh(trimesh.util.concatenate(meshes)))
+                # check that the same seed generates the same mesh and a different seed a different one
+                self.assertEqual(mesh_hashes[0], mesh_hashes[1])
+                self.assertNotEqual(mesh_hashes[0], mesh_hashes[2])
+
     def test_generation_cache(self):
         """Generate the terrain and check that caching works.
 
@@ -143,6 +269,85 @@ class TestTerrainGenerator(unittest.TestCase):
                     terrain_mesh_1.faces, terrain_mesh_2.faces, atol=1e-5, err_msg="Faces are not equal"
                 )
 
+    def test_generation_cache_sub_terrain_seeds(self):
+        """Generate identical sub-terrains at different grid positions and check that they are cached separately."""
+        # create a terrain with two sub-terrains of the same type and difficulty
+        cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.sub_terrains = {"random_uniform": SUB_TERRAIN_CFGS["random_uniform"].copy()}
+        cfg.num_rows = 1
+        cfg.num_cols = 2
+        cfg.curriculum = True
+        cfg.difficulty_range = (0.5, 0.5)
+        cfg.use_cache = True
+        cfg.seed = 0
+        cfg.cache_dir = self.output_dir
+        terrain_generator = TerrainGenerator(cfg=cfg)
+
+        # check that each sub-terrain has its own cache entry next to the one of the complete terrain
+        sub_terrain_hashes = set(os.listdir(cfg.cache_dir)) - {terrain_generator._get_terrain_hash()}
+        self.assertEqual(len(sub_terrain_hashes), 2)
+        # check that the sub-terrains are generated from different seeds
+        mesh_hashes = set()
+        for sub_terrain_hash in sub_terrain_hashes:
+            with np.load(os.path.join(cfg.cache_dir, sub_terrain_hash, "mesh.npz")) as data:
+                mesh_hashes.add(hashlib.md5(data["vertices"].tobytes()).hexdigest())
+        self.assertEqual(len(mesh_hashes), 2)
+
+    def test_generation_cache_formats(self):
+        """Generate the terrain and check that it is loaded from the terrain and sub-terrain caches."""
+        for cache_format in ["npz", "obj"]:
+            with self.subTest(cache_format=cache_format):
+                # clear output directory
+                if os.path.exists(self.output_dir):
+                    shutil.rmtree(self.output_dir)
+                # create terrain generator with cache enabled
+                cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+                cfg.use_cache = True
+                cfg.cache_format = cache_format
+                cfg.seed = 0
+                cfg.num_rows = 3
+                cfg.num_cols = 4
+                cfg.color_scheme = "random"
+                cfg.cache_dir = self.output_dir
+                cfg.sub_terrains["pyramid_stairs"].flat_patch_sampling = {
+                    "root_spawn": FlatPatchSamplingCfg(num_patches=8, patch_radius=0.5, max_height_diff=0.05),
+                }
+                terrain_generator_1 = TerrainGenerator(cfg=cfg)
+                terrain_cache_dir = os.path.join(cfg.cache_dir, terrain_generator_1._get_terrain_hash())
+                self.assertTrue(os.path.exists(os.path.join(terrain_cache_dir, "terrain.npz")))
+
+                # set a random seed to disturb the process
+                torch_utils.set_seed(12456)
+
+                # load the complete terrain from the cache
+                terrain_generator_2 = TerrainGenerator(cfg=cfg)
+                self.assertEqual(
+                    hash_mesh(terrain_generator_1.terrain_mesh), hash_mesh(terrain_generator_2.terrain_mesh)
+                )
+                np.testing.assert_array_equal(
+                    terrain_generator_1.terrain_mesh.visual.vertex_colors,
+                    terrain_generator_2.terrain_mesh.visual.vertex_colors,
+                )
+                np.testing.assert_array_equal(terrain_generator_1.terrain_origins, terrain_generator_2.terrain_origins)
+                self.assertSetEqual(set(terrain_generator_2.flat_patches), {"root_spawn"})
+                for name, flat_patches in terrain_generator_1.flat_patches.items():
+                    torch.testing.assert_close(flat_patches, terrain_generator_2.flat_patches[name], rtol=0.0, atol=0.0)
+
+                # remove the complete terrain to load the sub-terrains from the cache
+                shutil.rmtree(terrain_cache_dir)
+                hash_ids_1 = set(os.listdir(cfg.cache_dir))
+                terrain_generator_3 = TerrainGenerator(cfg=cfg)
+                # check that only the complete terrain is added to the cache
+                hash_ids_2 = set(os.listdir(cfg.cache_dir))
+                self.assertSetEqual(hash_ids_2 - hash_ids_1, {os.path.basename(terrain_cache_dir)})
+                # check that the meshes are equal
+                np.testing.assert_allclose(
+                    terrain_generator_1.terrain_mesh.vertices, terrain_generator_3.terrain_mesh.vertices, atol=1e-5
+                )
+                np.testing.assert_array_equal(
+                    terrain_generator_1.terrain_mesh.faces, terrain_generator_3.terrain_mesh.faces
+                )
+
     def test_terrain_flat_patches(self):
         """Test the flat patches generation."""
         # create terrain generator
@@ -165,6 +370,120 @@ class TestTerrainGenerator(unittest.TestCase):
         for _, flat_patches in terrain_generator.flat_patches.items():
             self.assertFalse(torch.allclose(flat_patches, torch.zeros_like(flat_patches)))
 
+    def test_terrain_flat_patches_reproducibility(self):
+        """Test that the flat patches are reproducible and lie on their sub-terrain."""
+        # create terrain generator
+        cfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.seed = 0
+        cfg.num_rows = 3
+        cfg.num_cols = 6
+        # add flat patch configuration
+        for _, sub_terrain_cfg in cfg.sub_terrains.items():
+            sub_terrain_cfg.flat_patch_sampling = {
+                "root_spawn": FlatPatchSamplingCfg(num_patches=8, patch_radius=[0.25, 0.5], max_height_diff=0.05),
+            }
+        # generate terrain twice
+        flat_patches_1 = TerrainGenerator(cfg=cfg).flat_patches["root_spawn"]
+        torch_utils.set_seed(12456)
+        terrain_generator = TerrainGenerator(cfg=cfg)
+        flat_patches_2 = terrain_generator.flat_patches["root_spawn"]
+        # check that the flat patches are the same
+        torch.testing.assert_close(flat_patches_1, flat_patches_2, rtol=0.0, atol=0.0)
+        # check that the flat patches lie within their sub-terrain
+        # note: the meshes of the height field sub-terrains can exceed their size by the horizontal scale
+        rows, cols = torch.meshgrid(torch.arange(cfg.num_rows), torch.arange(cfg.num_cols), indexing="ij")
+        lower = torch.stack(
+            [rows * cfg.size[0] - cfg.num_rows * cfg.size[0] / 2, cols * cfg.size[1] - cfg.num_cols * cfg.size[1] / 2],
+            dim=-1,
+        )
+        relative_positions = flat_patches_2[..., :2] - lower.unsqueeze(2)
+        self.assertGreaterEqual(relative_positions.min().item(), 0.5 - cfg.horizontal_scale)
+        self.assertLessEqual(relative_positions[..., 0].max().item(), cfg.size[0] - 0.5 + cfg.horizontal_scale)
+        self.assertLessEqual(relative_positions[..., 1].max().item(), cfg.size[1] - 0.5 + cfg.horizontal_scale)
+
+    def test_find_flat_patches_batched(self):
+        """Test the search of flat patches for multiple sub-terrains of a single mesh."""
+        # create two adjacent sub-terrains with a box in the middle of the second one
+        ground = trimesh.creation.box((8.0, 4.0, 1.0), trimesh.transformations.translation_matrix((4.0, 2.0, -0.5)))
+        obstacle = trimesh.creation.box((1.0, 1.0, 1.0), trimesh.transformations.translation_matrix((6.0, 2.0, 0.5)))
+        mesh = trimesh.util.concatenate([ground, obstacle])
+        wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device="cpu")
+        # define the searches
+        origins = torch.tensor([[2.0, 2.0, 0.0], [6.0, 2.0, 0.0], [6.0, 2.0, 0.0]])
+        bounds = torch.tensor([[[0.0, 0.0], [4.0, 4.0]], [[4.0, 0.0], [8.0, 4.0]], [[4.0, 0.0], [8.0, 4.0]]])
+        patch_cfgs = [
+            FlatPatchSamplingCfg(num_patches=50, patch_radius=0.5, max_height_diff=0.05),
+            FlatPatchSamplingCfg(num_patches=20, patch_radius=[0.2, 0.4], z_range=(-0.1, 0.1), max_height_diff=0.05),
+            FlatPatchSamplingCfg(num_patches=5, patch_radius=0.2, z_range=(0.9, 1.1), max_height_diff=0.05),
+        ]
+        flat_patches = find_flat_patches_batched(
+            wp_mesh, origins, patch_cfgs, bounds=bounds, generator=torch.Generator().manual_seed(0)
+        )
+
+        # check the number of patches
+        self.assertListEqual([len(patches) for patches in flat_patches], [50, 20, 5])
+        # check that the patches of the first sub-terrain do not extend into the second one
+        self.assertLessEqual(flat_patches[0][:, 0].max().item(), 1.5 + 1e-5)
+        torch.testing.assert_close(flat_patches[0][:, 2], torch.zeros(50), rtol=0.0, atol=1e-4)
+        # check that the patches of the second sub-terrain are on the ground next to the obstacle
+        self.assertGreaterEqual(flat_patches[1][:, :2].abs().max(dim=1)[0].min().item(), 0.5)
+        torch.testing.assert_close(flat_patches[1][:, 2], torch.zeros(20), rtol=0.0, atol=1e-4)
+        # check that the patches of the third search are on top of the obstacle
+        self.assertLessEqual(flat_patches[2][:, :2].abs().max().item(), 0.31)
+        torch.testing.assert_close(flat_patches[2][:, 2], torch.ones(5), rtol=0.0, atol=1e-4)
+
+        # check that the search is reproducible
+        flat_patches_2 = find_flat_patches_batched(
+            wp_mesh, origins, patch_cfgs, bounds=bounds, generator=torch.Generator().manual_seed(0)
+        )
+        for patches, patches_2 in zip(flat_patches, flat_patches_2):
+            torch.testing.assert_close(patches, patches_2, rtol=0.0, atol=0.0)
+
+        # check that an impossible search fails
+        patch_cfgs[2].z_range = (2.0, 3.0)
+        with self.assertRaises(RuntimeError):
+            find_flat_patches_batched(wp_mesh, origins, patch_cfgs, bounds=bounds, max_iterations=100)
+
+    def test_find_flat_patches_batched_face_ranges(self):
+        """Test that the searches only accept the faces of their sub-terrain and use their own generators."""
+        # create two adjacent sub-terrains where the second one has a slab overhanging the first one
+        ground_1 = trimesh.creation.box((4.0, 4.0, 1.0), trimesh.transformations.translation_matrix((2.0, 2.0, -0.5)))
+        ground_2 = trimesh.creation.box((4.0, 4.0, 1.0), trimesh.transformations.translation_matrix((6.0, 2.0, -0.5)))
+        slab = trimesh.creation.box((1.5, 4.0, 0.1), trimesh.transformations.translation_matrix((3.75, 2.0, 0.45)))
+        mesh = trimesh.util.concatenate([ground_1, ground_2, slab])
+        wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device="cpu")
+        # define the searches
+        origins = torch.tensor([[2.0, 2.0, 0.0], [6.0, 2.0, 0.0]])
+        bounds = torch.tensor([[[0.0, 0.0], [4.0, 4.0]], [[4.0, 0.0], [8.0, 4.0]]])
+        face_ranges = torch.tensor([[0, 12], [12, 36]])
+        patch_cfgs = [
+            FlatPatchSamplingCfg(num_patches=50, patch_radius=0.2, max_height_diff=0.05),
+            FlatPatchSamplingCfg(num_patches=10, patch_radius=0.2, max_height_diff=0.05),
+        ]
+        flat_patches = find_flat_patches_batched(
+            wp_mesh,
+            origins,
+            patch_cfgs,
+            bounds=bounds,
+            face_ranges=face_ranges,
+            generator=[torch.Generator().manual_seed(0), torch.Generator().manual_seed(1)],
+        )
+
+        # check that the patches of the first sub-terrain are on its ground and not below the slab
+        self.assertLessEqual(flat_patches[0][:, 0].max().item(), 0.8 + 1e-5)
+        torch.testing.assert_close(flat_patches[0][:, 2], torch.zeros(50), rtol=0.0, atol=1e-4)
+
+        # check that the patches of a search do not depend on the other searches
+        flat_patches_2 = find_flat_patches_batched(
+            wp_mesh,
+            origins[:1],
+            patch_cfgs[:1],
+            bounds=bounds[:1],
+            face_ranges=face_ranges[:1],
+            generator=[torch.Generator().manual_seed(0)],
+        )
+        torch.testing.assert_close(flat_patches[0], flat_patches_2[0], rtol=0.0, atol=0.0)
+
 
 if __name__ == "__main__":
     run_tests()
@@ -49,6 +49,11 @@ class TestCircularBuffer(unittest.TestCase):
         # check if the buffer has zeros entries
         self.assertEqual(self.buffer.current_length.tolist(), [0, 0, 0])
 
+        # reset the buffer with a slice of the batch indices
+        self.buffer.append(data)
+        self.buffer.reset(slice(None))
+        self.assertEqual(self.buffer.current_length.tolist(), [0, 0, 0])
+
     def test_reset_subset(self):
         """Test resetting a subset of batches in the circular buffer."""
         data1 = torch.ones((self.batch_size, 2), device=self.device)
@@ -71,6 +76,21 @@ class TestCircularBuffer(unittest.TestCase):
         for i in range(self.max_len):
             torch.testing.assert_close(self.buffer.buffer[reset_batch_id, 0], self.buffer.buffer[reset_batch_id, i])
 
+    def test_reset_subset_multiple(self):
+        """Test resetting subsets of batches several times between two appends."""
+        data1 = torch.ones((self.batch_size, 2), device=self.device)
+        data2 = 2.0 * data1.clone()
+        self.buffer.append(data1)
+        # reset the batches with a list and a tensor of indices
+        self.buffer.reset(batch_ids=[0])
+        self.buffer.reset(batch_ids=torch.tensor([2], device=self.device))
+        self.buffer.append(data2)
+        self.assertEqual(self.buffer.current_length.tolist(), [1, 2, 1])
+        # check that only the reset batches are filled with the first append after the reset
+        buffer = self.buffer.buffer
+        torch.testing.assert_close(buffer[[0, 2]], torch.full_like(buffer[[0, 2]], 2.0))
+        torch.testing.assert_close(buffer[1, -2:], torch.tensor([[1.0, 1.0], [2.0, 2.0]], device=self.device))
+
     def test_append_and_retrieve(self):
         """Test appending and retrieving data from the circular buffer."""
         # append some data
@@ -170,6 +190,29 @@ class TestCircularBuffer(unittest.TestCase):
         for idx in range(self.buffer.max_length - 1):
             self.assertTrue(torch.all(torch.le(retrieved_buffer[:, idx], retrieved_buffer[:, idx + 1])))
 
+    def test_return_buffer_view_prop(self):
+        """Test that the buffer view matches the returned buffer and shares the memory of the circular buffer."""
+        for i in range(self.buffer.max_length + 2):
+            data = torch.tensor([[i]], device=self.device).repeat(3, 2)
+            self.buffer.append(data)
+            # reset a batch in the middle of the history
+            if i == 3:
+                self.buffer.reset(batch_ids=[1])
+
+            buffer_view = self.buffer.buffer_view
+            torch.testing.assert_close(buffer_view, self.buffer.buffer)
+            self.assertNotEqual(buffer_view.data_ptr(), self.buffer.buffer.data_ptr())
+            # check that the history can be flattened without a copy
+            self.assertEqual(buffer_view.reshape(self.batch_size, -1).data_ptr(), buffer_view.data_ptr())
+
+        # check that the reset batch is filled with the first data appended after the reset
+        torch.testing.assert_close(
+            buffer_view[1], torch.tensor([[4, 4], [4, 4], [4, 4], [5, 5], [6, 6]], device=self.device)
+        )
+        # check that the view shares the memory of the circular buffer: the oldest entry is overwritten
+        self.buffer.append(torch.full((3, 2), -1, device=self.device))
+        torch.testing.assert_close(buffer_view[:, 0], torch.full((3, 2), -1, device=self.device))
+
 
 if __name__ == "__main__":
     run_tests()
@@ -101,6 +101,27 @@ class TestEpisodeData(unittest.TestCase):
                     )
                 )
 
+    def test_add_beyond_capacity(self):
+        """Test appending more steps than the preallocated capacity and trimming the storage."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                episode = EpisodeData(initial_capacity=2)
+                expected_data = torch.arange(10, device=device).reshape(5, 2)
+
+                for step_data in expected_data:
+                    episode.add("obs/term", step_data)
+                self.assertTrue(torch.equal(episode.data.get("obs").get("term"), expected_data))
+
+                # trimming the storage keeps the recorded data
+                episode.finalize()
+                self.assertTrue(torch.equal(episode.data.get("obs").get("term"), expected_data))
+
+                # test adding data to a key after trimming the storage
+                episode.add("obs/term", expected_data[0])
+                self.assertTrue(
+                    torch.equal(episode.data.get("obs").get("term"), torch.cat((expected_data, expected_data[:1])))
+                )
+
     def test_get_initial_state(self):
         """Test getting the initial state of the episode."""
         for device in ("cuda:0", "cpu"):
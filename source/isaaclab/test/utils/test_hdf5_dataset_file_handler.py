@@ -12,6 +12,7 @@ simulation_app = AppLauncher(headless=True).app
 
 """Rest everything follows from here."""
 
+import h5py
 import os
 import shutil
 import tempfile
@@ -19,7 +20,13 @@ import torch
 import unittest
 import uuid
 
-from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+from isaaclab.utils.datasets import (
+    AsyncHDF5DatasetFileHandler,
+    EpisodeData,
+    HDF5DatasetFileHandler,
+    HDF5DatasetKeyLayoutCfg,
+    HDF5DatasetLayoutCfg,
+)
 
 
 def create_test_episode(device):
@@ -124,6 +131,289 @@ class TestHDF5DatasetFileHandler(unittest.TestCase):
 
                 dataset_file_handler.close()
 
+    def test_episode_index(self):
+        """Test building, updating and filtering the episode index."""
+        dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+        dataset_file_handler = HDF5DatasetFileHandler()
+        dataset_file_handler.create(dataset_file_path, "test_env_name")
+
+        # write episodes with different lengths and success flags
+        for episode_index in range(12):
+            test_episode = EpisodeData()
+            test_episode.seed = episode_index
+            test_episode.success = episode_index % 2 == 0
+            for _ in range(episode_index + 1):
+                test_episode.add("actions", torch.zeros(3))
+            dataset_file_handler.write_episode(test_episode)
+
+        # check the index updated while writing
+        episode_index = dataset_file_handler.get_episode_index()
+        self.assertEqual(len(episode_index), 12)
+        self.assertEqual(episode_index.names[10], "demo_10")
+        self.assertEqual(episode_index.offsets.tolist(), [i * (i + 1) // 2 for i in range(12)])
+        self.assertEqual(episode_index.seeds.tolist(), list(range(12)))
+        dataset_file_handler.close()
+
+        # check the index stored in the file
+        dataset_file_handler = HDF5DatasetFileHandler()
+        dataset_file_handler.open(dataset_file_path)
+        episode_index = dataset_file_handler.get_episode_index()
+        self.assertEqual(episode_index.num_samples.tolist(), list(range(1, 13)))
+        self.assertEqual(episode_index.total_num_samples, 78)
+        # check the name and length lookups served by the index
+        self.assertEqual(dataset_file_handler.get_episode_names(), [f"demo_{i}" for i in range(12)])
+        self.assertEqual(dataset_file_handler.get_episode_length("demo_10"), 11)
+        self.assertIsNone(dataset_file_handler.get_episode_length("demo_12"))
+
+        # filter successful episodes with more than five samples
+        filtered_episode_index = episode_index.filter(success=True, min_num_samples=6)
+        self.assertEqual(filtered_episode_index.names.tolist(), ["demo_6", "demo_8", "demo_10"])
+        # sample episodes from the filtered index
+        sampled_names = filtered_episode_index.sample(2)
+        self.assertEqual(len(set(sampled_names)), 2)
+        self.assertTrue(set(sampled_names).issubset(filtered_episode_index.names.tolist()))
+        dataset_file_handler.close()
+
+        # append an episode to a file whose index is out of date
+        with h5py.File(dataset_file_path, "r+") as file:
+            del file[HDF5DatasetFileHandler.EPISODE_INDEX_GROUP_NAME]
+        dataset_file_handler = HDF5DatasetFileHandler()
+        dataset_file_handler.open(dataset_file_path, "a")
+        self.assertEqual(dataset_file_handler.get_episode_length("demo_0"), 1)
+        dataset_file_handler.write_episode(create_test_episode("cpu"))
+        self.assertEqual(dataset_file_handler.get_episode_length("demo_12"), 3)
+        episode_index = dataset_file_handler.get_episode_index()
+        self.assertEqual(len(episode_index), 13)
+        self.assertEqual(episode_index.names[-1], "demo_12")
+        self.assertEqual(episode_index.offsets[-1], 78)
+        dataset_file_handler.close()
+
+    def test_episode_index_reused_handler(self):
+        """Test that the episode index is rebuilt when a file handler is reused for another file."""
+        dataset_file_paths = [os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5") for _ in range(2)]
+        dataset_file_handler = HDF5DatasetFileHandler()
+        # create a file with three episodes and another file with a single episode
+        for dataset_file_path, num_episodes in zip(dataset_file_paths, (3, 1)):
+            dataset_file_handler.create(dataset_file_path, "test_env_name")
+            for _ in range(num_episodes):
+                dataset_file_handler.write_episode(create_test_episode("cpu"))
+            self.assertEqual(len(dataset_file_handler.get_episode_index()), num_episodes)
+            dataset_file_handler.close()
+
+        # open the files in turn with the same handler
+        for dataset_file_path, num_episodes in zip(dataset_file_paths, (3, 1)):
+            dataset_file_handler.open(dataset_file_path)
+            self.assertEqual(dataset_file_handler.get_num_episodes(), num_episodes)
+            self.assertEqual(len(dataset_file_handler.get_episode_index()), num_episodes)
+            dataset_file_handler.close()
+
+    def test_load_episode_lazy(self):
+        """Test loading episodes lazily and with an allow-list of keys."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+                # compress the observations to test reading through h5py instead of a memory map
+                layout_cfg = HDF5DatasetLayoutCfg(keys={"obs/.*": HDF5DatasetKeyLayoutCfg(compression="gzip")})
+                dataset_file_handler = HDF5DatasetFileHandler(layout_cfg)
+                dataset_file_handler.create(dataset_file_path, "test_env_name")
+                test_episode = create_test_episode(device)
+                test_episode.add("states/robot/joint_pos", torch.tensor([1.0, 2.0], device=device))
+                test_episode.add("states/robot/joint_pos", torch.tensor([3.0, 4.0], device=device))
+                dataset_file_handler.write_episode(test_episode)
+                dataset_file_handler.close()
+
+                dataset_file_handler = HDF5DatasetFileHandler()
+                dataset_file_handler.open(dataset_file_path)
+
+                # load the episode eagerly with an allow-list of keys
+                loaded_episode = dataset_file_handler.load_episode("demo_0", device=device, keys=["actions"])
+                self.assertEqual(list(loaded_episode.data.keys()), ["actions"])
+
+                # load the episode lazily
+                loaded_episode = dataset_file_handler.load_episode("demo_0", device=device, lazy=True)
+                self.assertEqual(loaded_episode.seed, test_episode.seed)
+                self.assertEqual(loaded_episode.success, test_episode.success)
+                self.assertTrue(torch.equal(loaded_episode.get_initial_state(), test_episode.get_initial_state()))
+                for action in test_episode.data["actions"]:
+                    self.assertTrue(torch.equal(loaded_episode.get_next_action(), action))
+                self.assertIsNone(loaded_episode.get_next_action())
+                self.assertTrue(
+                    torch.equal(
+                        loaded_episode.get_state(1)["robot"]["joint_pos"], torch.tensor([3.0, 4.0], device=device)
+                    )
+                )
+                self.assertIsNone(loaded_episode.get_state(2))
+                # read a time slice
+                self.assertTrue(
+                    torch.equal(
+                        loaded_episode.read("obs/policy/term1", slice(1, 3)),
+                        test_episode.data["obs"]["policy"]["term1"][1:3],
+                    )
+                )
+                self.assertTrue(
+                    torch.equal(
+                        loaded_episode.data["obs"]["policy"]["term1"], test_episode.data["obs"]["policy"]["term1"]
+                    )
+                )
+
+                # load the episode lazily with an allow-list of keys
+                loaded_episode = dataset_file_handler.load_episode(
+                    "demo_0", device=device, keys=["actions", "obs/policy"], lazy=True
+                )
+                self.assertEqual(sorted(loaded_episode.data.keys()), ["actions", "obs"])
+                self.assertIsNone(loaded_episode.get_initial_state())
+                self.assertIsNone(loaded_episode.get_state(0))
+                self.assertIsNotNone(loaded_episode.read("obs/policy/term1"))
+
+                dataset_file_handler.close()
+
+    def test_write_episode_with_layout(self):
+        """Test writing episodes with chunked, compressed and downcasted datasets."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+                layout_cfg = HDF5DatasetLayoutCfg(
+                    default=HDF5DatasetKeyLayoutCfg(compression="lzf"),
+                    keys={
+                        "obs/.*": HDF5DatasetKeyLayoutCfg(
+                            chunk_shape=(2, 8), compression="gzip", compression_level=4, shuffle=True, float16=True
+                        )
+                    },
+                )
+                dataset_file_handler = HDF5DatasetFileHandler(layout_cfg)
+                dataset_file_handler.create(dataset_file_path, "test_env_name")
+
+                test_episode = create_test_episode(device)
+                test_episode.add("obs/policy/term2", torch.tensor([0.5, 0.25], device=device))
+
+                dataset_file_handler.write_episode(test_episode)
+                dataset_file_handler.flush()
+
+                # check the layout of the written datasets
+                episode_group = dataset_file_handler._hdf5_data_group["demo_0"]
+                self.assertEqual(episode_group["actions"].compression, "lzf")
+                self.assertEqual(episode_group["obs/policy/term1"].compression, "gzip")
+                self.assertEqual(episode_group["obs/policy/term1"].compression_opts, 4)
+                self.assertTrue(episode_group["obs/policy/term1"].shuffle)
+                # chunk shapes are clamped to the data shape
+                self.assertEqual(episode_group["obs/policy/term1"].chunks, (2, 5))
+                # only the floating point datasets are downcasted
+                self.assertEqual(
+                    episode_group["obs/policy/term1"].dtype,
+                    test_episode.data["obs"]["policy"]["term1"].cpu().numpy().dtype,
+                )
+                self.assertEqual(str(episode_group["obs/policy/term2"].dtype), "float16")
+
+                dataset_file_handler.close()
+
+                # load the episode and check that the data types are restored
+                dataset_file_handler = HDF5DatasetFileHandler()
+                dataset_file_handler.open(dataset_file_path)
+                loaded_episode = dataset_file_handler.load_episode("demo_0", device=device)
+                self.assertTrue(torch.equal(loaded_episode.data["actions"], test_episode.data["actions"]))
+                self.assertTrue(
+                    torch.equal(
+                        loaded_episode.data["obs"]["policy"]["term1"], test_episode.data["obs"]["policy"]["term1"]
+                    )
+                )
+                self.assertTrue(
+                    torch.equal(
+                        loaded_episode.data["obs"]["policy"]["term2"], test_episode.data["obs"]["policy"]["term2"]
+                    )
+                )
+                dataset_file_handler.close()
+
+    def test_write_episode_async(self):
+        """Test writing episodes in the background and loading them from the dataset file."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+                dataset_file_handler = AsyncHDF5DatasetFileHandler(max_queue_size=2)
+                dataset_file_handler.create(dataset_file_path, "test_env_name")
+
+                test_episode = create_test_episode(device)
+
+                # write more episodes than the size of the queue
+                num_episodes = 5
+                for _ in range(num_episodes):
+                    dataset_file_handler.write_episode(test_episode)
+                    dataset_file_handler.flush()
+                self.assertEqual(dataset_file_handler.get_num_episodes(), num_episodes)
+
+                # wait for the queue to be drained
+                dataset_file_handler.wait()
+                self.assertEqual(dataset_file_handler.num_pending_episodes, 0)
+
+                # closing the dataset file writes the remaining episodes
+                dataset_file_handler.write_episode(test_episode)
+                dataset_file_handler.close()
+
+                # load the episodes from the dataset
+                dataset_file_handler = HDF5DatasetFileHandler()
+                dataset_file_handler.open(dataset_file_path)
+                self.assertEqual(dataset_file_handler.get_num_episodes(), num_episodes + 1)
+
+                for episode_name in dataset_file_handler.get_episode_names():
+                    loaded_episode = dataset_file_handler.load_episode(episode_name, device=device)
+                    self.assertTrue(torch.equal(loaded_episode.data["actions"], test_episode.data["actions"]))
+
+                dataset_file_handler.close()
+
+    def test_read_episodes_async(self):
+        """Test the episode counters of a handler that opens dataset files for reading."""
+        dataset_file_paths = [os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5") for _ in range(2)]
+        for dataset_file_path, num_episodes in zip(dataset_file_paths, (3, 1)):
+            dataset_file_handler = HDF5DatasetFileHandler()
+            dataset_file_handler.create(dataset_file_path, "test_env_name")
+            for _ in range(num_episodes):
+                dataset_file_handler.write_episode(create_test_episode("cpu"))
+            dataset_file_handler.close()
+
+        # open the files in turn with the same handler
+        dataset_file_handler = AsyncHDF5DatasetFileHandler()
+        for dataset_file_path, num_episodes in zip(dataset_file_paths, (3, 1)):
+            dataset_file_handler.open(dataset_file_path)
+            self.assertEqual(dataset_file_handler.get_num_episodes(), num_episodes)
+            self.assertEqual(dataset_file_handler.demo_count, num_episodes)
+            self.assertEqual(dataset_file_handler.num_pending_episodes, 0)
+            dataset_file_handler.close()
+
+    def test_write_episode_async_error(self):
+        """Test that an error in the writer thread is raised until the file is closed."""
+        dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+        dataset_file_handler = AsyncHDF5DatasetFileHandler()
+        dataset_file_handler.create(dataset_file_path, "test_env_name")
+
+        # fail to write the second episode
+        failing_episode = create_test_episode("cpu")
+        write_episode = dataset_file_handler._write_episode
+
+        def _write_episode(episode: EpisodeData):
+            if episode is failing_episode:
+                raise OSError("Failed to write the episode")
+            write_episode(episode)
+
+        dataset_file_handler._write_episode = _write_episode
+        dataset_file_handler.write_episode(create_test_episode("cpu"))
+        dataset_file_handler.write_episode(failing_episode)
+        dataset_file_handler.write_episode(create_test_episode("cpu"))
+        with self.assertRaisesRegex(RuntimeError, "2 queued episode"):
+            dataset_file_handler.wait()
+        # the error is raised again by the later calls
+        self.assertEqual(dataset_file_handler.get_num_episodes(), 1)
+        with self.assertRaises(RuntimeError):
+            dataset_file_handler.write_episode(create_test_episode("cpu"))
+        with self.assertRaises(RuntimeError):
+            dataset_file_handler.flush()
+        with self.assertRaises(RuntimeError):
+            dataset_file_handler.close()
+
+        # only the episode before the error is written
+        dataset_file_handler = HDF5DatasetFileHandler()
+        dataset_file_handler.open(dataset_file_path)
+        self.assertEqual(dataset_file_handler.get_num_episodes(), 1)
+        dataset_file_handler.close()
+
 
 if __name__ == "__main__":
     run_tests()
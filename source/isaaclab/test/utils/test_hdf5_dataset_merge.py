@@ -0,0 +1,91 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import h5py
+import os
+import shutil
+import tempfile
+import torch
+import unittest
+
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler, merge_hdf5_datasets
+
+
+def create_test_dataset_file(file_path: str, num_episodes: int, num_steps: int, success: bool):
+    """Create a dataset file with dummy episodes whose actions are filled with the episode index."""
+    dataset_file_handler = HDF5DatasetFileHandler()
+    dataset_file_handler.create(file_path, "test_env_name")
+    for episode_index in range(num_episodes):
+        episode = EpisodeData()
+        episode.success = success
+        for _ in range(num_steps):
+            episode.add("actions", torch.full((3,), float(episode_index)))
+            episode.add("obs/policy/term1", torch.ones(5))
+        dataset_file_handler.write_episode(episode)
+    dataset_file_handler.close()
+
+
+class TestHDF5DatasetMerge(unittest.TestCase):
+    """Test merging HDF5 dataset files."""
+
+    def setUp(self):
+        # create a temporary directory with two dataset files to merge
+        self.temp_dir = tempfile.mkdtemp()
+        self.input_files = [os.path.join(self.temp_dir, "input_0.hdf5"), os.path.join(self.temp_dir, "input_1.hdf5")]
+        # use more than ten episodes to test the ordering of the episode names
+        create_test_dataset_file(self.input_files[0], num_episodes=12, num_steps=4, success=True)
+        create_test_dataset_file(self.input_files[1], num_episodes=2, num_steps=3, success=False)
+
+    def tearDown(self):
+        # delete the temporary directory after the test
+        shutil.rmtree(self.temp_dir)
+
+    def test_merge(self):
+        """Test merging dataset files with the different merge modes."""
+        for mode in ("copy", "external_link", "virtual"):
+            with self.subTest(mode=mode):
+                output_file = os.path.join(self.temp_dir, "output", f"merged_{mode}.hdf5")
+                summary = merge_hdf5_datasets(self.input_files, output_file, mode=mode)
+
+                # check the summary
+                self.assertEqual([source.num_episodes for source in summary.sources], [12, 2])
+                self.assertEqual([source.num_samples for source in summary.sources], [48, 6])
+                self.assertEqual([source.num_successful_episodes for source in summary.sources], [12, 0])
+                self.assertEqual([source.env_name for source in summary.sources], ["test_env_name"] * 2)
+                self.assertEqual(summary.num_episodes, 14)
+                self.assertEqual(summary.num_samples, 54)
+                self.assertEqual(summary.num_successful_episodes, 12)
+                self.assertEqual(summary.output_file, output_file)
+                self.assertEqual(summary.mode, mode)
+
+                # check the merged dataset file
+                dataset_file_handler = HDF5DatasetFileHandler()
+                dataset_file_handler.open(output_file)
+                self.assertEqual(dataset_file_handler.get_num_episodes(), 14)
+                self.assertEqual(dataset_file_handler.get_env_name(), "test_env_name")
+                for episode_index in range(14):
+                    episode = dataset_file_handler.load_episode(f"demo_{episode_index}", device="cpu")
+                    # episodes are merged in the order of the files and of the episode indices
+                    expected_index = episode_index if episode_index < 12 else episode_index - 12
+                    self.assertTrue(torch.all(episode.data["actions"] == expected_index))
+                    self.assertEqual(episode.success, episode_index < 12)
+                dataset_file_handler.close()
+
+                with h5py.File(output_file, "r") as output:
+                    self.assertEqual(output["data"].attrs["total"], 54)
+                    self.assertEqual(output["data/demo_13"].attrs["num_samples"], 3)
+
+
+if __name__ == "__main__":
+    run_tests()
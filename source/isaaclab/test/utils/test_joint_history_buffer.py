@@ -0,0 +1,81 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+import unittest
+
+from isaaclab.utils import JointHistoryBuffer
+
+
+class TestJointHistoryBuffer(unittest.TestCase):
+    """Test fixture for checking the joint history buffer implementation."""
+
+    def setUp(self):
+        self.device: str = "cpu"
+        self.num_envs: int = 8
+        self.num_joints: int = 3
+        self.max_len: int = 5
+        # create the buffer
+        self.buffer = JointHistoryBuffer(self.max_len, self.num_envs, self.num_joints, 2, device=self.device)
+
+    def test_read_lags(self):
+        """Test reading fixed time lags against rolling a history tensor."""
+        lags = [0, 2, 4]
+        lags_index = self.buffer.create_lags_index(lags)
+        self.assertEqual(lags_index.shape, (self.max_len, len(lags)))
+        # reference history with the latest data first
+        history = torch.zeros(self.num_envs, self.max_len, self.num_joints, 2, device=self.device)
+        for step in range(12):
+            # reset some environments
+            if step == 7:
+                self.buffer.reset([1, 4])
+                history[[1, 4]] = 0.0
+            data = torch.rand(self.num_envs, self.num_joints, 2, device=self.device)
+            self.buffer.append(data)
+            history = history.roll(1, 1)
+            history[:, 0] = data
+            # check the history at the lags
+            expected = history[:, lags].permute(0, 2, 3, 1)
+            torch.testing.assert_close(self.buffer.read_lags(lags_index), expected)
+
+    def test_read_lag(self):
+        """Test reading a time lag per environment, clamped to the data appended since the last reset."""
+        lags = torch.arange(self.num_envs, device=self.device) % self.max_len
+        all_data = []
+        reset_step = 6
+        for step in range(15):
+            if step == reset_step:
+                self.buffer.reset([0, 3])
+            data = torch.rand(self.num_envs, self.num_joints, 2, device=self.device)
+            all_data.append(data)
+            # note: the data is also appended as the sequence of its channels
+            self.buffer.append(data if step % 2 == 0 else data.unbind(-1))
+            output = self.buffer.read_lag(lags)
+            for env_id in range(self.num_envs):
+                first_step = reset_step if env_id in (0, 3) and step >= reset_step else 0
+                expected = all_data[max(first_step, step - int(lags[env_id]))][env_id]
+                torch.testing.assert_close(output[env_id], expected)
+
+    def test_invalid_lags(self):
+        """Test that invalid time lags raise an error."""
+        with self.assertRaises(ValueError):
+            self.buffer.create_lags_index([0, self.max_len])
+        with self.assertRaises(ValueError):
+            self.buffer.create_lags_index([-1])
+        with self.assertRaises(ValueError):
+            JointHistoryBuffer(0, self.num_envs, self.num_joints, 2, device=self.device)
+
+
+if __name__ == "__main__":
+    run_tests()
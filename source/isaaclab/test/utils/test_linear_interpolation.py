@@ -0,0 +1,102 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+import unittest
+
+from isaaclab.utils import LinearInterpolation
+
+
+def reference_interpolation(x: torch.Tensor, y: torch.Tensor, q: torch.Tensor) -> torch.Tensor:
+    """Interpolates a single lookup table by comparing each query point with all the samples."""
+    q_1d = q.reshape(-1)
+    num_smaller_elements = torch.sum(x.unsqueeze(1) < q_1d.unsqueeze(0), dim=0)
+    lower_bound = torch.clamp(num_smaller_elements - 1, min=0)
+    upper_bound = torch.clamp(num_smaller_elements, max=x.numel() - 1)
+    weight = (q_1d - x[lower_bound]) / (x[upper_bound] - x[lower_bound])
+    weight[upper_bound == lower_bound] = 0.0
+    return (y[lower_bound] + weight * (y[upper_bound] - y[lower_bound])).view(q.shape)
+
+
+class TestLinearInterpolation(unittest.TestCase):
+    """Test fixture for checking the linear interpolation."""
+
+    def setUp(self):
+        self.device: str = "cpu"
+        self.generator = torch.Generator(device=self.device).manual_seed(0)
+
+    def _rand(self, *shape: int) -> torch.Tensor:
+        return torch.rand(*shape, generator=self.generator, device=self.device)
+
+    def test_single_table(self):
+        """Test the interpolation of a single lookup table with and without evenly spaced samples."""
+        for num_samples in (1, 2, 10, 100):
+            for uniform in (False, True):
+                with self.subTest(num_samples=num_samples, uniform=uniform):
+                    if uniform:
+                        x = torch.linspace(-2.0, 2.0, num_samples, device=self.device)
+                    else:
+                        x = torch.sort(4.0 * self._rand(num_samples) - 2.0).values
+                    y = self._rand(num_samples)
+                    # query points in and out of bounds, including the samples themselves
+                    q = 6.0 * self._rand(8, 5, 3) - 3.0
+                    q.view(-1)[: min(num_samples, q.numel())] = x[: q.numel()]
+                    interpolation = LinearInterpolation(x, y, device=self.device)
+                    # note: two samples are always evenly spaced
+                    self.assertEqual(interpolation.is_uniform, num_samples == 2 or (uniform and num_samples > 1))
+                    torch.testing.assert_close(interpolation.compute(q), reference_interpolation(x, y, q))
+
+    def test_batched_tables(self):
+        """Test the interpolation of a lookup table per joint and per environment and joint."""
+        num_envs, num_joints, num_samples = 16, 4, 20
+        for uniform in (False, True):
+            for batch_shape in ((num_joints,), (num_envs, num_joints)):
+                with self.subTest(uniform=uniform, batch_shape=batch_shape):
+                    if uniform:
+                        scale = 1.0 + self._rand(*batch_shape, 1)
+                        x = scale * torch.linspace(-1.0, 1.0, num_samples, device=self.device)
+                    else:
+                        x = torch.sort(4.0 * self._rand(*batch_shape, num_samples) - 2.0).values
+                    y = self._rand(*batch_shape, num_samples)
+                    q = 6.0 * self._rand(num_envs, num_joints) - 3.0
+                    interpolation = LinearInterpolation(x, y, device=self.device)
+                    self.assertEqual(interpolation.is_uniform, uniform)
+                    self.assertEqual(interpolation.batch_shape, batch_shape)
+                    # compare against interpolating each table separately
+                    x_full, y_full = x.expand(num_envs, num_joints, -1), y.expand(num_envs, num_joints, -1)
+                    expected = torch.zeros_like(q)
+                    for env_id in range(num_envs):
+                        for joint_id in range(num_joints):
+                            expected[env_id, joint_id] = reference_interpolation(
+                                x_full[env_id, joint_id], y_full[env_id, joint_id], q[env_id, joint_id]
+                            )
+                    torch.testing.assert_close(interpolation.compute(q), expected)
+
+    def test_invalid_inputs(self):
+        """Test that invalid inputs raise an error."""
+        x = torch.tensor([0.0, 1.0, 3.0], device=self.device)
+        with self.assertRaises(ValueError):
+            LinearInterpolation(torch.zeros(0), torch.zeros(0), device=self.device)
+        with self.assertRaises(ValueError):
+            LinearInterpolation(x, torch.zeros(4), device=self.device)
+        with self.assertRaises(ValueError):
+            LinearInterpolation(x.flip(0), torch.zeros(3), device=self.device)
+        with self.assertRaises(ValueError):
+            LinearInterpolation(x, torch.zeros(3), device=self.device, uniform=True)
+        with self.assertRaises(ValueError):
+            LinearInterpolation(x.repeat(4, 1), torch.zeros(4, 3), device=self.device).compute(torch.zeros(8, 5))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -156,6 +156,37 @@ class TestModifiers(unittest.TestCase):
                     # check if the modified data is close to the expected result
                     torch.testing.assert_close(processed_data, test_cfg.result)
 
+    def test_digital_filter_history(self):
+        """Test the history of the digital filter against the difference equation with resets."""
+        for device in ["cpu", "cuda"]:
+            with self.subTest(device=device):
+                # create a modifier with more input than output coefficients
+                modifier_cfg = modifiers.DigitalFilterCfg(A=[0.3, -0.1], B=[0.4, 0.2, 0.1])
+                modifier_obj = modifier_cfg.func(modifier_cfg, (4, 3), device=device)
+
+                inputs, outputs = [], []
+                for i in range(10):
+                    # reset the first environment
+                    if i == 6:
+                        modifier_obj.reset(env_ids=[0])
+                        inputs = [x.clone() for x in inputs]
+                        outputs = [y.clone() for y in outputs]
+                        for history in (inputs, outputs):
+                            for entry in history:
+                                entry[0] = 0.0
+                    data = torch.rand(4, 3, device=device)
+                    processed_data = modifier_obj(data)
+                    # compute the expected output with the difference equation
+                    inputs.insert(0, data)
+                    expected = sum(b * x for b, x in zip(modifier_cfg.B, inputs))
+                    expected = expected - sum(a * y for a, y in zip(modifier_cfg.A, outputs))
+                    outputs.insert(0, processed_data)
+                    torch.testing.assert_close(processed_data, expected)
+
+                # check the ordering of the history from the latest to the oldest entry
+                torch.testing.assert_close(modifier_obj.x_n, torch.stack(inputs[:3], dim=-1))
+                torch.testing.assert_close(modifier_obj.y_n, torch.stack(outputs[:2], dim=-1))
+
     def test_integral(self):
         """Test for integral modifier."""
         for device in ["cpu", "cuda"]:
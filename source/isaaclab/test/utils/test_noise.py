@@ -114,6 +114,99 @@ class TestNoise(unittest.TestCase):
                             self.assertTrue(noise_cfg.bias.device, device)
                             torch.testing.assert_close(noise_cfg.bias.repeat(data.shape[0], 1), bias_result)
 
+    def test_block_noise_sampler(self):
+        """Test the statistics of the noise pre-sampled by the block noise sampler."""
+        for device in ["cpu", "cuda"]:
+            for seed in [None, 42]:
+                with self.subTest(device=device, seed=seed):
+                    sampler = noise.BlockNoiseSampler(num_envs=1000, device=device, block_length=8, seed=seed)
+                    # register a gaussian noise before a uniform noise with tensor parameters
+                    std = torch.tensor([0.1, 0.2, 0.3], device=device)
+                    mean = torch.tensor([0.4, 0.5, 0.6], device=device)
+                    gaussian_id = sampler.register(noise.GaussianNoiseCfg(std=std, mean=mean), shape=(3,))
+                    n_min = torch.tensor([[-0.1, 0.2], [0.3, -0.4]], device=device)
+                    uniform_cfg = noise.UniformNoiseCfg(n_min=n_min, n_max=n_min + 0.5, operation="scale")
+                    uniform_id = sampler.register(uniform_cfg, shape=(2, 2))
+                    self.assertEqual(sampler.num_elements, 7)
+
+                    gaussian_noise, uniform_noise = [], []
+                    data = torch.rand(1000, 2, 2, device=device) + 0.5
+                    # note: the block is refilled several times over the steps
+                    for _ in range(20):
+                        sampler.step()
+                        gaussian_noise.append(sampler.apply(gaussian_id, torch.zeros(1000, 3, device=device)))
+                        uniform_noise.append(sampler.apply(uniform_id, data) / data)
+                    gaussian_noise = torch.cat(gaussian_noise)
+                    uniform_noise = torch.cat(uniform_noise)
+
+                    std_result, mean_result = torch.std_mean(gaussian_noise, dim=0)
+                    torch.testing.assert_close(std, std_result, atol=1e-2, rtol=1e-2)
+                    torch.testing.assert_close(mean, mean_result, atol=1e-2, rtol=1e-2)
+                    self.assertTrue(torch.all(uniform_noise >= n_min - 1e-5))
+                    self.assertTrue(torch.all(uniform_noise <= n_min + 0.5 + 1e-5))
+                    torch.testing.assert_close(uniform_noise.mean(dim=0), n_min + 0.25, atol=1e-2, rtol=1e-2)
+                    # the noise must be different at every step
+                    self.assertTrue(torch.all(gaussian_noise.view(20, 1000, 3).diff(dim=0) != 0.0))
+
+    def test_block_noise_sampler_seed(self):
+        """Test that the counter-based noise of an environment only depends on its own episode and step."""
+        for device in ["cpu", "cuda"]:
+            with self.subTest(device=device):
+                samplers = [
+                    noise.BlockNoiseSampler(num_envs=4, device=device, block_length=4, seed=0) for _ in range(2)
+                ]
+                for sampler in samplers:
+                    sampler.register(noise.GaussianNoiseCfg(std=1.0), shape=(2,))
+                    sampler.register(noise.UniformNoiseCfg(), shape=(3,))
+
+                # collect the noise of each environment per episode
+                # note: the first sampler resets environment 0 every 3 steps and the second one every 5 steps
+                episode_noise = [[dict() for _ in range(4)] for _ in samplers]
+                for sampler, reset_period, noise_per_env in zip(samplers, (3, 5), episode_noise):
+                    for step in range(30):
+                        if step > 0 and step % reset_period == 0:
+                            sampler.reset(env_ids=[0])
+                        sampler.step()
+                        noise_step = torch.cat(
+                            [
+                                sampler.apply(0, torch.zeros(4, 2, device=device)),
+                                sampler.apply(1, torch.zeros(4, 3, device=device)),
+                            ],
+                            dim=-1,
+                        )
+                        for env_id in range(4):
+                            episode = step // reset_period if env_id == 0 else 0
+                            noise_per_env[env_id].setdefault(episode, []).append(noise_step[env_id])
+
+                # the other environments are not affected by the resets of environment 0
+                for env_id in range(1, 4):
+                    torch.testing.assert_close(
+                        torch.stack(episode_noise[0][env_id][0]), torch.stack(episode_noise[1][env_id][0])
+                    )
+                # the noise of environment 0 restarts in each episode from the same stream
+                for episode in range(6):
+                    torch.testing.assert_close(
+                        torch.stack(episode_noise[0][0][episode][:3]), torch.stack(episode_noise[1][0][episode][:3])
+                    )
+                # the episodes have different noise
+                self.assertFalse(torch.allclose(episode_noise[0][0][0][0], episode_noise[0][0][1][0]))
+
+    def test_block_noise_sampler_invalid(self):
+        """Test the invalid usages of the block noise sampler."""
+        sampler = noise.BlockNoiseSampler(num_envs=4, device="cpu")
+        self.assertFalse(sampler.is_supported(noise.ConstantNoiseCfg()))
+        self.assertFalse(sampler.is_supported(noise.GaussianNoiseCfg(func=lambda data, cfg: data)))
+        with self.assertRaises(ValueError):
+            sampler.register(noise.ConstantNoiseCfg(), shape=(3,))
+        with self.assertRaises(RuntimeError):
+            sampler.apply(0, torch.zeros(4, 3))
+        sampler.register(noise.GaussianNoiseCfg(), shape=(3,))
+        sampler.step()
+        with self.assertRaises(RuntimeError):
+            sampler.register(noise.GaussianNoiseCfg(), shape=(3,))
+        with self.assertRaises(ValueError):
+            noise.BlockNoiseSampler(num_envs=4, device="cpu", block_length=0)
+
 
 if __name__ == "__main__":
     run_tests()
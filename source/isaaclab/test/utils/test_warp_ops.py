@@ -0,0 +1,206 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import numpy as np
+import torch
+import trimesh
+import unittest
+
+import warp as wp
+
+from isaaclab.utils.math import matrix_from_quat, quat_from_euler_xyz
+from isaaclab.utils.warp import RaycastEngine, convert_to_warp_mesh, raycast_mesh, raycast_meshes, refit_mesh
+
+
+class TestWarpOps(unittest.TestCase):
+    """Test fixture for the ray-casting operations based on warp."""
+
+    def setUp(self):
+        self.device = "cpu"
+        # create a ground and two obstacles on top of it
+        self.ground = trimesh.creation.box((10.0, 10.0, 1.0), trimesh.transformations.translation_matrix((0, 0, -0.5)))
+        self.obstacles = [
+            trimesh.creation.box((1.0, 1.0, 1.0), trimesh.transformations.translation_matrix((1.0, 0.0, 0.5))),
+            trimesh.creation.box((1.0, 1.0, 2.0), trimesh.transformations.translation_matrix((-1.0, 0.0, 1.0))),
+        ]
+        # create the rays pointing downwards on a line along the x-axis
+        self.ray_starts = torch.zeros(2, 50, 3, device=self.device)
+        self.ray_starts[..., 0] = torch.linspace(-3.0, 3.0, 100).view(2, 50)
+        self.ray_starts[..., 2] = 5.0
+        self.ray_directions = torch.zeros_like(self.ray_starts)
+        self.ray_directions[..., 2] = -1.0
+
+    def test_raycast_meshes(self):
+        """Test that ray-casting against multiple meshes is the same as ray-casting against the combined mesh."""
+        meshes = [self.ground, trimesh.util.concatenate(self.obstacles)]
+        wp_meshes = [convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device) for mesh in meshes]
+        combined_mesh = trimesh.util.concatenate(meshes)
+        wp_combined_mesh = convert_to_warp_mesh(combined_mesh.vertices, combined_mesh.faces, device=self.device)
+
+        ray_hits, ray_distance, ray_normal, _, ray_mesh_id = raycast_meshes(
+            self.ray_starts,
+            self.ray_directions,
+            wp_meshes,
+            return_distance=True,
+            return_normal=True,
+            return_mesh_id=True,
+        )
+        expected_ray_hits, expected_ray_distance, expected_ray_normal, _ = raycast_mesh(
+            self.ray_starts,
+            self.ray_directions,
+            wp_combined_mesh,
+            return_distance=True,
+            return_normal=True,
+        )
+        # check the shapes
+        self.assertEqual(ray_hits.shape, (2, 50, 3))
+        self.assertEqual(ray_distance.shape, (2, 50))
+        self.assertEqual(ray_mesh_id.shape, (2, 50))
+        # check the closest hits
+        torch.testing.assert_close(ray_hits, expected_ray_hits)
+        torch.testing.assert_close(ray_distance, expected_ray_distance)
+        torch.testing.assert_close(ray_normal, expected_ray_normal)
+        # check the hit meshes
+        on_obstacle = (ray_hits[..., 0].abs() - 1.0).abs() < 0.5
+        torch.testing.assert_close(ray_mesh_id, on_obstacle.int())
+
+    def test_raycast_meshes_miss(self):
+        """Test the outputs of rays that miss all the meshes."""
+        wp_meshes = [convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device) for mesh in self.obstacles]
+        ray_hits, ray_distance, _, ray_face_id, ray_mesh_id = raycast_meshes(
+            self.ray_starts,
+            -self.ray_directions,
+            wp_meshes,
+            return_distance=True,
+            return_face_id=True,
+            return_mesh_id=True,
+        )
+        self.assertTrue(torch.all(torch.isinf(ray_hits)))
+        self.assertTrue(torch.all(torch.isinf(ray_distance)))
+        self.assertTrue(torch.all(ray_face_id == -1))
+        self.assertTrue(torch.all(ray_mesh_id == -1))
+
+    def test_raycast_meshes_max_distance(self):
+        """Test that the hits beyond the maximum distance are ignored."""
+        wp_meshes = [convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device) for mesh in self.obstacles]
+        ray_hits = raycast_meshes(self.ray_starts, self.ray_directions, wp_meshes, max_dist=3.5)[0]
+        # only the higher obstacle is within the maximum distance
+        hit = ~torch.isinf(ray_hits[..., 2])
+        torch.testing.assert_close(ray_hits[..., 2][hit], torch.full_like(ray_hits[..., 2][hit], 2.0))
+        torch.testing.assert_close(hit, (ray_hits[..., 0] + 1.0).abs() < 0.5)
+
+    def test_raycast_engine(self):
+        """Test that the ray-cast engine matches the ray-casting against multiple meshes."""
+        meshes = [self.ground, trimesh.util.concatenate(self.obstacles)]
+        wp_meshes = [convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device) for mesh in meshes]
+        engine = RaycastEngine(
+            wp_meshes,
+            num_envs=2,
+            num_rays=50,
+            return_distance=True,
+            return_normal=True,
+            return_face_id=True,
+            return_mesh_id=True,
+        )
+        engine.ray_starts[:] = self.ray_starts
+        engine.ray_directions[:] = self.ray_directions
+        engine.raycast()
+
+        expected_outputs = raycast_meshes(
+            self.ray_starts,
+            self.ray_directions,
+            wp_meshes,
+            return_distance=True,
+            return_normal=True,
+            return_face_id=True,
+            return_mesh_id=True,
+        )
+        outputs = (engine.ray_hits, engine.ray_distance, engine.ray_normal, engine.ray_face_id, engine.ray_mesh_id)
+        for output, expected_output in zip(outputs, expected_outputs):
+            torch.testing.assert_close(output, expected_output)
+
+    def test_raycast_engine_env_ids(self):
+        """Test that the ray-cast engine only updates the given environments and overwrites missed hits."""
+        wp_meshes = [convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device) for mesh in self.obstacles]
+        ray_hits = torch.zeros(2, 50, 3, device=self.device)
+        engine = RaycastEngine(wp_meshes, num_envs=2, num_rays=50, return_distance=True, ray_hits=ray_hits)
+        engine.ray_starts[:] = self.ray_starts
+        engine.ray_directions[:] = self.ray_directions
+        expected_ray_hits, expected_ray_distance, _, _, _ = raycast_meshes(
+            self.ray_starts, self.ray_directions, wp_meshes, return_distance=True
+        )
+
+        # ray-cast the second environment only
+        engine.raycast(torch.tensor([1], device=self.device))
+        self.assertTrue(torch.all(ray_hits[0] == 0.0))
+        torch.testing.assert_close(ray_hits[1], expected_ray_hits[1])
+        torch.testing.assert_close(engine.ray_distance[1], expected_ray_distance[1])
+        # flip the rays of the second environment so that they miss all the meshes
+        engine.ray_directions[1] *= -1.0
+        engine.raycast([1])
+        self.assertTrue(torch.all(torch.isinf(ray_hits[1])))
+        self.assertTrue(torch.all(torch.isinf(engine.ray_distance[1])))
+        # ray-cast all the environments
+        engine.ray_directions[:] = self.ray_directions
+        engine.raycast(torch.arange(2, device=self.device))
+        torch.testing.assert_close(ray_hits, expected_ray_hits)
+        # check that the buffer of the ray hits is validated
+        with self.assertRaises(ValueError):
+            RaycastEngine(wp_meshes, num_envs=2, num_rays=50, ray_hits=torch.zeros(2, 50, 3, dtype=torch.float64))
+
+    def test_refit_mesh(self):
+        """Test that a refit mesh is the same as a mesh built at the new poses of its instances."""
+        # combine the obstacles into a mesh with two instances
+        positions = torch.tensor([[1.0, 0.0, 0.0], [-1.0, 0.0, 0.0]])
+        local_meshes = [
+            mesh.copy().apply_translation(-position.numpy()) for mesh, position in zip(self.obstacles, positions)
+        ]
+        mesh = trimesh.util.concatenate(self.obstacles)
+        wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+        local_points = wp.array(
+            np.concatenate([local_mesh.vertices for local_mesh in local_meshes]).astype(np.float32),
+            dtype=wp.vec3,
+            device=self.device,
+        )
+        instance_ids = wp.array(
+            np.repeat(np.arange(2, dtype=np.int32), [len(local_mesh.vertices) for local_mesh in local_meshes]),
+            dtype=wp.int32,
+            device=self.device,
+        )
+
+        # move the instances
+        new_positions = torch.tensor([[0.5, 0.0, 1.0], [-2.0, 0.0, 0.0]])
+        new_orientations = quat_from_euler_xyz(torch.tensor([0.0, 0.3]), torch.tensor([0.2, 0.0]), torch.zeros(2))
+        refit_mesh(wp_mesh, local_points, instance_ids, new_positions, new_orientations)
+
+        # build the expected mesh at the new poses
+        expected_meshes = []
+        for local_mesh, position, orientation in zip(local_meshes, new_positions, new_orientations):
+            transform = np.eye(4)
+            transform[:3, :3] = matrix_from_quat(orientation).numpy()
+            transform[:3, 3] = position.numpy()
+            expected_meshes.append(local_mesh.copy().apply_transform(transform))
+        expected_mesh = trimesh.util.concatenate(expected_meshes)
+        wp_expected_mesh = convert_to_warp_mesh(expected_mesh.vertices, expected_mesh.faces, device=self.device)
+
+        # check the points and the ray-casting results
+        np.testing.assert_allclose(wp_mesh.points.numpy(), expected_mesh.vertices, atol=1e-5)
+        torch.testing.assert_close(
+            raycast_meshes(self.ray_starts, self.ray_directions, [wp_mesh])[0],
+            raycast_mesh(self.ray_starts, self.ray_directions, wp_expected_mesh)[0],
+        )
+
+
+if __name__ == "__main__":
+    run_tests()